@@ -4,28 +4,139 @@ FastAPI 백엔드 서버 - 라벨링 품질 검수 API
 CLI 도구의 기능을 웹 API로 제공
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, Form, Request, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from contextlib import asynccontextmanager
+import asyncio
+import io
 import json
-import tempfile
 import os
+import shutil
+import time
 from pathlib import Path
 import sys
 
 # 백엔드 모듈들 임포트 (상대경로 사용)
 from src.core import QualityController
 from src.utils import AdvancedQualityAnalyzer
-from src.core.rule_fixer import RuleBasedFixer
+from src.core.worker_pool import (
+    PoolSaturatedError,
+    WorkerPool,
+    analyze_upload_task,
+    auto_fix_task,
+    validate_content_task,
+)
+from src.services.job_manager import JOB_AUTO_FIX, JOB_COMPARE, JOB_TYPES, STATE_DONE, JobManager, JobStore
+from src.utils.metrics import MetricsRegistry
+from src.utils.zip_processor import ZipProcessor
+
+# CPU 작업(검증/자동 수정) 프로세스 풀 설정 - 환경 변수로 변경 가능
+API_WORKERS = int(os.environ.get("QC_API_WORKERS", min(os.cpu_count() or 1, 4)))
+API_MAX_PENDING = int(os.environ.get("QC_API_MAX_PENDING", API_WORKERS * 4))
+API_MAX_WAITING = int(os.environ.get("QC_API_MAX_WAITING", API_MAX_PENDING * 4))
+
+# 대기열이 가득 찼을 때 클라이언트에 알려줄 재시도 대기 시간 (초)
+SATURATED_RETRY_AFTER = 1
+
+# 백그라운드 작업(일괄 자동 수정/비교) 설정
+JOBS_DIR = os.environ.get("QC_JOBS_DIR")
+JOB_WORKERS = int(os.environ.get("QC_JOB_WORKERS", 1))
+
+# 규칙별 시간 측정 비율 (0~1, 측정하는 작업은 검증이 느려지므로 표본만) / 결과 캐시 사용 여부
+RULE_TIMING_SAMPLE = float(os.environ.get("QC_RULE_TIMING_SAMPLE", 0.05))
+API_USE_CACHE = os.environ.get("QC_API_CACHE", "0") == "1"
+
+# 운영 지표 (/metrics)
+metrics = MetricsRegistry()
+REQUEST_LATENCY = metrics.histogram("qc_http_request_duration_seconds", "HTTP 요청 처리 시간",
+                                    ("method", "route", "status"))
+REQUESTS_IN_FLIGHT = metrics.gauge("qc_http_requests_in_flight", "처리 중인 HTTP 요청 수")
+TASK_LATENCY = metrics.histogram("qc_worker_task_duration_seconds", "작업자 풀 작업 소요 시간 (대기 포함)", ("task",))
+STAGE_LATENCY = metrics.histogram("qc_stage_duration_seconds", "작업 단계별 소요 시간", ("stage",))
+FIXER_LATENCY = metrics.histogram("qc_fixer_duration_seconds", "자동 수정 단계별 소요 시간", ("category",))
+RULE_SECONDS = metrics.counter("qc_rule_evaluation_seconds_total", "규칙별 평가 시간 합계 (표본 작업만)", ("rule",))
+RULE_CALLS = metrics.counter("qc_rule_evaluations_total", "규칙별 평가 횟수 (표본 작업만)", ("rule",))
+RULE_SAMPLED_TASKS = metrics.counter("qc_rule_timing_sampled_tasks_total", "규칙별 시간을 측정한 작업 수")
+RULE_ISSUES = metrics.counter("qc_rule_issues_total", "규칙별 검출 이슈 수", ("rule",))
+CACHE_REQUESTS = metrics.counter("qc_result_cache_requests_total", "검증 결과 캐시 조회 수", ("result",))
+REJECTED_REQUESTS = metrics.counter("qc_rejected_requests_total", "대기열이 가득 차 거절한 요청 수 (429)", ("queue",))
+
+def record_task_metrics(task: str, elapsed: float, task_metrics: Dict[str, Any]):
+    """작업자 프로세스에서 돌려받은 작업 지표 합산"""
+    TASK_LATENCY.observe(elapsed, task=task)
+    for stage, seconds in task_metrics['stages']:
+        STAGE_LATENCY.observe(seconds, stage=stage)
+    for category, seconds in task_metrics['fixer'].items():
+        FIXER_LATENCY.observe(seconds, category=category)
+    for rule_id, count in task_metrics['issues'].items():
+        RULE_ISSUES.inc(count, rule=rule_id)
+    if task_metrics['rules']:
+        RULE_SAMPLED_TASKS.inc()
+        for rule_id, values in task_metrics['rules'].items():
+            RULE_SECONDS.inc(values['seconds'], rule=rule_id)
+            RULE_CALLS.inc(values['calls'], rule=rule_id)
+    cache = task_metrics.get('cache')
+    if cache:
+        CACHE_REQUESTS.inc(cache['hits'], result="hit")
+        CACHE_REQUESTS.inc(cache['misses'], result="miss")
+
+worker_pool = WorkerPool(API_WORKERS, API_MAX_PENDING,
+                         config={'rule_timing_sample': RULE_TIMING_SAMPLE, 'use_cache': API_USE_CACHE},
+                         on_metrics=record_task_metrics, max_waiting=API_MAX_WAITING)
+# 작업 관리자는 lifespan에서 생성 (임포트만으로 작업 폴더를 만들지 않도록)
+job_manager: Optional[JobManager] = None
+
+metrics.gauge("qc_worker_pool_pending", "작업자 풀 실행/대기 중 작업 수", function=lambda: worker_pool.pending)
+metrics.gauge("qc_worker_pool_max_pending", "작업자 풀 실행/대기 작업 최대 수", function=lambda: worker_pool.max_pending)
+metrics.gauge("qc_worker_pool_waiting", "작업자 풀 자리를 기다리는 작업 수", function=lambda: worker_pool.waiting)
+metrics.gauge("qc_jobs_active", "대기/실행 중인 백그라운드 작업 수", function=lambda: job_manager.active if job_manager else 0)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 작업자 프로세스/작업 관리자 준비, 종료 시 정리"""
+    global job_manager
+    worker_pool.start()
+    try:
+        import psutil
+        # 첫 cpu_percent(interval=None) 호출은 기준점만 잡으므로 시작 시 한 번 호출
+        psutil.cpu_percent(interval=None)
+    except ImportError:
+        pass
+    job_manager = JobManager(JobStore(JOBS_DIR), workers=JOB_WORKERS)
+    resumed = job_manager.start()
+    if resumed:
+        print(f"🔁 중단된 작업 {resumed}개를 다시 실행합니다")
+    yield
+    job_manager.shutdown()
+    worker_pool.shutdown()
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="라벨링 품질 검수 API",
     description="AI 기반 라벨링 품질 검수 및 자동 수정 API",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """요청 처리 시간 기록 (라벨은 경로 대신 라우트 템플릿 사용)"""
+    REQUESTS_IN_FLIGHT.inc()
+    start_time = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        route = request.scope.get("route")
+        REQUEST_LATENCY.observe(time.perf_counter() - start_time, method=request.method,
+                                route=getattr(route, "path", "unmatched"), status=str(status))
+
 # CORS 설정 (React 프론트엔드와 연결)
 app.add_middleware(
     CORSMiddleware,
@@ -38,6 +149,19 @@ app.add_middleware(
 # 전역 인스턴스
 controller = QualityController()
 ai_analyzer = AdvancedQualityAnalyzer()
+zip_processor = ZipProcessor()
+
+# 배치 검수에서 동시에 검증할 문서 수
+BATCH_MAX_IN_FLIGHT = 4
+
+def saturated_error(queue: str = "api") -> HTTPException:
+    """작업자 풀이 가득 찼을 때 응답 (429)"""
+    REJECTED_REQUESTS.inc(queue=queue)
+    return HTTPException(
+        status_code=429,
+        detail="처리 중인 요청이 많습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": str(SATURATED_RETRY_AFTER)}
+    )
 
 # Pydantic 모델들
 class QualityIssueResponse(BaseModel):
@@ -84,6 +208,11 @@ async def root():
         "status": "running"
     }
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """운영 지표 (Prometheus 텍스트 형식)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
@@ -99,65 +228,146 @@ async def upload_file(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="JSON 파일만 지원됩니다")
 
     try:
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(mode='w+b', suffix='.json', delete=False) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_path = Path(temp_file.name)
-
-        try:
-            # 1. 기본 품질 검수 실행
-            issues = controller.validate_file(temp_path)
-
-            # 2. JSON 데이터 로드
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # 3. AI 분석 실행
-            anomalies = ai_analyzer.detect_anomalies(data)
-            optimizations = ai_analyzer.generate_optimization_suggestions(issues)
-
-            # 4. 품질 점수 계산 (간단한 공식)
-            quality_score = max(0, min(100, 100 - len(issues) * 2))
-
-            # 5. 응답 데이터 구성
-            issues_data = []
-            for issue in issues:
-                issues_data.append(QualityIssueResponse(
-                    rule_id=issue.rule_id,
-                    severity=issue.severity,
-                    message=issue.message,
-                    file_path=issue.file_path,
-                    element_id=getattr(issue, 'element_id', None),
-                    page_index=getattr(issue, 'page_index', None),
-                    category=issue.category,
-                    suggested_fix=getattr(issue, 'suggested_fix', None),
-                    auto_fixable=issue.auto_fixable
-                ))
-
-            ai_analysis = AIAnalysisResponse(
-                anomalies=anomalies,
-                optimizations=optimizations,
-                quality_score=quality_score
-            )
-
-            return ValidationResultResponse(
-                filename=file.filename,
-                issues_count=len(issues),
-                issues=issues_data,
-                ai_analysis=ai_analysis
-            )
+        # 1~2. 품질 검수 및 AI 분석 (작업자 프로세스에서 메모리로 한 번만 파싱)
+        content = await file.read()
+        result = await worker_pool.run(analyze_upload_task, content, file.filename)
+        issues = result["issues"]
+        anomalies = result["anomalies"]
+        optimizations = result["optimizations"]
+
+        # 3. 품질 점수 계산 (간단한 공식)
+        quality_score = quality_score_for(issues)
+
+        # 4. 응답 데이터 구성
+        issues_data = []
+        for issue in issues:
+            issues_data.append(QualityIssueResponse(
+                rule_id=issue.rule_id,
+                severity=issue.severity,
+                message=issue.message,
+                file_path=issue.file_path,
+                element_id=getattr(issue, 'element_id', None),
+                page_index=getattr(issue, 'page_index', None),
+                category=issue.category,
+                suggested_fix=getattr(issue, 'suggested_fix', None),
+                auto_fixable=issue.auto_fixable
+            ))
+
+        ai_analysis = AIAnalysisResponse(
+            anomalies=anomalies,
+            optimizations=optimizations,
+            quality_score=quality_score
+        )
 
-        finally:
-            # 임시 파일 정리
-            if temp_path.exists():
-                os.unlink(temp_path)
+        return ValidationResultResponse(
+            filename=file.filename,
+            issues_count=len(issues),
+            issues=issues_data,
+            ai_analysis=ai_analysis
+        )
 
-    except json.JSONDecodeError:
+    except PoolSaturatedError:
+        raise saturated_error()
+    except (json.JSONDecodeError, UnicodeDecodeError):
         raise HTTPException(status_code=400, detail="유효하지 않은 JSON 파일입니다")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 처리 중 오류: {str(e)}")
 
+def quality_score_for(issues) -> int:
+    """품질 점수 계산 (간단한 공식)"""
+    return max(0, min(100, 100 - len(issues) * 2))
+
+async def validate_document(document: str, content: bytes) -> Dict[str, Any]:
+    """배치 검수 문서 하나의 결과 (NDJSON 한 줄)"""
+    try:
+        # 배치 도중에는 거절하지 않고 작업자 풀에 자리가 날 때까지 기다림
+        issues = await worker_pool.run(validate_content_task, content, document, wait=True)
+    except ValueError as e:
+        # JSON 파싱/디코딩 오류는 해당 문서만 실패로 보고
+        return {"document": document, "status": "error", "error": f"유효하지 않은 JSON: {e}"}
+    except Exception as e:
+        # 작업자 풀 오류(대기열 초과, 작업자 종료 등)도 해당 문서만 실패로 보고하고 스트림은 계속
+        return {"document": document, "status": "error", "error": f"검증 실패 ({type(e).__name__}): {e}"}
+
+    return {
+        "document": document,
+        "status": "ok",
+        "issues_count": len(issues),
+        "quality_score": quality_score_for(issues),
+        "issues": list(issues.iter_dicts())
+    }
+
+@app.post("/api/validate_batch")
+async def validate_batch(files: List[UploadFile] = File(...)):
+    """
+    여러 문서 일괄 품질 검수
+    JSON 파일 또는 visualcontent ZIP(여러 ZIP/JSON을 묶은 배치 ZIP 포함)을 받아
+    메모리에서 검증하고, 문서별 결과를 끝나는 순서대로 NDJSON으로 전송
+    마지막 줄은 {"summary": {...}}
+    """
+    for file in files:
+        if not file.filename.lower().endswith(('.json', '.zip')):
+            raise HTTPException(status_code=400, detail=f"JSON 또는 ZIP 파일만 지원됩니다: {file.filename}")
+
+    # 스트리밍을 시작한 뒤에는 상태 코드를 바꿀 수 없으므로 시작 전에 대기열 확인
+    if worker_pool.saturated:
+        raise saturated_error()
+
+    async def generate():
+        start_time = time.time()
+        summary = {"documents": 0, "issues": 0, "errors": 0}
+        in_flight = set()
+        closing = False
+
+        def to_line(result: Dict[str, Any]) -> bytes:
+            summary["documents"] += 1
+            if result["status"] == "ok":
+                summary["issues"] += result["issues_count"]
+            else:
+                summary["errors"] += 1
+            return (json.dumps(result, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+
+        try:
+            for file in files:
+                # 업로드 내용을 메모리에서 바로 읽음 (임시 파일/압축 해제 없음)
+                documents = zip_processor.iter_uploaded_visualinfo(io.BytesIO(await file.read()), file.filename)
+
+                while True:
+                    # ZIP 멤버 읽기/압축 해제도 이벤트 루프 밖에서 수행
+                    try:
+                        document = await asyncio.to_thread(next, documents, None)
+                    except Exception as e:
+                        yield to_line({"document": file.filename, "status": "error", "error": f"ZIP 읽기 실패: {e}"})
+                        document = None
+
+                    if document is not None:
+                        in_flight.add(asyncio.create_task(validate_document(*document)))
+
+                    # 동시에 검증하는 문서 수 제한 (마지막에는 남은 문서 모두), 끝난 문서부터 바로 전송
+                    limit = BATCH_MAX_IN_FLIGHT if document is not None else 1
+                    while len(in_flight) >= limit:
+                        done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            yield to_line(task.result())
+
+                    if document is None:
+                        break
+        except Exception as e:
+            # 예상하지 못한 오류도 스트림을 그냥 끊지 않고 한 줄로 보고
+            yield to_line({"document": None, "status": "error", "error": f"배치 처리 중단 ({type(e).__name__}): {e}"})
+        except BaseException:
+            # 클라이언트 연결 종료/취소 - 더 보낼 수 없음
+            closing = True
+            raise
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if not closing:
+                summary["elapsed"] = round(time.time() - start_time, 3)
+                yield (json.dumps({"summary": summary}, ensure_ascii=False) + "\n").encode('utf-8')
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @app.post("/api/predict_label", response_model=LabelPredictionResponse)
 async def predict_label(request: LabelPredictionRequest):
     """
@@ -205,44 +415,123 @@ async def auto_fix_file(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="JSON 파일만 지원됩니다")
 
     try:
-        # 임시 디렉토리 생성
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir) / file.filename
-
-            # 파일 저장
-            content = await file.read()
-            with open(temp_path, 'wb') as f:
-                f.write(content)
-
-            # 수정 전 검증
-            before_issues = controller.validate_file(temp_path)
-
-            # 자동 수정 실행
-            fixer = RuleBasedFixer(temp_path.parent)
-            fixes = fixer.run_all_rule_fixes()
-
-            if fixes:
-                fixer.save_fixes()
-
-            # 수정 후 검증
-            after_issues = controller.validate_file(temp_path)
-
-            # 수정된 파일 내용 읽기
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                fixed_data = json.load(f)
-
-            return {
-                "success": True,
-                "before_issues": len(before_issues),
-                "after_issues": len(after_issues),
-                "fixed_count": len(before_issues) - len(after_issues),
-                "fixed_data": fixed_data,
-                "fixes_applied": fixes
-            }
+        # 검증/수정은 작업자 프로세스에서 실행
+        content = await file.read()
+        return await worker_pool.run(auto_fix_task, content, file.filename)
 
+    except PoolSaturatedError:
+        raise saturated_error()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자동 수정 중 오류: {str(e)}")
 
+def save_job_inputs(files: List[UploadFile], target_dir: Path):
+    """작업 입력 파일 저장 (JSON은 visualinfo/ 아래에 두어 비교기/수정기가 찾을 수 있게 함)"""
+    for file in files:
+        name = Path(file.filename).name
+        dest_dir = target_dir / "visualinfo" if name.lower().endswith('.json') else target_dir
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        with open(dest_dir / name, 'wb') as dest:
+            shutil.copyfileobj(file.file, dest)
+
+def create_and_submit_job(job_type: str, files: List[UploadFile],
+                          reference_files: Optional[List[UploadFile]]) -> Dict[str, Any]:
+    """작업 생성, 입력 파일 저장, 제출 (디스크 작업이 많으므로 스레드에서 실행)"""
+    store = job_manager.store
+    job = store.create(job_type)
+    input_dir = store.input_dir(job['id'])
+
+    try:
+        if job_type == JOB_AUTO_FIX:
+            # 배치 ZIP 안의 JSON과 구분되도록 업로드 JSON도 files/ 바로 아래에 저장
+            files_dir = input_dir / "files"
+            files_dir.mkdir()
+            for file in files:
+                with open(files_dir / Path(file.filename).name, 'wb') as dest:
+                    shutil.copyfileobj(file.file, dest)
+        else:
+            save_job_inputs(files, input_dir / "target")
+            save_job_inputs(reference_files, input_dir / "completed")
+    except OSError:
+        store.delete(job['id'])
+        raise
+
+    job_manager.submit(job)
+    return job
+
+def duplicate_filename(files: List[UploadFile]) -> Optional[str]:
+    """저장 시 서로 덮어쓰게 될 (경로를 뺀 이름이 같은) 업로드 파일 이름"""
+    seen = set()
+    for file in files:
+        name = Path(file.filename).name
+        if name in seen:
+            return name
+        seen.add(name)
+    return None
+
+@app.post("/api/jobs", status_code=202)
+async def create_job(
+    job_type: str = Form(...),
+    files: List[UploadFile] = File(...),
+    reference_files: Optional[List[UploadFile]] = File(None)
+):
+    """
+    백그라운드 작업 생성
+    - auto_fix: files(JSON/visualcontent ZIP/배치 ZIP) 일괄 자동 수정
+    - compare: files(원본)와 reference_files(검수완료) 비교
+    진행 상황은 GET /api/jobs/{job_id}, 결과는 GET /api/jobs/{job_id}/result
+    """
+    if job_type not in JOB_TYPES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 작업 종류: {job_type}")
+    if job_type == JOB_COMPARE and not reference_files:
+        raise HTTPException(status_code=400, detail="비교 작업에는 reference_files(검수완료 파일)가 필요합니다")
+    for file in files + (reference_files or []):
+        if not file.filename.lower().endswith(('.json', '.zip')):
+            raise HTTPException(status_code=400, detail=f"JSON 또는 ZIP 파일만 지원됩니다: {file.filename}")
+    for file_list in (files, reference_files or []):
+        duplicate = duplicate_filename(file_list)
+        if duplicate:
+            raise HTTPException(status_code=400, detail=f"같은 이름의 파일이 여러 개 있습니다: {duplicate}")
+    if job_manager.saturated:
+        raise saturated_error("jobs")
+
+    try:
+        return await asyncio.to_thread(create_and_submit_job, job_type, files, reference_files)
+    except PoolSaturatedError:
+        raise saturated_error("jobs")
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=f"작업 입력 저장 중 오류: {str(e)}")
+
+@app.get("/api/jobs")
+async def list_jobs():
+    """작업 목록 (최근 생성 순)"""
+    jobs = await asyncio.to_thread(job_manager.store.list)
+    return {"jobs": jobs, "active": job_manager.active}
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """작업 상태 및 진행률"""
+    job = job_manager.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return job
+
+@app.get("/api/jobs/{job_id}/result")
+async def download_job_result(job_id: str):
+    """작업 결과 다운로드 (auto_fix: 수정된 파일 ZIP, compare: 비교 보고서 JSON)"""
+    store = job_manager.store
+    job = store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    if job['state'] != STATE_DONE:
+        raise HTTPException(status_code=409, detail=f"완료되지 않은 작업입니다 (상태: {job['state']})")
+
+    result_path = store.result_path(job)
+    if not result_path.exists():
+        raise HTTPException(status_code=410, detail="작업 결과가 보존 기간이 지나 삭제되었습니다")
+
+    media_type = "application/zip" if result_path.suffix == ".zip" else "application/json"
+    return FileResponse(result_path, media_type=media_type, filename=f"{job['type']}-{job_id}{result_path.suffix}")
+
 @app.get("/api/system_status")
 async def system_status():
     """
@@ -255,8 +544,8 @@ async def system_status():
         # 메모리 정보
         memory = psutil.virtual_memory()
 
-        # CPU 정보
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU 정보 (직전 호출 이후 평균 - 이벤트 루프를 막지 않음, 기준점은 서버 시작 시 측정)
+        cpu_percent = psutil.cpu_percent(interval=None)
 
         # 디스크 정보
         disk = psutil.disk_usage('/')
@@ -277,9 +566,23 @@ async def system_status():
                 "percent": f"{(disk.used/disk.total)*100:.1f}%"
             },
             "modules": {
-                "quality_controller": "loaded",
-                "ai_analyzer": "loaded",
-                "rule_fixer": "loaded"
+                "ruleset_version": controller.validator.ruleset_version,
+                "rules": len(controller.validator.rules),
+                "rule_timing_sample": RULE_TIMING_SAMPLE,
+                "result_cache": API_USE_CACHE
+            },
+            "worker_pool": {
+                "workers": worker_pool.workers,
+                "running": worker_pool.started,
+                "pending": worker_pool.pending,
+                "max_pending": worker_pool.max_pending,
+                "waiting": worker_pool.waiting,
+                "max_waiting": worker_pool.max_waiting
+            },
+            "jobs": {
+                "workers": job_manager.workers,
+                "active": job_manager.active,
+                "max_active": job_manager.max_active
             }
         }
 
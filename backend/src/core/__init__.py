@@ -5,5 +5,7 @@
 from .quality_controller import QualityController
 from .rule_validator import RuleValidator
 from .rule_fixer import RuleBasedFixer
+from .pattern_matcher import PatternMatcher
+from .incremental_validator import IncrementalValidator
 
-__all__ = ['QualityController', 'RuleValidator', 'RuleBasedFixer']
+__all__ = ['QualityController', 'RuleValidator', 'RuleBasedFixer', 'PatternMatcher', 'IncrementalValidator']
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+증분 검증기
+문서 하나의 검증 상태(요소 레코드, 요소별 이슈, 문서 단위 규칙 그룹 색인)를 유지하고
+요소가 바뀌면 영향을 받는 부분만 다시 평가
+- 요소 단위 규칙(R001, R003~R005, R008~R010): 바뀐 요소만
+- R002: 바뀐 요소가 속했던/속한 텍스트 패턴 그룹만
+- R007: 바뀐 요소가 속했던/속한 텍스트 그룹만
+- R006: 바뀐 요소가 있던/있는 페이지만
+결과는 RuleValidator.validate_all_rules()와 같은 순서의 이슈 목록
+"""
+
+from bisect import insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models.quality_issue import QualityIssue
+from .rule_validator import ElementRecord, RuleValidator
+
+
+def element_key(element: Dict[str, Any]) -> Tuple:
+    """규칙이 읽는 요소 값 (이 값이 같으면 요소의 검증 결과도 같음)"""
+    category = element.get('category', {})
+    bbox = element.get('bbox', {})
+    element_type = category.get('type')
+    return (
+        element.get('id', 'unknown'),
+        element.get('content', {}).get('text', ''),
+        category.get('label', ''),
+        element_type,
+        element.get('pageIndex', 0),
+        bbox.get('top', 0),
+        bbox.get('left', 0),
+        bool(element.get('table', {}).get('cells')) if element_type == 'TABLE' else None
+    )
+
+
+class IncrementalValidator:
+    """문서 하나의 증분 검증 상태"""
+    
+    def __init__(self, file_path: str, validator: Optional[RuleValidator] = None):
+        self.file_path = file_path
+        self.validator = validator or RuleValidator()
+        self.issues: List[QualityIssue] = []
+        self.last_changed = 0  # 마지막 update()에서 다시 평가한 요소 수
+        self._reset()
+    
+    def _reset(self):
+        self._ids: List[str] = []
+        self._keys: List[Tuple] = []
+        self._records: List[ElementRecord] = []
+        self._local: Dict[str, Dict[int, QualityIssue]] = {
+            rule_id: {} for rule_id, _ in self.validator._element_checks
+        }
+        
+        # 문서 단위 규칙 그룹 색인 (그룹 키 → 요소 위치 목록, 위치 순)
+        self._r002_groups: Dict[str, List[int]] = {}
+        self._r007_groups: Dict[str, List[int]] = {}
+        self._pages: Dict[int, List[int]] = {}
+        
+        # 그룹별 이슈 (이슈가 있는 그룹만)
+        self._r002_issues: Dict[str, List[QualityIssue]] = {}
+        self._r007_issues: Dict[int, QualityIssue] = {}
+        self._r006_issues: Dict[int, List[QualityIssue]] = {}
+    
+    def validate(self, data: Dict[str, Any]) -> List[QualityIssue]:
+        """문서 전체 검증 (상태 초기화)"""
+        self._reset()
+        return self.update(data)
+    
+    def update(self, data: Dict[str, Any], changed_ids: Optional[Iterable[str]] = None) -> List[QualityIssue]:
+        """
+        바뀐 문서 다시 검증
+        
+        Args:
+            data: 수정된 visualinfo JSON 데이터 (요소를 제자리에서 수정한 같은 객체여도 됨)
+            changed_ids: 바뀐 요소 ID (None이면 이전 상태와 비교해서 찾음)
+        
+        Returns:
+            validate_all_rules()와 같은 이슈 목록
+        """
+        elements = data.get('elements', [])
+        if not elements:
+            self._reset()
+            self.last_changed = 0
+            self.issues = self.validator.validate_all_rules(data, self.file_path)
+            return self.issues
+        
+        ids = [element.get('id', 'unknown') for element in elements]
+        if ids == self._ids:
+            self._update_in_place(elements, changed_ids)
+        else:
+            self._rebuild(elements, ids)
+        
+        self.issues = self._collect_issues()
+        return self.issues
+    
+    # ------------------------------------------------------------------
+    # 상태 갱신
+    # ------------------------------------------------------------------
+    
+    def _update_in_place(self, elements: List[Dict], changed_ids: Optional[Iterable[str]]):
+        """요소 구성이 같을 때 - 바뀐 요소와 그 요소가 속한 그룹만 다시 평가"""
+        if changed_ids is None or len(set(self._ids)) != len(self._ids):
+            positions = range(len(elements))
+        else:
+            wanted = set(changed_ids)
+            positions = [pos for pos, element_id in enumerate(self._ids) if element_id in wanted]
+        
+        dirty_patterns: Set[str] = set()
+        dirty_texts: Set[str] = set()
+        dirty_pages: Set[int] = set()
+        changed = 0
+        
+        for pos in positions:
+            element = elements[pos]
+            key = element_key(element)
+            if key == self._keys[pos]:
+                if self._records[pos].element is not element:
+                    self._records[pos] = self._records[pos]._replace(element=element)
+                continue
+            
+            changed += 1
+            old = self._records[pos]
+            self._remove_from_groups(pos, old, dirty_patterns, dirty_texts, dirty_pages)
+            record = self._evaluate(pos, element, key)
+            self._add_to_groups(pos, record, dirty_patterns, dirty_texts, dirty_pages)
+        
+        for pattern in dirty_patterns:
+            self._evaluate_r002(pattern)
+        for text in dirty_texts:
+            self._evaluate_r007(text)
+        for page in dirty_pages:
+            self._evaluate_r006(page)
+        
+        self.last_changed = changed
+    
+    def _rebuild(self, elements: List[Dict], ids: List[str]):
+        """요소 추가/삭제/순서 변경 - 바뀌지 않은 요소의 레코드와 이슈는 재사용하고 그룹은 다시 구성"""
+        reusable: Dict[Tuple, Tuple[ElementRecord, List[Tuple[str, QualityIssue]]]] = {}
+        for pos, key in enumerate(self._keys):
+            local = [(rule_id, issues[pos]) for rule_id, issues in self._local.items() if pos in issues]
+            reusable.setdefault(key, (self._records[pos], local))
+        
+        self._reset()
+        self._ids = ids
+        changed = 0
+        
+        for pos, element in enumerate(elements):
+            key = element_key(element)
+            cached = reusable.get(key)
+            self._keys.append(key)
+            
+            if cached is None:
+                changed += 1
+                self._records.append(None)
+                record = self._evaluate(pos, element, key)
+            else:
+                record = cached[0]._replace(element=element)
+                self._records.append(record)
+                for rule_id, issue in cached[1]:
+                    self._local[rule_id][pos] = issue
+            
+            self._add_to_groups(pos, record, set(), set(), set())
+        
+        for pattern in self._r002_groups:
+            self._evaluate_r002(pattern)
+        for text in self._r007_groups:
+            self._evaluate_r007(text)
+        for page in self._pages:
+            self._evaluate_r006(page)
+        
+        self.last_changed = changed
+    
+    def _evaluate(self, pos: int, element: Dict[str, Any], key: Tuple) -> ElementRecord:
+        """요소 하나의 레코드 생성 + 요소 단위 규칙 평가"""
+        validator = self.validator
+        record = validator._to_record(element)
+        self._keys[pos] = key
+        self._records[pos] = record
+        
+        for rule_id, check in validator._element_checks:
+            issue = check(record, self.file_path)
+            if issue:
+                self._local[rule_id][pos] = issue
+            else:
+                self._local[rule_id].pop(pos, None)
+        
+        return record
+    
+    def _remove_from_groups(self, pos: int, record: ElementRecord,
+                            dirty_patterns: Set[str], dirty_texts: Set[str], dirty_pages: Set[int]):
+        pattern = self.validator._r002_pattern(record)
+        if pattern is not None:
+            _remove_position(self._r002_groups, pattern, pos)
+            dirty_patterns.add(pattern)
+        
+        text = self.validator._r007_text(record)
+        if text is not None:
+            _remove_position(self._r007_groups, text, pos)
+            self._r007_issues.pop(pos, None)
+            dirty_texts.add(text)
+        
+        _remove_position(self._pages, record.page_index, pos)
+        dirty_pages.add(record.page_index)
+    
+    def _add_to_groups(self, pos: int, record: ElementRecord,
+                       dirty_patterns: Set[str], dirty_texts: Set[str], dirty_pages: Set[int]):
+        pattern = self.validator._r002_pattern(record)
+        if pattern is not None:
+            insort(self._r002_groups.setdefault(pattern, []), pos)
+            dirty_patterns.add(pattern)
+        
+        text = self.validator._r007_text(record)
+        if text is not None:
+            insort(self._r007_groups.setdefault(text, []), pos)
+            dirty_texts.add(text)
+        
+        insort(self._pages.setdefault(record.page_index, []), pos)
+        dirty_pages.add(record.page_index)
+    
+    # ------------------------------------------------------------------
+    # 문서 단위 규칙 (그룹 하나씩)
+    # ------------------------------------------------------------------
+    
+    def _evaluate_r002(self, pattern: str):
+        positions = self._r002_groups.get(pattern)
+        issues = []
+        if positions:
+            records = [self._records[pos] for pos in positions]
+            issues = self.validator._finalize_r002({pattern: records}, self.file_path)
+        
+        if issues:
+            self._r002_issues[pattern] = issues
+        else:
+            self._r002_issues.pop(pattern, None)
+    
+    def _evaluate_r007(self, text: str):
+        seen_texts = {}
+        for pos in self._r007_groups.get(text, []):
+            issue = self.validator._check_r007(self._records[pos], seen_texts, self.file_path)
+            if issue:
+                self._r007_issues[pos] = issue
+            else:
+                self._r007_issues.pop(pos, None)
+    
+    def _evaluate_r006(self, page: int):
+        positions = self._pages.get(page)
+        issues = []
+        if positions:
+            records = [self._records[pos] for pos in positions]
+            issues = self.validator._finalize_r006({page: records}, self.file_path)
+        
+        if issues:
+            self._r006_issues[page] = issues
+        else:
+            self._r006_issues.pop(page, None)
+    
+    def _collect_issues(self) -> List[QualityIssue]:
+        """규칙 순서 → 요소(그룹 첫 요소) 순서로 이슈 목록 구성 (validate_all_rules()와 같은 순서)"""
+        issues = []
+        for rule_id in self.validator.rules:
+            if rule_id in self._local:
+                by_position = self._local[rule_id]
+                issues.extend(by_position[pos] for pos in sorted(by_position))
+            elif rule_id == "R002":
+                for pattern in sorted(self._r002_issues, key=lambda p: self._r002_groups[p][0]):
+                    issues.extend(self._r002_issues[pattern])
+            elif rule_id == "R006":
+                for page in sorted(self._r006_issues, key=lambda p: self._pages[p][0]):
+                    issues.extend(self._r006_issues[page])
+            elif rule_id == "R007":
+                issues.extend(self._r007_issues[pos] for pos in sorted(self._r007_issues))
+        
+        return issues
+
+
+def _remove_position(groups: Dict[Any, List[int]], key: Any, pos: int):
+    """그룹에서 요소 위치 제거 (빈 그룹은 삭제)"""
+    positions = groups[key]
+    positions.remove(pos)
+    if not positions:
+        del groups[key]
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+라벨링 패턴 매처
+제목/날짜/법령 구조/불필요 요소 패턴을 미리 컴파일해 두고 호출 한 번으로 모든 그룹 적중 여부를 반환
+- '^' 패턴: 하나의 정규식으로 합쳐 텍스트 시작 위치에서만 평가
+- 나머지 패턴: 패턴별 re.search (이미 적중한 그룹의 패턴은 건너뜀)
+  합치면 의미가 달라지는 '^' 패턴(최상위 '|', 번호 그룹/역참조, 전역 플래그)도 여기서 평가
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
+
+
+# 패턴 그룹 정의 (그룹명 → 패턴 목록)
+# '^'로 시작하는 패턴은 텍스트 시작에서만, 나머지는 텍스트 전체에서 검색 (re.search와 동일)
+PATTERN_GROUPS = {
+    # R003: 제목 패턴
+    "title": [
+        r'^[IVX]+\.\s+',           # "I. ", "II. " 등
+        r'^\d+\.\s+[가-힣]+',      # "1. 개요", "2. 현황" 등
+        r'^[가나다라마바사]\.\s+', # "가. ", "나. " 등
+        r'^제\d+[장절조]\s+',      # "제1장 ", "제2절 " 등
+    ],
+    # R004, R010: 날짜 패턴
+    "date": [
+        r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일',      # "2021년 2월 3일"
+        r'^\d{4}\.\s*\d{1,2}\.\s*\d{1,2}$',        # "2021. 2. 3"
+        r'^\d{4}-\d{1,2}-\d{1,2}$',                # "2021-02-03"
+        r'^\d{4}\.\s*\d{1,2}\.\s*\d{1,2}\s*작성',  # "2021. 2. 3 작성"
+    ],
+    # 법령 구조: 법령명 (수정기 전용 - 일반 문장 끝의 '~법'도 적중하므로 예측에는 쓰지 않음)
+    "law_name": [
+        r'[가-힣]+법$',            # ~법
+    ],
+    # 법령 구조: ParaTitle 대상
+    "law_title": [
+        r'^제\s*\d+\s*편',         # 제~편
+        r'^제\s*\d+\s*장',         # 제~장
+        r'^제\s*\d+\s*절',         # 제~절
+        r'^제\s*\d+\s*조',         # 제~조
+    ],
+    # 법령 구조: ListText 대상
+    "list_item": [
+        r'^\s*\(\d+\)',            # (1), (2) 형태
+        r'^\s*\d+\.',              # 1., 2. 형태
+        r'^\s*[가-힣]\.',          # 가., 나. 형태
+        r'^제\s*\d+\s*항',         # 제~항
+    ],
+    # 제거 대상 불필요 요소
+    "unnecessary": [
+        r'(?i:The\s*현안)',
+        r'첨부자료',
+        r'참고자료',
+        r'별첨',
+        r'^로그',
+        r'헤더.*정보',
+    ],
+}
+
+
+# 패턴 어디에 있든 전체에 적용되는 인라인 플래그 - (?i) 등 (범위 지정 (?i:...)은 제외)
+GLOBAL_FLAGS_PATTERN = re.compile(r'\(\?[aiLmsux]+\)')
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """괄호/문자 클래스 밖의 '|'가 있는지 (있으면 '^'가 첫 번째 대안에만 걸림)"""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+            # "[]..."나 "[^]..."의 ']'는 클래스 안의 문자
+            if pattern[i + 1:i + 2] == '^':
+                i += 1
+            if pattern[i + 1:i + 2] == ']':
+                i += 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _can_combine(pattern: str) -> bool:
+    """'^' 패턴을 앞의 '^'만 떼어 전방탐색으로 합쳐도 의미가 같은지
+
+    최상위 '|'가 있으면 '^'가 모든 대안에 걸리게 되고, 번호 그룹/역참조는 합친 정규식에서
+    번호가 바뀌며, 전역 인라인 플래그는 패턴 중간에 올 수 없으므로 합치지 않음
+    """
+    if not pattern.startswith('^'):
+        return False
+    if re.compile(pattern).groups:
+        return False
+    return not _has_top_level_alternation(pattern) and not GLOBAL_FLAGS_PATTERN.search(pattern)
+
+
+class PatternMatcher:
+    """여러 패턴 그룹을 미리 컴파일해 한 번에 평가하는 매처"""
+
+    def __init__(self, pattern_groups: Optional[Dict[str, List[str]]] = None):
+        self.pattern_groups = pattern_groups or PATTERN_GROUPS
+        self._group_names = {}
+        self._anchored = self._compile_anchored(self.pattern_groups)
+        self._unanchored = [
+            (name, re.compile(pattern))
+            for name, patterns in self.pattern_groups.items()
+            for pattern in patterns if not _can_combine(pattern)
+        ]
+        # 패턴 구성 식별자 (패턴이 바뀌면 결과 캐시가 무효화되도록 캐시 키에 포함)
+        source = '\0'.join(
+            f"{name}\0{pattern}" for name, patterns in self.pattern_groups.items() for pattern in patterns
+        )
+        self.fingerprint = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+
+    def _compile_anchored(self, pattern_groups: Dict[str, List[str]]) -> "re.Pattern":
+        """
+        '^' 패턴마다 위치 0에서 평가되는 선택적 전방탐색을 만들어 하나로 연결
+
+        각 전방탐색은 적중 시 이름 있는 그룹에 캡처를 남기므로 match 한 번으로
+        시작 위치 패턴 전체의 적중 여부를 알 수 있다. 텍스트를 훑는 패턴은 여기에
+        넣으면 패턴마다 텍스트를 다시 읽게 되므로 따로 search로 평가한다.
+        합치면 의미가 달라지는 '^' 패턴도 search로 평가한다 (_can_combine).
+        """
+        parts = []
+        for name, patterns in pattern_groups.items():
+            for i, pattern in enumerate(patterns):
+                if not _can_combine(pattern):
+                    continue
+
+                group = f"{name}_{i}"
+                self._group_names[group] = name
+                parts.append(f"(?:(?=(?P<{group}>{pattern[1:]}))|)")
+
+        return re.compile(''.join(parts))
+
+    def match(self, text: str) -> FrozenSet[str]:
+        """텍스트에서 적중한 패턴 그룹명 집합 반환"""
+        if not text:
+            return frozenset()
+
+        groups = self._anchored.match(text).groupdict()
+        hits = {self._group_names[group] for group, value in groups.items() if value is not None}
+
+        for name, regex in self._unanchored:
+            if name not in hits and regex.search(text):
+                hits.add(name)
+
+        return frozenset(hits)
+
+
+@lru_cache(maxsize=None)
+def get_pattern_matcher() -> PatternMatcher:
+    """기본 패턴 그룹으로 컴파일된 공용 매처 (프로세스당 한 번 컴파일)"""
+    return PatternMatcher()
@@ -4,15 +4,30 @@
 전체적인 품질 검수 프로세스를 관리
 """
 
+import io
 import json
 import logging
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import partial
 
 from ..models.quality_issue import QualityIssue
-from .rule_validator import RuleValidator
-from .rule_fixer import RuleBasedFixer
+from ..models.issue_store import IssueStore
+from ..utils import json_codec
+from .rule_validator import RuleStats, RuleValidator
+from .rule_fixer import DocumentFixResult, RuleBasedFixer
+from .incremental_validator import IncrementalValidator
+from ..utils.report_writer import IssueSummary, open_issue_writer
+from ..utils.zip_processor import ZipProcessor
+from ..utils.result_cache import DEFAULT_MAX_BYTES, ResultCache, dump_issues, load_issues
+from ..utils.visualinfo_stream import iter_elements
+
+# 이 크기 이상인 visualinfo는 요소 단위 스트리밍으로 검증 (문서 전체를 dict로 만들지 않음)
+DEFAULT_STREAM_MIN_BYTES = 64 * 1024 * 1024
 
 
 @dataclass
@@ -25,6 +40,7 @@ class QualityReport:
     remaining_issues: int
     issue_types: Dict[str, int]
     processing_time: float
+    profile: Optional[Dict[str, Any]] = None  # 규칙/수정 단계별 소요 시간 (config['profile']일 때)
 
 
 class QualityController:
@@ -33,9 +49,20 @@ class QualityController:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.validator = RuleValidator()
-        self.fixer = None
+        self.zip_processor = ZipProcessor()
+        self.cache = self._setup_cache()
         self.logger = self._setup_logger()
+        self.stream_min_bytes = self.config.get('stream_min_bytes', DEFAULT_STREAM_MIN_BYTES)
+        
+        # 규칙/수정 단계별 시간 측정 (config['profile']이 참일 때만)
+        self.fixer_stats: Optional[RuleStats] = None
+        if self.config.get('profile', False):
+            self.validator.stats = RuleStats()
+            self.fixer_stats = RuleStats()
         
+        # 문서를 직접 받아 수정하므로 모든 파일에 하나만 사용
+        self.fixer = RuleBasedFixer(cache=self.cache, stats=self.fixer_stats)
+    
     def _setup_logger(self) -> logging.Logger:
         """로거 설정"""
         logger = logging.getLogger(__name__)
@@ -48,20 +75,33 @@ class QualityController:
             )
             handler.setFormatter(formatter)
             logger.addHandler(handler)
-            
+        
         return logger
     
+    def _setup_cache(self) -> Optional[ResultCache]:
+        """결과 캐시 설정 (config['use_cache']가 참일 때만 사용)"""
+        if not self.config.get('use_cache', False):
+            return None
+        
+        return ResultCache(
+            cache_dir=self.config.get('cache_dir'),
+            max_bytes=self.config.get('cache_max_bytes', DEFAULT_MAX_BYTES)
+        )
+    
     def validate_file(self, file_path: Path) -> List[QualityIssue]:
-        """단일 파일 검증"""
+        """단일 파일 검증 (ZIP 파일이면 내부 visualinfo JSON만 읽어서 검증)"""
+        if file_path.suffix.lower() == '.zip':
+            return self.validate_zip(file_path)
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if file_path.stat().st_size >= self.stream_min_bytes:
+                return self.validate_stream(partial(open, file_path, 'rb'), str(file_path))
             
-            issues = self.validator.validate_all_rules(data, str(file_path))
-            
-            self.logger.info(f"파일 검증 완료: {file_path} ({len(issues)}개 이슈)")
-            return issues
+            with open(file_path, 'rb') as f:
+                content = f.read()
             
+            return self.validate_content(content, str(file_path))
+        
         except Exception as e:
             self.logger.error(f"파일 검증 실패: {file_path} - {e}")
             return [QualityIssue(
@@ -71,55 +111,298 @@ class QualityController:
                 file_path=str(file_path)
             )]
     
-    def validate_directory(self, dir_path: Path) -> Dict[str, List[QualityIssue]]:
-        """디렉토리 내 모든 JSON 파일 검증"""
-        results = {}
-        json_files = list(dir_path.rglob("*.json"))
+    def validate_data(self, data: Dict, file_path: str) -> List[QualityIssue]:
+        """이미 로드된 visualinfo 데이터 검증"""
+        issues = self.validator.validate_all_rules(data, file_path)
+        
+        self.logger.info(f"파일 검증 완료: {file_path} ({len(issues)}개 이슈)")
+        return issues
+    
+    def incremental_validator(self, data: Dict, file_path: str) -> IncrementalValidator:
+        """
+        편집 중인 문서용 증분 검증기 (첫 검증 결과는 .issues)
+        이후 update(data, changed_ids)로 바뀐 요소와 관련된 규칙만 다시 평가
+        """
+        incremental = IncrementalValidator(file_path, self.validator)
+        incremental.validate(data)
+        return incremental
+    
+    def validate_content(self, content: bytes, file_path: str) -> List[QualityIssue]:
+        """visualinfo JSON 원본 바이트 검증 - 캐시에 같은 내용의 결과가 있으면 파싱/검증 생략"""
+        if len(content) >= self.stream_min_bytes:
+            # 큰 문서는 바이트가 이미 메모리에 있어도 dict 트리를 만들지 않도록 스트리밍
+            return self.validate_stream(partial(io.BytesIO, content), file_path)
+        
+        if self.cache is None:
+            return self.validate_data(json_codec.loads(content), file_path)
+        
+        key = self.cache.make_key("validate", self.validator.ruleset_version, content)
+        cached = self.cache.get(key)
+        if cached is not None:
+            issues = load_issues(cached, file_path)
+            self.logger.info(f"파일 검증 완료 (캐시): {file_path} ({len(issues)}개 이슈)")
+            return issues
+        
+        issues = self.validate_data(json_codec.loads(content), file_path)
+        self.cache.put(key, dump_issues(issues, file_path))
+        return issues
+    
+    def validate_stream(self, open_stream: Callable[[], ContextManager[BinaryIO]], file_path: str) -> List[QualityIssue]:
+        """
+        큰 visualinfo 스트리밍 검증 - 요소를 하나씩 읽어 규칙에 필요한 필드만 보관
         
-        self.logger.info(f"디렉토리 검증 시작: {dir_path} ({len(json_files)}개 파일)")
+        Args:
+            open_stream: 바이너리 스트림을 여는 함수 (캐시를 쓰면 키 계산용으로 한 번 더 호출)
+            file_path: 이슈에 기록할 파일 경로
+        """
+        key = None
+        if self.cache is not None:
+            with open_stream() as stream:
+                key = self.cache.make_stream_key("validate", self.validator.ruleset_version, stream)
+            cached = self.cache.get(key)
+            if cached is not None:
+                issues = load_issues(cached, file_path)
+                self.logger.info(f"파일 검증 완료 (캐시): {file_path} ({len(issues)}개 이슈)")
+                return issues
         
-        for file_path in json_files:
-            issues = self.validate_file(file_path)
+        with open_stream() as stream:
+            issues = self.validator.validate_elements(iter_elements(stream), file_path)
+        
+        self.logger.info(f"파일 검증 완료 (스트리밍): {file_path} ({len(issues)}개 이슈)")
+        if key is not None:
+            self.cache.put(key, dump_issues(issues, file_path))
+        return issues
+    
+    def validate_zip(self, zip_path: Path) -> List[QualityIssue]:
+        """ZIP 파일 내부 visualinfo JSON 검증 (디스크에 압축 해제하지 않음)"""
+        try:
+            entries = self.zip_processor.read_all_visualinfo_bytes(zip_path, self.stream_min_bytes)
+        except Exception as e:
+            self.logger.error(f"ZIP 검증 실패: {zip_path} - {e}")
+            return [QualityIssue(
+                rule_id="SYSTEM_ERROR",
+                severity="error",
+                message=f"ZIP 로드 실패: {str(e)}",
+                file_path=str(zip_path)
+            )]
+        
+        if not entries:
+            self.logger.warning(f"visualinfo JSON이 없는 ZIP: {zip_path}")
+        
+        issues = []
+        for entry, content in entries:
+            try:
+                if content is None:
+                    issues.extend(self.validate_stream(partial(self.zip_processor.open_visualinfo, entry),
+                                                       entry.display_path))
+                else:
+                    issues.extend(self.validate_content(content, entry.display_path))
+            except Exception as e:
+                self.logger.error(f"ZIP 검증 실패: {entry.display_path} - {e}")
+                issues.append(QualityIssue(
+                    rule_id="SYSTEM_ERROR",
+                    severity="error",
+                    message=f"ZIP 로드 실패: {str(e)}",
+                    file_path=entry.display_path
+                ))
+        
+        return issues
+    
+    def validate_directory(self, dir_path: Path, workers: Optional[int] = None,
+                           progress_callback: Optional[Callable[[Path, List[QualityIssue]], None]] = None
+                           ) -> Dict[str, List[QualityIssue]]:
+        """
+        디렉토리 내 모든 JSON 파일 검증
+        config['include_zip']이 True면 ZIP 파일(내부 visualinfo JSON)도 검증
+        (ZIP 내부 문서의 경로는 "x.zip/.../y_visualinfo.json" 형태이며 실제 파일이 아님)
+        
+        Args:
+            dir_path: 검증할 디렉토리
+            workers: 병렬 처리 프로세스 수 (None이면 config['workers'], 1 이하면 순차 처리)
+            progress_callback: 파일 하나의 검증이 끝날 때마다 (파일 경로, 이슈 목록)으로 호출
+        
+        Returns:
+            파일 경로 순으로 정렬된 {파일 경로: 이슈 목록} (이슈가 있는 파일만)
+        """
+        results = {}
+        for file_path, issues in self.iter_directory(dir_path, workers, progress_callback):
             if issues:
                 results[str(file_path)] = issues
         
         return results
     
-    def auto_fix_file(self, file_path: Path) -> List[QualityIssue]:
-        """단일 파일 자동 수정"""
-        if not self.fixer:
-            self.fixer = RuleBasedFixer(file_path.parent)
+    def validate_directory_store(self, dir_path: Path, workers: Optional[int] = None,
+                                 progress_callback: Optional[Callable[[Path, List[QualityIssue]], None]] = None
+                                 ) -> IssueStore:
+        """
+        validate_directory()와 같지만 결과를 열 단위 IssueStore에 모음
+        파일 수십만 개 규모에서 QualityIssue 객체를 모두 들고 있지 않도록 할 때 사용
+        """
+        store = IssueStore()
+        for _, issues in self.iter_directory(dir_path, workers, progress_callback):
+            store.extend(issues)
         
-        try:
-            # 수정 전 검증
-            before_issues = self.validate_file(file_path)
-            
-            # 자동 수정 실행
-            fixes = self.fixer.run_all_rule_fixes()
+        return store
+    
+    def export_issues(self, dir_path: Path, output_path: Path, workers: Optional[int] = None,
+                      progress_callback: Optional[Callable[[Path, List[QualityIssue]], None]] = None
+                      ) -> IssueSummary:
+        """
+        디렉토리 검증 결과를 파일별로 바로 이슈 파일(.jsonl/.parquet)에 기록
+        
+        Returns:
+            누적 집계 (generate_report()에 그대로 전달 가능)
+        """
+        with open_issue_writer(output_path) as writer:
+            for file_path, issues in self.iter_directory(dir_path, workers, progress_callback):
+                writer.write(str(file_path), issues)
+        
+        self.logger.info(f"이슈 목록 저장 완료: {output_path} ({len(writer.summary)}개 이슈)")
+        return writer.summary
+    
+    def iter_directory(self, dir_path: Path, workers: Optional[int] = None,
+                       progress_callback: Optional[Callable[[Path, List[QualityIssue]], None]] = None,
+                       include_zip: Optional[bool] = None) -> Iterator[Tuple[Path, List[QualityIssue]]]:
+        """
+        디렉토리 내 파일을 검증하면서 파일 경로 순으로 (파일 경로, 이슈 목록)을 내보냄
+        include_zip이 None이면 config['include_zip'] (기본 False - JSON 파일만)
+        """
+        if include_zip is None:
+            include_zip = self.config.get('include_zip', False)
+        json_files = list(dir_path.rglob("*.json"))
+        if include_zip:
+            json_files += dir_path.rglob("*.zip")
+        json_files.sort()
+        if workers is None:
+            workers = self.config.get('workers', 1)
+        
+        self.logger.info(f"디렉토리 검증 시작: {dir_path} ({len(json_files)}개 파일, {max(workers, 1)}개 프로세스)")
+        
+        if workers > 1 and len(json_files) > 1:
+            yield from self._iter_files_parallel(json_files, workers, progress_callback)
+        else:
+            for file_path in json_files:
+                issues = self.validate_file(file_path)
+                if progress_callback:
+                    progress_callback(file_path, issues)
+                yield file_path, issues
+    
+    def _iter_files_parallel(self, json_files: List[Path], workers: int,
+                             progress_callback: Optional[Callable[[Path, List[QualityIssue]], None]] = None
+                             ) -> Iterator[Tuple[Path, List[QualityIssue]]]:
+        """
+        프로세스 풀로 파일 검증
+        - progress_callback은 파일 검증이 끝나는 순서대로 바로 호출
+        - 결과는 파일 경로 순으로 내보내되, 앞 파일이 느려도 뒤 파일은 계속 제출해서 처리
+          (끝났지만 아직 내보내지 않은 결과 + 실행 중인 파일은 workers * 16개로 제한)
+        """
+        pending_files = enumerate(json_files)
+        max_outstanding = workers * 16  # 느린 파일 뒤에 결과가 한없이 쌓이지 않도록 제한
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.config,)) as executor:
+            running: Dict[Future, Tuple[int, Path]] = {}
+            finished: Dict[int, Tuple[Path, List[QualityIssue]]] = {}
+            next_index = 0
             
-            # 수정 후 검증
-            after_issues = self.validate_file(file_path)
+            while True:
+                # 빈 자리만큼 다음 파일 제출
+                for index, file_path in islice(pending_files, max_outstanding - len(running) - len(finished)):
+                    running[executor.submit(_validate_file_worker, file_path)] = (index, file_path)
+                if not running:
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, file_path = running.pop(future)
+                    issues = self._worker_result(file_path, future)
+                    if progress_callback:
+                        progress_callback(file_path, issues)
+                    finished[index] = (file_path, issues)
+                
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+    
+    def _worker_result(self, file_path: Path, future: Future) -> List[QualityIssue]:
+        """작업자 결과에서 이슈 목록을 꺼내고 측정값은 이 컨트롤러에 합산"""
+        try:
+            issues, rule_profile, fixer_profile = future.result()
+        except Exception as e:
+            self.logger.error(f"파일 검증 실패: {file_path} - {e}")
+            return [QualityIssue(
+                rule_id="SYSTEM_ERROR",
+                severity="error",
+                message=f"병렬 검증 실패: {str(e)}",
+                file_path=str(file_path)
+            )]
+        
+        if rule_profile is not None:
+            self.validator.stats.merge(rule_profile)
+        if fixer_profile is not None:
+            self.fixer_stats.merge(fixer_profile)
+        return issues
+    
+    def auto_fix_content(self, content: bytes, file_path: str,
+                         stage: Optional[Callable[[str], ContextManager]] = None
+                         ) -> Tuple[List[QualityIssue], DocumentFixResult, List[QualityIssue]]:
+        """
+        visualinfo JSON 원본 바이트 자동 수정 (임시 파일 없이 메모리에서)
+        수정 전 검증 → 수정 → 수정 사항이 있을 때만 수정 후 검증
+        
+        Args:
+            content: visualinfo JSON 원본 바이트
+            file_path: 이슈에 기록할 파일 경로
+            stage: 단계 이름("validate", "fix", "revalidate")을 받아 그 단계를 감싸는 컨텍스트 (시간 측정용)
+        
+        Returns:
+            (수정 전 이슈, 수정 결과, 수정 후 이슈) - 수정 사항이 없으면 수정 후 이슈는 수정 전 이슈
+        """
+        stage = stage or (lambda name: nullcontext())
+        
+        with stage("validate"):
+            before_issues = self.validate_content(content, file_path)
+        
+        with stage("fix"):
+            result = self.fixer.fix_content(content)
+        
+        with stage("revalidate"):
+            after_issues = self.validate_data(result.data, file_path) if result.changed else before_issues
+        
+        return before_issues, result, after_issues
+    
+    def auto_fix_file(self, file_path: Path) -> List[QualityIssue]:
+        """단일 visualinfo JSON 파일 자동 수정 (수정 사항이 있으면 같은 파일에 저장) - 수정 후 이슈 목록"""
+        try:
+            before_issues, result, after_issues = self.auto_fix_content(Path(file_path).read_bytes(), str(file_path))
+            if result.changed:
+                json_codec.dump(result.data, file_path)
             
             fixed_count = len(before_issues) - len(after_issues)
             self.logger.info(f"자동 수정 완료: {file_path} ({fixed_count}개 수정)")
             
             return after_issues
-            
+        
         except Exception as e:
             self.logger.error(f"자동 수정 실패: {file_path} - {e}")
             return []
     
-    def generate_report(self, validation_results: Dict[str, List[QualityIssue]], 
+    def generate_report(self, validation_results: Union[Dict[str, List[QualityIssue]], IssueStore, IssueSummary],
                        processing_time: float) -> QualityReport:
-        """품질 검수 보고서 생성"""
-        total_files = len(validation_results)
-        total_issues = sum(len(issues) for issues in validation_results.values())
-        
-        # 이슈 타입별 분류
-        issue_types = {}
-        for issues in validation_results.values():
-            for issue in issues:
-                issue_types[issue.rule_id] = issue_types.get(issue.rule_id, 0) + 1
+        """품질 검수 보고서 생성 (validate_directory() 결과, IssueStore 또는 export_issues() 집계)"""
+        if isinstance(validation_results, (IssueStore, IssueSummary)):
+            total_files = validation_results.file_count
+            total_issues = len(validation_results)
+            issue_types = validation_results.count_by_rule()
+        else:
+            total_files = len(validation_results)
+            total_issues = sum(len(issues) for issues in validation_results.values())
+            
+            # 이슈 타입별 분류
+            issue_types = {}
+            for issues in validation_results.values():
+                for issue in issues:
+                    issue_types[issue.rule_id] = issue_types.get(issue.rule_id, 0) + 1
         
         return QualityReport(
             total_files=total_files,
@@ -128,9 +411,20 @@ class QualityController:
             fixed_issues=0,  # 자동 수정 후 계산
             remaining_issues=total_issues,
             issue_types=issue_types,
-            processing_time=processing_time
+            processing_time=processing_time,
+            profile=self.profile_report()
         )
     
+    def profile_report(self) -> Optional[Dict[str, Any]]:
+        """규칙/수정 단계별 소요 시간 요약 (측정하지 않으면 None)"""
+        if self.validator.stats is None:
+            return None
+        
+        return {
+            "rules": self.validator.stats.report(),
+            "fixer": self.fixer_stats.report()
+        }
+    
     def export_report(self, report: QualityReport, output_path: Path):
         """보고서 파일로 내보내기"""
         report_data = {
@@ -145,6 +439,8 @@ class QualityController:
             "issue_breakdown": report.issue_types,
             "timestamp": str(Path().cwd())  # 현재 시간으로 대체 가능
         }
+        if report.profile is not None:
+            report_data["profile"] = report.profile
         
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(report_data, f, ensure_ascii=False, indent=2)
@@ -152,6 +448,38 @@ class QualityController:
         self.logger.info(f"보고서 저장 완료: {output_path}")
 
 
+# 프로세스 풀 작업자별 컨트롤러 (작업자 초기화 시 한 번 생성)
+_worker_controller: Optional[QualityController] = None
+
+
+def _init_worker(config: Optional[Dict] = None):
+    """프로세스 풀 작업자 초기화"""
+    global _worker_controller
+    _worker_controller = QualityController(config)
+
+
+def _validate_file_worker(file_path: Path) -> Tuple[List[QualityIssue], Optional[Dict[str, Any]],
+                                                    Optional[Dict[str, Any]]]:
+    """
+    프로세스 풀 작업자에서 단일 파일 검증
+    (이슈 목록, 이 파일의 규칙별 측정값, 수정 단계별 측정값) - 측정하지 않으면 None
+    """
+    if _worker_controller is None:
+        _init_worker()
+    issues = _worker_controller.validate_file(file_path)
+    return issues, _export_stats(_worker_controller.validator.stats), _export_stats(_worker_controller.fixer_stats)
+
+
+def _export_stats(stats: Optional[RuleStats]) -> Optional[Dict[str, Any]]:
+    """작업자 측정값을 보내고 다음 파일을 위해 초기화"""
+    if stats is None:
+        return None
+    
+    exported = stats.export()
+    stats.reset()
+    return exported
+
+
 def main():
     """테스트용 메인 함수"""
     controller = QualityController()
@@ -7,61 +7,147 @@
 - 순서 재정렬
 """
 
-import re
-import json
 import copy
+import logging
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 from ..models.quality_issue import FixResult
+from ..utils import json_codec
+from ..utils.result_cache import ResultCache
+from .pattern_matcher import get_pattern_matcher
+from .rule_validator import RuleStats
+
+
+# 수정 룰셋 버전 (수정 로직이 바뀌면 올려서 결과 캐시 무효화)
+FIXER_VERSION = "1"
+
+
+@dataclass
+class DocumentFixResult:
+    """문서 하나의 자동 수정 결과"""
+    data: Dict[str, Any]                 # 수정된 visualinfo 데이터 (수정 사항이 없으면 원본과 같은 내용)
+    fixes: Dict[str, List[FixResult]]    # 수정 단계별 수정 내역
+    timings: Dict[str, float] = field(default_factory=dict)  # 수정 단계별 소요 시간 (초, 캐시 사용 시 비어 있음)
+    
+    @property
+    def fix_count(self) -> int:
+        return sum(len(fix_list) for fix_list in self.fixes.values())
+    
+    @property
+    def changed(self) -> bool:
+        return self.fix_count > 0
 
 
 class RuleBasedFixer:
-    """룰 기반 자동 수정기"""
+    """
+    룰 기반 자동 수정기
+    fix_document()/fix_content()는 문서 상태를 인스턴스에 남기지 않으므로 인스턴스 하나로
+    여러 문서를 차례로 수정할 수 있음 (stats 누적은 잠그지 않으므로 스레드 간 공유는 지원하지 않음)
+    (extract_dir를 주면 그 폴더의 visualinfo 파일을 읽어 run_all_rule_fixes()/save_fixes()로 수정)
+    """
     
-    def __init__(self, extract_dir: Path):
+    def __init__(self, extract_dir: Optional[Path] = None, cache: Optional[ResultCache] = None,
+                 stats: Optional[RuleStats] = None):
+        """
+        Args:
+            extract_dir: visualinfo 폴더가 있는 압축 해제 폴더 (None이면 문서를 fix_* 메서드로 전달)
+            cache: 수정 결과 캐시
+            stats: 수정 단계별 시간/수정 수를 누적할 RuleStats (여러 문서에 공유 가능)
+        """
         self.extract_dir = extract_dir
         self.visualinfo_file = None
         self.visualinfo_data = {}
+        self.pattern_matcher = get_pattern_matcher()
+        self.cache = cache
+        self.stats = stats
+        self.logger = logging.getLogger(__name__)
+        self.timings: Dict[str, float] = {}  # extract_dir 문서의 수정 단계별 소요 시간 (초)
+        self._content: Optional[bytes] = None
         
         # visualinfo 파일 찾기
-        visualinfo_files = list((extract_dir / "visualinfo").glob("*_visualinfo.json"))
-        if visualinfo_files:
-            self.visualinfo_file = visualinfo_files[0]
-            with open(self.visualinfo_file, 'r', encoding='utf-8') as f:
-                self.visualinfo_data = json.load(f)
+        if extract_dir is not None:
+            visualinfo_files = list((extract_dir / "visualinfo").glob("*_visualinfo.json"))
+            if visualinfo_files:
+                self.visualinfo_file = visualinfo_files[0]
+                self._content = self.visualinfo_file.read_bytes()
+                self.visualinfo_data = json_codec.loads(self._content)
+    
+    def fix_document(self, data: Dict[str, Any]) -> DocumentFixResult:
+        """이미 로드된 visualinfo 데이터 수정 (data를 제자리에서 수정, 캐시 사용 안 함)"""
+        fixes, timings = self._run_all_rule_fixes(data)
+        return DocumentFixResult(data, fixes, timings)
+    
+    def fix_content(self, content: bytes) -> DocumentFixResult:
+        """visualinfo JSON 원본 바이트 수정 (캐시에 같은 내용의 결과가 있으면 재사용)"""
+        return self._fix_content(content)
+    
+    def fix_file(self, json_path: Path, save: bool = True) -> DocumentFixResult:
+        """visualinfo JSON 파일 수정 (save가 참이고 수정 사항이 있으면 같은 파일에 저장)"""
+        result = self.fix_content(Path(json_path).read_bytes())
+        
+        if save and result.changed:
+            json_codec.dump(result.data, json_path)
+        return result
     
-    def fix_unnecessary_elements(self) -> List[FixResult]:
+    def _fix_content(self, content: bytes, data: Optional[Dict[str, Any]] = None) -> DocumentFixResult:
+        """원본 바이트 기준 캐시 조회 후 수정 (data가 있으면 이미 파싱한 문서로 사용)"""
+        cache_key = None
+        if self.cache is not None:
+            # 같은 내용을 이전에 수정한 결과가 있으면 원본 파싱 없이 수정 결과를 바로 사용
+            version = f"{FIXER_VERSION}-{self.pattern_matcher.fingerprint}"
+            cache_key = self.cache.make_key("fix", version, content)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("캐시된 수정 결과 사용")
+                fixes = {
+                    category: [FixResult.from_dict(fix) for fix in fix_list]
+                    for category, fix_list in cached['fixes'].items()
+                }
+                if cached['data'] is not None:
+                    return DocumentFixResult(cached['data'], fixes)
+                # 수정 사항이 없던 문서는 원본 그대로
+                return DocumentFixResult(data if data is not None else json_codec.loads(content), fixes)
+        
+        if data is None:
+            data = json_codec.loads(content)
+        fixes, timings = self._run_all_rule_fixes(data)
+        
+        if cache_key is not None:
+            # 수정 사항이 없으면 원본과 같으므로 데이터는 저장하지 않음
+            has_fixes = any(fixes.values())
+            self.cache.put(cache_key, {
+                'fixes': {
+                    category: [fix.to_dict() for fix in fix_list]
+                    for category, fix_list in fixes.items()
+                },
+                'data': data if has_fixes else None
+            })
+        
+        return DocumentFixResult(data, fixes, timings)
+    
+    def fix_unnecessary_elements(self, data: Optional[Dict[str, Any]] = None) -> List[FixResult]:
         """불필요한 요소 제거"""
         fixes = []
         
-        if not self.visualinfo_data:
+        data = self.visualinfo_data if data is None else data
+        if not data:
             return fixes
         
-        elements = self.visualinfo_data.get('elements', [])
+        elements = data.get('elements', [])
         original_count = len(elements)
         
-        # 불필요한 텍스트 패턴
-        unnecessary_patterns = [
-            r"The\s*현안",
-            r"첨부자료", 
-            r"참고자료",
-            r"별첨",
-            r"^로그",
-            r"헤더.*정보"
-        ]
-        
-        # 제거할 요소들 찾기
+        # 제거할 요소들 찾기 (불필요한 텍스트 패턴)
         elements_to_remove = []
         for i, element in enumerate(elements):
             text = element.get('content', {}).get('text', '')
             if not text:
                 continue
-                
-            for pattern in unnecessary_patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    elements_to_remove.append(i)
-                    break
+            
+            if "unnecessary" in self.pattern_matcher.match(text):
+                elements_to_remove.append(i)
         
         # 뒤에서부터 제거 (인덱스 변경 방지)
         for i in reversed(elements_to_remove):
@@ -74,18 +160,19 @@ class RuleBasedFixer:
             ))
         
         if fixes:
-            self.visualinfo_data['elements'] = elements
+            data['elements'] = elements
         
         return fixes
     
-    def fix_label_types(self) -> List[FixResult]:
+    def fix_label_types(self, data: Optional[Dict[str, Any]] = None) -> List[FixResult]:
         """라벨 타입 자동 수정"""
         fixes = []
         
-        if not self.visualinfo_data:
+        data = self.visualinfo_data if data is None else data
+        if not data:
             return fixes
         
-        elements = self.visualinfo_data.get('elements', [])
+        elements = data.get('elements', [])
         
         for element in elements:
             text = element.get('content', {}).get('text', '').strip()
@@ -111,46 +198,33 @@ class RuleBasedFixer:
         """올바른 라벨 타입 결정"""
         if not text:
             return current_label
-
+        
         text = text.strip()
-
+        
+        pattern_hits = self.pattern_matcher.match(text)
+        
         # R003: 법령 구조 라벨링
-        # ParaTitle로 변경해야 할 패턴들
-        if re.search(r'[가-힣]+법$', text):  # ~법
-            element['category']['type'] = 'HEADING'
-            return 'ParaTitle'
-        elif re.search(r'^제\s*\d+\s*편', text):  # 제~편
-            element['category']['type'] = 'HEADING'
-            return 'ParaTitle'
-        elif re.search(r'^제\s*\d+\s*장', text):  # 제~장
-            element['category']['type'] = 'HEADING'
-            return 'ParaTitle'
-        elif re.search(r'^제\s*\d+\s*절', text):  # 제~절
-            element['category']['type'] = 'HEADING'
-            return 'ParaTitle'
-        elif re.search(r'^제\s*\d+\s*조', text):  # 제~조
+        # ParaTitle로 변경해야 할 패턴들 (~법, 제~편/장/절/조)
+        if "law_name" in pattern_hits or "law_title" in pattern_hits:
             element['category']['type'] = 'HEADING'
             return 'ParaTitle'
         
-        # ListText로 변경해야 할 패턴들
-        elif (re.search(r'^\s*\(\d+\)', text) or  # (1), (2) 형태
-              re.search(r'^\s*\d+\.', text) or    # 1., 2. 형태
-              re.search(r'^\s*[가-힣]\.', text) or # 가., 나. 형태
-              '항' in text):                      # 항이 포함된 내용
+        # ListText로 변경해야 할 패턴들 ((1), 1., 가. 형태 또는 항이 포함된 내용)
+        elif "list_item" in pattern_hits or '항' in text:
             element['category']['type'] = 'LIST'
             return 'ListText'
-
+        
         # RegionTitle이면서 텍스트에 '원문' 또는 '번역문'이 포함된 경우 ParaTitle로 변경
         if current_label == "RegionTitle" and ("원문" in text or "번역문" in text):
             return "ParaTitle"
-
+        
         # R001: '원문' / '번역문'이면서 ListText인 경우 ParaText로 변경
         if text in {"원문", "번역문"} and current_label == "ListText":
             # 타입도 함께 변경
             if 'category' in element and 'type' in element['category']:
                 element['category']['type'] = 'PARAGRAPH'
             return 'ParaText'
-
+        
         return current_label
     
     def _is_legal_content(self, text: str) -> bool:
@@ -162,14 +236,15 @@ class RuleBasedFixer:
         
         return any(keyword in text for keyword in legal_keywords)
     
-    def fix_element_order(self) -> List[FixResult]:
+    def fix_element_order(self, data: Optional[Dict[str, Any]] = None) -> List[FixResult]:
         """요소 순서 정렬"""
         fixes = []
         
-        if not self.visualinfo_data:
+        data = self.visualinfo_data if data is None else data
+        if not data:
             return fixes
         
-        elements = self.visualinfo_data.get('elements', [])
+        elements = data.get('elements', [])
         original_order = [e.get('id') for e in elements]
         
         # 페이지별로 그룹화 후 Y좌표 기준 정렬
@@ -191,7 +266,7 @@ class RuleBasedFixer:
         new_order = [e.get('id') for e in sorted_elements]
         
         if original_order != new_order:
-            self.visualinfo_data['elements'] = sorted_elements
+            data['elements'] = sorted_elements
             fixes.append(FixResult(
                 success=True,
                 description="요소 순서 정렬 완료",
@@ -201,14 +276,15 @@ class RuleBasedFixer:
         
         return fixes
     
-    def fix_table_structure(self) -> List[FixResult]:
+    def fix_table_structure(self, data: Optional[Dict[str, Any]] = None) -> List[FixResult]:
         """테이블 구조 수정"""
         fixes = []
         
-        if not self.visualinfo_data:
+        data = self.visualinfo_data if data is None else data
+        if not data:
             return fixes
         
-        elements = self.visualinfo_data.get('elements', [])
+        elements = data.get('elements', [])
         table_elements = [e for e in elements if e.get('category', {}).get('type') == 'TABLE']
         
         for table in table_elements:
@@ -249,14 +325,15 @@ class RuleBasedFixer:
         
         return fixed_table
     
-    def remove_forbidden_tags(self) -> List[FixResult]:
+    def remove_forbidden_tags(self, data: Optional[Dict[str, Any]] = None) -> List[FixResult]:
         """금지된 태그 제거"""
         fixes = []
         
-        if not self.visualinfo_data:
+        data = self.visualinfo_data if data is None else data
+        if not data:
             return fixes
         
-        elements = self.visualinfo_data.get('elements', [])
+        elements = data.get('elements', [])
         forbidden_tags = ['연결', '국가명', '정책명', '법률명', '요약']
         
         for element in elements:
@@ -280,27 +357,50 @@ class RuleBasedFixer:
         return fixes
     
     def run_all_rule_fixes(self) -> Dict[str, List[FixResult]]:
-        """모든 룰 기반 수정 실행"""
+        """extract_dir 문서에 모든 룰 기반 수정 실행 (캐시된 결과가 있으면 재사용)"""
+        if self._content is None:
+            return {}
+        
+        result = self._fix_content(self._content, self.visualinfo_data)
+        self.visualinfo_data = result.data
+        self.timings = result.timings
+        return result.fixes
+    
+    def _run_all_rule_fixes(self, data: Dict[str, Any]) -> Tuple[Dict[str, List[FixResult]], Dict[str, float]]:
+        """모든 룰 기반 수정 실행 - (수정 단계별 수정 내역, 수정 단계별 소요 시간)"""
         all_fixes = {}
+        timings = {}
+        
+        if self.stats is not None:
+            self.stats.add_document(len(data.get('elements', [])))
         
         print("  불필요한 요소 제거 중...")
-        all_fixes['unnecessary'] = self.fix_unnecessary_elements()
+        all_fixes['unnecessary'] = self._timed('unnecessary', self.fix_unnecessary_elements, data, timings)
         
         print("  라벨 타입 수정 중...")
-        all_fixes['labels'] = self.fix_label_types()
+        all_fixes['labels'] = self._timed('labels', self.fix_label_types, data, timings)
         
         # 순서 정렬 비활성화 (기존 순서 유지)
         # print("  요소 순서 정렬 중...")
-        # all_fixes['order'] = self.fix_element_order()
+        # all_fixes['order'] = self.fix_element_order(data)
         all_fixes['order'] = []
         
         print("  테이블 구조 수정 중...")
-        all_fixes['tables'] = self.fix_table_structure()
+        all_fixes['tables'] = self._timed('tables', self.fix_table_structure, data, timings)
         
         print("  금지된 태그 제거 중...")
-        all_fixes['tags'] = self.remove_forbidden_tags()
+        all_fixes['tags'] = self._timed('tags', self.remove_forbidden_tags, data, timings)
         
-        return all_fixes
+        return all_fixes, timings
+    
+    def _timed(self, category: str, fix, data: Dict[str, Any], timings: Dict[str, float]) -> List[FixResult]:
+        """수정 단계 실행 시간 기록"""
+        start = time.perf_counter()
+        fixes = fix(data)
+        timings[category] = time.perf_counter() - start
+        if self.stats is not None:
+            self.stats.add(category, timings[category], len(fixes))
+        return fixes
     
     def save_fixes(self) -> bool:
         """수정된 결과 저장 (백업 없이)"""
@@ -309,11 +409,10 @@ class RuleBasedFixer:
         
         try:
             # 수정된 데이터 저장
-            with open(self.visualinfo_file, 'w', encoding='utf-8') as f:
-                json.dump(self.visualinfo_data, f, ensure_ascii=False, indent=2)
+            json_codec.dump(self.visualinfo_data, self.visualinfo_file)
             
             return True
-            
+        
         except Exception as e:
             print(f"룰 기반 수정 결과 저장 실패: {e}")
             return False
@@ -5,9 +5,204 @@
 
 import json
 import re
-from typing import Dict, List, Any
+import time
+from bisect import bisect_left
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Any, FrozenSet, NamedTuple, Optional, Set
 
 from ..models.quality_issue import QualityIssue, create_label_issue, create_content_issue, create_structure_issue
+from .pattern_matcher import get_pattern_matcher
+
+
+# 규칙별 상수 정의
+FORBIDDEN_LABELS = ['연결', '국가명', '정책명', '법률명', '요약']
+
+PARATEXT_TARGET_TEXTS = {"원문", "번역문", "본문"}
+
+# R002 텍스트 패턴 생성용 (숫자, 특수문자 제거)
+R002_STRIP_PATTERN = re.compile(r'[0-9\W]+')
+
+# R006 같은 줄로 간주할 top 좌표 차이 (pt)
+R006_LINE_TOLERANCE = 3.0
+
+# validate_elements()에서 빈 스트림 확인용
+_NO_ELEMENT = object()
+
+# 검증 룰셋 버전 (룰 로직이 바뀌면 올려서 결과 캐시 무효화)
+RULESET_VERSION = "1"
+
+
+class ElementRecord(NamedTuple):
+    """규칙 평가용 정규화 요소 (요소당 한 번만 생성)"""
+    element: Dict[str, Any]
+    element_id: str
+    text: str
+    label: str
+    element_type: Optional[str]
+    page_index: int
+    top: float
+    left: float
+    pattern_hits: FrozenSet[str]
+
+
+def reading_order_ranks(records: List[ElementRecord], tolerance: float = R006_LINE_TOLERANCE) -> List[int]:
+    """
+    요소별 읽기 순서 순위 계산 (O(n log n))
+    
+    top 기준으로 정렬한 뒤 줄 시작 요소와의 top 차이가 tolerance 이하인 요소들을
+    같은 줄로 묶고, 줄 안에서는 left 순서로 정렬한다. 동일 위치는 원래 순서를 유지한다.
+    
+    Returns:
+        records[i]의 읽기 순서 순위 목록
+    """
+    by_top = sorted(range(len(records)), key=lambda i: records[i].top)
+    
+    line_of = [0] * len(records)
+    line = 0
+    line_top = None
+    for i in by_top:
+        if line_top is None or records[i].top - line_top > tolerance:
+            line += 1
+            line_top = records[i].top
+        line_of[i] = line
+    
+    ordered = sorted(range(len(records)), key=lambda i: (line_of[i], records[i].left, i))
+    
+    ranks = [0] * len(records)
+    for rank, i in enumerate(ordered):
+        ranks[i] = rank
+    return ranks
+
+
+def longest_increasing_subsequence(values: List[int]) -> Set[int]:
+    """
+    최장 증가 부분 수열의 인덱스 집합 (O(n log n))
+    
+    이 집합에 속하지 않는 요소들이 올바른 순서를 만들기 위해 옮겨야 하는 최소 요소 집합이다.
+    """
+    tails = []          # 길이별 마지막 값
+    tail_indices = []   # 길이별 마지막 인덱스
+    previous = [-1] * len(values)
+    
+    for i, value in enumerate(values):
+        pos = bisect_left(tails, value)
+        if pos > 0:
+            previous[i] = tail_indices[pos - 1]
+        if pos == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[pos] = value
+            tail_indices[pos] = i
+    
+    result = set()
+    i = tail_indices[-1] if tail_indices else -1
+    while i != -1:
+        result.add(i)
+        i = previous[i]
+    return result
+
+
+class RuleStats:
+    """규칙(또는 수정 단계)별 평가 시간/호출 수/이슈 수 누적
+    RuleValidator.stats / RuleBasedFixer.stats에 지정했을 때만 수집
+    
+    "pattern_scan"은 요소 정규화 시 모든 패턴 규칙을 한 번에 평가하는 공통 비용
+    """
+    
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.issues: Dict[str, int] = {}
+        self.documents = 0
+        self.elements = 0
+    
+    def add_document(self, element_count: int):
+        """처리한 문서 수/요소 수 누적"""
+        self.documents += 1
+        self.elements += element_count
+    
+    def add(self, name: str, seconds: float, issues: int = 0):
+        """직접 잰 실행 시간 한 번 누적"""
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.issues[name] = self.issues.get(name, 0) + issues
+    
+    def timed(self, name: str, fn: Callable, count_calls: bool = True) -> Callable:
+        """fn 호출 시간을 name 항목에 누적하는 래퍼
+        
+        count_calls=False면 시간/이슈만 더하고 호출 수는 세지 않음
+        (한 규칙을 누적 단계와 마무리 단계로 나눠 잴 때 마무리 쪽에 사용)
+        """
+        seconds, calls, issues = self.seconds, self.calls, self.issues
+        perf_counter = time.perf_counter
+        
+        def wrapper(*args):
+            start = perf_counter()
+            result = fn(*args)
+            seconds[name] = seconds.get(name, 0.0) + perf_counter() - start
+            if count_calls:
+                calls[name] = calls.get(name, 0) + 1
+            if isinstance(result, list):
+                issues[name] = issues.get(name, 0) + len(result)
+            elif isinstance(result, QualityIssue):
+                issues[name] = issues.get(name, 0) + 1
+            return result
+        
+        return wrapper
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """{항목: {'seconds', 'calls', 'issues'}}"""
+        return {
+            name: {
+                'seconds': self.seconds[name],
+                'calls': self.calls.get(name, 0),
+                'issues': self.issues.get(name, 0)
+            }
+            for name in self.seconds
+        }
+    
+    def export(self) -> Dict[str, Any]:
+        """다른 프로세스로 보낼 누적 값 (merge()로 합산)"""
+        return {'documents': self.documents, 'elements': self.elements, 'items': self.snapshot()}
+    
+    def merge(self, exported: Dict[str, Any]):
+        """다른 프로세스에서 받은 export() 값 합산"""
+        self.documents += exported['documents']
+        self.elements += exported['elements']
+        for name, values in exported['items'].items():
+            self.seconds[name] = self.seconds.get(name, 0.0) + values['seconds']
+            self.calls[name] = self.calls.get(name, 0) + values['calls']
+            self.issues[name] = self.issues.get(name, 0) + values['issues']
+    
+    def report(self) -> Dict[str, Any]:
+        """보고서용 요약 (항목은 소요 시간 내림차순)"""
+        total = sum(self.seconds.values())
+        items = []
+        for name, values in sorted(self.snapshot().items(), key=lambda item: -item[1]['seconds']):
+            items.append({
+                'name': name,
+                'seconds': round(values['seconds'], 6),
+                'share': round(values['seconds'] / total, 4) if total > 0 else 0.0,
+                'calls': values['calls'],
+                'issues': values['issues'],
+                'us_per_element': round(values['seconds'] / self.elements * 1e6, 3) if self.elements else 0.0
+            })
+        
+        return {
+            'documents': self.documents,
+            'elements': self.elements,
+            'total_seconds': round(total, 6),
+            'items': items
+        }
+    
+    def reset(self):
+        """누적 값 모두 초기화"""
+        self.seconds.clear()
+        self.calls.clear()
+        self.issues.clear()
+        self.documents = 0
+        self.elements = 0
 
 
 class RuleValidator:
@@ -15,6 +210,22 @@ class RuleValidator:
     
     def __init__(self):
         self.rules = self._load_validation_rules()
+        self.pattern_matcher = get_pattern_matcher()
+        self.ruleset_version = f"{RULESET_VERSION}-{self.pattern_matcher.fingerprint}"
+        
+        # 규칙별 시간 측정 (None이면 측정하지 않음 - 측정 비용 없음)
+        self.stats: Optional[RuleStats] = None
+        
+        # 단일 순회에서 요소마다 평가하는 규칙
+        self._element_checks = [
+            ("R001", self._check_r001),
+            ("R003", self._check_r003),
+            ("R004", self._check_r004),
+            ("R005", self._check_r005),
+            ("R008", self._check_r008),
+            ("R009", self._check_r009),
+            ("R010", self._check_r010),
+        ]
     
     def _load_validation_rules(self) -> Dict[str, Any]:
         """검증 규칙 로드"""
@@ -81,8 +292,19 @@ class RuleValidator:
             }
         }
     
-    def validate_all_rules(self, data: Dict[str, Any], file_path: str) -> List[QualityIssue]:
-        """모든 규칙 검증"""
+    def validate_all_rules(self, data: Dict[str, Any], file_path: str, fused: bool = True) -> List[QualityIssue]:
+        """
+        모든 규칙 검증
+        
+        Args:
+            data: visualinfo JSON 데이터
+            file_path: 이슈에 기록할 파일 경로
+            fused: True면 요소를 한 번만 순회하며 모든 규칙을 평가 (기본값),
+                   False면 규칙별로 요소를 따로 순회
+        
+        Returns:
+            규칙 순서(R001~R010)대로 정렬된 이슈 목록
+        """
         issues = []
         
         elements = data.get('elements', [])
@@ -90,6 +312,9 @@ class RuleValidator:
             issues.append(create_structure_issue("STRUCTURE_001", "요소가 없습니다", file_path))
             return issues
         
+        if fused:
+            return self._validate_fused(elements, file_path)
+        
         # 각 규칙 실행
         issues.extend(self._validate_r001_empty_text(elements, file_path))
         issues.extend(self._validate_r002_label_consistency(elements, file_path))
@@ -104,329 +329,381 @@ class RuleValidator:
         
         return issues
     
-    def _validate_r001_empty_text(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
-        """R001: 빈 텍스트 검증"""
-        issues = []
-        
+    def validate_elements(self, elements: Iterable[Dict[str, Any]], file_path: str) -> List[QualityIssue]:
+        """
+        요소 스트림 검증 (visualinfo_stream.iter_elements() 등 문서 전체를 올리지 않을 때)
+        요소를 한 번만 순회하며 validate_all_rules()와 같은 이슈 목록을 만듦
+        """
+        elements = iter(elements)
+        first = next(elements, _NO_ELEMENT)
+        if first is _NO_ELEMENT:
+            return [create_structure_issue("STRUCTURE_001", "요소가 없습니다", file_path)]
+        return self._validate_fused(chain((first,), elements), file_path)
+    
+    def _validate_fused(self, elements: Iterable[Dict], file_path: str) -> List[QualityIssue]:
+        """단일 순회 검증 - 요소별 규칙은 즉시 평가하고 문서 단위 규칙은 누적 후 평가"""
+        rule_issues = {rule_id: [] for rule_id in self.rules}
+        
+        # 문서 단위 규칙용 누적 자료
+        text_patterns = {}  # R002
+        page_groups = {}    # R006
+        seen_texts = {}     # R007
+        
+        to_record = self._to_record
+        element_checks = self._element_checks
+        collect_r002, check_r007 = self._collect_r002, self._check_r007
+        finalize_r002, finalize_r006 = self._finalize_r002, self._finalize_r006
+        
+        stats = self.stats
+        if stats is not None:
+            to_record = stats.timed("pattern_scan", to_record)
+            element_checks = [(rule_id, stats.timed(rule_id, check)) for rule_id, check in element_checks]
+            collect_r002, check_r007 = stats.timed("R002", collect_r002), stats.timed("R007", check_r007)
+            # R002는 요소별 누적 호출 수만 세고 문서 단위 마무리는 시간/이슈만 합산
+            finalize_r002 = stats.timed("R002", finalize_r002, count_calls=False)
+            finalize_r006 = stats.timed("R006", finalize_r006)
+        
+        element_count = 0
         for element in elements:
-            text = element.get('content', {}).get('text', '').strip()
-            element_id = element.get('id', 'unknown')
-            page_index = element.get('pageIndex', 0)
+            element_count += 1
+            record = to_record(element)
             
-            if not text:
-                issues.append(QualityIssue(
-                    rule_id="R001",
-                    severity="error",
-                    message="빈 텍스트 요소",
-                    file_path=file_path,
-                    element_id=element_id,
-                    page_index=page_index,
-                    category="label_content",
-                    suggested_fix="요소 제거 또는 텍스트 추가",
-                    auto_fixable=True
-                ))
+            for rule_id, check in element_checks:
+                issue = check(record, file_path)
+                if issue:
+                    rule_issues[rule_id].append(issue)
+            
+            collect_r002(record, text_patterns)
+            page_groups.setdefault(record.page_index, []).append(record)
+            
+            issue = check_r007(record, seen_texts, file_path)
+            if issue:
+                rule_issues["R007"].append(issue)
+        
+        if stats is not None:
+            stats.add_document(element_count)
+        
+        rule_issues["R002"] = finalize_r002(text_patterns, file_path)
+        rule_issues["R006"] = finalize_r006(page_groups, file_path)
+        
+        issues = []
+        for rule_id in self.rules:
+            issues.extend(rule_issues[rule_id])
         
         return issues
     
-    def _validate_r002_label_consistency(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
-        """R002: 라벨 타입 일관성 검증"""
-        issues = []
+    def _to_record(self, element: Dict[str, Any]) -> ElementRecord:
+        """요소를 규칙 평가용 레코드로 정규화 (패턴 규칙은 여기서 한 번에 평가)"""
+        category = element.get('category', {})
+        bbox = element.get('bbox', {})
+        text = element.get('content', {}).get('text', '').strip()
+        return ElementRecord(
+            element=element,
+            element_id=element.get('id', 'unknown'),
+            text=text,
+            label=category.get('label', ''),
+            element_type=category.get('type'),
+            page_index=element.get('pageIndex', 0),
+            top=bbox.get('top', 0),
+            left=bbox.get('left', 0),
+            pattern_hits=self.pattern_matcher.match(text)
+        )
+    
+    def _to_records(self, elements: List[Dict]) -> List[ElementRecord]:
+        """요소 목록 정규화"""
+        return [self._to_record(element) for element in elements]
+    
+    # ------------------------------------------------------------------
+    # 요소 단위 규칙 (레코드 하나로 판단)
+    # ------------------------------------------------------------------
+    
+    def _check_r001(self, record: ElementRecord, file_path: str) -> Optional[QualityIssue]:
+        """R001: 빈 텍스트 검증"""
+        if record.text:
+            return None
+        
+        return QualityIssue(
+            rule_id="R001",
+            severity="error",
+            message="빈 텍스트 요소",
+            file_path=file_path,
+            element_id=record.element_id,
+            page_index=record.page_index,
+            category="label_content",
+            suggested_fix="요소 제거 또는 텍스트 추가",
+            auto_fixable=True
+        )
+    
+    def _check_r003(self, record: ElementRecord, file_path: str) -> Optional[QualityIssue]:
+        """R003: 제목 패턴 검증"""
+        if "title" in record.pattern_hits and record.label not in ['ParaTitle', 'DocTitle']:
+            return create_label_issue(
+                "R003",
+                record.element_id,
+                record.label,
+                "ParaTitle",
+                file_path,
+                record.page_index
+            )
+        return None
+    
+    def _check_r004(self, record: ElementRecord, file_path: str) -> Optional[QualityIssue]:
+        """R004: 날짜 형식 검증"""
+        if "date" in record.pattern_hits and record.label != 'Date':
+            return create_label_issue(
+                "R004",
+                record.element_id,
+                record.label,
+                "Date",
+                file_path,
+                record.page_index
+            )
+        return None
+    
+    def _check_r005(self, record: ElementRecord, file_path: str) -> Optional[QualityIssue]:
+        """R005: 테이블 구조 검증"""
+        if record.element_type != 'TABLE':
+            return None
+        
+        table_data = record.element.get('table', {})
+        cells = table_data.get('cells', [])
+        
+        if cells:
+            return None
+        
+        return QualityIssue(
+            rule_id="R005",
+            severity="error",
+            message="테이블에 셀이 없습니다",
+            file_path=file_path,
+            element_id=record.element_id,
+            category="structure",
+            auto_fixable=False
+        )
+    
+    def _r007_text(self, record: ElementRecord) -> Optional[str]:
+        """R007: 중복 비교 대상 텍스트 (너무 짧은 텍스트는 제외)"""
+        text = record.text
+        if not text or len(text) < 5:
+            return None
+        return text
+    
+    def _check_r007(self, record: ElementRecord, seen_texts: Dict[str, str], file_path: str) -> Optional[QualityIssue]:
+        """R007: 중복 요소 검증 (seen_texts에 첫 등장 요소를 누적)"""
+        text = self._r007_text(record)
+        
+        if text is None:
+            return None
+        
+        if text not in seen_texts:
+            seen_texts[text] = record.element_id
+            return None
+        
+        return QualityIssue(
+            rule_id="R007",
+            severity="warning",
+            message=f"중복된 텍스트: {text[:50]}...",
+            file_path=file_path,
+            element_id=record.element_id,
+            category="consistency",
+            suggested_fix="중복 요소 제거 또는 병합",
+            auto_fixable=True,
+            metadata={
+                "duplicate_of": seen_texts[text],
+                "text": text
+            }
+        )
+    
+    def _check_r008(self, record: ElementRecord, file_path: str) -> Optional[QualityIssue]:
+        """R008: 금지된 라벨 검증"""
+        if record.label not in FORBIDDEN_LABELS:
+            return None
+        
+        return QualityIssue(
+            rule_id="R008",
+            severity="error",
+            message=f"금지된 라벨 사용: {record.label}",
+            file_path=file_path,
+            element_id=record.element_id,
+            category="label_type",
+            suggested_fix="적절한 라벨로 변경",
+            auto_fixable=True
+        )
+    
+    def _check_r009(self, record: ElementRecord, file_path: str) -> Optional[QualityIssue]:
+        """R009: 특정 텍스트 라벨 검증 ('원문', '번역문', '본문' → ParaText)"""
+        if record.text in PARATEXT_TARGET_TEXTS and record.label != 'ParaText':
+            return create_label_issue(
+                "R009",
+                record.element_id,
+                record.label,
+                "ParaText",
+                file_path,
+                record.page_index
+            )
+        return None
+    
+    def _check_r010(self, record: ElementRecord, file_path: str) -> Optional[QualityIssue]:
+        """R010: 날짜 패턴 라벨 검증"""
+        if "date" in record.pattern_hits and record.label != 'Date':
+            return create_label_issue(
+                "R010",
+                record.element_id,
+                record.label,
+                "Date",
+                file_path,
+                record.page_index
+            )
+        return None
+    
+    # ------------------------------------------------------------------
+    # 문서 단위 규칙 (누적 후 평가)
+    # ------------------------------------------------------------------
+    
+    def _r002_pattern(self, record: ElementRecord) -> Optional[str]:
+        """R002: 요소의 텍스트 패턴 (숫자, 특수문자 제거 / 그룹화 대상이 아니면 None)"""
+        if not record.text or not record.label:
+            return None
         
-        # 유사한 텍스트 패턴 그룹화
-        text_patterns = {}
+        pattern = R002_STRIP_PATTERN.sub('', record.text.lower())
         
-        for element in elements:
-            text = element.get('content', {}).get('text', '').strip()
-            label = element.get('category', {}).get('label', '')
-            element_id = element.get('id', 'unknown')
-            
-            if not text or not label:
-                continue
-            
-            # 텍스트 패턴 생성 (숫자, 특수문자 제거)
-            pattern = re.sub(r'[0-9\W]+', '', text.lower())
-            
-            if len(pattern) < 3:  # 너무 짧은 패턴은 제외
-                continue
-            
-            if pattern not in text_patterns:
-                text_patterns[pattern] = []
-            
-            text_patterns[pattern].append({
-                'element_id': element_id,
-                'text': text,
-                'label': label,
-                'element': element
-            })
+        if len(pattern) < 3:  # 너무 짧은 패턴은 제외
+            return None
+        return pattern
+    
+    def _collect_r002(self, record: ElementRecord, text_patterns: Dict[str, List[ElementRecord]]):
+        """R002: 유사한 텍스트 패턴 그룹화"""
+        pattern = self._r002_pattern(record)
+        if pattern is not None:
+            text_patterns.setdefault(pattern, []).append(record)
+    
+    def _finalize_r002(self, text_patterns: Dict[str, List[ElementRecord]], file_path: str) -> List[QualityIssue]:
+        """R002: 패턴별 라벨 일관성 검사"""
+        issues = []
         
-        # 패턴별 라벨 일관성 검사
-        for pattern, items in text_patterns.items():
-            if len(items) < 2:
+        for pattern, records in text_patterns.items():
+            if len(records) < 2:
                 continue
             
-            labels = set(item['label'] for item in items)
+            labels = set(record.label for record in records)
             if len(labels) > 1:
                 # 가장 많이 사용된 라벨을 권장 라벨로 선택
                 label_counts = {}
-                for item in items:
-                    label_counts[item['label']] = label_counts.get(item['label'], 0) + 1
+                for record in records:
+                    label_counts[record.label] = label_counts.get(record.label, 0) + 1
                 
                 recommended_label = max(label_counts, key=label_counts.get)
                 
-                for item in items:
-                    if item['label'] != recommended_label:
+                for record in records:
+                    if record.label != recommended_label:
                         issues.append(create_label_issue(
                             "R002",
-                            item['element_id'],
-                            item['label'],
+                            record.element_id,
+                            record.label,
                             recommended_label,
                             file_path,
-                            item['element'].get('pageIndex', 0)
+                            record.page_index
                         ))
         
         return issues
     
-    def _validate_r003_title_patterns(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
-        """R003: 제목 패턴 검증"""
+    def _finalize_r006(self, page_groups: Dict[int, List[ElementRecord]], file_path: str) -> List[QualityIssue]:
+        """R006: 페이지별 순서 일관성 검사 (최소 이동 요소만 보고)"""
         issues = []
         
-        title_patterns = [
-            r'^[IVX]+\.\s+',           # "I. ", "II. " 등
-            r'^\d+\.\s+[가-힣]+',      # "1. 개요", "2. 현황" 등  
-            r'^[가나다라마바사]\.\s+', # "가. ", "나. " 등
-            r'^제\d+[장절조]\s+',      # "제1장 ", "제2절 " 등
-        ]
-        
-        for element in elements:
-            text = element.get('content', {}).get('text', '').strip()
-            current_label = element.get('category', {}).get('label', '')
-            element_id = element.get('id', 'unknown')
-            page_index = element.get('pageIndex', 0)
-            
-            if not text:
-                continue
-            
-            # 제목 패턴 확인
-            is_title_pattern = any(re.search(pattern, text) for pattern in title_patterns)
+        for page_idx, records in page_groups.items():
+            expected_positions = reading_order_ranks(records)
+            in_order = longest_increasing_subsequence(expected_positions)
             
-            if is_title_pattern and current_label not in ['ParaTitle', 'DocTitle']:
-                issues.append(create_label_issue(
-                    "R003",
-                    element_id,
-                    current_label,
-                    "ParaTitle",
-                    file_path,
-                    page_index
+            for i, record in enumerate(records):
+                if i in in_order:
+                    continue
+                
+                expected_position = expected_positions[i]
+                issues.append(QualityIssue(
+                    rule_id="R006",
+                    severity="warning",
+                    message=f"요소 순서가 읽기 순서와 다릅니다 (현재: {i}, 예상: {expected_position})",
+                    file_path=file_path,
+                    element_id=record.element_id,
+                    page_index=page_idx,
+                    category="structure",
+                    auto_fixable=True
                 ))
         
         return issues
     
-    def _validate_r004_date_format(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
-        """R004: 날짜 형식 검증"""
+    # ------------------------------------------------------------------
+    # 규칙별 개별 실행 (fused=False)
+    # ------------------------------------------------------------------
+    
+    def _run_element_check(self, check, elements: List[Dict], file_path: str) -> List[QualityIssue]:
+        """요소 단위 규칙을 전체 요소에 적용"""
         issues = []
         
-        date_patterns = [
-            r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일',      # "2021년 2월 3일"
-            r'^\d{4}\.\s*\d{1,2}\.\s*\d{1,2}$',        # "2021. 2. 3"
-            r'^\d{4}-\d{1,2}-\d{1,2}$',                # "2021-02-03"
-            r'^\d{4}\.\s*\d{1,2}\.\s*\d{1,2}\s*작성',  # "2021. 2. 3 작성"
-        ]
-        
-        for element in elements:
-            text = element.get('content', {}).get('text', '').strip()
-            current_label = element.get('category', {}).get('label', '')
-            element_id = element.get('id', 'unknown')
-            page_index = element.get('pageIndex', 0)
-            
-            if not text:
-                continue
-            
-            # 날짜 패턴 확인
-            is_date_pattern = any(re.search(pattern, text) for pattern in date_patterns)
-            
-            if is_date_pattern and current_label != 'Date':
-                issues.append(create_label_issue(
-                    "R004",
-                    element_id,
-                    current_label,
-                    "Date",
-                    file_path,
-                    page_index
-                ))
+        for record in self._to_records(elements):
+            issue = check(record, file_path)
+            if issue:
+                issues.append(issue)
         
         return issues
     
+    def _validate_r001_empty_text(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
+        """R001: 빈 텍스트 검증"""
+        return self._run_element_check(self._check_r001, elements, file_path)
+    
+    def _validate_r002_label_consistency(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
+        """R002: 라벨 타입 일관성 검증"""
+        text_patterns = {}
+        for record in self._to_records(elements):
+            self._collect_r002(record, text_patterns)
+        
+        return self._finalize_r002(text_patterns, file_path)
+    
+    def _validate_r003_title_patterns(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
+        """R003: 제목 패턴 검증"""
+        return self._run_element_check(self._check_r003, elements, file_path)
+    
+    def _validate_r004_date_format(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
+        """R004: 날짜 형식 검증"""
+        return self._run_element_check(self._check_r004, elements, file_path)
+    
     def _validate_r005_table_structure(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
         """R005: 테이블 구조 검증"""
-        issues = []
-        
-        table_elements = [e for e in elements if e.get('category', {}).get('type') == 'TABLE']
-        
-        for table in table_elements:
-            element_id = table.get('id', 'unknown')
-            table_data = table.get('table', {})
-            cells = table_data.get('cells', [])
-            
-            if not cells:
-                issues.append(QualityIssue(
-                    rule_id="R005",
-                    severity="error",
-                    message="테이블에 셀이 없습니다",
-                    file_path=file_path,
-                    element_id=element_id,
-                    category="structure",
-                    auto_fixable=False
-                ))
-        
-        return issues
+        return self._run_element_check(self._check_r005, elements, file_path)
     
     def _validate_r006_order_consistency(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
         """R006: 순서 일관성 검증"""
-        issues = []
-        
         # 페이지별로 그룹화
         page_groups = {}
-        for element in elements:
-            page_idx = element.get('pageIndex', 0)
-            if page_idx not in page_groups:
-                page_groups[page_idx] = []
-            page_groups[page_idx].append(element)
-        
-        for page_idx, page_elements in page_groups.items():
-            # Y좌표 순서와 실제 순서 비교
-            sorted_by_position = sorted(page_elements, key=lambda e: e.get('bbox', {}).get('top', 0))
-            
-            for i, element in enumerate(page_elements):
-                expected_position = sorted_by_position.index(element)
-                if i != expected_position:
-                    issues.append(QualityIssue(
-                        rule_id="R006",
-                        severity="warning",
-                        message=f"요소 순서가 읽기 순서와 다릅니다 (현재: {i}, 예상: {expected_position})",
-                        file_path=file_path,
-                        element_id=element.get('id', 'unknown'),
-                        page_index=page_idx,
-                        category="structure",
-                        auto_fixable=True
-                    ))
+        for record in self._to_records(elements):
+            page_groups.setdefault(record.page_index, []).append(record)
         
-        return issues
+        return self._finalize_r006(page_groups, file_path)
     
     def _validate_r007_duplicate_elements(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
         """R007: 중복 요소 검증"""
         issues = []
-        
         seen_texts = {}
         
-        for element in elements:
-            text = element.get('content', {}).get('text', '').strip()
-            element_id = element.get('id', 'unknown')
-            
-            if not text or len(text) < 5:  # 너무 짧은 텍스트는 제외
-                continue
-            
-            if text in seen_texts:
-                issues.append(QualityIssue(
-                    rule_id="R007",
-                    severity="warning",
-                    message=f"중복된 텍스트: {text[:50]}...",
-                    file_path=file_path,
-                    element_id=element_id,
-                    category="consistency",
-                    suggested_fix="중복 요소 제거 또는 병합",
-                    auto_fixable=True,
-                    metadata={
-                        "duplicate_of": seen_texts[text],
-                        "text": text
-                    }
-                ))
-            else:
-                seen_texts[text] = element_id
+        for record in self._to_records(elements):
+            issue = self._check_r007(record, seen_texts, file_path)
+            if issue:
+                issues.append(issue)
         
         return issues
     
     def _validate_r008_forbidden_labels(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
         """R008: 금지된 라벨 검증"""
-        issues = []
-        
-        forbidden_labels = ['연결', '국가명', '정책명', '법률명', '요약']
-        
-        for element in elements:
-            current_label = element.get('category', {}).get('label', '')
-            element_id = element.get('id', 'unknown')
-            
-            if current_label in forbidden_labels:
-                issues.append(QualityIssue(
-                    rule_id="R008",
-                    severity="error",
-                    message=f"금지된 라벨 사용: {current_label}",
-                    file_path=file_path,
-                    element_id=element_id,
-                    category="label_type",
-                    suggested_fix="적절한 라벨로 변경",
-                    auto_fixable=True
-                ))
-        
-        return issues
+        return self._run_element_check(self._check_r008, elements, file_path)
     
     def _validate_r009_specific_text_labels(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
         """R009: 특정 텍스트 라벨 검증 ('원문', '번역문', '본문' → ParaText)"""
-        issues = []
-        
-        target_texts = {"원문", "번역문", "본문"}
-        
-        for element in elements:
-            text = element.get('content', {}).get('text', '').strip()
-            current_label = element.get('category', {}).get('label', '')
-            element_id = element.get('id', 'unknown')
-            page_index = element.get('pageIndex', 0)
-            
-            if text in target_texts and current_label != 'ParaText':
-                issues.append(create_label_issue(
-                    "R009",
-                    element_id,
-                    current_label,
-                    "ParaText",
-                    file_path,
-                    page_index
-                ))
-        
-        return issues
+        return self._run_element_check(self._check_r009, elements, file_path)
     
     def _validate_r010_date_pattern_labels(self, elements: List[Dict], file_path: str) -> List[QualityIssue]:
         """R010: 날짜 패턴 라벨 검증"""
-        issues = []
-        
-        date_patterns = [
-            r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일',      # "2021년 2월 3일"
-            r'^\d{4}\.\s*\d{1,2}\.\s*\d{1,2}\s*작성',  # "2021. 2. 3 작성"
-            r'^\d{4}\.\s*\d{1,2}\.\s*\d{1,2}$',        # "2021. 2. 3"
-            r'^\d{4}-\d{1,2}-\d{1,2}$',                # "2021-02-03"
-        ]
-        
-        for element in elements:
-            text = element.get('content', {}).get('text', '').strip()
-            current_label = element.get('category', {}).get('label', '')
-            element_id = element.get('id', 'unknown')
-            page_index = element.get('pageIndex', 0)
-            
-            if not text:
-                continue
-            
-            # 날짜 패턴 확인
-            is_date_pattern = any(re.search(pattern, text) for pattern in date_patterns)
-            
-            if is_date_pattern and current_label != 'Date':
-                issues.append(create_label_issue(
-                    "R010",
-                    element_id,
-                    current_label,
-                    "Date",
-                    file_path,
-                    page_index
-                ))
-        
-        return issues
+        return self._run_element_check(self._check_r010, elements, file_path)
 
 
 def main():
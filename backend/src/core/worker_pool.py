@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+API 작업자 프로세스 풀
+FastAPI 요청의 CPU 작업(JSON 파싱, 룰 검증, 자동 수정)을 별도 프로세스에서 실행하여
+큰 문서를 처리하는 동안에도 이벤트 루프가 다른 요청(/health 등)에 바로 응답
+- 실행 중인 작업 수와 자리를 기다리는 작업 수를 각각 제한하고, 넘으면 PoolSaturatedError (API에서 429로 응답)
+- 작업마다 단계별 소요 시간/규칙별 이슈 수/캐시 적중을 함께 돌려주어 메인 프로세스에서 지표로 합산
+"""
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from ..models.issue_store import IssueStore
+from ..models.quality_issue import QualityIssue
+from ..utils.advanced_analyzer import AdvancedQualityAnalyzer
+from ..utils import json_codec
+from .quality_controller import QualityController
+from .rule_validator import RuleStats
+
+# 규칙별 시간 측정 비율 기본값 (측정 시 검증 시간이 늘어나므로 일부 작업만 표본으로 측정)
+DEFAULT_RULE_TIMING_SAMPLE = 0.05
+
+# 작업 지표 콜백: (작업 이름, 대기 포함 소요 시간, 작업 지표)
+MetricsCallback = Callable[[str, float, Dict[str, Any]], None]
+
+
+class PoolSaturatedError(RuntimeError):
+    """대기 작업 수 제한에 걸려 새 작업을 받을 수 없음"""
+
+
+class WorkerPool:
+    """asyncio용 프로세스 풀 (대기 작업 수 제한)"""
+    
+    def __init__(self, workers: int, max_pending: int, config: Optional[Dict] = None,
+                 on_metrics: Optional[MetricsCallback] = None, max_waiting: Optional[int] = None):
+        """
+        Args:
+            workers: 작업자 프로세스 수
+            max_pending: 작업자 풀에 넘긴(실행 중 + 풀 대기열) 작업 최대 수
+            config: 작업자별 QualityController 설정 (rule_timing_sample: 규칙별 시간 측정 비율 0~1)
+            on_metrics: 작업이 끝날 때마다 작업 지표를 받을 콜백 (메인 프로세스에서 호출)
+            max_waiting: max_pending이 찼을 때 자리를 기다릴 수 있는 작업 최대 수 (기본 max_pending,
+                         넘으면 wait=True여도 PoolSaturatedError)
+        """
+        self.workers = max(workers, 1)
+        self.max_pending = max(max_pending, self.workers)
+        self.max_waiting = max(max_waiting if max_waiting is not None else self.max_pending, 0)
+        self.config = config
+        self.on_metrics = on_metrics
+        self.pending = 0
+        self.waiting = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+    
+    @property
+    def saturated(self) -> bool:
+        """대기 작업 수 제한에 도달했는지"""
+        return self.pending >= self.max_pending
+    
+    @property
+    def started(self) -> bool:
+        """작업자 프로세스가 시작되었는지"""
+        return self._executor is not None
+    
+    def start(self):
+        """작업자 프로세스 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_api_worker,
+                                                 initargs=(self.config,))
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+    
+    def shutdown(self):
+        """작업자 프로세스 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def run(self, fn: Callable, *args, wait: bool = False) -> Any:
+        """
+        작업자 프로세스에서 fn(*args) 실행
+        
+        Args:
+            wait: True면 자리가 날 때까지 기다림 (기다리는 작업이 max_waiting개를 넘으면 PoolSaturatedError),
+                  False면 가득 찼을 때 바로 PoolSaturatedError
+        """
+        self.start()
+        if self._slots.locked():
+            if not wait:
+                raise PoolSaturatedError(f"처리 대기 작업이 가득 찼습니다 ({self.max_pending}개)")
+            if self.waiting >= self.max_waiting:
+                raise PoolSaturatedError(f"자리를 기다리는 작업이 가득 찼습니다 ({self.max_waiting}개)")
+        
+        start_time = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        
+        self.pending += 1
+        try:
+            # 기다리는 동안 작업자가 비정상 종료되어 풀이 없어졌으면 새로 만듦
+            self.start()
+            result, metrics = await asyncio.wrap_future(self._executor.submit(_run_task, fn, args))
+            if self.on_metrics is not None:
+                self.on_metrics(fn.__name__, time.perf_counter() - start_time, metrics)
+            return result
+        except BrokenProcessPool:
+            # 작업자가 비정상 종료되면 다음 요청에서 풀을 새로 만듦
+            self._executor = None
+            raise
+        finally:
+            self.pending -= 1
+            self._slots.release()
+
+
+# 작업자 프로세스별 인스턴스 (작업자 초기화 시 한 번 생성)
+_worker_controller: Optional[QualityController] = None
+_worker_analyzer: Optional[AdvancedQualityAnalyzer] = None
+_worker_timing_sample = DEFAULT_RULE_TIMING_SAMPLE
+
+# 실행 중인 작업의 지표 (작업자 프로세스는 한 번에 작업 하나만 실행)
+_task_metrics: Dict[str, Any] = {}
+
+
+def _init_api_worker(config: Optional[Dict] = None):
+    """작업자 프로세스 초기화"""
+    global _worker_controller, _worker_analyzer, _worker_timing_sample
+    _worker_controller = QualityController(config)
+    _worker_analyzer = AdvancedQualityAnalyzer()
+    _worker_timing_sample = (config or {}).get('rule_timing_sample', DEFAULT_RULE_TIMING_SAMPLE)
+
+
+def _controller() -> QualityController:
+    if _worker_controller is None:
+        _init_api_worker()
+    return _worker_controller
+
+
+def _run_task(fn: Callable, args: tuple) -> tuple:
+    """
+    작업 실행 후 (결과, 작업 지표) 반환
+    
+    작업 지표:
+        stages: [(단계, 초)], fixer: {수정 단계: 초}, issues: {규칙: 이슈 수},
+        rules: RuleStats.snapshot() (표본 작업만), cache: {'hits', 'misses'}
+    """
+    global _task_metrics
+    controller = _controller()
+    cache = controller.cache
+    cache_before = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    
+    rule_stats = RuleStats() if random.random() < _worker_timing_sample else None
+    controller.validator.stats = rule_stats
+    _task_metrics = {'stages': [], 'fixer': {}, 'issues': {}}
+    try:
+        result = fn(*args)
+    finally:
+        controller.validator.stats = None
+    
+    metrics = _task_metrics
+    metrics['rules'] = rule_stats.snapshot() if rule_stats is not None else {}
+    if cache is not None:
+        metrics['cache'] = {'hits': cache.hits - cache_before[0], 'misses': cache.misses - cache_before[1]}
+    return result, metrics
+
+
+@contextmanager
+def _stage(name: str) -> Iterator[None]:
+    """작업 단계 소요 시간 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _task_metrics.setdefault('stages', []).append((name, time.perf_counter() - start))
+
+
+def _count_issues(issues: List[QualityIssue]) -> List[QualityIssue]:
+    """규칙별 이슈 수 기록 (모든 작업에서 수집)"""
+    counts = _task_metrics.setdefault('issues', {})
+    for issue in issues:
+        counts[issue.rule_id] = counts.get(issue.rule_id, 0) + 1
+    return issues
+
+
+def validate_content_task(content: bytes, file_path: str) -> IssueStore:
+    """
+    visualinfo JSON 원본 바이트 검증 (JSON 오류는 ValueError)
+    결과는 열 단위 IssueStore로 돌려주어 프로세스 간 전달 크기와 직렬화 시간을 줄임
+    """
+    with _stage("validate"):
+        issues = _controller().validate_content(content, file_path)
+    return IssueStore.from_issues(_count_issues(issues))
+
+
+def analyze_upload_task(content: bytes, filename: str) -> Dict[str, Any]:
+    """업로드 파일 검증 + AI 분석 (/upload)"""
+    with _stage("parse"):
+        data = json_codec.loads(content)
+    with _stage("validate"):
+        issues = _count_issues(_controller().validate_data(data, filename))
+    with _stage("analyze"):
+        anomalies = _worker_analyzer.detect_anomalies(data)
+        optimizations = _worker_analyzer.generate_optimization_suggestions(issues)
+    
+    return {
+        "issues": issues,
+        "anomalies": anomalies,
+        "optimizations": optimizations
+    }
+
+
+def auto_fix_task(content: bytes, filename: str) -> Dict[str, Any]:
+    """업로드 파일 자동 수정 (/api/auto_fix) - 임시 파일 없이 메모리에서 수정"""
+    before_issues, result, after_issues = _controller().auto_fix_content(content, filename, stage=_stage)
+    _count_issues(before_issues)
+    _task_metrics['fixer'] = dict(result.timings)
+    
+    return {
+        "success": True,
+        "before_issues": len(before_issues),
+        "after_issues": len(after_issues),
+        "fixed_count": len(before_issues) - len(after_issues),
+        "fixed_data": result.data,
+        "fixes_applied": result.fixes
+    }
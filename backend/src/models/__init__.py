@@ -3,5 +3,7 @@
 """
 
 from .quality_issue import QualityIssue, FixResult, create_label_issue, create_content_issue, create_structure_issue
+from .issue_store import IssueStore, IssueRange
 
-__all__ = ['QualityIssue', 'FixResult', 'create_label_issue', 'create_content_issue', 'create_structure_issue']
+__all__ = ['QualityIssue', 'FixResult', 'create_label_issue', 'create_content_issue', 'create_structure_issue',
+           'IssueStore', 'IssueRange']
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+열 단위 이슈 저장소
+대량 검증 결과를 QualityIssue 객체 대신 배열 열(column)로 보관
+- 규칙/심각도/카테고리/메시지/수정 제안 문자열과 파일 경로는 한 번만 저장하고 번호로 참조
+- 요소 ID(숫자 문자열)와 페이지 번호는 정수 배열, 같은 내용의 metadata는 하나만 보관
+- 보고서/API는 to_dict()/iter_dicts()로 객체를 만들지 않고 바로 직렬화
+"""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .quality_issue import QualityIssue
+
+
+# 정수 열에서 None / 정수로 담을 수 없는 값을 나타내는 값
+_NONE = -1
+_OTHER = -(2 ** 63)
+
+
+class _StringTable:
+    """문자열 ↔ 번호 (0은 None)"""
+    
+    def __init__(self):
+        self.values: List[Optional[str]] = [None]
+        self._codes: Dict[str, int] = {}
+    
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+    
+    def __len__(self) -> int:
+        return len(self.values) - 1
+
+
+class IssueStore:
+    """열 단위 이슈 목록 (추가만 가능)"""
+    
+    def __init__(self):
+        self._strings = _StringTable()  # 규칙, 심각도, 카테고리, 메시지, 수정 제안
+        self._paths = _StringTable()    # 파일 경로
+        self._rule = array('I')
+        self._severity = array('I')
+        self._category = array('I')
+        self._message = array('I')
+        self._suggested_fix = array('I')
+        self._file = array('I')
+        self._element = array('q')
+        self._page = array('q')
+        self._auto_fixable = bytearray()
+        self._metadata = array('I')
+        self._metadata_values: List[Dict[str, Any]] = [{}]  # 0은 빈 metadata
+        self._metadata_codes: Dict[tuple, int] = {}
+        # 정수 열에 담지 못한 원래 값 (행 → 값, 거의 없음)
+        self._other_elements: Dict[int, Any] = {}
+        self._other_pages: Dict[int, Any] = {}
+    
+    @classmethod
+    def from_issues(cls, issues: Iterable[QualityIssue]) -> "IssueStore":
+        store = cls()
+        store.extend(issues)
+        return store
+    
+    def _encode_element_id(self, row: int, value: Any) -> int:
+        """
+        요소 ID 열 값
+        숫자 문자열("0", "12")은 그 정수, 그 외 문자열("unknown", "007")은 -(문자열 번호 + 1),
+        문자열이 아닌 값은 원래 값 보관
+        """
+        if value is None:
+            return _NONE
+        if type(value) is str:
+            if value.isascii() and value.isdigit() and len(value) <= 18 and (len(value) == 1 or value[0] != "0"):
+                return int(value)
+            return -(self._strings.code(value) + 1)
+        self._other_elements[row] = value
+        return _OTHER
+    
+    def _encode_page_index(self, row: int, value: Any) -> int:
+        """페이지 번호 열 값 - 0 이상의 정수가 아니면 원래 값 보관"""
+        if value is None:
+            return _NONE
+        if type(value) is int and 0 <= value < 2 ** 62:
+            return value
+        self._other_pages[row] = value
+        return _OTHER
+    
+    def _encode_metadata(self, metadata: Optional[Dict[str, Any]]) -> int:
+        """metadata 번호 (값이 모두 hashable이면 같은 내용끼리 공유)"""
+        if not metadata:
+            return 0
+        try:
+            key = tuple(sorted(metadata.items()))
+            hash(key)
+        except TypeError:
+            key = None
+        
+        if key is not None:
+            code = self._metadata_codes.get(key)
+            if code is not None:
+                return code
+        
+        code = len(self._metadata_values)
+        self._metadata_values.append(dict(metadata))
+        if key is not None:
+            self._metadata_codes[key] = code
+        return code
+    
+    def append(self, issue: QualityIssue):
+        row = len(self._rule)
+        strings = self._strings
+        self._rule.append(strings.code(issue.rule_id))
+        self._severity.append(strings.code(issue.severity))
+        self._category.append(strings.code(issue.category))
+        self._message.append(strings.code(issue.message))
+        self._suggested_fix.append(strings.code(issue.suggested_fix))
+        self._file.append(self._paths.code(issue.file_path))
+        self._element.append(self._encode_element_id(row, issue.element_id))
+        self._page.append(self._encode_page_index(row, issue.page_index))
+        self._auto_fixable.append(1 if issue.auto_fixable else 0)
+        self._metadata.append(self._encode_metadata(issue._metadata))
+    
+    def extend(self, issues: Iterable[QualityIssue]) -> "IssueRange":
+        """이슈 여러 개 추가 - 추가된 행 범위를 돌려줌"""
+        start = len(self._rule)
+        for issue in issues:
+            self.append(issue)
+        return IssueRange(self, start, len(self._rule))
+    
+    def __len__(self) -> int:
+        return len(self._rule)
+    
+    def _element_id(self, row: int) -> Optional[str]:
+        value = self._element[row]
+        if value >= 0:
+            return str(value)
+        if value == _NONE:
+            return None
+        if value == _OTHER:
+            return self._other_elements[row]
+        return self._strings.values[-value - 1]
+    
+    def _page_index(self, row: int) -> Optional[int]:
+        value = self._page[row]
+        if value >= 0:
+            return value
+        if value == _NONE:
+            return None
+        return self._other_pages[row]
+    
+    def to_dict(self, row: int) -> Dict[str, Any]:
+        """행 하나를 QualityIssue.to_dict()와 같은 형식으로"""
+        strings = self._strings.values
+        return {
+            "rule_id": strings[self._rule[row]],
+            "severity": strings[self._severity[row]],
+            "message": strings[self._message[row]],
+            "file_path": self._paths.values[self._file[row]],
+            "element_id": self._element_id(row),
+            "page_index": self._page_index(row),
+            "category": strings[self._category[row]],
+            "suggested_fix": strings[self._suggested_fix[row]],
+            "auto_fixable": bool(self._auto_fixable[row]),
+            "metadata": dict(self._metadata_values[self._metadata[row]])
+        }
+    
+    def get(self, row: int) -> QualityIssue:
+        """행 하나를 QualityIssue로"""
+        return QualityIssue(**self.to_dict(row))
+    
+    def __getitem__(self, row: int) -> QualityIssue:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return self.get(row)
+    
+    def __iter__(self) -> Iterator[QualityIssue]:
+        return (self.get(row) for row in range(len(self)))
+    
+    def iter_dicts(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """행 범위의 to_dict() (QualityIssue 객체를 만들지 않음)"""
+        stop = len(self) if stop is None else stop
+        return (self.to_dict(row) for row in range(start, stop))
+    
+    def count_by_rule(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, int]:
+        """규칙별 이슈 수"""
+        strings = self._strings.values
+        counts = Counter(self._rule[start:stop])
+        return {strings[code]: count for code, count in counts.items()}
+    
+    def messages(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        strings = self._strings.values
+        return (strings[code] for code in self._message[start:stop])
+    
+    def files(self) -> List[str]:
+        """이슈가 있는 파일 경로 (처음 추가된 순서)"""
+        return self._paths.values[1:]
+    
+    @property
+    def file_count(self) -> int:
+        return len(self._paths)
+    
+    def nbytes(self) -> int:
+        """열 배열 크기 합계 (문자열 표와 metadata 제외, 대략적인 값)"""
+        columns = (self._rule, self._severity, self._category, self._message, self._suggested_fix,
+                   self._file, self._element, self._page, self._metadata)
+        return sum(column.itemsize * len(column) for column in columns) + len(self._auto_fixable)
+
+
+class IssueRange:
+    """IssueStore의 연속된 행 범위 (문서 하나의 이슈 목록처럼 사용)"""
+    
+    __slots__ = ('store', 'start', 'stop')
+    
+    def __init__(self, store: IssueStore, start: int, stop: int):
+        self.store = store
+        self.start = start
+        self.stop = stop
+    
+    def __len__(self) -> int:
+        return self.stop - self.start
+    
+    def __iter__(self) -> Iterator[QualityIssue]:
+        return (self.store.get(row) for row in range(self.start, self.stop))
+    
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        return self.store.iter_dicts(self.start, self.stop)
+    
+    def count_by_rule(self) -> Dict[str, int]:
+        return self.store.count_by_rule(self.start, self.stop)
+    
+    def messages(self) -> Iterator[str]:
+        return self.store.messages(self.start, self.stop)
@@ -25,30 +25,52 @@ class IssueCategory(Enum):
     CONSISTENCY = "consistency"
 
 
-@dataclass
 class QualityIssue:
-    """품질 이슈 데이터 클래스"""
-    rule_id: str
-    severity: str
-    message: str
-    file_path: str
-    element_id: Optional[str] = None
-    page_index: Optional[int] = None
-    category: Optional[str] = None
-    suggested_fix: Optional[str] = None
-    auto_fixable: bool = False
-    metadata: Optional[Dict[str, Any]] = None
+    """품질 이슈 (__slots__ 사용 - 대량 검증 시 인스턴스 메모리 절약, metadata는 필요할 때만 생성)"""
     
-    def __post_init__(self):
-        """초기화 후 처리"""
-        if self.metadata is None:
-            self.metadata = {}
-            
-        # 라벨 변경 정보가 있으면 metadata에 저장
-        if hasattr(self, 'old_label'):
-            self.metadata['old_label'] = self.old_label
-        if hasattr(self, 'new_label'):
-            self.metadata['new_label'] = self.new_label
+    __slots__ = ('rule_id', 'severity', 'message', 'file_path', 'element_id', 'page_index',
+                 'category', 'suggested_fix', 'auto_fixable', '_metadata')
+    
+    def __init__(self, rule_id: str, severity: str, message: str, file_path: str,
+                 element_id: Optional[str] = None, page_index: Optional[int] = None,
+                 category: Optional[str] = None, suggested_fix: Optional[str] = None,
+                 auto_fixable: bool = False, metadata: Optional[Dict[str, Any]] = None):
+        self.rule_id = rule_id
+        self.severity = severity
+        self.message = message
+        self.file_path = file_path
+        self.element_id = element_id
+        self.page_index = page_index
+        self.category = category
+        self.suggested_fix = suggested_fix
+        self.auto_fixable = auto_fixable
+        self._metadata = metadata or None
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """추가 정보 (처음 접근할 때 빈 dict 생성)"""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]):
+        self._metadata = value or None
+    
+    def _values(self) -> tuple:
+        return (self.rule_id, self.severity, self.message, self.file_path, self.element_id, self.page_index,
+                self.category, self.suggested_fix, self.auto_fixable, self._metadata or {})
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+    
+    def __repr__(self) -> str:
+        return (f"QualityIssue(rule_id={self.rule_id!r}, severity={self.severity!r}, message={self.message!r}, "
+                f"file_path={self.file_path!r}, element_id={self.element_id!r}, page_index={self.page_index!r}, "
+                f"category={self.category!r}, suggested_fix={self.suggested_fix!r}, "
+                f"auto_fixable={self.auto_fixable!r}, metadata={self._metadata or {}!r})")
     
     @property
     def severity_level(self) -> int:
@@ -72,7 +94,7 @@ class QualityIssue:
             "category": self.category,
             "suggested_fix": self.suggested_fix,
             "auto_fixable": self.auto_fixable,
-            "metadata": self.metadata
+            "metadata": self._metadata if self._metadata is not None else {}
         }
     
     @classmethod
@@ -117,6 +139,11 @@ class FixResult:
             "metadata": self.metadata
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FixResult":
+        """딕셔너리에서 생성"""
+        return cls(**data)
+    
     def __str__(self) -> str:
         """문자열 표현"""
         status = "✅" if self.success else "❌"
@@ -133,7 +160,7 @@ def create_label_issue(rule_id: str, message: str, element_id: str, file_path: s
         metadata['old_label'] = old_label
     if new_label:
         metadata['new_label'] = new_label
-        
+    
     return QualityIssue(
         rule_id=rule_id,
         severity="warning",
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+비동기 PDF 업로더 - aiohttp 기반 API 클라이언트
+PDFUploader와 같은 메서드 구성으로 이벤트 루프(FastAPI 등)를 막지 않고
+한 프로세스에서 여러 문서의 업로드/OCR 대기를 동시에 진행
+- 전체/호스트별 연결 수 제한이 있는 공용 연결 풀
+- PDF 파일을 메모리에 통째로 읽지 않고 스트리밍 업로드
+"""
+
+import asyncio
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from ..utils import json_codec
+from .pdf_uploader import (
+    DEFAULT_BASE_URL,
+    DEFAULT_HEADERS,
+    IMAGE_DOWNLOAD_RETRIES,
+    IMAGE_DOWNLOAD_WORKERS,
+    IMAGE_RETRY_BACKOFF,
+    RETRYABLE_STATUS_CODES,
+    PollSchedule,
+    collect_image_paths,
+    parse_retry_after,
+    progress_hint,
+    write_visualcontent_base,
+)
+
+
+# 연결 풀 기본 크기
+DEFAULT_MAX_CONNECTIONS = 64
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 16
+
+
+class AsyncPDFUploader:
+    """PDF 업로드 및 OCR 처리를 위한 비동기 API 클라이언트
+    
+    사용 예:
+        async with AsyncPDFUploader() as uploader:
+            file_info = await uploader.upload_pdf(pdf_path)
+    """
+    
+    def __init__(self, base_url: str = DEFAULT_BASE_URL,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+                 image_workers: int = IMAGE_DOWNLOAD_WORKERS):
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.image_workers = image_workers
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> "AsyncPDFUploader":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """공용 세션 (첫 요청 시 실행 중인 이벤트 루프에서 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS)
+        return self._session
+    
+    async def close(self):
+        """세션과 연결 풀 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def upload_pdf(self, pdf_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        PDF 파일을 업로드합니다. (파일은 청크 단위로 스트리밍 전송)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+        
+        Returns:
+            업로드 결과 정보 (fileId, fileName, numOfPages 등)
+        """
+        try:
+            url = f"{self.base_url}/files/upload"
+            
+            # 파일 열기와 청크 읽기(aiohttp가 실행기에서 수행) 모두 이벤트 루프 밖에서 수행
+            f = await asyncio.to_thread(open, pdf_path, 'rb')
+            try:
+                form = aiohttp.FormData()
+                form.add_field('file', f, filename=pdf_path.name, content_type='application/pdf')
+                
+                async with self.session.post(url, data=form) as response:
+                    response.raise_for_status()
+                    result = await response.json(content_type=None)
+            finally:
+                f.close()
+            
+            if result.get('codeNum') == 0:
+                return result.get('data')
+            else:
+                print(f"❌ 업로드 오류: {result.get('code', 'Unknown error')}")
+                return None
+        
+        except aiohttp.ClientError as e:
+            print(f"❌ 네트워크 오류: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ 업로드 오류: {e}")
+            return None
+    
+    async def extract_pages(self, file_id: str, page_range: str) -> Optional[Dict[str, Any]]:
+        """
+        페이지 범위를 OCR 처리 요청합니다.
+        
+        Args:
+            file_id: 업로드된 파일의 ID
+            page_range: 페이지 범위 (예: "1-120")
+        
+        Returns:
+            OCR 처리 결과 정보
+        """
+        try:
+            url = f"{self.base_url}/files/{file_id}/extract-page"
+            params = {'range': page_range}
+            
+            # flow.md에 따른 추가 헤더 설정
+            headers = {
+                'origin': self.base_url.replace('/api/v1/dl', ''),
+                'referer': f"{self.base_url.replace('/api/v1/dl', '')}/"
+            }
+            
+            async with self.session.post(url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                result = await response.json(content_type=None)
+            
+            if result.get('codeNum') == 0:
+                return result.get('data')
+            else:
+                print(f"❌ OCR 처리 오류: {result.get('code', 'Unknown error')}")
+                return None
+        
+        except aiohttp.ClientError as e:
+            print(f"❌ 네트워크 오류: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ OCR 처리 오류: {e}")
+            return None
+    
+    async def get_visual_info(self, file_id: str, engine: str = "pdf_ai_dl", ocr_mode: str = "AUTO",
+                              progress_callback=None, num_pages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        VisualInfo 결과를 조회합니다. (폴링 규칙은 PDFUploader.get_visual_info와 동일)
+        
+        Args:
+            file_id: 업로드된 파일의 ID
+            engine: OCR 엔진 (기본값: pdf_ai_dl)
+            ocr_mode: OCR 모드 (기본값: AUTO)
+            num_pages: 문서 페이지 수 (대기 제한 시간 계산에 사용)
+        
+        Returns:
+            VisualInfo JSON 데이터
+        """
+        try:
+            url = f"{self.base_url}/files/{file_id}/visualinfo"
+            params = {
+                'engine': engine,
+                'ocrMode': ocr_mode
+            }
+            
+            schedule = PollSchedule(num_pages)
+            
+            while True:
+                async with self.session.get(url, params=params) as response:
+                    retry_after = parse_retry_after(response.headers.get('retry-after'))
+                    hint = None
+                    
+                    if response.status not in RETRYABLE_STATUS_CODES:
+                        response.raise_for_status()
+                        
+                        # 응답이 JSON인지 확인
+                        if 'application/json' in response.headers.get('content-type', ''):
+                            try:
+                                result = json_codec.loads(await response.read())
+                            except json.JSONDecodeError:
+                                result = None
+                            
+                            hint = progress_hint(result)
+                            if result is not None and hint is None:
+                                return result
+                
+                delay = schedule.next_delay(retry_after)
+                if delay is None:
+                    break
+                
+                message = schedule.message(delay, hint)
+                if progress_callback:
+                    progress_callback(message)
+                else:
+                    print(f"⏳ {message}")
+                await asyncio.sleep(delay)
+            
+            print(f"❌ OCR 처리 시간 초과 ({schedule.timeout:.0f}초)")
+            return None
+        
+        except aiohttp.ClientError as e:
+            print(f"❌ 네트워크 오류: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ VisualInfo 조회 오류: {e}")
+            return None
+    
+    async def download_image(self, file_id: str, image_path: str,
+                             retries: int = IMAGE_DOWNLOAD_RETRIES) -> Optional[bytes]:
+        """
+        이미지 파일을 다운로드합니다.
+        
+        Args:
+            file_id: 파일 ID
+            image_path: 이미지 경로 (예: "figure/xxx.png")
+            retries: 네트워크 오류/서버 오류 시 재시도 횟수
+        
+        Returns:
+            이미지 바이너리 데이터
+        """
+        url = f"{self.base_url}/files/{file_id}/extract-image"
+        params = {'imagePath': image_path}
+        
+        for attempt in range(retries + 1):
+            try:
+                async with self.session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    return await response.read()
+            
+            except aiohttp.ClientError as e:
+                # 클라이언트 오류(4xx, 429 제외)는 재시도해도 같은 결과
+                status_code = getattr(e, 'status', None)
+                retryable = status_code is None or status_code >= 500 or status_code == 429
+                
+                if not retryable or attempt == retries:
+                    print(f"❌ 이미지 다운로드 오류 ({image_path}): {e}")
+                    return None
+                await asyncio.sleep(IMAGE_RETRY_BACKOFF * (2 ** attempt))
+            except Exception as e:
+                print(f"❌ 이미지 처리 오류 ({image_path}): {e}")
+                return None
+        
+        return None
+    
+    async def create_visualcontent_zip(self, pdf_path: Path, visual_info: Dict[str, Any],
+                                       zip_path: Path, file_id: str = None) -> bool:
+        """
+        VisualContent ZIP 파일을 생성합니다.
+        
+        이미지는 최대 image_workers개씩 동시에 받아 받는 대로 ZIP에 기록하므로 메모리에는
+        이미지가 최대 image_workers개만 남고, ZIP 기록(디스크 I/O)은 별도 스레드에서 수행합니다.
+        
+        Args:
+            pdf_path: 원본 PDF 파일 경로
+            visual_info: VisualInfo JSON 데이터
+            zip_path: 생성할 ZIP 파일 경로
+            file_id: API에서 받은 fileId (가장 정확함)
+        
+        Returns:
+            성공 여부
+        """
+        try:
+            zipf = await asyncio.to_thread(zipfile.ZipFile, zip_path, 'w', zipfile.ZIP_DEFLATED)
+            try:
+                # 1~3. 원본 PDF, visualinfo JSON, 메타데이터
+                actual_file_id = await asyncio.to_thread(write_visualcontent_base, zipf, pdf_path,
+                                                         visual_info, file_id)
+                
+                # 4. 이미지 파일들 다운로드 및 추가
+                image_paths = collect_image_paths(visual_info)
+                if image_paths:
+                    print(f"📥 {len(image_paths)}개 이미지 다운로드 중...")
+                    await self._add_images(zipf, actual_file_id, image_paths)
+            finally:
+                await asyncio.to_thread(zipf.close)
+            
+            return True
+        
+        except Exception as e:
+            print(f"❌ ZIP 파일 생성 오류: {e}")
+            return False
+    
+    async def _add_images(self, zipf: zipfile.ZipFile, file_id: str, image_paths: List[str]):
+        """이미지 동시 다운로드 (문서당 최대 image_workers개) - 받는 대로 ZIP에 추가"""
+        semaphore = asyncio.Semaphore(self.image_workers)
+        write_lock = asyncio.Lock()
+        
+        async def add(image_path: str):
+            # 기록까지 마친 뒤 자리를 넘겨서 받아 둔 이미지가 쌓이지 않도록 함
+            async with semaphore:
+                image_data = await self.download_image(file_id, image_path)
+                if not image_data:
+                    print(f"  ❌ 실패: {image_path}")
+                    return
+                
+                # PNG 등은 이미 압축되어 있으므로 재압축하지 않고 그대로 저장
+                async with write_lock:
+                    await asyncio.to_thread(zipf.writestr, image_path, image_data,
+                                            compress_type=zipfile.ZIP_STORED)
+                print(f"  ✅ 추가됨: {image_path} ({len(image_data):,} bytes)")
+        
+        tasks = [asyncio.create_task(add(image_path)) for image_path in image_paths]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # 기록 오류/취소 시 남은 다운로드를 정리한 뒤 ZIP을 닫음
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+백그라운드 작업 관리자
+HTTP 요청 시간 안에 끝나지 않는 일괄 자동 수정/비교 작업을 작업자 프로세스에서 실행
+- 작업 상태/진행률/결과를 디스크(작업별 폴더)에 저장하여 서버 재시작 후에도 조회 가능
+- 재시작 시 끝나지 않은 작업은 다시 대기열에 넣음
+- 보존 기간과 최대 보관 개수를 넘은 완료 작업은 자동 삭제
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.quality_controller import QualityController
+from ..core.worker_pool import PoolSaturatedError
+from ..utils import json_codec
+from ..utils.quality_comparator import QualityComparator
+from ..utils.zip_processor import is_visualinfo_member
+from ..utils.zip_recompressor import ZipRecompressor
+
+
+# 기본 작업 저장 위치
+DEFAULT_JOBS_DIR = Path.home() / ".cache" / "labeling_qc" / "jobs"
+
+# 작업 종류
+JOB_AUTO_FIX = "auto_fix"  # 업로드한 문서 일괄 자동 수정
+JOB_COMPARE = "compare"    # 원본/검수완료 문서 비교
+JOB_TYPES = (JOB_AUTO_FIX, JOB_COMPARE)
+
+# 작업 상태
+STATE_QUEUED = "queued"
+STATE_RUNNING = "running"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+FINISHED_STATES = (STATE_DONE, STATE_FAILED)
+
+# 보존 제한 (완료된 작업 기준)
+JOB_RETENTION_SECONDS = 7 * 24 * 3600
+JOB_MAX_COUNT = 200
+
+# 동시에 대기/실행할 수 있는 작업 수
+JOB_MAX_ACTIVE = 20
+
+JOB_FILE_NAME = "job.json"
+INPUT_DIR_NAME = "input"
+RESULT_FILE_NAMES = {JOB_AUTO_FIX: "result.zip", JOB_COMPARE: "result.json"}
+
+
+class JobStore:
+    """작업별 폴더(job.json, input/, 결과 파일)에 작업을 저장하는 영구 저장소
+    
+    작업자 프로세스도 같은 폴더에 진행률을 기록하므로 프로세스 간 공유 매체 역할을 함
+    """
+    
+    def __init__(self, jobs_dir: Path = None):
+        self.jobs_dir = Path(jobs_dir) if jobs_dir else DEFAULT_JOBS_DIR
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+    
+    def job_dir(self, job_id: str) -> Path:
+        return self.jobs_dir / job_id
+    
+    def input_dir(self, job_id: str) -> Path:
+        return self.job_dir(job_id) / INPUT_DIR_NAME
+    
+    def result_path(self, job: Dict[str, Any]) -> Path:
+        return self.job_dir(job['id']) / RESULT_FILE_NAMES[job['type']]
+    
+    def create(self, job_type: str) -> Dict[str, Any]:
+        """새 작업 생성 (입력 파일은 input_dir에 저장한 뒤 제출)"""
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"지원하지 않는 작업 종류: {job_type}")
+        
+        job_id = uuid.uuid4().hex
+        self.input_dir(job_id).mkdir(parents=True)
+        now = time.time()
+        job = {
+            'id': job_id,
+            'type': job_type,
+            'state': STATE_QUEUED,
+            'created': now,
+            'updated': now,
+            'progress': {'done': 0, 'total': 0},
+            'message': "대기 중",
+            'error': None,
+            'summary': None
+        }
+        self._write(job)
+        return job
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (없거나 손상되었으면 None)"""
+        # 경로 조작 방지 - 작업 ID는 uuid hex
+        if not job_id.isalnum():
+            return None
+        
+        try:
+            with open(self.job_dir(job_id) / JOB_FILE_NAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def list(self) -> List[Dict[str, Any]]:
+        """전체 작업 (최근 생성 순)"""
+        jobs = [self.get(path.name) for path in self.jobs_dir.iterdir() if path.is_dir()]
+        return sorted((job for job in jobs if job), key=lambda job: job['created'], reverse=True)
+    
+    def update(self, job_id: str, **fields) -> Optional[Dict[str, Any]]:
+        """작업 상태 갱신"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        
+        job.update(fields)
+        job['updated'] = time.time()
+        self._write(job)
+        return job
+    
+    def delete(self, job_id: str):
+        shutil.rmtree(self.job_dir(job_id), ignore_errors=True)
+    
+    def prune(self, retention_seconds: float = JOB_RETENTION_SECONDS, max_count: int = JOB_MAX_COUNT) -> int:
+        """보존 기간이 지났거나 최대 개수를 넘은 완료 작업 삭제 (오래된 것부터)
+        
+        Returns:
+            삭제된 작업 수
+        """
+        jobs = self.list()
+        finished = [job for job in jobs if job['state'] in FINISHED_STATES]
+        cutoff = time.time() - retention_seconds
+        overflow = max(len(jobs) - max_count, 0)
+        removed = 0
+        
+        for job in sorted(finished, key=lambda job: job['updated']):
+            if job['updated'] >= cutoff and removed >= overflow:
+                break
+            self.delete(job['id'])
+            removed += 1
+        
+        # 작업 생성 중 중단되어 job.json이 없는 폴더 정리
+        for path in self.jobs_dir.iterdir():
+            if path.is_dir() and not (path / JOB_FILE_NAME).exists() and path.stat().st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        
+        return removed
+    
+    def _write(self, job: Dict[str, Any]):
+        """job.json 원자적 저장 (조회 중인 요청이 쓰다 만 파일을 읽지 않도록)"""
+        job_file = self.job_dir(job['id']) / JOB_FILE_NAME
+        temp_path = job_file.with_name(f".{JOB_FILE_NAME}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(temp_path, job_file)
+
+
+class JobManager:
+    """작업자 프로세스 풀에서 작업 실행"""
+    
+    def __init__(self, store: JobStore, workers: int = 1, max_active: int = JOB_MAX_ACTIVE):
+        self.store = store
+        self.workers = max(workers, 1)
+        self.max_active = max_active
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # 완료 콜백은 실행기 관리 스레드에서 호출되므로 _futures는 잠금 안에서만 다룸
+        self._futures: Dict[str, Future] = {}
+        self._futures_lock = threading.Lock()
+        # start()를 호출한 이벤트 루프 (완료 처리를 이 루프로 넘김)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+    
+    @property
+    def active(self) -> int:
+        """대기/실행 중인 작업 수"""
+        with self._futures_lock:
+            futures = list(self._futures.values())
+        return sum(1 for future in futures if not future.done())
+    
+    @property
+    def saturated(self) -> bool:
+        """대기/실행 중인 작업 수 제한에 도달했는지"""
+        return self.active >= self.max_active
+    
+    def start(self) -> int:
+        """오래된 작업 정리 후 이전 실행에서 끝나지 않은 작업을 다시 제출
+        
+        Returns:
+            다시 제출한 작업 수
+        """
+        self._stopping = False
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self.store.prune()
+        
+        resumed = 0
+        for job in reversed(self.store.list()):
+            with self._futures_lock:
+                submitted = job['id'] in self._futures
+            if job['state'] not in FINISHED_STATES and not submitted:
+                self.store.update(job['id'], state=STATE_QUEUED, message="서버 재시작 후 다시 대기 중")
+                self._submit(job['id'])
+                resumed += 1
+        return resumed
+    
+    def shutdown(self):
+        """작업자 종료 (실행 중이던 작업은 다음 시작 시 다시 실행)"""
+        self._stopping = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._futures_lock:
+            self._futures.clear()
+    
+    def submit(self, job: Dict[str, Any]):
+        """입력 파일 저장이 끝난 작업 제출 (대기 작업이 가득 차면 PoolSaturatedError)"""
+        if self.saturated:
+            self.store.delete(job['id'])
+            raise PoolSaturatedError(f"작업 대기열이 가득 찼습니다 ({self.max_active}개)")
+        
+        self.store.prune()
+        self._submit(job['id'])
+    
+    def _submit(self, job_id: str):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        
+        future = self._executor.submit(run_job, str(self.store.jobs_dir), job_id)
+        with self._futures_lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda f: self._on_done(job_id, f))
+    
+    def _on_done(self, job_id: str, future: Future):
+        """작업 완료 콜백 (실행기 관리 스레드) - 작업자 오류를 기록하고 정리는 이벤트 루프에서"""
+        if not future.cancelled() and not self._stopping:
+            error = future.exception()
+            if error is not None:
+                self.store.update(job_id, state=STATE_FAILED, error=f"작업자 오류: {error}")
+        
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._finish, job_id, future)
+                return
+            except RuntimeError:
+                pass  # 루프가 이미 닫힘 (서버 종료 중)
+        self._finish(job_id, future)
+    
+    def _finish(self, job_id: str, future: Future):
+        """끝난 작업을 목록에서 빼고, 작업자 프로세스가 비정상 종료했으면 다음 제출 시 풀을 새로 만듦"""
+        with self._futures_lock:
+            if self._futures.get(job_id) is future:
+                del self._futures[job_id]
+        
+        if not future.cancelled() and not self._stopping and future.exception() is not None:
+            self._executor = None
+
+
+def run_job(jobs_dir: str, job_id: str):
+    """작업자 프로세스에서 작업 하나 실행 - 진행률과 결과를 저장소에 기록"""
+    store = JobStore(Path(jobs_dir))
+    job = store.update(job_id, state=STATE_RUNNING, message="처리 중", error=None)
+    if job is None:
+        return
+    
+    def progress(done: int, total: int, message: str):
+        store.update(job_id, progress={'done': done, 'total': total}, message=message)
+    
+    try:
+        runner = JOB_RUNNERS[job['type']]
+        summary = runner(store.input_dir(job_id), store.result_path(job), progress)
+    except Exception as e:
+        store.update(job_id, state=STATE_FAILED, message="실패", error=str(e))
+        return
+    
+    store.update(job_id, state=STATE_DONE, message="완료", summary=summary)
+
+
+def _unique_path(directory: Path, name: str) -> Path:
+    """directory 안에서 아직 쓰이지 않은 파일 경로 (이미 있으면 "이름-2.json"처럼 번호를 붙임)"""
+    path = directory / name
+    stem, suffix = path.stem, path.suffix
+    index = 2
+    while path.exists():
+        path = directory / f"{stem}-{index}{suffix}"
+        index += 1
+    return path
+
+
+def _expand_batch_zips(files_dir: Path):
+    """visualinfo가 없는 배치 ZIP은 안의 visualcontent ZIP/JSON을 입력 폴더로 꺼냄
+    
+    폴더가 달라도 이름이 같은 멤버나 업로드한 파일과 이름이 겹치는 멤버는 번호를 붙여 따로 저장.
+    꺼낸 파일이 없는 ZIP은 그대로 두어 문서별 처리에서 오류로 기록되도록 함
+    """
+    for zip_path in sorted(files_dir.glob("*.zip")):
+        if not zipfile.is_zipfile(zip_path):
+            continue  # 손상된 ZIP은 문서별 처리에서 오류로 기록
+        
+        extracted = 0
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            members = zip_ref.namelist()
+            if any(is_visualinfo_member(member) for member in members):
+                continue
+            
+            for member in members:
+                name = Path(member).name
+                if name.lower().endswith(('.zip', '.json')):
+                    with zip_ref.open(member) as src, open(_unique_path(files_dir, name), 'wb') as dest:
+                        shutil.copyfileobj(src, dest)
+                    extracted += 1
+        
+        if extracted:
+            zip_path.unlink()
+
+
+def _fix_visualinfo(controller: QualityController, name: str, content: bytes) -> Dict[str, Any]:
+    """visualinfo JSON 하나 자동 수정 (수정 전후 검증 포함, 임시 파일 없이 메모리에서)"""
+    before_issues, result, after_issues = controller.auto_fix_content(content, name)
+    
+    return {
+        'document': name,
+        'before_issues': len(before_issues),
+        'after_issues': len(after_issues),
+        'fixes': {category: len(fix_list) for category, fix_list in result.fixes.items()},
+        'content': json_codec.dumps(result.data) if result.changed else None
+    }
+
+
+def run_auto_fix_job(input_dir: Path, result_path: Path, progress: Callable[[int, int, str], None]) -> Dict[str, Any]:
+    """업로드 문서 일괄 자동 수정 - 결과는 수정된 파일과 report.json을 담은 ZIP"""
+    files_dir = input_dir / "files"
+    _expand_batch_zips(files_dir)
+    sources = sorted(p for p in files_dir.iterdir() if p.suffix.lower() in ('.json', '.zip'))
+    
+    controller = QualityController()
+    documents = []
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = Path(temp_dir)
+        recompressor = ZipRecompressor(output_dir)
+        
+        for index, source in enumerate(sources):
+            progress(index, len(sources), f"자동 수정 중: {source.name}")
+            
+            try:
+                if source.suffix.lower() == '.json':
+                    report = _fix_visualinfo(controller, source.name, source.read_bytes())
+                    (output_dir / source.name).write_bytes(report.pop('content') or source.read_bytes())
+                    documents.append(report)
+                    continue
+                
+                # visualcontent ZIP - 수정된 visualinfo 멤버만 교체하고 나머지는 그대로 복사
+                replacements = {}
+                with zipfile.ZipFile(source, 'r') as zip_ref:
+                    members = [m for m in zip_ref.namelist() if is_visualinfo_member(m)]
+                    if not members:
+                        documents.append({'document': source.name, 'error': "visualinfo JSON이나 visualcontent ZIP이 없는 ZIP"})
+                        continue
+                    for member in members:
+                        report = _fix_visualinfo(controller, Path(member).name, zip_ref.read(member))
+                        report['document'] = f"{source.name}/{member}"
+                        content = report.pop('content')
+                        if content is not None:
+                            replacements[member] = content
+                        documents.append(report)
+                
+                if replacements:
+                    recompressor.rewrite_zip(source, replacements, output_dir / source.name)
+                else:
+                    shutil.copy2(source, output_dir / source.name)
+            
+            except (ValueError, OSError, zipfile.BadZipFile) as e:
+                documents.append({'document': source.name, 'error': str(e)})
+        
+        summary = {
+            'documents': len(documents),
+            'errors': sum(1 for doc in documents if 'error' in doc),
+            'before_issues': sum(doc.get('before_issues', 0) for doc in documents),
+            'after_issues': sum(doc.get('after_issues', 0) for doc in documents)
+        }
+        summary['fixed_count'] = summary['before_issues'] - summary['after_issues']
+        (output_dir / "report.json").write_text(
+            json.dumps({'summary': summary, 'documents': documents}, ensure_ascii=False, indent=2), encoding='utf-8'
+        )
+        
+        # 결과 ZIP은 임시 파일에 쓴 뒤 교체 (다운로드 중인 요청이 쓰다 만 파일을 받지 않도록)
+        temp_result = result_path.with_name(f".{result_path.name}.tmp")
+        with zipfile.ZipFile(temp_result, 'w', zipfile.ZIP_DEFLATED) as result_zip:
+            for path in sorted(output_dir.iterdir()):
+                # visualcontent ZIP은 이미 압축되어 있으므로 그대로 저장
+                compress_type = zipfile.ZIP_STORED if path.suffix.lower() == '.zip' else zipfile.ZIP_DEFLATED
+                result_zip.write(path, path.name, compress_type=compress_type)
+        os.replace(temp_result, result_path)
+    
+    progress(len(sources), len(sources), "완료")
+    return summary
+
+
+def run_compare_job(input_dir: Path, result_path: Path, progress: Callable[[int, int, str], None]) -> Dict[str, Any]:
+    """원본(target)/검수완료(completed) 문서 비교 - 결과는 비교 보고서 JSON"""
+    comparator = QualityComparator()
+    
+    # 비교하면서 보고서를 임시 파일에 바로 기록한 뒤 교체
+    temp_result = result_path.with_name(f".{result_path.name}.tmp")
+    report = comparator.write_comparison_report(
+        input_dir / "target", input_dir / "completed", temp_result,
+        progress_callback=lambda done, total: progress(done, total, f"비교 중 ({done}/{total})")
+    )
+    os.replace(temp_result, result_path)
+    
+    return report['summary']
+
+
+JOB_RUNNERS = {
+    JOB_AUTO_FIX: run_auto_fix_job,
+    JOB_COMPARE: run_compare_job
+}
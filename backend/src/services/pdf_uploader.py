@@ -4,39 +4,195 @@ PDF 업로더 - API를 통한 PDF 업로드 및 OCR 처리
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import random
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from tqdm import tqdm
 
+from ..utils import json_codec
+
+
+# 기본 API 주소
+# http://172.19.2.164
+# http://172.19.3.222
+# http://172.19.0.35
+DEFAULT_BASE_URL = "http://172.19.0.35/studio-lite/api/v1/dl"
+
+# flow.md에 따른 기본 헤더
+DEFAULT_HEADERS = {
+    'accept': 'application/json, text/plain, */*',
+    'accept-encoding': 'gzip, deflate',
+    'accept-language': 'ko-KR,ko;q=0.9,en-GB;q=0.8,en;q=0.7,en-US;q=0.6',
+    'connection': 'keep-alive',
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36'
+}
+
+# OCR 결과 폴링 간격 (초): 짧게 시작해서 지수적으로 늘림
+POLL_INITIAL_INTERVAL = 1.0
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_INTERVAL = 15.0
+POLL_JITTER = 0.2  # 간격의 ±20% 무작위 변동 (동시에 요청한 문서들의 폴링이 몰리지 않도록)
+POLL_MIN_INTERVAL = POLL_INITIAL_INTERVAL  # Retry-After가 0이거나 지난 날짜여도 이만큼은 기다림
+
+# OCR 대기 제한 시간 (초): 기본 시간 + 페이지당 시간, 최소 OCR_MIN_TIMEOUT
+OCR_BASE_TIMEOUT = 60.0
+OCR_TIMEOUT_PER_PAGE = 5.0
+OCR_MIN_TIMEOUT = 300.0
+
+# 처리 중임을 알리며 Retry-After를 보낼 수 있는 상태 코드
+RETRYABLE_STATUS_CODES = {202, 429, 503}
+
+# 이미지 다운로드 동시 요청 수 및 재시도
+IMAGE_DOWNLOAD_WORKERS = 8
+IMAGE_DOWNLOAD_RETRIES = 3
+IMAGE_RETRY_BACKOFF = 0.5  # 재시도 대기 (초): 0.5, 1, 2 ...
+
+
+def ocr_timeout(num_pages: Optional[int]) -> float:
+    """페이지 수에 비례한 OCR 대기 제한 시간"""
+    if not num_pages:
+        return OCR_MIN_TIMEOUT
+    return max(OCR_MIN_TIMEOUT, OCR_BASE_TIMEOUT + OCR_TIMEOUT_PER_PAGE * num_pages)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def progress_hint(result: Any) -> Optional[Any]:
+    """처리 중 응답(JSON)의 진행률 힌트 - 결과(elements)가 없고 progress 필드가 있을 때만"""
+    if not isinstance(result, dict) or 'elements' in result:
+        return None
+    
+    data = result.get('data')
+    if 'progress' in result:
+        return result['progress']
+    if isinstance(data, dict) and 'elements' not in data and 'progress' in data:
+        return data['progress']
+    return None
+
+
+class PollSchedule:
+    """OCR 결과 폴링 일정 - 지수 백오프 + 지터, 서버 Retry-After 우선, 페이지 수 비례 제한 시간"""
+    
+    def __init__(self, num_pages: Optional[int] = None):
+        self.timeout = ocr_timeout(num_pages)
+        self.deadline = time.monotonic() + self.timeout
+        self.interval = POLL_INITIAL_INTERVAL
+        self.poll_count = 0
+    
+    def next_delay(self, retry_after: Optional[float] = None) -> Optional[float]:
+        """다음 폴링까지 대기 시간 (제한 시간이 지났으면 None)"""
+        self.poll_count += 1
+        
+        if retry_after is not None:
+            # Retry-After: 0 / 지난 HTTP 날짜로 쉬지 않고 폴링하지 않도록 최소 간격 적용
+            delay = max(retry_after, POLL_MIN_INTERVAL)
+        else:
+            delay = self.interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+            self.interval = min(self.interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL)
+        
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return min(delay, remaining)
+    
+    def message(self, delay: float, hint: Any = None) -> str:
+        """진행 상태 메시지"""
+        message = f"OCR 대기 중... ({self.poll_count}회, {delay:.1f}초 후 재시도"
+        if hint is not None:
+            message += f", 진행률: {hint}"
+        return message + ")"
+
+
+def collect_image_paths(visual_info: Dict[str, Any]) -> List[str]:
+    """visualinfo 요소에서 이미지 경로 추출 (중복 제거, 정렬)"""
+    image_paths = set()
+    for element in visual_info.get('elements', []):
+        content = element.get('content', {})
+        if 'imagePath' in content:
+            image_paths.add(content['imagePath'])
+    return sorted(image_paths)
+
+
+def write_visualcontent_base(zipf: zipfile.ZipFile, pdf_path: Path, visual_info: Dict[str, Any],
+                             file_id: Optional[str] = None) -> str:
+    """
+    VisualContent ZIP에 원본 PDF, visualinfo JSON, 메타데이터 기록
+    
+    Returns:
+        실제 사용한 fileId (매개변수 > visual_info.metadata.fileId)
+    """
+    # 1. original 폴더에 PDF 파일 추가
+    zipf.write(pdf_path, f"original/{pdf_path.name}")
+    
+    # 2. visualinfo 폴더에 JSON 파일 추가
+    metadata = visual_info.get("metadata", {})
+    
+    # fileId 우선순위: 매개변수 > visual_info.metadata.fileId
+    actual_file_id = file_id or metadata.get("fileId")
+    if not actual_file_id:
+        raise ValueError("fileId를 찾을 수 없습니다.")
+    
+    # Working 형태: 원본 파일명 기반으로 JSON 파일명 생성
+    json_filename = f"{pdf_path.stem}_visualinfo.json"
+    zipf.writestr(f"visualinfo/{json_filename}", json_codec.dumps(visual_info))
+    
+    # 3. meta 폴더에 메타데이터 추가
+    meta_data = {
+        "fileId": actual_file_id,
+        "fileName": metadata.get("fileName", pdf_path.name),
+        "created": metadata.get("created", ""),
+        "processing": {
+            "engine": metadata.get("engine", "pdf_ai_dl"),
+            "ocrMode": metadata.get("ocrMode", "AUTO")
+        }
+    }
+    meta_filename = f"{actual_file_id}_meta.json"
+    zipf.writestr(f"meta/{meta_filename}", json_codec.dumps(meta_data))
+    
+    return actual_file_id
+
 
 class PDFUploader:
     """PDF 업로드 및 OCR 처리를 위한 API 클라이언트"""
     
-    def __init__(self, base_url: str = "http://172.19.0.35/studio-lite/api/v1/dl"):
-        # http://172.19.2.164
-        # http://172.19.3.222
-        # http://172.19.0.35
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, pool_size: int = 10):
         self.base_url = base_url
         self.session = requests.Session()
+        # 여러 문서를 동시에 처리할 때 연결을 재사용할 수 있도록 연결 풀 크기 설정
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         # flow.md에 따른 기본 헤더 설정
-        self.session.headers.update({
-            'accept': 'application/json, text/plain, */*',
-            'accept-encoding': 'gzip, deflate',
-            'accept-language': 'ko-KR,ko;q=0.9,en-GB;q=0.8,en;q=0.7,en-US;q=0.6',
-            'connection': 'keep-alive',
-            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36'
-        })
-        
+        self.session.headers.update(DEFAULT_HEADERS)
+    
     def upload_pdf(self, pdf_path: Path) -> Optional[Dict[str, Any]]:
         """
         PDF 파일을 업로드합니다.
         
         Args:
             pdf_path: PDF 파일 경로
-            
+        
         Returns:
             업로드 결과 정보 (fileId, fileName, numOfPages 등)
         """
@@ -56,7 +212,7 @@ class PDFUploader:
                 else:
                     print(f"❌ 업로드 오류: {result.get('code', 'Unknown error')}")
                     return None
-                    
+        
         except requests.RequestException as e:
             print(f"❌ 네트워크 오류: {e}")
             return None
@@ -71,7 +227,7 @@ class PDFUploader:
         Args:
             file_id: 업로드된 파일의 ID
             page_range: 페이지 범위 (예: "1-120")
-            
+        
         Returns:
             OCR 처리 결과 정보
         """
@@ -95,7 +251,7 @@ class PDFUploader:
             else:
                 print(f"❌ OCR 처리 오류: {result.get('code', 'Unknown error')}")
                 return None
-                
+        
         except requests.RequestException as e:
             print(f"❌ 네트워크 오류: {e}")
             return None
@@ -103,15 +259,20 @@ class PDFUploader:
             print(f"❌ OCR 처리 오류: {e}")
             return None
     
-    def get_visual_info(self, file_id: str, engine: str = "pdf_ai_dl", ocr_mode: str = "AUTO", progress_callback=None) -> Optional[Dict[str, Any]]:
+    def get_visual_info(self, file_id: str, engine: str = "pdf_ai_dl", ocr_mode: str = "AUTO", progress_callback=None,
+                        num_pages: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         VisualInfo 결과를 조회합니다.
         
+        OCR이 끝날 때까지 폴링하며, 간격은 1초에서 시작해 지수적으로(지터 포함) 늘어납니다.
+        서버가 Retry-After 헤더나 진행률을 보내면 그에 맞춰 대기합니다.
+        
         Args:
             file_id: 업로드된 파일의 ID
             engine: OCR 엔진 (기본값: pdf_ai_dl)
             ocr_mode: OCR 모드 (기본값: AUTO)
-            
+            num_pages: 문서 페이지 수 (업로드 응답의 numOfPages, 대기 제한 시간 계산에 사용)
+        
         Returns:
             VisualInfo JSON 데이터
         """
@@ -122,34 +283,44 @@ class PDFUploader:
                 'ocrMode': ocr_mode
             }
             
-            # OCR 처리가 완료될 때까지 대기 (최대 5분)
-            max_retries = 30
-            retry_count = 0
+            # OCR 처리가 완료될 때까지 대기 (페이지 수에 비례한 제한 시간)
+            schedule = PollSchedule(num_pages)
             
-            while retry_count < max_retries:
+            while True:
                 response = self.session.get(url, params=params)
-                response.raise_for_status()
                 
-                # 응답이 JSON인지 확인
-                content_type = response.headers.get('content-type', '')
-                if 'application/json' in content_type:
-                    try:
-                        result = response.json()
-                        return result
-                    except json.JSONDecodeError:
-                        pass
+                retry_after = parse_retry_after(response.headers.get('retry-after'))
+                hint = None
+                
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                    
+                    # 응답이 JSON인지 확인
+                    content_type = response.headers.get('content-type', '')
+                    if 'application/json' in content_type:
+                        try:
+                            result = json_codec.loads(response.content)
+                        except json.JSONDecodeError:
+                            result = None
+                        
+                        hint = progress_hint(result)
+                        if result is not None and hint is None:
+                            return result
                 
-                # OCR 처리 중이면 10초 대기 후 재시도
+                delay = schedule.next_delay(retry_after)
+                if delay is None:
+                    break
+                
+                message = schedule.message(delay, hint)
                 if progress_callback:
-                    progress_callback(f"OCR 대기 중... ({retry_count + 1}/{max_retries})")
+                    progress_callback(message)
                 else:
-                    print(f"⏳ OCR 처리 중... ({retry_count + 1}/{max_retries})")
-                time.sleep(10)
-                retry_count += 1
+                    print(f"⏳ {message}")
+                time.sleep(delay)
             
-            print(f"❌ OCR 처리 시간 초과 ({max_retries * 10}초)")
+            print(f"❌ OCR 처리 시간 초과 ({schedule.timeout:.0f}초)")
             return None
-                
+        
         except requests.RequestException as e:
             print(f"❌ 네트워크 오류: {e}")
             return None
@@ -157,33 +328,43 @@ class PDFUploader:
             print(f"❌ VisualInfo 조회 오류: {e}")
             return None
     
-    def download_image(self, file_id: str, image_path: str) -> Optional[bytes]:
+    def download_image(self, file_id: str, image_path: str, retries: int = IMAGE_DOWNLOAD_RETRIES) -> Optional[bytes]:
         """
         이미지 파일을 다운로드합니다.
         
         Args:
             file_id: 파일 ID
             image_path: 이미지 경로 (예: "figure/xxx.png")
-            
+            retries: 네트워크 오류/서버 오류 시 재시도 횟수
+        
         Returns:
             이미지 바이너리 데이터
         """
-        try:
-            # 이미지 다운로드 URL 구성
-            url = f"{self.base_url}/files/{file_id}/extract-image"
-            params = {'imagePath': image_path}
-            
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            return response.content
+        # 이미지 다운로드 URL 구성
+        url = f"{self.base_url}/files/{file_id}/extract-image"
+        params = {'imagePath': image_path}
+        
+        for attempt in range(retries + 1):
+            try:
+                response = self.session.get(url, params=params)
+                response.raise_for_status()
+                
+                return response.content
             
-        except requests.RequestException as e:
-            print(f"❌ 이미지 다운로드 오류 ({image_path}): {e}")
-            return None
-        except Exception as e:
-            print(f"❌ 이미지 처리 오류 ({image_path}): {e}")
-            return None
+            except requests.RequestException as e:
+                # 클라이언트 오류(4xx, 429 제외)는 재시도해도 같은 결과
+                status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+                retryable = status_code is None or status_code >= 500 or status_code == 429
+                
+                if not retryable or attempt == retries:
+                    print(f"❌ 이미지 다운로드 오류 ({image_path}): {e}")
+                    return None
+                time.sleep(IMAGE_RETRY_BACKOFF * (2 ** attempt))
+            except Exception as e:
+                print(f"❌ 이미지 처리 오류 ({image_path}): {e}")
+                return None
+        
+        return None
     
     def create_visualcontent_zip(self, pdf_path: Path, visual_info: Dict[str, Any], zip_path: Path, file_id: str = None) -> bool:
         """
@@ -194,67 +375,41 @@ class PDFUploader:
             visual_info: VisualInfo JSON 데이터
             zip_path: 생성할 ZIP 파일 경로
             file_id: API에서 받은 fileId (가장 정확함)
-            
+        
         Returns:
             성공 여부
         """
         try:
             with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # 1. original 폴더에 PDF 파일 추가
-                zipf.write(pdf_path, f"original/{pdf_path.name}")
-
-                # 2. visualinfo 폴더에 JSON 파일 추가
-                metadata = visual_info.get("metadata", {})
-                
-                # fileId 우선순위: 매개변수 > visual_info.metadata.fileId
-                actual_file_id = file_id or metadata.get("fileId")
-                if not actual_file_id:
-                    raise ValueError("fileId를 찾을 수 없습니다.")
-
-                # Working 형태: 원본 파일명 기반으로 JSON 파일명 생성
-                json_filename = f"{pdf_path.stem}_visualinfo.json"
-                json_content = json.dumps(visual_info, ensure_ascii=False, indent=2)
-                zipf.writestr(f"visualinfo/{json_filename}", json_content.encode('utf-8'))
-                
-                # 3. meta 폴더에 메타데이터 추가
-                meta_data = {
-                    "fileId": actual_file_id,
-                    "fileName": metadata.get("fileName", pdf_path.name),
-                    "created": metadata.get("created", ""),
-                    "processing": {
-                        "engine": metadata.get("engine", "pdf_ai_dl"),
-                        "ocrMode": metadata.get("ocrMode", "AUTO")
-                    }
-                }
-                meta_filename = f"{actual_file_id}_meta.json"
-                meta_content = json.dumps(meta_data, ensure_ascii=False, indent=2)
-                zipf.writestr(f"meta/{meta_filename}", meta_content.encode('utf-8'))
+                # 1~3. 원본 PDF, visualinfo JSON, 메타데이터
+                actual_file_id = write_visualcontent_base(zipf, pdf_path, visual_info, file_id)
                 
                 # 4. 이미지 파일들 다운로드 및 추가
-                elements = visual_info.get('elements', [])
-                image_paths = set()  # 중복 방지
-                
-                # visualinfo에서 이미지 경로 추출
-                for element in elements:
-                    content = element.get('content', {})
-                    if 'imagePath' in content:
-                        image_paths.add(content['imagePath'])
+                image_paths = collect_image_paths(visual_info)
                 
-                # 이미지 다운로드 및 ZIP에 추가
+                # 이미지 동시 다운로드 후 완료되는 대로 ZIP에 추가
+                # (PNG 등은 이미 압축되어 있으므로 재압축하지 않고 그대로 저장)
                 if image_paths:
                     print(f"📥 {len(image_paths)}개 이미지 다운로드 중...")
-                    for image_path in image_paths:
-                        print(f"  다운로드 중: {image_path}")
-                        image_data = self.download_image(actual_file_id, image_path)
+                    workers = min(IMAGE_DOWNLOAD_WORKERS, len(image_paths))
+                    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image") as executor:
+                        futures = {
+                            executor.submit(self.download_image, actual_file_id, image_path): image_path
+                            for image_path in image_paths
+                        }
                         
-                        if image_data:
-                            zipf.writestr(image_path, image_data)
-                            print(f"  ✅ 추가됨: {image_path} ({len(image_data):,} bytes)")
-                        else:
-                            print(f"  ❌ 실패: {image_path}")
+                        for future in as_completed(futures):
+                            image_path = futures[future]
+                            image_data = future.result()
+                            
+                            if image_data:
+                                zipf.writestr(image_path, image_data, compress_type=zipfile.ZIP_STORED)
+                                print(f"  ✅ 추가됨: {image_path} ({len(image_data):,} bytes)")
+                            else:
+                                print(f"  ❌ 실패: {image_path}")
             
             return True
-            
+        
         except Exception as e:
             print(f"❌ ZIP 파일 생성 오류: {e}")
             return False
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+업로드 작업 저널
+PDF별 업로드/OCR 진행 상태를 JSONL 파일에 추가 기록하여 중단된 배치를 이어서 처리
+- (PDF 내용 해시, 출력 ZIP 경로)로 문서를 식별 (내용이 같아도 이름이 다른 PDF는 따로 기록)
+- 재실행 시 완료된 문서는 건너뛰고, OCR 대기 중이던 문서는 재업로드 없이 fileId로 결과 조회
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+# 저널 파일명 (PDF 폴더 안에 생성)
+UPLOAD_JOURNAL_NAME = ".upload_journal.jsonl"
+
+# 문서 처리 상태
+STATE_UPLOADED = "uploaded"          # 업로드 완료 (fileId 발급)
+STATE_OCR_REQUESTED = "ocr_requested"  # OCR 요청 완료, 결과 대기
+STATE_DONE = "done"                  # ZIP 생성 완료
+STATE_FAILED = "failed"              # 처리 실패 (재실행 시 처음부터 다시 처리)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 저널 기록 키: (PDF 내용 SHA-256, 출력 ZIP 경로)
+JournalKey = Tuple[str, str]
+
+
+def file_sha256(file_path: Path) -> str:
+    """파일 내용 SHA-256 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadJournal:
+    """추가 기록(append-only) JSONL 업로드 저널 - 여러 스레드에서 동시에 기록 가능"""
+    
+    def __init__(self, journal_path: Path, resume: bool = True):
+        """
+        Args:
+            journal_path: 저널 파일 경로
+            resume: False면 기존 기록을 무시하고 새로 시작
+        """
+        self.journal_path = journal_path
+        self._lock = threading.Lock()
+        self._entries: Dict[JournalKey, Dict[str, Any]] = {}
+        
+        if resume and journal_path.exists():
+            self._load()
+        else:
+            journal_path.parent.mkdir(parents=True, exist_ok=True)
+            journal_path.write_text("", encoding='utf-8')
+    
+    def _load(self):
+        """저널 재생 - 문서별 마지막 상태만 유지 (손상된 줄은 건너뜀)"""
+        line_count = 0
+        complete_size = 0
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # 기록 도중 종료되어 잘린 마지막 줄
+                    break
+                line_count += 1
+                complete_size += len(line)
+                try:
+                    record = json.loads(line)
+                    self._entries[(record['sha256'], record['output'])] = record
+                except (ValueError, KeyError, TypeError):
+                    continue
+        
+        if complete_size < self.journal_path.stat().st_size:
+            # 잘린 줄을 남겨 두면 다음 기록이 그 뒤에 붙어 함께 손상되므로 잘라냄
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(complete_size)
+        
+        # 기록이 많이 쌓였으면 마지막 상태만 남기도록 압축
+        if line_count > 2 * len(self._entries) + 100:
+            self._compact()
+    
+    def _compact(self):
+        """문서별 마지막 상태만 남겨 저널 다시 쓰기 (임시 파일 교체로 원자적)"""
+        temp_path = self.journal_path.with_name(f"{self.journal_path.name}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in self._entries.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self.journal_path)
+    
+    def get(self, content_hash: str, output_path: Path) -> Optional[Dict[str, Any]]:
+        """문서의 마지막 기록"""
+        with self._lock:
+            record = self._entries.get((content_hash, str(output_path)))
+            return dict(record) if record else None
+    
+    def record(self, content_hash: str, pdf_path: Path, output_path: Path, state: str, **fields) -> Dict[str, Any]:
+        """
+        문서 상태 기록 (이전 기록의 fileId 등은 유지하고 새 값으로 갱신)
+        
+        Args:
+            content_hash: PDF 내용 SHA-256
+            pdf_path: PDF 파일 경로
+            output_path: 이 PDF로 만들 ZIP 경로
+            state: 처리 상태 (STATE_*)
+        
+        Returns:
+            갱신된 기록
+        """
+        key = (content_hash, str(output_path))
+        with self._lock:
+            record = dict(self._entries.get(key, {}))
+            record.update(fields)
+            record.update({
+                'sha256': content_hash,
+                'output': str(output_path),
+                'pdf': pdf_path.name,
+                'state': state,
+                'updated': time.strftime('%Y-%m-%dT%H:%M:%S')
+            })
+            self._entries[key] = record
+            
+            # 비정상 종료 시에도 기록이 남도록 한 줄씩 바로 디스크에 반영
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            
+            return dict(record)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+PDF 업로드 파이프라인
+업로드 → OCR 요청 → VisualInfo 대기 → ZIP 생성 과정을 여러 문서에 대해 동시에 진행
+- 문서별 처리는 독립적이므로 스레드 풀에서 최대 concurrency개 문서를 동시에 처리
+- OCR 대기(폴링)가 문서마다 병렬로 진행되고, 끝난 문서부터 바로 ZIP 생성
+- AsyncUploadPipeline은 같은 과정을 AsyncPDFUploader로 한 이벤트 루프에서 진행 (문서마다 스레드 없음)
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from .pdf_uploader import PDFUploader
+from .upload_journal import STATE_DONE, STATE_FAILED, STATE_OCR_REQUESTED, STATE_UPLOADED, UploadJournal, file_sha256
+
+if TYPE_CHECKING:
+    # aiohttp는 비동기 파이프라인을 쓸 때만 필요
+    from .async_pdf_uploader import AsyncPDFUploader
+
+
+@dataclass
+class UploadResult:
+    """문서별 업로드 처리 결과"""
+    pdf_path: Path
+    success: bool
+    zip_path: Optional[Path] = None
+    file_id: Optional[str] = None
+    num_pages: int = 0
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    skipped: bool = False  # 이전 실행에서 이미 완료되어 건너뜀
+
+
+class UploadPipeline:
+    """PDF 업로드/OCR/ZIP 생성 파이프라인"""
+    
+    def __init__(self, uploader: PDFUploader, concurrency: int = 1,
+                 log: Callable[[str], None] = print,
+                 progress: Optional[Callable[[Path, str], None]] = None,
+                 journal: Optional[UploadJournal] = None):
+        """
+        Args:
+            uploader: API 클라이언트 (연결 풀 크기는 concurrency 이상 권장)
+            concurrency: 동시에 처리할 문서 수 (1이면 순차 처리)
+            log: 처리 메시지 출력 함수 (tqdm 사용 시 pbar.write)
+            progress: OCR 대기 등 진행 상태 콜백 (문서 경로, 메시지)
+            journal: 작업 저널 (있으면 중단된 배치를 이어서 처리)
+        """
+        self.uploader = uploader
+        self.concurrency = max(concurrency, 1)
+        self.log = log
+        self.progress = progress
+        self.journal = journal
+    
+    def process_pdf(self, pdf_path: Path, output_dir: Path) -> UploadResult:
+        """
+        단일 PDF 처리: 업로드 → OCR 요청 → VisualInfo 대기 → ZIP 생성
+        
+        저널이 있으면 단계마다 상태를 기록하고, 이전 실행에서 완료된 문서는 건너뛰며
+        업로드/OCR 요청까지 끝난 문서는 기존 fileId로 결과 조회부터 이어서 처리한다.
+        """
+        file_start_time = time.time()
+        zip_path = output_dir / f"visualcontent-{pdf_path.stem}.zip"
+        content_hash = None
+        entry = None
+        
+        def failed(message: str, **kwargs) -> UploadResult:
+            self.log(f"❌ {message}: {pdf_path.name}")
+            if content_hash:
+                self.journal.record(content_hash, pdf_path, zip_path, STATE_FAILED, error=message)
+            return UploadResult(pdf_path, False, error=message,
+                                elapsed=time.time() - file_start_time, **kwargs)
+        
+        try:
+            if self.journal is not None:
+                content_hash = file_sha256(pdf_path)
+                entry = self.journal.get(content_hash, zip_path)
+            
+            # 0. 이전 실행에서 ZIP까지 만든 문서는 건너뜀
+            if entry and entry['state'] == STATE_DONE and zip_path.exists():
+                self.log(f"⏭️ 이미 처리됨: {pdf_path.name}")
+                return UploadResult(pdf_path, True, zip_path=zip_path, file_id=entry.get('fileId'),
+                                    num_pages=entry.get('numOfPages', 0), skipped=True)
+            
+            resumed = bool(entry and entry['state'] in (STATE_UPLOADED, STATE_OCR_REQUESTED) and entry.get('fileId'))
+            
+            if resumed:
+                # 이미 업로드된 문서는 재업로드하지 않음
+                file_id = entry['fileId']
+                num_pages = entry.get('numOfPages', 0)
+                self.log(f"🔁 이어서 처리: {pdf_path.name} (fileId: {file_id}, 상태: {entry['state']})")
+            else:
+                # 1. PDF 업로드
+                file_info = self.uploader.upload_pdf(pdf_path)
+                if not file_info:
+                    return failed("업로드 실패")
+                
+                file_id = file_info['fileId']
+                num_pages = file_info['numOfPages']
+                upload_time = time.time() - file_start_time
+                self.log(f"✅ 업로드 완료: {file_info['fileName']} ({num_pages}페이지, {upload_time:.1f}초)")
+                if content_hash:
+                    self.journal.record(content_hash, pdf_path, zip_path, STATE_UPLOADED,
+                                        fileId=file_id, numOfPages=num_pages)
+            
+            # 2. OCR 처리 요청
+            if not (resumed and entry['state'] == STATE_OCR_REQUESTED):
+                ocr_start_time = time.time()
+                extract_result = self.uploader.extract_pages(file_id, f"1-{num_pages}")
+                if not extract_result:
+                    return failed("OCR 처리 실패", file_id=file_id, num_pages=num_pages)
+                
+                self.log(f"🔍 OCR 요청 완료: {pdf_path.name} ({time.time() - ocr_start_time:.1f}초)")
+                if content_hash:
+                    self.journal.record(content_hash, pdf_path, zip_path, STATE_OCR_REQUESTED)
+            
+            # 3. VisualInfo 다운로드 (대기 시간 포함)
+            visual_start_time = time.time()
+            progress_callback = None
+            if self.progress:
+                progress_callback = lambda msg: self.progress(pdf_path, msg)
+            visual_info = self.uploader.get_visual_info(file_id, progress_callback=progress_callback,
+                                                       num_pages=num_pages)
+            if not visual_info:
+                if resumed:
+                    # 서버 재시작 등으로 이전 fileId를 더 이상 조회할 수 없으면 처음부터 다시 처리
+                    self.log(f"⚠️ 이전 작업을 이어갈 수 없어 다시 업로드합니다: {pdf_path.name}")
+                    self.journal.record(content_hash, pdf_path, zip_path, STATE_FAILED, error="이전 fileId 조회 실패")
+                    return self.process_pdf(pdf_path, output_dir)
+                return failed("VisualInfo 다운로드 실패", file_id=file_id, num_pages=num_pages)
+            
+            self.log(f"📄 VisualInfo 완료: {pdf_path.name} ({time.time() - visual_start_time:.1f}초)")
+            
+            # 4. ZIP 파일로 저장
+            zip_start_time = time.time()
+            if not self.uploader.create_visualcontent_zip(pdf_path, visual_info, zip_path, file_id):
+                return failed("ZIP 파일 생성 실패", file_id=file_id, num_pages=num_pages)
+            
+            if content_hash:
+                self.journal.record(content_hash, pdf_path, zip_path, STATE_DONE)
+            
+            file_total_time = time.time() - file_start_time
+            self.log(f"📦 ZIP 생성 완료: {zip_path.name} (생성: {time.time() - zip_start_time:.1f}초, 총: {file_total_time:.1f}초)")
+            return UploadResult(pdf_path, True, zip_path=zip_path, file_id=file_id,
+                                num_pages=num_pages, elapsed=file_total_time)
+        
+        except Exception as e:
+            self.log(f"❌ {pdf_path.name} 처리 중 오류: {e}")
+            return UploadResult(pdf_path, False, error=str(e), elapsed=time.time() - file_start_time)
+    
+    def run(self, pdf_files: List[Path], output_dir: Path,
+            on_complete: Optional[Callable[[UploadResult], None]] = None) -> List[UploadResult]:
+        """
+        여러 PDF 처리
+        
+        Args:
+            pdf_files: 처리할 PDF 목록
+            output_dir: ZIP 저장 폴더
+            on_complete: 문서 하나가 끝날 때마다 (완료 순서대로) 호출
+        
+        Returns:
+            pdf_files 순서의 처리 결과 목록
+        """
+        results = {}
+        
+        if self.concurrency == 1 or len(pdf_files) <= 1:
+            for pdf_path in pdf_files:
+                results[pdf_path] = self.process_pdf(pdf_path, output_dir)
+                if on_complete:
+                    on_complete(results[pdf_path])
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="upload") as executor:
+                futures = {executor.submit(self.process_pdf, pdf_path, output_dir): pdf_path for pdf_path in pdf_files}
+                
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[futures[future]] = result
+                    if on_complete:
+                        on_complete(result)
+        
+        return [results[pdf_path] for pdf_path in pdf_files]
+
+
+class AsyncUploadPipeline:
+    """AsyncPDFUploader 기반 업로드/OCR/ZIP 생성 파이프라인 (작업 저널 미지원)"""
+    
+    def __init__(self, uploader: "AsyncPDFUploader", concurrency: int = 1,
+                 log: Callable[[str], None] = print,
+                 progress: Optional[Callable[[Path, str], None]] = None):
+        """
+        Args:
+            uploader: 비동기 API 클라이언트 (연결 풀 크기는 concurrency 이상 권장)
+            concurrency: 동시에 처리할 문서 수
+            log: 처리 메시지 출력 함수
+            progress: OCR 대기 등 진행 상태 콜백 (문서 경로, 메시지)
+        """
+        self.uploader = uploader
+        self.concurrency = max(concurrency, 1)
+        self.log = log
+        self.progress = progress
+    
+    async def process_pdf(self, pdf_path: Path, output_dir: Path) -> UploadResult:
+        """단일 PDF 처리: 업로드 → OCR 요청 → VisualInfo 대기 → ZIP 생성"""
+        file_start_time = time.time()
+        zip_path = output_dir / f"visualcontent-{pdf_path.stem}.zip"
+        
+        def failed(message: str, **kwargs) -> UploadResult:
+            self.log(f"❌ {message}: {pdf_path.name}")
+            return UploadResult(pdf_path, False, error=message,
+                                elapsed=time.time() - file_start_time, **kwargs)
+        
+        try:
+            # 1. PDF 업로드
+            file_info = await self.uploader.upload_pdf(pdf_path)
+            if not file_info:
+                return failed("업로드 실패")
+            
+            file_id = file_info['fileId']
+            num_pages = file_info['numOfPages']
+            self.log(f"✅ 업로드 완료: {file_info['fileName']} ({num_pages}페이지, {time.time() - file_start_time:.1f}초)")
+            
+            # 2. OCR 처리 요청
+            if not await self.uploader.extract_pages(file_id, f"1-{num_pages}"):
+                return failed("OCR 처리 실패", file_id=file_id, num_pages=num_pages)
+            
+            # 3. VisualInfo 다운로드 (대기 시간 포함)
+            progress_callback = None
+            if self.progress:
+                progress_callback = lambda msg: self.progress(pdf_path, msg)
+            visual_info = await self.uploader.get_visual_info(file_id, progress_callback=progress_callback,
+                                                             num_pages=num_pages)
+            if not visual_info:
+                return failed("VisualInfo 다운로드 실패", file_id=file_id, num_pages=num_pages)
+            
+            # 4. ZIP 파일로 저장
+            if not await self.uploader.create_visualcontent_zip(pdf_path, visual_info, zip_path, file_id):
+                return failed("ZIP 파일 생성 실패", file_id=file_id, num_pages=num_pages)
+            
+            file_total_time = time.time() - file_start_time
+            self.log(f"📦 ZIP 생성 완료: {zip_path.name} (총: {file_total_time:.1f}초)")
+            return UploadResult(pdf_path, True, zip_path=zip_path, file_id=file_id,
+                                num_pages=num_pages, elapsed=file_total_time)
+        
+        except Exception as e:
+            self.log(f"❌ {pdf_path.name} 처리 중 오류: {e}")
+            return UploadResult(pdf_path, False, error=str(e), elapsed=time.time() - file_start_time)
+    
+    async def run(self, pdf_files: List[Path], output_dir: Path,
+                  on_complete: Optional[Callable[[UploadResult], None]] = None) -> List[UploadResult]:
+        """여러 PDF를 최대 concurrency개씩 동시에 처리 (UploadPipeline.run()과 같은 규칙)"""
+        slots = asyncio.Semaphore(self.concurrency)
+        
+        async def process(pdf_path: Path) -> UploadResult:
+            async with slots:
+                result = await self.process_pdf(pdf_path, output_dir)
+            if on_complete:
+                on_complete(result)
+            return result
+        
+        return list(await asyncio.gather(*(process(pdf_path) for pdf_path in pdf_files)))
@@ -7,9 +7,9 @@ import json
 import logging
 from typing import Dict, List, Any, Tuple, Optional
 from collections import Counter
-import re
 
 from ..models.quality_issue import QualityIssue
+from ..core.pattern_matcher import get_pattern_matcher
 
 
 class AdvancedQualityAnalyzer:
@@ -17,6 +17,7 @@ class AdvancedQualityAnalyzer:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.pattern_matcher = get_pattern_matcher()
 
     def detect_anomalies(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """데이터에서 이상 패턴을 감지"""
@@ -70,19 +71,22 @@ class AdvancedQualityAnalyzer:
         confidence = 0.6
         reason = '기본 텍스트로 분류'
 
+        # 검증기/수정기와 동일한 패턴 그룹으로 판단
+        pattern_hits = self.pattern_matcher.match(text)
+
         # 제목 패턴
-        if re.match(r'^제\s*\d+\s*[장절조항]', text):
+        if "law_title" in pattern_hits:
             predicted_label = 'ParaTitle'
             confidence = 0.95
             reason = '법률 제목 패턴 매칭'
-        elif re.match(r'^\d+\.\s*', text) or text.startswith('○'):
-            predicted_label = 'ListText'
-            confidence = 0.85
-            reason = '목록 형식 패턴 매칭'
-        elif re.search(r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일', text):
+        elif "date" in pattern_hits:
             predicted_label = 'Date'
             confidence = 0.90
             reason = '날짜 형식 패턴 매칭'
+        elif "list_item" in pattern_hits or text.startswith('○'):
+            predicted_label = 'ListText'
+            confidence = 0.85
+            reason = '목록 형식 패턴 매칭'
 
         return predicted_label, confidence, reason
 
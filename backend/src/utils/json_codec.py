@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+visualinfo JSON 읽기/쓰기
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈 사용
+- 읽기: orjson이 거부하는 입력(BOM, NaN, 64비트를 넘는 정수 등)은 표준 json으로 다시 읽음
+- 쓰기: 어느 쪽이든 json.dumps(data, ensure_ascii=False, indent=2)와 바이트 단위로 같은 UTF-8
+  (라벨링 도구가 읽는 형식) - 실수 표기가 다를 수 있는 문서는 표준 json으로 씀
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson이 그대로 쓰는 스칼라 타입 (실수 외에는 표준 json과 표기가 같음)
+_PLAIN_TYPES = frozenset((str, int, bool, type(None)))
+
+# 사용 중인 구현 (상태 확인/벤치마크 기록용)
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def _stdlib_dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _same_float_format(data: Any) -> bool:
+    """
+    orjson과 표준 json의 실수 표기가 같은 문서인지
+    두 구현 모두 최단 표현을 쓰지만 지수 표기 기준이 달라서 0 또는 1e-4 <= |x| < 1e16인 실수만 같음
+    (NaN/Infinity도 여기서 걸러져 표준 json으로 씀)
+    """
+    stack = [data]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        value_type = type(value)
+        if value_type is dict:
+            extend(value.values())
+        elif value_type is list or value_type is tuple:
+            extend(value)
+        elif value_type is float:
+            if not (value == 0.0 or 1e-4 <= abs(value) < 1e16):
+                return False
+        elif value_type not in _PLAIN_TYPES:
+            # 하위 클래스 등은 표준 json으로
+            return False
+    return True
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """JSON 바이트/문자열 파싱 (오류는 json.JSONDecodeError)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def load(path: Path) -> Any:
+    """JSON 파일 읽기"""
+    return loads(Path(path).read_bytes())
+
+
+def dumps(data: Any) -> bytes:
+    """visualinfo 형식(ensure_ascii=False, indent=2)의 UTF-8 바이트"""
+    if orjson is not None and _same_float_format(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # 문자열이 아닌 키, 64비트를 넘는 정수 등 orjson이 쓰지 못하는 값
+            pass
+    return _stdlib_dumps(data)
+
+
+def dump(data: Any, path: Path):
+    """visualinfo 형식으로 파일 쓰기"""
+    Path(path).write_bytes(dumps(data))
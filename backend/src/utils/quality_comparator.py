@@ -3,37 +3,126 @@
 검수 비교 도구 - 자동 검수 결과와 수동 검수 결과를 비교
 """
 
-import json
+import heapq
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterator, List, Any, Optional, Union
 from dataclasses import dataclass
 
-from backend.src.core import QualityController
-from backend.src.models.quality_issue import QualityIssue
-from backend.src.utils.zip_processor import ZipProcessor
+from ..core import QualityController
+from ..models.quality_issue import QualityIssue
+from ..models.issue_store import IssueRange, IssueStore
+from . import json_codec
+from .report_writer import DocumentReportWriter, open_issue_writer
+from .result_cache import ResultCache, dump_issues, load_issues
+from .zip_processor import ZipProcessor, VisualinfoEntry
+
+
+# 비교 로직 버전 (차이점 계산 방식이 바뀌면 올려서 결과 캐시 무효화)
+COMPARISON_VERSION = "1"
+
+# 보고서의 "이슈가 많은 상위 파일" 수
+TOP_ISSUE_FILES = 5
 
 
 @dataclass
 class ComparisonResult:
     """비교 결과 데이터 클래스"""
     file_path: str
-    auto_issues: List[QualityIssue]
+    auto_issues: IssueRange  # QualityComparator.issues 안의 이 파일 이슈 범위
     manual_fixed: bool
     differences: List[str]
     accuracy_score: float
 
 
+class ComparisonSummary:
+    """비교 결과 누적 집계 (결과를 모두 보관하지 않고 보고서 요약 계산)"""
+    
+    def __init__(self, top_n: int = TOP_ISSUE_FILES):
+        self.top_n = top_n
+        self.total_files = 0
+        self.files_with_manual_fixes = 0
+        self.accuracy_sum = 0.0
+        self.total_auto_issues = 0
+        self.total_manual_changes = 0
+        self.accuracy_distribution = {"high_accuracy": 0, "medium_accuracy": 0, "low_accuracy": 0}
+        self._top: List[tuple] = []  # (이슈 수, -순번, 항목) 최소 힙
+    
+    def add(self, result: ComparisonResult):
+        issue_count = len(result.auto_issues)
+        accuracy = result.accuracy_score
+        
+        self.total_files += 1
+        self.files_with_manual_fixes += 1 if result.manual_fixed else 0
+        self.accuracy_sum += accuracy
+        self.total_auto_issues += issue_count
+        self.total_manual_changes += len(result.differences)
+        
+        if accuracy >= 80:
+            self.accuracy_distribution["high_accuracy"] += 1
+        elif accuracy >= 60:
+            self.accuracy_distribution["medium_accuracy"] += 1
+        else:
+            self.accuracy_distribution["low_accuracy"] += 1
+        
+        # 이슈 수가 같으면 먼저 처리한 파일 우선 (sorted(..., reverse=True)와 같은 순서)
+        entry = (issue_count, -self.total_files, {
+            "file": result.file_path,
+            "auto_issues_count": issue_count,
+            "manual_changes_count": len(result.differences),
+            "accuracy": accuracy
+        })
+        if len(self._top) < self.top_n:
+            heapq.heappush(self._top, entry)
+        elif entry[:2] > self._top[0][:2]:
+            heapq.heapreplace(self._top, entry)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """보고서의 summary/accuracy_distribution/top_issue_files"""
+        total_files = self.total_files
+        return {
+            "summary": {
+                "total_files": total_files,
+                "files_with_manual_fixes": self.files_with_manual_fixes,
+                "manual_fix_rate": (self.files_with_manual_fixes / total_files * 100) if total_files > 0 else 0,
+                "average_accuracy": self.accuracy_sum / total_files if total_files else 0,
+                "total_auto_issues": self.total_auto_issues,
+                "total_manual_changes": self.total_manual_changes
+            },
+            "accuracy_distribution": dict(self.accuracy_distribution),
+            "top_issue_files": [entry for _, _, entry in sorted(self._top, key=lambda e: e[:2], reverse=True)]
+        }
+
+
 class QualityComparator:
     """품질 검수 비교기"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ResultCache] = None):
         self.controller = QualityController()
         self.zip_processor = ZipProcessor()
+        self.cache = cache
+        self.issues = IssueStore()  # 마지막 compare_directories()의 자동 검출 이슈 전체
+    
+    def compare_directories(self, target_dir: Path, completed_dir: Path,
+                            progress_callback: Optional[Callable[[int, int], None]] = None) -> List[ComparisonResult]:
+        """
+        폴더명 매칭 + visualinfo/*.json만 비교
+        
+        Args:
+            progress_callback: 원본 문서 하나를 처리할 때마다 (처리한 수, 원본 문서 수)로 호출
+        """
+        self.issues = IssueStore()
+        return list(self.iter_compare_directories(target_dir, completed_dir, progress_callback))
     
-    def compare_directories(self, target_dir: Path, completed_dir: Path) -> List[ComparisonResult]:
-        """폴더명 매칭 + visualinfo/*.json만 비교"""
-        results = []
+    def iter_compare_directories(self, target_dir: Path, completed_dir: Path,
+                                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                                 keep_issues: bool = True) -> Iterator[ComparisonResult]:
+        """
+        compare_directories()와 같지만 문서 하나를 비교할 때마다 결과를 내보냄
         
+        Args:
+            keep_issues: False면 이슈를 self.issues에 모으지 않고 문서마다 따로 보관
+                         (결과를 바로 기록하고 버리는 스트리밍 보고서용)
+        """
         # 먼저 각 디렉토리에서 ZIP 파일 처리
         print(f"🔍 원본 폴더 ZIP 처리 중: {target_dir}")
         target_jsons = self._get_json_files(target_dir, "원본")
@@ -46,13 +135,13 @@ class QualityComparator:
         completed_jsons_by_id = {}
         
         for json_file in target_jsons:
-            if "visualinfo" in str(json_file):
+            if isinstance(json_file, VisualinfoEntry) or "visualinfo" in str(json_file):
                 doc_id = self._get_file_key(json_file)
                 if doc_id:
                     target_jsons_by_id[doc_id] = json_file
         
         for json_file in completed_jsons:
-            if "visualinfo" in str(json_file):
+            if isinstance(json_file, VisualinfoEntry) or "visualinfo" in str(json_file):
                 doc_id = self._get_file_key(json_file)
                 if doc_id:
                     completed_jsons_by_id[doc_id] = json_file
@@ -64,15 +153,21 @@ class QualityComparator:
         
         # 매칭되는 파일들을 비교
         compared = 0
-        for doc_id, target_json in sorted(target_jsons_by_id.items()):
+        for index, (doc_id, target_json) in enumerate(sorted(target_jsons_by_id.items()), 1):
             if doc_id in completed_jsons_by_id:
                 completed_json = completed_jsons_by_id[doc_id]
-                result = self._compare_single_file(target_json, completed_json)
-                results.append(result)
+                store = self.issues if keep_issues else IssueStore()
+                result = self._compare_single_file(target_json, completed_json, store)
                 compared += 1
                 print(f"✅ 비교 완료 ({compared}/{total_docs}): {doc_id}")
             else:
+                result = None
                 print(f"⚠️ 정답 파일 없음: {doc_id}")
+            
+            if progress_callback:
+                progress_callback(index, len(target_jsons_by_id))
+            if result is not None:
+                yield result
         
         # 비교되지 않은 정답 파일 체크
         missing = 0
@@ -83,25 +178,35 @@ class QualityComparator:
         
         if missing > 0:
             print(f"\n⚠️ {missing}개 파일이 원본에서 누락됨")
-        
-        return results
     
-    def _get_json_files(self, directory: Path, label: str) -> List[Path]:
-        """디렉토리에서 JSON 파일 추출 - 자동으로 ZIP 처리"""
-        # ZIP 파일 처리
-        zip_files = list(directory.rglob("*.zip"))
-        if zip_files:
-            print(f"� {label} 디렉토리에서 ZIP 파일 {len(zip_files)}개 발견, 압축 해제 시작...")
-            for zip_file in zip_files:
-                self.zip_processor.extract_zip_file(zip_file)
-        
-        # visualinfo/*.json 파일만 검색
+    def _get_json_files(self, directory: Path, label: str) -> List[Union[VisualinfoEntry, Path]]:
+        """디렉토리에서 visualinfo JSON 목록 수집 - ZIP 파일은 압축 해제 없이 내부 멤버를 직접 참조"""
+        # ZIP 파일 내부 visualinfo 멤버
+        zip_entries = self.zip_processor.find_visualinfo_entries(directory)
+        if zip_entries:
+            print(f"📦 {label} 디렉토리에서 ZIP 내부 visualinfo JSON {len(zip_entries)}개 발견")
+        
+        # 이미 추출된 visualinfo/*.json 파일 (같은 문서면 추출된 파일이 우선)
         json_files = list(directory.rglob("visualinfo/*.json"))
         print(f"📄 {label} 디렉토리에서 visualinfo JSON 파일 {len(json_files)}개 발견")
         
-        return json_files
+        return zip_entries + json_files
+    
+    def _read_visualinfo(self, source: Union[VisualinfoEntry, Path]) -> bytes:
+        """ZIP 멤버 또는 JSON 파일에서 visualinfo 원본 바이트 읽기"""
+        if isinstance(source, VisualinfoEntry):
+            return self.zip_processor.read_visualinfo_bytes(source)
+        
+        with open(source, 'rb') as f:
+            return f.read()
     
-    def _get_file_key(self, file_path: Path) -> str:
+    def _source_path(self, source: Union[VisualinfoEntry, Path]) -> str:
+        """이슈에 기록할 경로"""
+        if isinstance(source, VisualinfoEntry):
+            return source.display_path
+        return str(source)
+    
+    def _get_file_key(self, file_path: Union[VisualinfoEntry, Path]) -> str:
         """파일 매칭용 키 생성"""
         # visualinfo 파일명에서 고유 식별자 추출
         name = file_path.name
@@ -109,8 +214,8 @@ class QualityComparator:
             # "FLAW2023000592_visualinfo.json" → "FLAW2023000592"
             return name.split("_visualinfo")[0]
         else:
-            return file_path.stem
-            
+            return Path(name).stem
+    
     def _get_folder_name(self, file_path: Path) -> str:
         """파일 경로에서 상위 폴더명 추출"""
         # visualinfo/*.json 파일의 상위 폴더명 추출
@@ -120,36 +225,71 @@ class QualityComparator:
         except:
             return ""
     
-    def _compare_single_file(self, target_file: Path, completed_file: Path) -> ComparisonResult:
-        """단일 파일 비교"""
-        # 자동 검수 실행
-        auto_issues = self.controller.validate_file(target_file)
+    def _compare_single_file(self, target_file: Union[VisualinfoEntry, Path],
+                             completed_file: Union[VisualinfoEntry, Path],
+                             store: Optional[IssueStore] = None) -> ComparisonResult:
+        """단일 파일 비교 (이슈는 store, 없으면 self.issues에 추가)"""
+        target_path = self._source_path(target_file)
         
-        # 원본과 검수완료 파일 비교
-        differences = self._find_differences(target_file, completed_file)
+        try:
+            target_content = self._read_visualinfo(target_file)
+            completed_content = self._read_visualinfo(completed_file)
+            
+            # 두 파일 내용이 모두 같은 비교 결과가 캐시에 있으면 파싱/검증 생략
+            cache_key = None
+            cached = None
+            if self.cache is not None:
+                version = f"{COMPARISON_VERSION}-{self.controller.validator.ruleset_version}"
+                cache_key = self.cache.make_key("compare", version, target_content, completed_content)
+                cached = self.cache.get(cache_key)
+            
+            if cached is None:
+                target_data = json_codec.loads(target_content)
+                completed_data = json_codec.loads(completed_content)
+        except Exception as e:
+            auto_issues = [QualityIssue(
+                rule_id="SYSTEM_ERROR",
+                severity="error",
+                message=f"파일 로드 실패: {str(e)}",
+                file_path=target_path
+            )]
+            differences = [f"파일 비교 오류: {str(e)}"]
+        else:
+            if cached is not None:
+                auto_issues = load_issues(cached['auto_issues'], target_path)
+                differences = cached['differences']
+            else:
+                # 자동 검수 실행
+                auto_issues = self.controller.validate_data(target_data, target_path)
+                
+                # 원본과 검수완료 파일 비교
+                differences = self._find_differences(target_data, completed_data)
+                
+                if cache_key is not None:
+                    self.cache.put(cache_key, {
+                        'auto_issues': dump_issues(auto_issues, target_path),
+                        'differences': differences
+                    })
+        
+        # 이슈는 열 단위 저장소에 모으고 결과에는 범위만 보관
+        auto_range = (self.issues if store is None else store).extend(auto_issues)
         
         # 정확도 계산
-        accuracy = self._calculate_accuracy(auto_issues, differences)
+        accuracy = self._calculate_accuracy(auto_range, differences)
         
         return ComparisonResult(
             file_path=str(target_file.name),
-            auto_issues=auto_issues,
+            auto_issues=auto_range,
             manual_fixed=len(differences) > 0,
             differences=differences,
             accuracy_score=accuracy
         )
     
-    def _find_differences(self, target_file: Path, completed_file: Path) -> List[str]:
+    def _find_differences(self, target_data: Dict[str, Any], completed_data: Dict[str, Any]) -> List[str]:
         """파일 간 차이점 찾기"""
         differences = []
         
         try:
-            with open(target_file, 'r', encoding='utf-8') as f:
-                target_data = json.load(f)
-            
-            with open(completed_file, 'r', encoding='utf-8') as f:
-                completed_data = json.load(f)
-            
             # 요소별 비교
             target_elements = {e.get('id'): e for e in target_data.get('elements', [])}
             completed_elements = {e.get('id'): e for e in completed_data.get('elements', [])}
@@ -181,14 +321,14 @@ class QualityComparator:
         
         return differences
     
-    def _calculate_accuracy(self, auto_issues: List[QualityIssue], manual_differences: List[str]) -> float:
+    def _calculate_accuracy(self, auto_issues: IssueRange, manual_differences: List[str]) -> float:
         """정확도 계산"""
         if not manual_differences:
             # 수동 수정이 없고 자동 검수에서도 이슈가 없으면 100%
-            return 100.0 if not auto_issues else 90.0
+            return 100.0 if not len(auto_issues) else 90.0
         
         # 자동 검수가 발견한 이슈와 수동 수정이 얼마나 일치하는지 계산
-        auto_label_issues = [issue for issue in auto_issues if 'label' in issue.message.lower()]
+        auto_label_issues = [message for message in auto_issues.messages() if 'label' in message.lower()]
         manual_label_changes = [diff for diff in manual_differences if '라벨 변경' in diff]
         
         if not auto_label_issues and not manual_label_changes:
@@ -206,53 +346,59 @@ class QualityComparator:
     
     def generate_comparison_report(self, results: List[ComparisonResult]) -> Dict[str, Any]:
         """비교 보고서 생성"""
-        total_files = len(results)
-        files_with_manual_fixes = sum(1 for r in results if r.manual_fixed)
+        summary = ComparisonSummary()
+        for result in results:
+            summary.add(result)
         
-        # 정확도 통계
-        accuracies = [r.accuracy_score for r in results]
-        avg_accuracy = sum(accuracies) / len(accuracies) if accuracies else 0
+        report = summary.to_dict()
+        report["detailed_results"] = [self._detailed_result(r) for r in results]
+        return report
+    
+    def _detailed_result(self, result: ComparisonResult, include_issues: bool = True) -> Dict[str, Any]:
+        """보고서의 파일별 상세 결과"""
+        detail = {"file": result.file_path}
+        if include_issues:
+            detail["auto_issues"] = list(result.auto_issues.iter_dicts())
+        else:
+            detail["auto_issues_count"] = len(result.auto_issues)
+        detail["manual_differences"] = result.differences
+        detail["accuracy_score"] = result.accuracy_score
+        return detail
+    
+    def write_comparison_report(self, target_dir: Path, completed_dir: Path, report_path: Optional[Path],
+                                issues_path: Optional[Path] = None,
+                                progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        비교하면서 보고서를 파일에 바로 기록 (비교 결과/이슈를 메모리에 모으지 않음)
         
-        # 이슈 통계
-        total_auto_issues = sum(len(r.auto_issues) for r in results)
-        total_manual_changes = sum(len(r.differences) for r in results)
+        Args:
+            report_path: .jsonl/.ndjson이면 파일별 결과 한 줄씩 + 마지막 줄 요약,
+                         그 외에는 generate_comparison_report()와 같은 키의 JSON (None이면 기록하지 않음)
+            issues_path: 지정하면 이슈는 이 파일(.jsonl/.parquet)에 한 행씩 기록하고 보고서에는 이슈 수만 기록
         
-        # 가장 많은 이슈가 있는 파일들
-        top_issue_files = sorted(results, key=lambda r: len(r.auto_issues), reverse=True)[:5]
+        Returns:
+            summary/accuracy_distribution/top_issue_files (print_summary()에 사용)
+        """
+        summary = ComparisonSummary()
+        issue_writer = open_issue_writer(issues_path) if issues_path else None
+        report_writer = DocumentReportWriter(report_path) if report_path else None
         
-        return {
-            "summary": {
-                "total_files": total_files,
-                "files_with_manual_fixes": files_with_manual_fixes,
-                "manual_fix_rate": (files_with_manual_fixes / total_files * 100) if total_files > 0 else 0,
-                "average_accuracy": avg_accuracy,
-                "total_auto_issues": total_auto_issues,
-                "total_manual_changes": total_manual_changes
-            },
-            "accuracy_distribution": {
-                "high_accuracy": sum(1 for a in accuracies if a >= 80),
-                "medium_accuracy": sum(1 for a in accuracies if 60 <= a < 80),
-                "low_accuracy": sum(1 for a in accuracies if a < 60)
-            },
-            "top_issue_files": [
-                {
-                    "file": r.file_path,
-                    "auto_issues_count": len(r.auto_issues),
-                    "manual_changes_count": len(r.differences),
-                    "accuracy": r.accuracy_score
-                }
-                for r in top_issue_files
-            ],
-            "detailed_results": [
-                {
-                    "file": r.file_path,
-                    "auto_issues": [issue.to_dict() for issue in r.auto_issues],
-                    "manual_differences": r.differences,
-                    "accuracy_score": r.accuracy_score
-                }
-                for r in results
-            ]
-        }
+        try:
+            for result in self.iter_compare_directories(target_dir, completed_dir, progress_callback,
+                                                        keep_issues=False):
+                summary.add(result)
+                if issue_writer is not None:
+                    issue_writer.write(result.file_path, result.auto_issues)
+                if report_writer is not None:
+                    report_writer.write(self._detailed_result(result, include_issues=issue_writer is None))
+        finally:
+            report = summary.to_dict()
+            if report_writer is not None:
+                report_writer.close(report)
+            if issue_writer is not None:
+                issue_writer.close()
+        
+        return report
     
     def print_summary(self, report: Dict[str, Any]):
         """요약 출력"""
@@ -287,40 +433,38 @@ def main():
     parser = argparse.ArgumentParser(description="자동수정 결과와 정답 폴더 비교")
     parser.add_argument("target_dir", help="자동수정 결과 폴더 경로")
     parser.add_argument("completed_dir", help="정답(수동검수) 폴더 경로")
-    parser.add_argument("--report", help="비교 리포트 저장 경로", default="quality_comparison_report.json")
+    parser.add_argument("--report", help="비교 리포트 저장 경로 (.jsonl이면 파일별 한 줄씩)",
+                        default="quality_comparison_report.json")
+    parser.add_argument("--issues", help="자동 검출 이슈를 한 행씩 따로 저장할 경로 (.jsonl 또는 .parquet)")
     args = parser.parse_args()
-
+    
     target_dir = Path(args.target_dir)
     completed_dir = Path(args.completed_dir)
     report_file = Path(args.report)
-
+    issues_file = Path(args.issues) if args.issues else None
+    
     if not target_dir.exists():
         print(f"❌ 검수 대상 폴더를 찾을 수 없습니다: {target_dir}")
         return
-
+    
     if not completed_dir.exists():
         print(f"❌ 검수 완료 폴더를 찾을 수 없습니다: {completed_dir}")
         return
-
+    
     print("🚀 검수 비교 시작")
     print(f"📂 검수 대상: {target_dir}")
     print(f"📂 검수 완료: {completed_dir}")
-
-    # 비교 실행
+    
+    # 비교하면서 상세 보고서 저장
     comparator = QualityComparator()
-    results = comparator.compare_directories(target_dir, completed_dir)
-
-    # 보고서 생성
-    report = comparator.generate_comparison_report(results)
-
+    report = comparator.write_comparison_report(target_dir, completed_dir, report_file, issues_file)
+    
     # 결과 출력
     comparator.print_summary(report)
-
-    # 상세 보고서 저장
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
-
+    
     print(f"\n💾 상세 보고서 저장: {report_file}")
+    if issues_file:
+        print(f"💾 이슈 목록 저장: {issues_file}")
 
 
 if __name__ == "__main__":
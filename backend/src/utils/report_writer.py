@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+스트리밍 보고서 작성기
+문서 하나를 처리할 때마다 결과를 파일에 바로 기록하고, 요약은 누적 집계로 계산
+(전체 결과를 메모리에 모은 뒤 json.dump 하지 않음)
+- 이슈 파일: NDJSON(.jsonl/.ndjson, 이슈 한 줄에 하나) 또는 Parquet(.parquet, pyarrow 필요)
+- 문서별 보고서: NDJSON(문서 한 줄 + 마지막 줄 요약) 또는 JSON(detailed_results를 이어서 기록)
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from ..models.issue_store import IssueRange, IssueStore
+from ..models.quality_issue import QualityIssue
+
+# 줄 단위 JSON으로 기록할 확장자
+NDJSON_SUFFIXES = ('.jsonl', '.ndjson')
+
+# Parquet row group 크기 (이 행 수만큼 모이면 기록)
+PARQUET_BATCH_SIZE = 50_000
+
+# 이슈 파일 열 (document + QualityIssue.to_dict() 필드)
+ISSUE_COLUMNS = ('document', 'rule_id', 'severity', 'message', 'file_path', 'element_id', 'page_index',
+                 'category', 'suggested_fix', 'auto_fixable', 'metadata')
+
+Issues = Union[Iterable[QualityIssue], IssueStore, IssueRange]
+
+
+def iter_issue_dicts(issues: Issues) -> Iterator[Dict[str, Any]]:
+    """이슈 목록/IssueStore/IssueRange를 to_dict() 형식으로"""
+    if isinstance(issues, (IssueStore, IssueRange)):
+        return issues.iter_dicts()
+    return (issue.to_dict() for issue in issues)
+
+
+def is_ndjson_path(path: Path) -> bool:
+    return Path(path).suffix.lower() in NDJSON_SUFFIXES
+
+
+class IssueSummary:
+    """
+    이슈 누적 집계
+    generate_report()에서 IssueStore와 같은 방식(len, file_count, count_by_rule, files)으로 사용
+    """
+    
+    def __init__(self):
+        self.documents = 0
+        self.total_issues = 0
+        self.rule_counts: Counter = Counter()
+        self.severity_counts: Counter = Counter()
+        self._files: List[str] = []  # 이슈가 있는 문서 (처리 순서)
+    
+    def add(self, document: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """문서 하나의 이슈(to_dict() 형식) 집계 - 이슈 수를 돌려줌"""
+        count = 0
+        for row in rows:
+            self.rule_counts[row['rule_id']] += 1
+            self.severity_counts[row['severity']] += 1
+            count += 1
+        
+        self.documents += 1
+        self.total_issues += count
+        if count:
+            self._files.append(document)
+        return count
+    
+    def __len__(self) -> int:
+        return self.total_issues
+    
+    @property
+    def file_count(self) -> int:
+        return len(self._files)
+    
+    def files(self) -> List[str]:
+        return list(self._files)
+    
+    def count_by_rule(self) -> Dict[str, int]:
+        return dict(self.rule_counts)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "files_with_issues": self.file_count,
+            "total_issues": self.total_issues,
+            "issue_breakdown": dict(self.rule_counts),
+            "severity_breakdown": dict(self.severity_counts)
+        }
+
+
+class IssueWriter:
+    """이슈 파일 작성기 기본 클래스 (문서 단위로 write 호출)"""
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.summary = IssueSummary()
+    
+    def write(self, document: str, issues: Issues) -> int:
+        """문서 하나의 이슈 기록 - 이슈 수를 돌려줌"""
+        return self.summary.add(document, self._write_rows(document, iter_issue_dicts(issues)))
+    
+    def _write_rows(self, document: str, rows: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        raise NotImplementedError
+    
+    def close(self):
+        raise NotImplementedError
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class NDJSONIssueWriter(IssueWriter):
+    """이슈 한 줄에 하나씩 JSON으로 기록"""
+    
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._file = open(self.path, 'w', encoding='utf-8')
+    
+    def _write_rows(self, document: str, rows: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        write = self._file.write
+        for row in rows:
+            write(json.dumps({"document": document, **row}, ensure_ascii=False))
+            write("\n")
+            yield row
+    
+    def close(self):
+        self._file.close()
+
+
+class ParquetIssueWriter(IssueWriter):
+    """이슈를 Parquet로 기록 (batch_size 행마다 row group 하나, metadata는 JSON 문자열)"""
+    
+    def __init__(self, path: Path, batch_size: int = PARQUET_BATCH_SIZE):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet 출력에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        
+        super().__init__(path)
+        self._pa = pa
+        self._schema = pa.schema([
+            ('document', pa.string()),
+            ('rule_id', pa.string()),
+            ('severity', pa.string()),
+            ('message', pa.string()),
+            ('file_path', pa.string()),
+            ('element_id', pa.string()),
+            ('page_index', pa.int64()),
+            ('category', pa.string()),
+            ('suggested_fix', pa.string()),
+            ('auto_fixable', pa.bool_()),
+            ('metadata', pa.string())
+        ])
+        self._writer = pq.ParquetWriter(str(self.path), self._schema)
+        self._batch_size = batch_size
+        self._columns: Dict[str, List[Any]] = {name: [] for name in ISSUE_COLUMNS}
+    
+    def _write_rows(self, document: str, rows: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        columns = self._columns
+        for row in rows:
+            element_id = row['element_id']
+            page_index = row['page_index']
+            columns['document'].append(document)
+            columns['rule_id'].append(row['rule_id'])
+            columns['severity'].append(row['severity'])
+            columns['message'].append(row['message'])
+            columns['file_path'].append(row['file_path'])
+            columns['element_id'].append(None if element_id is None else str(element_id))
+            columns['page_index'].append(page_index if isinstance(page_index, int) else None)
+            columns['category'].append(row['category'])
+            columns['suggested_fix'].append(row['suggested_fix'])
+            columns['auto_fixable'].append(bool(row['auto_fixable']))
+            columns['metadata'].append(json.dumps(row['metadata'], ensure_ascii=False) if row['metadata'] else None)
+            yield row
+        
+        if len(columns['document']) >= self._batch_size:
+            self._flush()
+    
+    def _flush(self):
+        if not self._columns['document']:
+            return
+        self._writer.write_table(self._pa.Table.from_pydict(self._columns, schema=self._schema))
+        self._columns = {name: [] for name in ISSUE_COLUMNS}
+    
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+def open_issue_writer(path: Path) -> IssueWriter:
+    """확장자에 맞는 이슈 파일 작성기 (.parquet → Parquet, 그 외 → NDJSON)"""
+    if Path(path).suffix.lower() == '.parquet':
+        return ParquetIssueWriter(path)
+    return NDJSONIssueWriter(path)
+
+
+class DocumentReportWriter:
+    """
+    문서별 보고서 작성기
+    - NDJSON: 문서 결과 한 줄씩, 마지막 줄은 요약
+    - JSON: {"detailed_results": [문서 결과, ...], 요약 키...} (문서 결과를 이어서 기록하고 요약은 마지막에)
+    """
+    
+    def __init__(self, path: Path, records_key: str = "detailed_results"):
+        self.path = Path(path)
+        self.ndjson = is_ndjson_path(self.path)
+        self._records_key = records_key
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._count = 0
+        if not self.ndjson:
+            self._file.write(f'{{\n  {json.dumps(records_key)}: [')
+    
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        if self.ndjson:
+            self._file.write(line + "\n")
+        else:
+            self._file.write(("," if self._count else "") + "\n    " + line)
+        self._count += 1
+    
+    def close(self, summary: Optional[Dict[str, Any]] = None):
+        """요약을 기록하고 파일 닫기"""
+        summary = summary or {}
+        if self.ndjson:
+            if summary:
+                self._file.write(json.dumps(summary, ensure_ascii=False, default=str) + "\n")
+        else:
+            self._file.write("\n  ]" if self._count else "]")
+            for key, value in summary.items():
+                self._file.write(f",\n  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False, default=str)}")
+            self._file.write("\n}\n")
+        self._file.close()
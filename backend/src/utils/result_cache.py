@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+검수 결과 캐시
+visualinfo JSON 내용 해시와 룰셋 버전을 키로 검증/수정 결과를 디스크에 저장
+- 내용이 바뀌지 않은 문서는 JSON 파싱과 룰 평가를 건너뜀
+- 최근 사용 순(LRU)으로 오래된 항목부터 정리하여 용량 제한 유지
+  (저장할 때 용량 추정치가 제한을 넘으면 정리 - 조회만 하는 실행은 캐시 폴더를 훑지 않음)
+"""
+
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from ..models.quality_issue import QualityIssue
+
+
+# 기본 캐시 위치 및 용량 제한
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "labeling_qc"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 100000
+
+# 캐시 항목 형식 버전 (저장 형식이 바뀌면 올려서 기존 항목 무효화)
+CACHE_FORMAT_VERSION = "1"
+
+# make_stream_key()에서 한 번에 읽을 바이트 수
+STREAM_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def dump_issues(issues: List[QualityIssue], file_path: str) -> List[Dict[str, Any]]:
+    """캐시 저장용 이슈 목록 - 파일 경로는 내용과 무관하므로 제거 (None으로 표시)"""
+    values = []
+    for issue in issues:
+        value = issue.to_dict()
+        if value["file_path"] == file_path:
+            value["file_path"] = None
+        values.append(value)
+    return values
+
+
+def load_issues(values: List[Dict[str, Any]], file_path: str) -> List[QualityIssue]:
+    """캐시에서 읽은 이슈 목록에 현재 파일 경로를 채워 복원"""
+    issues = []
+    for value in values:
+        if value["file_path"] is None:
+            value["file_path"] = file_path
+        issues.append(QualityIssue.from_dict(value))
+    return issues
+
+
+class ResultCache:
+    """내용 해시 기반 디스크 캐시 (LRU, 용량 제한)"""
+    
+    def __init__(self, cache_dir: Path = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        
+        # 캐시 전체 용량/항목 수 추정치 (첫 put에서 한 번 세고 이후 put마다 갱신, 제한을 넘을 때만 정리)
+        self._total_bytes: Optional[int] = None
+        self._total_entries = 0
+    
+    def make_key(self, namespace: str, version: str, *contents: bytes) -> str:
+        """네임스페이스/버전/원본 내용으로 캐시 키 생성"""
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_FORMAT_VERSION}\0{namespace}\0{version}\0".encode('utf-8'))
+        for content in contents:
+            # 여러 내용을 이어 붙일 때 경계가 모호하지 않도록 길이를 함께 기록
+            digest.update(len(content).to_bytes(8, 'big'))
+            digest.update(content)
+        return digest.hexdigest()
+    
+    def make_stream_key(self, namespace: str, version: str, stream: BinaryIO,
+                        chunk_size: int = STREAM_HASH_CHUNK_SIZE) -> str:
+        """스트림 내용을 조금씩 읽어 캐시 키 생성 (큰 문서용 - 같은 내용이어도 make_key()와는 다른 키)"""
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_FORMAT_VERSION}\0{namespace}\0{version}\0stream\0".encode('utf-8'))
+        for chunk in iter(lambda: stream.read(chunk_size), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 손상되었으면 None)"""
+        entry_path = self._entry_path(key)
+        
+        try:
+            with open(entry_path, 'rb') as f:
+                value = json.loads(f.read())
+            # 최근 사용 시각 갱신 (LRU 정리 기준)
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return value
+    
+    def put(self, key: str, value: Any):
+        """캐시 저장 (임시 파일에 쓴 뒤 교체하여 동시 실행 중인 프로세스와 충돌하지 않음)"""
+        entry_path = self._entry_path(key)
+        temp_path = entry_path.with_name(f".{entry_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        data = json.dumps(value, ensure_ascii=False, default=str).encode('utf-8')
+        
+        try:
+            old_size = entry_path.stat().st_size
+        except OSError:
+            old_size = None
+        
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            print(f"⚠️ 캐시 저장 실패: {e}")
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return
+        
+        if self._total_bytes is None:
+            # 첫 저장 시 한 번만 전체를 세고 (필요하면 정리) 이후로는 추정치로 판단
+            self.prune()
+            return
+        
+        self._total_bytes += len(data) - (old_size or 0)
+        if old_size is None:
+            self._total_entries += 1
+        if self._total_bytes > self.max_bytes or self._total_entries > self.max_entries:
+            self.prune()
+    
+    def prune(self) -> int:
+        """용량/개수 제한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+        
+        Returns:
+            삭제된 항목 수
+        """
+        entries = []
+        total_bytes = 0
+        
+        for entry_path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total_bytes += stat.st_size
+        
+        self._total_bytes, self._total_entries = total_bytes, len(entries)
+        if total_bytes <= self.max_bytes and len(entries) <= self.max_entries:
+            return 0
+        
+        # 제한의 90%까지 줄여서 매번 정리가 반복되지 않도록 함
+        target_bytes = int(self.max_bytes * 0.9)
+        target_entries = int(self.max_entries * 0.9)
+        remaining = len(entries)
+        removed = 0
+        
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total_bytes <= target_bytes and remaining <= target_entries:
+                break
+            try:
+                entry_path.unlink()
+            except OSError:
+                continue
+            total_bytes -= size
+            remaining -= 1
+            removed += 1
+        
+        self._total_bytes, self._total_entries = total_bytes, remaining
+        return removed
+    
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        for entry_path in self.cache_dir.glob("*/*.json"):
+            try:
+                entry_path.unlink()
+            except OSError:
+                pass
+        self._total_bytes, self._total_entries = 0, 0
+    
+    def _entry_path(self, key: str) -> Path:
+        """키에 해당하는 항목 경로 (앞 2자리로 하위 폴더 분산)"""
+        return self.cache_dir / key[:2] / f"{key}.json"
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+visualinfo 요소 스트리밍 읽기
+문서 전체를 dict로 만들지 않고 "elements" 배열의 요소를 하나씩 파싱해서 돌려줌
+- 메모리는 읽기 버퍼(STREAM_CHUNK_SIZE 단위)와 요소 하나 크기로 제한
+- slim=True면 규칙이 읽는 필드(id, category, content.text, bbox, pageIndex, 테이블 셀 유무)만 남김
+  (content.html/markdown 등 텍스트 중복 필드는 요소를 파싱한 직후 버림)
+- 파일 객체면 무엇이든 사용 가능 (일반 파일, ZipFile.open() 멤버, BytesIO)
+"""
+
+import codecs
+import json
+import re
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+# 한 번에 읽을 바이트 수
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+_NON_WHITESPACE = re.compile(r'[^ \t\n\r]')
+_decoder = json.JSONDecoder()
+
+
+def slim_element(element: Any) -> Any:
+    """규칙 평가에 필요한 필드만 남긴 요소 (RuleValidator._to_record()와 R005가 읽는 필드)"""
+    if not isinstance(element, dict):
+        return element
+    
+    slim = {}
+    for key in ('id', 'category', 'bbox', 'pageIndex'):
+        if key in element:
+            slim[key] = element[key]
+    
+    content = element.get('content')
+    if isinstance(content, dict):
+        slim['content'] = {'text': content['text']} if 'text' in content else {}
+    elif 'content' in element:
+        slim['content'] = content
+    
+    table = element.get('table')
+    if isinstance(table, dict):
+        # R005는 셀 유무만 봄 - 첫 셀만 남김
+        cells = table.get('cells')
+        slim['table'] = {'cells': cells[:1] if isinstance(cells, list) else cells}
+    
+    return slim
+
+
+class _StreamReader:
+    """바이트 스트림을 UTF-8 텍스트 버퍼로 조금씩 읽으며 JSON 값 단위로 파싱"""
+    
+    def __init__(self, stream: BinaryIO, chunk_size: int):
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    
+    def fill(self) -> bool:
+        """버퍼에 더 읽어 붙임 (더 읽을 내용이 없으면 False)"""
+        if self.eof:
+            return False
+        
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        # 남은 버퍼만큼 더 읽어서 큰 요소를 여러 번 다시 파싱해도 전체는 선형 시간
+        data = self._stream.read(max(self._chunk_size, len(self.buffer)))
+        if not data:
+            self.eof = True
+            self.buffer += self._decoder.decode(b'', True)
+            return False
+        
+        self.buffer += self._decoder.decode(data)
+        return True
+    
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (끝이면 '')"""
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self.fill():
+                return ''
+    
+    def expect(self, chars: str) -> str:
+        """다음 문자가 chars 중 하나인지 확인하고 넘김"""
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+    
+    def value(self) -> Any:
+        """다음 JSON 값 하나 파싱"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # 값이 버퍼 끝에서 잘렸을 수 있으므로 더 읽고 다시 시도
+                if self.fill():
+                    continue
+                raise
+            
+            if end == len(self.buffer) and self.fill():
+                # 숫자 등은 버퍼 끝에서 잘려도 파싱되므로 다음 내용까지 읽고 다시 시도
+                continue
+            
+            self.pos = end
+            return value
+
+
+def iter_elements(stream: BinaryIO, slim: bool = True,
+                  chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    visualinfo JSON 스트림에서 "elements" 요소를 하나씩 읽기
+    
+    Args:
+        stream: 바이너리 파일 객체
+        slim: True면 slim_element()로 규칙에 필요한 필드만 남김
+        chunk_size: 한 번에 읽을 바이트 수
+    
+    Yields:
+        문서 순서대로 요소 (최상위가 객체가 아니거나 elements가 없으면 없음)
+    
+    Raises:
+        json.JSONDecodeError: JSON 형식 오류 (요소를 일부 돌려준 뒤에 발생할 수 있음)
+    """
+    reader = _StreamReader(stream, chunk_size)
+    
+    if reader.peek() != '{':
+        reader.value()
+    else:
+        reader.expect('{')
+        if reader.peek() == '}':
+            reader.pos += 1
+        else:
+            while True:
+                if reader.peek() != '"':
+                    raise json.JSONDecodeError("Expecting property name enclosed in double quotes",
+                                               reader.buffer, reader.pos)
+                key = reader.value()
+                reader.expect(':')
+                
+                if key == 'elements' and reader.peek() == '[':
+                    reader.expect('[')
+                    if reader.peek() == ']':
+                        reader.pos += 1
+                    else:
+                        while True:
+                            element = reader.value()
+                            yield slim_element(element) if slim else element
+                            if reader.expect(',]') == ']':
+                                break
+                else:
+                    reader.value()
+                
+                if reader.expect(',}') == '}':
+                    break
+    
+    if reader.peek():
+        raise json.JSONDecodeError("Extra data", reader.buffer, reader.pos)
+
+
+def iter_file_elements(file_path: Path, slim: bool = True) -> Iterator[Any]:
+    """visualinfo JSON 파일에서 요소를 하나씩 읽기"""
+    with open(file_path, 'rb') as f:
+        yield from iter_elements(f, slim)
+
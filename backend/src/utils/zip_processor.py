@@ -4,11 +4,57 @@ ZIP 파일 처리기
 라벨링 데이터 ZIP 파일을 추출하고 JSON 파일을 찾는 도구
 """
 
+import io
+import tempfile
 import zipfile
-from pathlib import Path
-from typing import List
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
 import shutil
 
+from . import json_codec
+
+# 배치 ZIP 안의 ZIP을 메모리에 둘 최대 크기 (넘으면 임시 파일로 옮김)
+NESTED_ZIP_SPOOL_BYTES = 16 * 1024 * 1024
+
+
+class VisualinfoEntry(NamedTuple):
+    """ZIP 내부 visualinfo JSON 위치"""
+    zip_path: Path
+    member: str
+    
+    @property
+    def name(self) -> str:
+        """멤버 파일명 (예: TLAW1202000357_TP_visualinfo.json)"""
+        return PurePosixPath(self.member).name
+    
+    @property
+    def display_path(self) -> str:
+        """이슈/보고서에 기록할 경로 (ZIP 경로/멤버 경로)"""
+        return f"{self.zip_path}/{self.member}"
+
+
+def is_visualinfo_member(member: str) -> bool:
+    """ZIP 멤버가 visualinfo/*.json 파일인지 확인"""
+    path = PurePosixPath(member)
+    return path.parent.name == "visualinfo" and path.suffix == ".json"
+
+
+@contextmanager
+def _spool_member(zip_ref: zipfile.ZipFile, member: str) -> Iterator[BinaryIO]:
+    """
+    ZIP 멤버를 탐색 가능한 파일로 열기
+    압축된 멤버 스트림은 뒤로 탐색할 때마다 처음부터 다시 풀어야 하므로, 작은 멤버는 메모리에,
+    큰 멤버는 임시 파일에 한 번만 풀어 둠 (NESTED_ZIP_SPOOL_BYTES)
+    """
+    # SpooledTemporaryFile은 Python 3.11 전까지 seekable()이 없어 ZipFile에 넘길 수 없음
+    small = zip_ref.getinfo(member).file_size <= NESTED_ZIP_SPOOL_BYTES
+    with (io.BytesIO() if small else tempfile.TemporaryFile()) as spool:
+        with zip_ref.open(member) as source:
+            shutil.copyfileobj(source, spool)
+        spool.seek(0)
+        yield spool
+
 
 class ZipProcessor:
     """ZIP 파일 처리기"""
@@ -40,7 +86,7 @@ class ZipProcessor:
             
             print(f"📦 추출 완료: {zip_path.name} → {extract_dir}")
             return extract_dir
-            
+        
         except Exception as e:
             print(f"❌ 추출 실패: {zip_path.name} - {e}")
             return None
@@ -78,6 +124,99 @@ class ZipProcessor:
         
         return json_files
     
+    def list_visualinfo_entries(self, zip_path: Path) -> List[VisualinfoEntry]:
+        """ZIP 파일 안의 visualinfo JSON 목록 (압축 해제 없음)"""
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            return [
+                VisualinfoEntry(zip_path, member)
+                for member in zip_ref.namelist()
+                if is_visualinfo_member(member)
+            ]
+    
+    def find_visualinfo_entries(self, source_dir: Path) -> List[VisualinfoEntry]:
+        """디렉토리 내 모든 ZIP 파일의 visualinfo JSON 목록 (압축 해제 없음)"""
+        entries = []
+        
+        for zip_path in sorted(source_dir.rglob("*.zip")):
+            try:
+                entries.extend(self.list_visualinfo_entries(zip_path))
+            except (zipfile.BadZipFile, OSError) as e:
+                print(f"❌ ZIP 읽기 실패: {zip_path.name} - {e}")
+        
+        return entries
+    
+    def read_visualinfo(self, entry: VisualinfoEntry) -> Dict[str, Any]:
+        """visualinfo 멤버만 메모리로 읽어 JSON 로드 (PDF 등 다른 멤버는 읽지 않음)"""
+        with zipfile.ZipFile(entry.zip_path, 'r') as zip_ref:
+            return json_codec.loads(zip_ref.read(entry.member))
+    
+    def read_visualinfo_bytes(self, entry: VisualinfoEntry) -> bytes:
+        """visualinfo 멤버의 원본 바이트만 메모리로 읽기"""
+        with zipfile.ZipFile(entry.zip_path, 'r') as zip_ref:
+            return zip_ref.read(entry.member)
+    
+    def read_all_visualinfo(self, zip_path: Path) -> List[Tuple[VisualinfoEntry, Dict[str, Any]]]:
+        """ZIP 파일을 한 번만 열어 모든 visualinfo 멤버 로드"""
+        return [(entry, json_codec.loads(content)) for entry, content in self.read_all_visualinfo_bytes(zip_path)]
+    
+    def read_all_visualinfo_bytes(self, zip_path: Path,
+                                  max_bytes: Optional[int] = None) -> List[Tuple[VisualinfoEntry, Optional[bytes]]]:
+        """
+        ZIP 파일을 한 번만 열어 모든 visualinfo 멤버의 원본 바이트 로드 (JSON 파싱 없음)
+        max_bytes 이상인 멤버는 읽지 않고 None (open_visualinfo()로 스트리밍해서 처리)
+        """
+        results = []
+        
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for info in zip_ref.infolist():
+                if not is_visualinfo_member(info.filename):
+                    continue
+                entry = VisualinfoEntry(zip_path, info.filename)
+                if max_bytes is not None and info.file_size >= max_bytes:
+                    results.append((entry, None))
+                else:
+                    results.append((entry, zip_ref.read(info)))
+        
+        return results
+    
+    @contextmanager
+    def open_visualinfo(self, entry: VisualinfoEntry) -> Iterator[BinaryIO]:
+        """visualinfo 멤버를 압축을 풀면서 읽는 스트림 (멤버 전체를 메모리에 올리지 않음)"""
+        with zipfile.ZipFile(entry.zip_path, 'r') as zip_ref:
+            with zip_ref.open(entry.member) as stream:
+                yield stream
+    
+    def iter_uploaded_visualinfo(self, fileobj: BinaryIO, filename: str) -> Iterator[Tuple[str, bytes]]:
+        """
+        업로드된 파일에서 visualinfo JSON을 하나씩 읽기 (디스크에 저장/압축 해제하지 않음)
+        
+        - .json: 파일 자체
+        - .zip: visualcontent ZIP(visualinfo/*.json) 또는 여러 visualcontent ZIP/JSON을 묶은 배치 ZIP
+        
+        Args:
+            fileobj: 탐색 가능한 바이너리 파일 객체
+            filename: 업로드 파일명 (결과 경로 표시용)
+        
+        Yields:
+            (문서 경로, visualinfo 원본 바이트) - 문서 경로는 "파일명/멤버 경로" 형식
+        """
+        if not filename.lower().endswith('.zip'):
+            yield filename, fileobj.read()
+            return
+        
+        with zipfile.ZipFile(fileobj, 'r') as zip_ref:
+            for member in zip_ref.namelist():
+                lower = member.lower()
+                if is_visualinfo_member(member) or (lower.endswith('.json') and '/' not in member):
+                    yield f"{filename}/{member}", zip_ref.read(member)
+                elif lower.endswith('.zip'):
+                    # 배치 ZIP 안의 visualcontent ZIP - 통째로 읽지 않고 visualinfo만 읽음
+                    with _spool_member(zip_ref, member) as inner_file, \
+                            zipfile.ZipFile(inner_file, 'r') as inner_ref:
+                        for inner_member in inner_ref.namelist():
+                            if is_visualinfo_member(inner_member):
+                                yield f"{filename}/{member}/{inner_member}", inner_ref.read(inner_member)
+    
     def process_directory(self, source_dir: Path) -> List[Path]:
         """디렉토리 전체 처리"""
         print(f"🚀 처리 시작: {source_dir}")
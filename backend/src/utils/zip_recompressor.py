@@ -2,12 +2,262 @@
 """
 ZIP 재압축기
 수정된 JSON 파일들을 다시 ZIP 파일로 압축하는 도구
+- 변경되지 않은 멤버(원본 PDF 등)는 압축된 바이트를 그대로 복사
+- 변경된 멤버만 새로 압축
+- 임시 파일에 쓴 뒤 교체하여 원자적으로 저장
 """
 
+import os
+import struct
+import time
+import uuid
 import zipfile
-import shutil
+import zlib
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Tuple
+
+
+# 원시 복사 시 한 번에 읽을 크기
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# ZIP 레코드 형식 (PKWARE APPNOTE 4.3 - 로컬 헤더, 중앙 디렉토리, 끝 레코드)
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+_LOCAL_SIGNATURE = b'PK\x03\x04'
+_CENTRAL_HEADER = struct.Struct('<4s4B4HL2L5H2L')
+_CENTRAL_SIGNATURE = b'PK\x01\x02'
+_DATA_DESCRIPTOR_SIGNATURE = b'PK\x07\x08'
+_END_RECORD = struct.Struct('<4s4H2LH')
+_END_SIGNATURE = b'PK\x05\x06'
+_ZIP64_END_RECORD = struct.Struct('<4sQ2H2L4Q')
+_ZIP64_END_SIGNATURE = b'PK\x06\x06'
+_ZIP64_LOCATOR = struct.Struct('<4sLQL')
+_ZIP64_LOCATOR_SIGNATURE = b'PK\x06\x07'
+
+# 32비트 필드 한계 (넘으면 zip64 extra 필드에 기록)
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP64_COUNT_LIMIT = 0xFFFF
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP64_VERSION = 45
+
+# 일반 목적 플래그: 암호화 / 데이터 디스크립터 사용 (크기/CRC를 데이터 뒤에 기록) / 파일명 UTF-8
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+
+# 새로 압축하는 멤버의 기록 정보 (zipfile.ZipFile.writestr 기본값과 같음)
+_DEFLATE_VERSION = 20
+_DEFAULT_EXTERNAL_ATTR = 0o600 << 16
+
+
+class _CentralEntry(NamedTuple):
+    """중앙 디렉토리에 기록할 멤버 정보"""
+    filename: bytes
+    create_version: int
+    create_system: int
+    extract_version: int
+    flag_bits: int
+    compress_type: int
+    date_time: Tuple[int, int, int, int, int, int]
+    crc: int
+    compress_size: int
+    file_size: int
+    extra: bytes
+    comment: bytes
+    internal_attr: int
+    external_attr: int
+    header_offset: int
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """extra 필드에서 zip64 항목 제거 (크기/위치가 바뀌므로 기록할 때 다시 만듦)"""
+    fields = []
+    pos = 0
+    while pos + 4 <= len(extra):
+        header_id, size = struct.unpack_from('<2H', extra, pos)
+        if header_id != _ZIP64_EXTRA_ID:
+            fields.append(extra[pos:pos + 4 + size])
+        pos += 4 + size
+    return b''.join(fields)
+
+
+def _zip64_extra(values: List[int]) -> bytes:
+    if not values:
+        return b''
+    return struct.pack(f'<2H{len(values)}Q', _ZIP64_EXTRA_ID, 8 * len(values), *values)
+
+
+def _dos_date_time(date_time: Tuple[int, ...]) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def _encode_filename(info: zipfile.ZipInfo) -> bytes:
+    """원본 멤버 파일명을 원래 바이트로 (UTF-8 플래그가 없으면 zipfile이 cp437로 읽음)"""
+    return info.filename.encode('utf-8' if info.flag_bits & _FLAG_UTF8 else 'cp437')
+
+
+class RawZipWriter:
+    """
+    로컬 헤더/중앙 디렉토리를 struct로 직접 기록하는 ZIP 작성기
+    zipfile에는 압축된 데이터를 그대로 옮기는 공개 API가 없어서 사용 (zip64 지원)
+    """
+    
+    def __init__(self, fp: BinaryIO):
+        self.fp = fp
+        self._entries: List[_CentralEntry] = []
+    
+    def copy_member(self, src_fp: BinaryIO, info: zipfile.ZipInfo):
+        """원본 ZIP 멤버의 압축된 데이터를 압축 해제 없이 복사"""
+        src_fp.seek(info.header_offset)
+        header = _LOCAL_HEADER.unpack(src_fp.read(_LOCAL_HEADER.size))
+        if header[0] != _LOCAL_SIGNATURE:
+            raise zipfile.BadZipFile(f"잘못된 로컬 헤더: {info.filename}")
+        name_length, extra_length = header[10], header[11]
+        src_fp.seek(name_length, os.SEEK_CUR)
+        local_extra = _strip_zip64_extra(src_fp.read(extra_length))
+        
+        # 크기/CRC를 로컬 헤더에 바로 기록 (암호화된 멤버는 검증 바이트가 달라지므로 디스크립터 유지)
+        flag_bits = info.flag_bits
+        if not flag_bits & _FLAG_ENCRYPTED:
+            flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+        
+        entry = _CentralEntry(
+            filename=_encode_filename(info),
+            create_version=info.create_version,
+            create_system=info.create_system,
+            extract_version=info.extract_version,
+            flag_bits=flag_bits,
+            compress_type=info.compress_type,
+            date_time=info.date_time,
+            crc=info.CRC,
+            compress_size=info.compress_size,
+            file_size=info.file_size,
+            extra=_strip_zip64_extra(info.extra),
+            comment=info.comment,
+            internal_attr=info.internal_attr,
+            external_attr=info.external_attr,
+            header_offset=self.fp.tell()
+        )
+        self._write_local_header(entry, local_extra)
+        
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = src_fp.read(min(remaining, COPY_CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"압축 데이터가 잘렸습니다: {info.filename}")
+            self.fp.write(chunk)
+            remaining -= len(chunk)
+        
+        if flag_bits & _FLAG_DATA_DESCRIPTOR:
+            self._write_data_descriptor(entry)
+        self._entries.append(entry)
+    
+    def write_member(self, filename: str, data: bytes, date_time: Tuple[int, ...],
+                     external_attr: int = _DEFAULT_EXTERNAL_ATTR):
+        """새 내용을 deflate로 압축해서 기록"""
+        try:
+            name, flag_bits = filename.encode('ascii'), 0
+        except UnicodeEncodeError:
+            name, flag_bits = filename.encode('utf-8'), _FLAG_UTF8
+        
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+        
+        entry = _CentralEntry(
+            filename=name,
+            create_version=_DEFLATE_VERSION,
+            create_system=3 if os.sep == '/' else 0,
+            extract_version=_DEFLATE_VERSION,
+            flag_bits=flag_bits,
+            compress_type=zipfile.ZIP_DEFLATED,
+            date_time=tuple(date_time),
+            crc=zlib.crc32(data),
+            compress_size=len(compressed),
+            file_size=len(data),
+            extra=b'',
+            comment=b'',
+            internal_attr=0,
+            external_attr=external_attr,
+            header_offset=self.fp.tell()
+        )
+        self._write_local_header(entry, b'')
+        self.fp.write(compressed)
+        self._entries.append(entry)
+    
+    def close(self, comment: bytes = b''):
+        """중앙 디렉토리와 끝 레코드 기록"""
+        fp = self.fp
+        start_dir = fp.tell()
+        
+        for entry in self._entries:
+            zip64_values = [value for value in (entry.file_size, entry.compress_size, entry.header_offset)
+                            if value > _ZIP64_LIMIT]
+            extra = _zip64_extra(zip64_values) + entry.extra
+            dos_time, dos_date = _dos_date_time(entry.date_time)
+            fp.write(_CENTRAL_HEADER.pack(
+                _CENTRAL_SIGNATURE, entry.create_version, entry.create_system,
+                max(entry.extract_version, _ZIP64_VERSION) if zip64_values else entry.extract_version, 0,
+                entry.flag_bits, entry.compress_type, dos_time, dos_date, entry.crc,
+                min(entry.compress_size, _ZIP64_LIMIT), min(entry.file_size, _ZIP64_LIMIT),
+                len(entry.filename), len(extra), len(entry.comment), 0,
+                entry.internal_attr, entry.external_attr, min(entry.header_offset, _ZIP64_LIMIT)
+            ))
+            fp.write(entry.filename)
+            fp.write(extra)
+            fp.write(entry.comment)
+        
+        end_dir = fp.tell()
+        count, size_dir = len(self._entries), end_dir - start_dir
+        if count > _ZIP64_COUNT_LIMIT or size_dir > _ZIP64_LIMIT or start_dir > _ZIP64_LIMIT:
+            fp.write(_ZIP64_END_RECORD.pack(
+                _ZIP64_END_SIGNATURE, _ZIP64_END_RECORD.size - 12, _ZIP64_VERSION, _ZIP64_VERSION,
+                0, 0, count, count, size_dir, start_dir
+            ))
+            fp.write(_ZIP64_LOCATOR.pack(_ZIP64_LOCATOR_SIGNATURE, 0, end_dir, 1))
+        
+        fp.write(_END_RECORD.pack(
+            _END_SIGNATURE, 0, 0, min(count, _ZIP64_COUNT_LIMIT), min(count, _ZIP64_COUNT_LIMIT),
+            min(size_dir, _ZIP64_LIMIT), min(start_dir, _ZIP64_LIMIT), len(comment)
+        ))
+        fp.write(comment)
+    
+    def _write_local_header(self, entry: _CentralEntry, extra: bytes):
+        zip64 = entry.file_size > _ZIP64_LIMIT or entry.compress_size > _ZIP64_LIMIT
+        if zip64:
+            extra = _zip64_extra([entry.file_size, entry.compress_size]) + extra
+        
+        if entry.flag_bits & _FLAG_DATA_DESCRIPTOR:
+            crc, compress_size, file_size = 0, 0, 0
+        elif zip64:
+            crc, compress_size, file_size = entry.crc, _ZIP64_LIMIT, _ZIP64_LIMIT
+        else:
+            crc, compress_size, file_size = entry.crc, entry.compress_size, entry.file_size
+        
+        dos_time, dos_date = _dos_date_time(entry.date_time)
+        self.fp.write(_LOCAL_HEADER.pack(
+            _LOCAL_SIGNATURE, max(entry.extract_version, _ZIP64_VERSION) if zip64 else entry.extract_version, 0,
+            entry.flag_bits, entry.compress_type, dos_time, dos_date, crc, compress_size, file_size,
+            len(entry.filename), len(extra)
+        ))
+        self.fp.write(entry.filename)
+        self.fp.write(extra)
+    
+    def _write_data_descriptor(self, entry: _CentralEntry):
+        if entry.file_size > _ZIP64_LIMIT or entry.compress_size > _ZIP64_LIMIT:
+            self.fp.write(struct.pack('<4sL2Q', _DATA_DESCRIPTOR_SIGNATURE, entry.crc,
+                                      entry.compress_size, entry.file_size))
+        else:
+            self.fp.write(struct.pack('<4s3L', _DATA_DESCRIPTOR_SIGNATURE, entry.crc,
+                                      entry.compress_size, entry.file_size))
+
+
+def file_crc32(file_path: Path) -> int:
+    """파일 CRC32 계산"""
+    crc = 0
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(COPY_CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc
 
 
 class ZipRecompressor:
@@ -17,40 +267,150 @@ class ZipRecompressor:
         self.output_dir = output_dir or Path("fixed_files")
         self.output_dir.mkdir(exist_ok=True)
     
-    def recompress_directory(self, extracted_dir: Path) -> Path:
-        """추출된 디렉토리를 다시 ZIP으로 압축"""
+    def rewrite_zip(self, source_zip: Path, replacements: Dict[str, bytes], dest_zip: Path = None) -> Optional[Path]:
+        """
+        변경된 멤버만 교체하여 ZIP 재작성
+        
+        Args:
+            source_zip: 원본 ZIP 파일
+            replacements: {멤버 경로: 새 내용} - 이 멤버들만 새로 압축 (원본에 없으면 추가)
+            dest_zip: 저장할 ZIP 경로 (None이면 output_dir/원본 파일명)
+        
+        Returns:
+            저장된 ZIP 경로
+        
+        Raises:
+            zipfile.BadZipFile, OSError: 원본을 읽거나 새 ZIP을 쓰지 못한 경우 (임시 파일은 삭제)
+        """
+        dest_zip = dest_zip or self.output_dir / source_zip.name
+        dest_zip.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._temp_path(dest_zip)
+        
+        try:
+            with zipfile.ZipFile(source_zip, 'r') as src_zip, open(source_zip, 'rb') as src_fp, \
+                    open(temp_path, 'wb') as dest_fp:
+                writer = RawZipWriter(dest_fp)
+                now = time.localtime()[:6]
+                for info in src_zip.infolist():
+                    if info.filename in replacements:
+                        writer.write_member(info.filename, replacements[info.filename], now, info.external_attr)
+                    else:
+                        writer.copy_member(src_fp, info)
+                
+                for name, data in replacements.items():
+                    if name not in src_zip.NameToInfo:
+                        writer.write_member(name, data, now)
+                
+                writer.close(src_zip.comment)
+            
+            os.replace(temp_path, dest_zip)
+            return dest_zip
+        
+        except Exception as e:
+            print(f"❌ ZIP 재작성 실패: {source_zip.name} - {e}")
+            temp_path.unlink(missing_ok=True)
+            raise
+    
+    def recompress_directory(self, extracted_dir: Path, source_zip: Path = None) -> Path:
+        """
+        추출된 디렉토리를 다시 ZIP으로 압축
+        
+        source_zip이 주어지면 원본과 내용이 같은 파일은 원본의 압축 데이터를 그대로 복사하고
+        변경된 파일만 새로 압축한다.
+        """
         zip_name = f"{extracted_dir.name}.zip"
         zip_path = self.output_dir / zip_name
         
+        if source_zip and source_zip.exists():
+            try:
+                replacements = self._changed_files(extracted_dir, source_zip)
+                if replacements is not None:
+                    self.rewrite_zip(source_zip, replacements, zip_path)
+                    print(f"📦 재압축 완료: {zip_name} (변경 {len(replacements)}개)")
+                    return zip_path
+                print(f"⚠️ 원본에서 삭제된 파일이 있어 전체 재압축: {source_zip.name}")
+            except Exception as e:
+                print(f"⚠️ 원본 복사 재작성 실패, 전체 재압축: {source_zip.name} - {e}")
+        
+        temp_path = self._temp_path(zip_path)
+        
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
                 for file_path in extracted_dir.rglob('*'):
                     if file_path.is_file():
                         # 상대 경로로 추가
                         arcname = file_path.relative_to(extracted_dir)
                         zipf.write(file_path, arcname)
             
+            os.replace(temp_path, zip_path)
             print(f"📦 재압축 완료: {zip_name}")
             return zip_path
-            
+        
         except Exception as e:
             print(f"❌ 재압축 실패: {extracted_dir.name} - {e}")
+            temp_path.unlink(missing_ok=True)
             return None
     
-    def recompress_all(self, extracted_base_dir: Path) -> List[Path]:
-        """모든 추출된 디렉토리 재압축"""
+    def recompress_all(self, extracted_base_dir: Path, source_dir: Path = None) -> List[Path]:
+        """
+        모든 추출된 디렉토리 재압축
+        
+        Args:
+            extracted_base_dir: 추출된 디렉토리들의 상위 폴더
+            source_dir: 원본 ZIP 폴더 - 주어지면 같은 이름의 원본 ZIP에서 변경되지 않은 멤버를 복사
+        """
         extracted_dirs = [d for d in extracted_base_dir.iterdir() if d.is_dir()]
         recompressed_files = []
         
+        source_zips = {}
+        if source_dir:
+            output_dir = self.output_dir.resolve()
+            for zip_path in sorted(source_dir.rglob("*.zip"), key=lambda p: len(p.parts)):
+                # 이전 실행 결과물(output_dir 내부)은 원본으로 사용하지 않음
+                if output_dir in zip_path.resolve().parents:
+                    continue
+                source_zips.setdefault(zip_path.stem, zip_path)
+        
         print(f"🔄 재압축 시작: {len(extracted_dirs)}개 디렉토리")
         
         for extracted_dir in extracted_dirs:
-            zip_path = self.recompress_directory(extracted_dir)
+            zip_path = self.recompress_directory(extracted_dir, source_zips.get(extracted_dir.name))
             if zip_path:
                 recompressed_files.append(zip_path)
         
         print(f"✅ 재압축 완료: {len(recompressed_files)}개 파일")
         return recompressed_files
+    
+    def _changed_files(self, extracted_dir: Path, source_zip: Path) -> Optional[Dict[str, bytes]]:
+        """
+        원본 ZIP 멤버와 크기 또는 CRC가 다른 추출 파일 (새로 추가된 파일 포함)
+        
+        추출 디렉토리가 기준이므로 원본 멤버 중 디스크에서 삭제된 파일이 있으면
+        원본 복사로는 표현할 수 없어 None 반환 (전체 재압축 대상)
+        """
+        with zipfile.ZipFile(source_zip, 'r') as src_zip:
+            source_infos = {info.filename: info for info in src_zip.infolist()}
+        
+        extracted_files = {
+            file_path.relative_to(extracted_dir).as_posix(): file_path
+            for file_path in extracted_dir.rglob('*') if file_path.is_file()
+        }
+        if any(not info.is_dir() and name not in extracted_files for name, info in source_infos.items()):
+            return None
+        
+        changed = {}
+        for arcname, file_path in extracted_files.items():
+            info = source_infos.get(arcname)
+            if info and info.file_size == file_path.stat().st_size and info.CRC == file_crc32(file_path):
+                continue
+            
+            changed[arcname] = file_path.read_bytes()
+        
+        return changed
+    
+    def _temp_path(self, dest_path: Path) -> Path:
+        """대상 파일과 같은 폴더의 임시 파일 경로 (os.replace로 원자적 교체)"""
+        return dest_path.with_name(f".{dest_path.name}.{uuid.uuid4().hex[:8]}.tmp")
 
 
 def main():
@@ -0,0 +1,3 @@
+"""
+라벨링 품질 검수 도구 - 성능 측정 도구 패키지
+"""
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+검수 핵심 기능 처리량 측정
+합성 문서(benchmarks.synthetic_corpus)로 문서 크기/문서 수별
+JSON 파싱/직렬화, RuleValidator, RuleBasedFixer, ZIP 추출/재작성, QualityComparator 처리 시간을 측정
+- 측정 결과를 JSON으로 저장하고 이전 결과(--baseline)와 비교해 느려진 항목 표시
+
+사용 예:
+    python -m benchmarks.core_benchmark --elements 10 100 1000 10000 --docs 1 10 100 --save bench/HEAD.json
+    python -m benchmarks.core_benchmark --elements 100000 --docs 1000 --cases validate fix
+    python -m benchmarks.core_benchmark --baseline bench/main.json --fail-on-regression
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.src.core.rule_fixer import RuleBasedFixer
+from backend.src.core.rule_validator import RuleValidator
+from backend.src.utils import json_codec
+from backend.src.utils.quality_comparator import QualityComparator
+from backend.src.utils.zip_processor import ZipProcessor
+from backend.src.utils.zip_recompressor import ZipRecompressor
+
+from .synthetic_corpus import DEFAULT_ERROR_RATE, visualinfo_bytes, write_corpus
+
+
+# 측정 항목 (순서대로 실행)
+CASES = ["parse", "serialize", "validate", "fix", "zip_extract", "zip_repack", "compare"]
+
+# 문서 수를 늘려 측정할 때의 문서당 요소 수 기본값
+DEFAULT_DOC_ELEMENTS = 200
+
+# 이전 결과보다 이 비율 이상 느려지면 성능 저하로 표시
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+@contextlib.contextmanager
+def quiet():
+    """측정 대상의 진행 출력/로그 숨김"""
+    logging.disable(logging.CRITICAL)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def measure(run: Callable[[], None], repeat: int, setup: Optional[Callable[[], None]] = None) -> List[float]:
+    """run() 실행 시간 repeat회 측정 (setup은 매 회 측정 전에 실행, 시간에 포함하지 않음)"""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with quiet():
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+class CorpusCase:
+    """문서 수 x 문서당 요소 수 한 조합의 합성 문서 (ZIP, 검수완료본 ZIP, 압축 해제 폴더)"""
+
+    def __init__(self, work_dir: Path, docs: int, elements: int, seed: int, error_rate: float):
+        self.docs = docs
+        self.elements = elements
+        self.work_dir = work_dir / f"d{docs}_e{elements}"
+        self.zip_dir = self.work_dir / "zip"
+        self.reviewed_dir = self.work_dir / "reviewed"
+        self.extract_dir = self.work_dir / "extracted"
+
+        self.zip_paths = write_corpus(self.zip_dir, docs, elements, seed, error_rate,
+                                      layout="zip", reviewed_dir=self.reviewed_dir)
+        self.json_paths = write_corpus(self.extract_dir, docs, elements, seed, error_rate, layout="json")
+        self.contents = [path.read_bytes() for path in self.json_paths]
+
+    @property
+    def total_elements(self) -> int:
+        return self.docs * self.elements
+
+    def cleanup(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+def run_parse(case: CorpusCase, repeat: int) -> List[float]:
+    """json_codec.loads (orjson이 있으면 orjson)"""
+    def run():
+        for content in case.contents:
+            json_codec.loads(content)
+    return measure(run, repeat)
+
+
+def run_serialize(case: CorpusCase, repeat: int) -> List[float]:
+    """json_codec.dumps (visualinfo 저장 형식)"""
+    documents = [json_codec.loads(content) for content in case.contents]
+
+    def run():
+        for data in documents:
+            json_codec.dumps(data)
+    return measure(run, repeat)
+
+
+def run_validate(case: CorpusCase, repeat: int) -> List[float]:
+    """RuleValidator (파싱 제외)"""
+    validator = RuleValidator()
+    documents = [json_codec.loads(content) for content in case.contents]
+
+    def run():
+        for path, data in zip(case.json_paths, documents):
+            validator.validate_all_rules(data, str(path))
+    return measure(run, repeat)
+
+
+def run_fix(case: CorpusCase, repeat: int) -> List[float]:
+    """RuleBasedFixer 전체 수정 (파일 읽기/파싱 제외, 저장 제외)"""
+    fixers: List[RuleBasedFixer] = []
+
+    def setup():
+        # 수정기는 문서를 직접 바꾸므로 매 회 새로 읽음
+        fixers.clear()
+        fixers.extend(RuleBasedFixer(path.parent.parent) for path in case.json_paths)
+
+    def run():
+        for fixer in fixers:
+            fixer.run_all_rule_fixes()
+    return measure(run, repeat, setup)
+
+
+def run_zip_extract(case: CorpusCase, repeat: int) -> List[float]:
+    """ZipProcessor로 전체 ZIP 압축 해제"""
+    output_dir = case.work_dir / "extract_bench"
+
+    def setup():
+        shutil.rmtree(output_dir, ignore_errors=True)
+        output_dir.mkdir()
+
+    def run():
+        ZipProcessor(extract_base_dir=output_dir).extract_all_zips(case.zip_dir)
+    return measure(run, repeat, setup)
+
+
+def run_zip_repack(case: CorpusCase, repeat: int) -> List[float]:
+    """ZipRecompressor.rewrite_zip으로 visualinfo만 교체해 재작성"""
+    output_dir = case.work_dir / "repack_bench"
+    output_dir.mkdir(exist_ok=True)
+    recompressor = ZipRecompressor(output_dir)
+    replacements = []
+    for zip_path, json_path, content in zip(case.zip_paths, case.json_paths, case.contents):
+        data = json_codec.loads(content)
+        data["runtime"] += 1
+        replacements.append((zip_path, {f"visualinfo/{json_path.name}": visualinfo_bytes(data)}))
+
+    def run():
+        for zip_path, replacement in replacements:
+            recompressor.rewrite_zip(zip_path, replacement)
+    return measure(run, repeat)
+
+
+def run_compare(case: CorpusCase, repeat: int) -> List[float]:
+    """QualityComparator로 원본 ZIP 폴더와 검수완료본 ZIP 폴더 비교 (캐시 없음)"""
+    comparator = QualityComparator()
+
+    def run():
+        comparator.compare_directories(case.zip_dir, case.reviewed_dir)
+    return measure(run, repeat)
+
+
+CASE_RUNNERS: Dict[str, Callable[[CorpusCase, int], List[float]]] = {
+    "parse": run_parse,
+    "serialize": run_serialize,
+    "validate": run_validate,
+    "fix": run_fix,
+    "zip_extract": run_zip_extract,
+    "zip_repack": run_zip_repack,
+    "compare": run_compare,
+}
+
+
+def summarize(name: str, case: CorpusCase, timings: List[float]) -> Dict[str, Any]:
+    """측정 항목 하나의 결과 (최솟값 기준)"""
+    best = min(timings)
+    return {
+        "case": name,
+        "docs": case.docs,
+        "elements": case.elements,
+        "seconds": round(best, 6),
+        "median": round(statistics.median(timings), 6),
+        "docs_per_sec": round(case.docs / best, 2) if best > 0 else 0.0,
+        "elements_per_sec": round(case.total_elements / best, 1) if best > 0 else 0.0,
+        "us_per_element": round(best / case.total_elements * 1e6, 3)
+    }
+
+
+def size_matrix(elements: List[int], docs: List[int], doc_elements: int) -> List[Tuple[int, int]]:
+    """(문서 수, 문서당 요소 수) 조합 - 문서 1개로 크기를 늘리는 곡선 + 같은 크기로 문서 수를 늘리는 곡선"""
+    sizes = [(1, count) for count in elements] + [(count, doc_elements) for count in docs]
+    return sorted(set(sizes), key=lambda size: (size[0] * size[1], size))
+
+
+def git_revision() -> Dict[str, Any]:
+    """측정한 커밋 (git이 없으면 None)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                capture_output=True, text=True, check=True).stdout
+        return {"commit": commit, "dirty": bool(status.strip())}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def compare_with_baseline(rows: List[Dict[str, Any]], baseline: Dict[str, Any],
+                          threshold: float) -> List[Dict[str, Any]]:
+    """이전 측정 결과와 같은 조합끼리 비교 - 각 행에 baseline_seconds/change 추가, 느려진 행 반환"""
+    previous = {(row["case"], row["docs"], row["elements"]): row for row in baseline.get("results", [])}
+    regressions = []
+    for row in rows:
+        old = previous.get((row["case"], row["docs"], row["elements"]))
+        if not old or old["seconds"] <= 0:
+            continue
+        row["baseline_seconds"] = old["seconds"]
+        row["change"] = round(row["seconds"] / old["seconds"] - 1, 4)
+        if row["change"] > threshold:
+            regressions.append(row)
+    return regressions
+
+
+def print_table(rows: List[Dict[str, Any]], threshold: float):
+    """측정 결과 표 출력 (항목별로 크기 순)"""
+    print(f"\n{'항목':<12} {'문서':>6} {'요소/문서':>9} {'소요(초)':>10} {'문서/초':>9} {'µs/요소':>9} {'이전 대비':>9}")
+    print("-" * 74)
+    for row in sorted(rows, key=lambda r: (CASES.index(r["case"]), r["docs"] * r["elements"], r["docs"])):
+        change = ""
+        if "change" in row:
+            change = f"{row['change']:+.1%}" + (" ⚠️" if row["change"] > threshold else "")
+        print(f"{row['case']:<12} {row['docs']:>6} {row['elements']:>9} {row['seconds']:>10.4f} "
+              f"{row['docs_per_sec']:>9.1f} {row['us_per_element']:>9.2f} {change:>9}")
+
+
+def main():
+    """핵심 기능 처리량 측정 실행"""
+    parser = argparse.ArgumentParser(description="합성 문서로 검증/수정/ZIP/비교 처리량 측정")
+    parser.add_argument("--elements", type=int, nargs='+', default=[10, 100, 1000, 10000],
+                        help="문서 1개로 측정할 문서당 요소 수 목록")
+    parser.add_argument("--docs", type=int, nargs='+', default=[1, 10, 100],
+                        help=f"문서당 --doc-elements개 요소로 측정할 문서 수 목록")
+    parser.add_argument("--doc-elements", type=int, default=DEFAULT_DOC_ELEMENTS,
+                        help="문서 수별 측정 시 문서당 요소 수")
+    parser.add_argument("--cases", nargs='+', choices=CASES, default=CASES, help="측정 항목")
+    parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 문서 seed")
+    parser.add_argument("--error-rate", type=float, default=DEFAULT_ERROR_RATE, help="합성 문서 규칙 위반 비율")
+    parser.add_argument("--save", type=Path, help="측정 결과 JSON 저장 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 이전 측정 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="성능 저하로 표시할 소요 시간 증가 비율")
+    parser.add_argument("--fail-on-regression", action="store_true", help="성능 저하 항목이 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="core_bench_") as temp_dir:
+        for docs, elements in size_matrix(args.elements, args.docs, args.doc_elements):
+            print(f"📄 합성 문서 생성: {docs}개 x {elements}개 요소")
+            case = CorpusCase(Path(temp_dir), docs, elements, args.seed, args.error_rate)
+            try:
+                for name in args.cases:
+                    print(f"⏱️ {name} 측정 중...")
+                    rows.append(summarize(name, case, CASE_RUNNERS[name](case, args.repeat)))
+            finally:
+                case.cleanup()
+
+    regressions = []
+    if baseline is not None:
+        regressions = compare_with_baseline(rows, baseline, args.threshold)
+
+    print_table(rows, args.threshold)
+
+    if args.save:
+        report = {
+            **git_revision(),
+            "timestamp": datetime.now().isoformat(timespec='seconds'),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "json_backend": json_codec.BACKEND,
+            "settings": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+            "results": rows
+        }
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\n💾 측정 결과 저장: {args.save}")
+
+    if baseline is not None:
+        base_commit = (baseline.get("commit") or "?")[:10]
+        if regressions:
+            print(f"\n⚠️ {base_commit} 대비 {args.threshold:.0%} 이상 느려진 항목 {len(regressions)}개")
+        else:
+            print(f"\n✅ {base_commit} 대비 성능 저하 없음")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
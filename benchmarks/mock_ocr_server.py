@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+로컬 모의 OCR 서버
+flow.md에 정리된 studio-lite/api/v1/dl API를 흉내 내는 테스트용 서버
+- /files/upload, /files/{fileId}/extract-page, /files/{fileId}/visualinfo, /files/{fileId}/extract-image
+- 응답 지연, 페이지 수에 비례한 OCR 처리 시간 분포, 오류 주입 설정 가능
+- visualcontent ZIP 폴더(예: upload_test/)가 주어지면 같은 문서의 visualinfo/이미지를 그대로 응답
+
+사용 예:
+    python -m benchmarks.mock_ocr_server --port 8900 --canned upload_test --ocr-delay-per-page 0.2
+    python -m benchmarks.upload_benchmark upload_test --url http://127.0.0.1:8900/studio-lite/api/v1/dl
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+import zipfile
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+API_PREFIX = "/studio-lite/api/v1/dl"
+
+# PDF 페이지 객체 (/Type /Pages 제외)
+PDF_PAGE_PATTERN = re.compile(rb'/Type\s*/Page(?![s\w])')
+
+# 1x1 투명 PNG (이미지가 없는 문서의 extract-image 응답)
+BLANK_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000d4944415478da63f8ffff3f0005fe02fea7d6a4820000000049454e44ae426082"
+)
+
+
+@dataclass
+class MockOCRConfig:
+    """모의 서버 동작 설정"""
+    latency: float = 0.02              # 모든 요청의 기본 응답 지연 (초)
+    ocr_delay_base: float = 1.0        # OCR 처리 기본 시간 (초)
+    ocr_delay_per_page: float = 0.2    # 페이지당 OCR 처리 시간 (초)
+    ocr_delay_sigma: float = 0.3       # OCR 처리 시간 로그정규 분포 편차 (0이면 고정)
+    failure_rate: float = 0.0          # 요청마다 503을 돌려줄 확률
+    retry_after: Optional[float] = None  # 설정 시 처리 중 응답을 202 + Retry-After로 보냄
+    max_concurrent_ocr: int = 0        # 동시에 처리할 수 있는 OCR 작업 수 (0이면 무제한)
+
+
+@dataclass
+class MockFile:
+    """업로드된 파일 상태"""
+    file_id: str
+    file_name: str
+    file_size: int
+    num_pages: int
+    created: str
+    canned_key: Optional[str] = None
+    ready_at: Optional[float] = None
+
+
+class CannedDocuments:
+    """visualcontent ZIP에서 읽은 문서별 visualinfo/이미지 (키: PDF 파일명 stem)"""
+
+    def __init__(self, source_dir: Optional[Path] = None):
+        self.visualinfo: Dict[str, Dict[str, Any]] = {}
+        self.images: Dict[str, Dict[str, bytes]] = {}
+
+        if source_dir:
+            for zip_path in sorted(source_dir.rglob("*.zip")):
+                self._load_zip(zip_path)
+
+    def _load_zip(self, zip_path: Path):
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            members = zip_ref.namelist()
+            visualinfo_members = [m for m in members if m.startswith("visualinfo/") and m.endswith("_visualinfo.json")]
+            if not visualinfo_members:
+                return
+
+            key = PurePosixPath(visualinfo_members[0]).name[:-len("_visualinfo.json")]
+            self.visualinfo[key] = json.loads(zip_ref.read(visualinfo_members[0]))
+            self.images[key] = {
+                member: zip_ref.read(member)
+                for member in members
+                if not member.endswith('/') and member.split('/')[0] not in ("original", "visualinfo", "meta")
+            }
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.visualinfo
+
+    def __len__(self) -> int:
+        return len(self.visualinfo)
+
+
+class MockOCRState:
+    """서버 전체 상태 (요청 스레드 간 공유)"""
+
+    def __init__(self, config: MockOCRConfig, canned: CannedDocuments):
+        self.config = config
+        self.canned = canned
+        self.files: Dict[str, MockFile] = {}
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "uploads": 0, "polls": 0, "completed": 0, "injected_failures": 0}
+        # 처리 슬롯별 다음 사용 가능 시각 (max_concurrent_ocr 제한 시 대기열 흉내)
+        self._ocr_slots = [0.0] * config.max_concurrent_ocr
+
+    def ocr_duration(self, num_pages: int) -> float:
+        """OCR 처리 시간 (평균은 기본 시간 + 페이지당 시간, 로그정규 분포로 변동)"""
+        mean = self.config.ocr_delay_base + self.config.ocr_delay_per_page * num_pages
+        if self.config.ocr_delay_sigma <= 0:
+            return mean
+        # 평균이 mean이 되도록 mu 보정
+        sigma = self.config.ocr_delay_sigma
+        return random.lognormvariate(0, sigma) * mean / math.exp(sigma * sigma / 2)
+
+    def schedule_ocr(self, mock_file: MockFile):
+        """OCR 완료 시각 결정 (동시 처리 수 제한이 있으면 가장 먼저 비는 슬롯에 배정)"""
+        duration = self.ocr_duration(mock_file.num_pages)
+        now = time.monotonic()
+        with self.lock:
+            if self._ocr_slots:
+                slot = min(range(len(self._ocr_slots)), key=self._ocr_slots.__getitem__)
+                start = max(now, self._ocr_slots[slot])
+                self._ocr_slots[slot] = start + duration
+                mock_file.ready_at = start + duration
+            else:
+                mock_file.ready_at = now + duration
+
+
+def count_pdf_pages(content: bytes) -> int:
+    """PDF 바이트에서 페이지 수 추정"""
+    return max(len(PDF_PAGE_PATTERN.findall(content)), 1)
+
+
+def parse_multipart_file(content_type: str, body: bytes) -> Tuple[str, bytes]:
+    """multipart/form-data 본문에서 첫 번째 파일의 (파일명, 내용) 추출"""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        raise ValueError("multipart boundary 없음")
+    boundary = b"--" + match.group(1).encode('latin-1')
+
+    for part in body.split(boundary):
+        header_end = part.find(b"\r\n\r\n")
+        if header_end < 0:
+            continue
+        headers = part[:header_end].decode('utf-8', errors='replace')
+        filename = re.search(r'filename="([^"]*)"', headers)
+        if filename:
+            data = part[header_end + 4:]
+            if data.endswith(b"\r\n"):
+                data = data[:-2]
+            return filename.group(1), data
+
+    raise ValueError("업로드 파일 없음")
+
+
+def make_synthetic_visualinfo(mock_file: MockFile) -> Dict[str, Any]:
+    """준비된 문서가 없을 때 페이지 수만큼 요소를 만든 visualinfo"""
+    elements = []
+    for page_index in range(mock_file.num_pages):
+        elements.append({
+            "id": str(len(elements)),
+            "category": {"label": "ParaTitle", "type": "HEADING"},
+            "content": {"text": f"제{page_index + 1}조 (목적)"},
+            "bbox": {"left": 80.0, "top": 100.0, "width": 400.0, "height": 18.0},
+            "pageIndex": page_index
+        })
+        elements.append({
+            "id": str(len(elements)),
+            "category": {"label": "ParaText", "type": "PARAGRAPH"},
+            "content": {"text": "이 법은 모의 OCR 서버가 생성한 본문입니다."},
+            "bbox": {"left": 80.0, "top": 130.0, "width": 400.0, "height": 60.0},
+            "pageIndex": page_index
+        })
+    return {"elements": elements}
+
+
+class MockOCRHandler(BaseHTTPRequestHandler):
+    """요청 처리기 - 응답 형식은 flow.md의 실제 서버 응답과 동일"""
+
+    protocol_version = "HTTP/1.1"
+    state: MockOCRState = None  # make_server에서 지정
+
+    def log_message(self, format, *args):
+        pass
+
+    # ----- 공통 -----
+
+    def _read_body(self) -> bytes:
+        """요청 본문 읽기 (Content-Length 또는 chunked)"""
+        if self.headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b"".join(chunks)
+
+        length = int(self.headers.get('content-length', 0) or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('content-type', content_type)
+        self.send_header('content-length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'), 'application/json', headers)
+
+    def _api_response(self, code: str, data: Dict[str, Any], code_num: int = 0, status: int = 200):
+        self._send_json(status, {
+            "codeNum": code_num,
+            "code": code,
+            "data": data,
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime()),
+            "status": status
+        })
+
+    def _file_data(self, mock_file: MockFile) -> Dict[str, Any]:
+        return {
+            "fileId": mock_file.file_id,
+            "fileName": mock_file.file_name,
+            "created": mock_file.created,
+            "createdEpoch": str(int(time.time() * 1000)),
+            "fileSize": mock_file.file_size,
+            "numOfPages": mock_file.num_pages
+        }
+
+    def _route(self) -> Tuple[Optional[str], Optional[str], Dict[str, list]]:
+        """(fileId, 동작, 쿼리) 분리 - /files/upload는 (None, 'upload')"""
+        parsed = urlparse(self.path)
+        path = parsed.path
+        if not path.startswith(API_PREFIX + "/files/"):
+            return None, None, {}
+
+        parts = path[len(API_PREFIX + "/files/"):].split("/")
+        query = parse_qs(parsed.query)
+        if parts == ["upload"]:
+            return None, "upload", query
+        if len(parts) == 2:
+            return parts[0], parts[1], query
+        return None, None, query
+
+    def _before_request(self) -> bool:
+        """공통 지연 및 오류 주입 - 오류를 보냈으면 False"""
+        state = self.state
+        with state.lock:
+            state.stats["requests"] += 1
+
+        if state.config.latency > 0:
+            time.sleep(state.config.latency)
+
+        if state.config.failure_rate > 0 and random.random() < state.config.failure_rate:
+            with state.lock:
+                state.stats["injected_failures"] += 1
+            self._send_json(503, {"codeNum": -1, "code": "mock.injected.failure"})
+            return False
+        return True
+
+    def _get_file(self, file_id: str) -> Optional[MockFile]:
+        with self.state.lock:
+            mock_file = self.state.files.get(file_id)
+        if mock_file is None:
+            self._api_response("file.not.found", {}, code_num=404, status=404)
+        return mock_file
+
+    # ----- 엔드포인트 -----
+
+    def do_POST(self):
+        body = self._read_body()
+        if not self._before_request():
+            return
+
+        file_id, action, query = self._route()
+
+        if action == "upload":
+            try:
+                file_name, content = parse_multipart_file(self.headers.get('content-type', ''), body)
+            except ValueError as e:
+                self._api_response("file.upload.fail", {"error": str(e)}, code_num=400, status=400)
+                return
+
+            key = Path(file_name).stem
+            mock_file = MockFile(
+                file_id=str(uuid.uuid4()),
+                file_name=file_name,
+                file_size=len(content),
+                num_pages=count_pdf_pages(content),
+                created=time.strftime('%Y-%m-%dT%H:%M:%S.000000000Z', time.gmtime()),
+                canned_key=key if key in self.state.canned else None
+            )
+            with self.state.lock:
+                self.state.files[mock_file.file_id] = mock_file
+                self.state.stats["uploads"] += 1
+            self._api_response("file.upload.success", self._file_data(mock_file))
+            return
+
+        if action == "extract-page":
+            mock_file = self._get_file(file_id)
+            if mock_file is None:
+                return
+            self.state.schedule_ocr(mock_file)
+            self._api_response("extract.pdf.pages.success", self._file_data(mock_file))
+            return
+
+        self._send_json(404, {"codeNum": 404, "code": "not.found"})
+
+    def do_GET(self):
+        if not self._before_request():
+            return
+
+        file_id, action, query = self._route()
+        mock_file = self._get_file(file_id) if file_id else None
+        if file_id and mock_file is None:
+            return
+
+        if action == "visualinfo":
+            with self.state.lock:
+                self.state.stats["polls"] += 1
+
+            if mock_file.ready_at is None or time.monotonic() < mock_file.ready_at:
+                # 처리 중: 실제 서버처럼 JSON이 아닌 응답, 설정 시 202 + Retry-After
+                if self.state.config.retry_after is not None:
+                    self._send(202, b"processing", 'text/plain',
+                               {'retry-after': f"{self.state.config.retry_after:g}"})
+                else:
+                    self._send(200, b"processing", 'text/plain')
+                return
+
+            if mock_file.canned_key:
+                visual_info = dict(self.state.canned.visualinfo[mock_file.canned_key])
+            else:
+                visual_info = make_synthetic_visualinfo(mock_file)
+            visual_info["metadata"] = dict(visual_info.get("metadata", {}), fileId=mock_file.file_id,
+                                           fileName=mock_file.file_name, numOfPages=mock_file.num_pages)
+
+            with self.state.lock:
+                self.state.stats["completed"] += 1
+            self._send_json(200, visual_info)
+            return
+
+        if action == "extract-image":
+            image_path = query.get('imagePath', [""])[0]
+            images = self.state.canned.images.get(mock_file.canned_key, {})
+            self._send(200, images.get(image_path, BLANK_PNG), 'image/png')
+            return
+
+        self._send_json(404, {"codeNum": 404, "code": "not.found"})
+
+
+def make_server(host: str = "127.0.0.1", port: int = 0, config: Optional[MockOCRConfig] = None,
+                canned_dir: Optional[Path] = None) -> ThreadingHTTPServer:
+    """
+    모의 서버 생성 (port=0이면 빈 포트 자동 선택)
+
+    Returns:
+        서버 객체 - server.state로 통계 확인, server.base_url로 PDFUploader base_url 지정
+    """
+    state = MockOCRState(config or MockOCRConfig(), CannedDocuments(canned_dir))
+    handler = type("BoundMockOCRHandler", (MockOCRHandler,), {"state": state})
+
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+    server.base_url = f"http://{host}:{server.server_address[1]}{API_PREFIX}"
+    return server
+
+
+def start_background_server(**kwargs) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 모의 서버 실행 (server.shutdown()으로 종료)"""
+    server = make_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, name="mock-ocr-server", daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    """모의 서버 실행"""
+    parser = argparse.ArgumentParser(description="로컬 모의 OCR 서버 (studio-lite API)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--canned", type=Path, help="응답에 사용할 visualcontent ZIP 폴더 (예: upload_test)")
+    parser.add_argument("--latency", type=float, default=0.02, help="요청당 응답 지연 (초)")
+    parser.add_argument("--ocr-delay-base", type=float, default=1.0, help="OCR 기본 처리 시간 (초)")
+    parser.add_argument("--ocr-delay-per-page", type=float, default=0.2, help="페이지당 OCR 처리 시간 (초)")
+    parser.add_argument("--ocr-delay-sigma", type=float, default=0.3, help="OCR 처리 시간 로그정규 편차 (0이면 고정)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="요청별 503 오류 확률 (0~1)")
+    parser.add_argument("--retry-after", type=float, help="처리 중 응답을 202 + Retry-After(초)로 보냄")
+    parser.add_argument("--max-concurrent-ocr", type=int, default=0, help="서버 동시 OCR 처리 수 (0이면 무제한)")
+    args = parser.parse_args()
+
+    config = MockOCRConfig(
+        latency=args.latency,
+        ocr_delay_base=args.ocr_delay_base,
+        ocr_delay_per_page=args.ocr_delay_per_page,
+        ocr_delay_sigma=args.ocr_delay_sigma,
+        failure_rate=args.failure_rate,
+        retry_after=args.retry_after,
+        max_concurrent_ocr=args.max_concurrent_ocr
+    )
+    server = make_server(args.host, args.port, config, args.canned)
+
+    print(f"🧪 모의 OCR 서버 실행: {server.base_url}")
+    print(f"📦 준비된 문서: {len(server.state.canned)}개")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 요청 통계: {server.state.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+합성 visualinfo 문서 생성기
+실제 OCR 결과와 같은 구조(runtime, metadata, pageSizes, bbox, content.text/html/markdown,
+표/그림 요소)의 문서를 원하는 크기로 만들어 성능 측정과 테스트에 사용
+- 같은 seed면 항상 같은 문서 (측정 결과를 커밋 간 비교 가능)
+- error_rate 비율의 요소에 검증 규칙이 잡아내는 오류를 심음 (빈 텍스트, 잘못된 라벨, 중복, 순서 뒤바뀜 등)
+- 오류를 심지 않은 같은 문서를 검수완료본으로 만들어 QualityComparator 측정에 사용
+
+사용 예:
+    python -m benchmarks.synthetic_corpus corpus/ --docs 100 --elements 1000
+    python -m benchmarks.synthetic_corpus corpus/ --docs 10 --elements 10000 --reviewed corpus_reviewed/
+"""
+
+import argparse
+import math
+import random
+import uuid
+import zipfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.src.core.rule_validator import FORBIDDEN_LABELS, PARATEXT_TARGET_TEXTS
+from backend.src.utils import json_codec
+
+
+# A4 페이지 크기 (pt)
+PAGE_WIDTH = 595.32
+PAGE_HEIGHT = 841.92
+
+# 본문 영역 (머리글/바닥글 제외)
+BODY_TOP = 70.0
+BODY_BOTTOM = 780.0
+BODY_LEFT = 72.0
+
+# 페이지당 본문 요소 수 기본값 (실제 법령 번역 문서 평균에 가깝게)
+DEFAULT_ELEMENTS_PER_PAGE = 16
+
+# 기본 오류 비율 (요소 중 규칙 위반으로 만들 비율)
+DEFAULT_ERROR_RATE = 0.05
+
+# 본문 요소 종류별 비율 (라벨, 타입, 가중치)
+BODY_ELEMENT_WEIGHTS = [
+    ("ParaText", "PARAGRAPH", 58),
+    ("ParaTitle", "HEADING", 16),
+    ("ListText", "LIST", 8),
+    ("OtherText", "PARAGRAPH", 4),
+    ("RegionTitle", "HEADING", 3),
+    ("Date", "PARAGRAPH", 2),
+    ("TableName", "CAPTION", 2),
+    ("Table", "TABLE", 4),
+    ("Figure", "FIGURE", 3),
+]
+
+# 문장 생성용 어휘
+WORDS = [
+    "콘텐츠", "창조", "보호", "활용", "촉진", "국가", "지방공공단체", "사업자", "시책", "기본", "이념",
+    "정보", "통신", "기술", "진흥", "저작권", "권리", "의무", "필요한", "조치", "강구", "노력",
+    "제작", "유통", "보급", "국민", "생활", "향상", "경제", "사회", "발전", "기여", "목적", "규정",
+    "정하는", "바에", "따라", "관계", "행정기관", "장", "협력", "지원", "인재", "육성", "연구", "개발",
+    "국제", "교류", "환경", "정비", "적절한", "관리", "이용", "계획", "수립", "시행", "평가"
+]
+CLAUSE_NAMES = ["목적", "정의", "기본이념", "국가의 책무", "지방공공단체의 책무", "사업자의 책무",
+                "연계의 강화", "법제상의 조치", "인재의 육성", "연구개발의 추진", "유통의 촉진"]
+CHAPTER_NAMES = ["총칙", "기본적 시책", "콘텐츠 사업의 진흥", "보칙", "벌칙"]
+
+# 불필요한 요소로 자동 수정 시 제거되는 텍스트 (pattern_matcher의 unnecessary 패턴)
+UNNECESSARY_TEXTS = ["첨부자료", "참고자료", "별첨"]
+
+
+def _word_text(rng: random.Random, min_words: int, max_words: int) -> str:
+    """어휘를 이어 붙인 임의 문장"""
+    count = rng.randint(min_words, max_words)
+    return " ".join(rng.choices(WORDS, k=count)) + "."
+
+
+def _body_text(rng: random.Random, label: str, counters: Dict[str, int]) -> str:
+    """라벨에 맞는 텍스트 (제목은 조/장 번호가 이어지도록)"""
+    if label == "ParaTitle":
+        counters["clause"] += 1
+        return f"제{counters['clause']}조({rng.choice(CLAUSE_NAMES)})"
+    if label == "RegionTitle":
+        counters["chapter"] += 1
+        return f"제{counters['chapter']}장 {rng.choice(CHAPTER_NAMES)}"
+    if label == "ListText":
+        counters["item"] += 1
+        return f"{counters['item']}. {_word_text(rng, 2, 8)}"
+    if label == "Date":
+        return f"{rng.randint(1990, 2024)}.{rng.randint(1, 12)}.{rng.randint(1, 28)}"
+    if label == "TableName":
+        return f"<표 {counters['clause'] + 1}> {_word_text(rng, 2, 5)}"
+    if label == "OtherText":
+        return _word_text(rng, 3, 12)
+    return _word_text(rng, 8, 60)
+
+
+def _markup(label: str, element_type: str, text: str) -> Dict[str, str]:
+    """content.html / content.markdown"""
+    flat = " ".join(text.split())
+    if element_type == "HEADING":
+        return {"html": f"<h1>{flat}</h1>", "markdown": f"# {text}"}
+    if element_type == "LIST":
+        return {"html": f"<ul><li>{flat}</li></ul>", "markdown": f"- {text}"}
+    if element_type == "CAPTION":
+        return {"html": f"<figcaption>{flat}</figcaption>", "markdown": text}
+    if element_type == "HEADER":
+        return {"html": f"<header>{flat}</header>", "markdown": text}
+    if element_type == "FOOTER":
+        return {"html": f"<footer>{flat}</footer>", "markdown": text}
+    return {"html": f"<p>{flat}</p>", "markdown": text}
+
+
+def _image_name(file_id: str, kind: str, element_id: int, page_index: int, bbox: Dict[str, float]) -> str:
+    """OCR 결과의 이미지 파일명 형식 (좌표의 소수점은 _로 표기)"""
+    left, top, width, height = (str(round(bbox[key], 2)).replace(".", "_")
+                                for key in ("left", "top", "width", "height"))
+    return f"{file_id}_{kind}_id{element_id}_page{page_index}_dpi200_l{left}_t{top}_w{width}_h{height}.png"
+
+
+def _table_content(rng: random.Random, bbox: Dict[str, float]) -> Dict[str, Any]:
+    """표 요소 content (셀, html, markdown)"""
+    rows, cols = rng.randint(2, 6), rng.randint(2, 4)
+    cell_width, cell_height = bbox["width"] / cols, bbox["height"] / rows
+    cells, html_rows, md_rows = [], [], []
+
+    for row in range(rows):
+        row_texts = []
+        for col in range(cols):
+            text = _word_text(rng, 1, 4)
+            row_texts.append(text)
+            cells.append({
+                "cellId": str(len(cells)),
+                "rowspan": [row],
+                "colspan": [col],
+                "bbox": {
+                    "left": round(bbox["left"] + col * cell_width, 3),
+                    "top": round(bbox["top"] + row * cell_height, 3),
+                    "width": round(cell_width, 3),
+                    "height": round(cell_height, 3)
+                },
+                "text": text
+            })
+        html_rows.append("  <tr>\n" + "".join(f"   <td>{text}</td>\n" for text in row_texts) + "  </tr>\n")
+        md_rows.append("| " + " | ".join(row_texts) + " |")
+        if row == 0:
+            md_rows.append("|" + " --- |" * cols)
+
+    return {
+        "text": " ".join(cell["text"] for cell in cells),
+        "html": "<table>\n <tbody>\n" + "".join(html_rows) + " </tbody>\n</table>",
+        "markdown": "\n".join(md_rows),
+        "table": {"cells": cells}
+    }
+
+
+def _element(element_id: int, label: str, element_type: str, page_index: int,
+             bbox: Dict[str, float], rng: random.Random, level: int = 2) -> Dict[str, Any]:
+    return {
+        "id": str(element_id),
+        "category": {"label": label, "type": element_type},
+        "level": level,
+        "confidence": round(rng.uniform(0.3, 1.0), 6),
+        "content": {},
+        "bbox": {key: round(value, 3) for key, value in bbox.items()},
+        "pageIndex": page_index
+    }
+
+
+def generate_document(doc_id: str, num_elements: int, seed: int = 0,
+                      error_rate: float = DEFAULT_ERROR_RATE,
+                      elements_per_page: int = DEFAULT_ELEMENTS_PER_PAGE) -> Dict[str, Any]:
+    """
+    합성 visualinfo 문서 생성
+
+    Args:
+        doc_id: 문서 ID (metadata.fileName의 stem)
+        num_elements: 요소 수 (머리글/쪽번호 포함)
+        seed: 난수 seed (같은 값이면 같은 문서)
+        error_rate: 규칙 위반으로 만들 요소 비율 (0이면 검수완료본과 같은 깨끗한 문서)
+        elements_per_page: 페이지당 본문 요소 수
+    """
+    rng = random.Random(f"{seed}:{doc_id}")
+    file_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=rng.randint(0, 365 * 86400))
+    num_pages = max(1, math.ceil(num_elements / (elements_per_page + 2)))
+
+    labels = [entry[:2] for entry in BODY_ELEMENT_WEIGHTS]
+    weights = [entry[2] for entry in BODY_ELEMENT_WEIGHTS]
+    counters = {"clause": 0, "chapter": 0, "item": 0}
+    doc_title = f"{rng.choice(WORDS)} {rng.choice(WORDS)} 및 {rng.choice(WORDS)}에 관한 법률"
+
+    elements: List[Dict[str, Any]] = []
+    page_sizes = []
+    for page_index in range(num_pages):
+        page_sizes.append({"width": PAGE_WIDTH, "height": PAGE_HEIGHT, "pageIndex": page_index,
+                           "orientation": "PORTRAIT"})
+        remaining = num_elements - len(elements)
+
+        # 머리글 (첫 페이지는 문서 제목)
+        if page_index == 0:
+            label, element_type, text = "DocTitle", "HEADING", doc_title
+            bbox = {"left": 87.0, "top": 105.0, "width": 375.0, "height": 18.0}
+        else:
+            label, element_type, text = "PageHeader", "HEADER", f"{doc_title} [일본]"
+            bbox = {"left": 72.0, "top": 23.0, "width": 287.0, "height": 13.0}
+        element = _element(len(elements), label, element_type, page_index, bbox, rng, level=1)
+        element["content"] = {"text": text, **_markup(label, element_type, text)}
+        elements.append(element)
+
+        # 본문 (위에서 아래로 배치)
+        body_count = min(elements_per_page, remaining - 2) if page_index < num_pages - 1 else remaining - 2
+        top = BODY_TOP + (60.0 if page_index == 0 else 0.0)
+        line_height = (BODY_BOTTOM - top) / max(body_count, 1)
+        for _ in range(max(body_count, 0)):
+            label, element_type = rng.choices(labels, weights)[0]
+            height = max(line_height * rng.uniform(0.5, 0.9), 4.0)
+            bbox = {"left": BODY_LEFT + rng.uniform(-6, 30), "top": top,
+                    "width": rng.uniform(80, 450), "height": height}
+            element = _element(len(elements), label, element_type, page_index, bbox, rng,
+                               level=1 if element_type == "HEADING" else 2)
+
+            if element_type == "TABLE":
+                element["content"] = _table_content(rng, bbox)
+                element["content"]["image"] = _image_name(file_id, "table", len(elements), page_index, bbox)
+            elif element_type == "FIGURE":
+                element["content"] = {"image": _image_name(file_id, "figure", len(elements), page_index, bbox)}
+            else:
+                text = _body_text(rng, label, counters)
+                element["content"] = {"text": text, **_markup(label, element_type, text)}
+
+            elements.append(element)
+            top += line_height
+
+        # 쪽번호 (텍스트가 없는 요소 - 실제 OCR 결과와 같음)
+        if len(elements) < num_elements:
+            bbox = {"left": 295.0, "top": 802.0, "width": 5.0, "height": 8.0}
+            elements.append(_element(len(elements), "PageNumber", "PARAGRAPH", page_index, bbox, rng))
+
+    document = {
+        "runtime": rng.randint(2000, 60000),
+        "version": "1.0.0",
+        "metadata": {
+            "fileId": file_id,
+            "fileName": f"{doc_id}.pdf",
+            "created": created.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "updated": (created + timedelta(seconds=25)).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "createdEpoch": str(int(created.timestamp() * 1000)),
+            "fileSize": 100000 + num_pages * rng.randint(50000, 150000),
+            "numOfPages": num_pages,
+            "engine": "pdf_ai_dl",
+            "ocrMode": "AUTO"
+        },
+        "elements": elements,
+        "pageSizes": page_sizes
+    }
+
+    if error_rate > 0:
+        inject_errors(document, error_rate, random.Random(f"{seed}:{doc_id}:errors"))
+    return document
+
+
+def inject_errors(document: Dict[str, Any], error_rate: float, rng: random.Random) -> int:
+    """
+    검증 규칙이 잡아내는 오류를 요소에 심음 (문서 직접 수정)
+
+    Returns:
+        오류를 심은 요소 수
+    """
+    elements = document["elements"]
+    text_elements = [e for e in elements if e["content"].get("text") and e["category"]["type"] != "TABLE"]
+    count = min(int(len(elements) * error_rate), len(text_elements))
+    targets = rng.sample(text_elements, count)
+    pages: Dict[int, List[Dict[str, Any]]] = {}
+    for element in elements:
+        pages.setdefault(element["pageIndex"], []).append(element)
+
+    for element in targets:
+        content = element["content"]
+        category = element["category"]
+        kind = rng.randrange(8)
+
+        if kind == 0:
+            # R001 빈 텍스트
+            content.update(text="", html="<p></p>", markdown="")
+        elif kind == 1:
+            # R003 제목 패턴인데 본문 라벨
+            text = f"제{rng.randint(1, 99)}조 {rng.choice(CLAUSE_NAMES)}"
+            content.update(text=text, **_markup("ParaText", "PARAGRAPH", text))
+            category.update(label="ParaText", type="PARAGRAPH")
+        elif kind == 2:
+            # R004/R010 날짜인데 본문 라벨
+            text = f"{rng.randint(1990, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            content.update(text=text, **_markup("ParaText", "PARAGRAPH", text))
+            category.update(label="ParaText", type="PARAGRAPH")
+        elif kind == 3:
+            # R009 원문/번역문 표시가 목록 라벨
+            text = rng.choice(sorted(PARATEXT_TARGET_TEXTS))
+            content.update(text=text, **_markup("ListText", "LIST", text))
+            category.update(label="ListText", type="LIST")
+        elif kind == 4:
+            # R008 금지 라벨 (+ 자동 수정이 제거하는 금지 태그)
+            category["label"] = rng.choice(FORBIDDEN_LABELS)
+            element["tags"] = [rng.choice(FORBIDDEN_LABELS), "검토"]
+        elif kind == 5:
+            # R007 앞 요소와 같은 텍스트
+            source = rng.choice(text_elements)
+            content.update({key: source["content"][key] for key in ("text", "html", "markdown")})
+        elif kind == 6:
+            # R006 읽기 순서 뒤바뀜 (같은 페이지의 다른 요소와 위치 교환)
+            other = rng.choice(pages[element["pageIndex"]])
+            element["bbox"], other["bbox"] = other["bbox"], element["bbox"]
+        else:
+            # 자동 수정 시 제거되는 불필요한 요소
+            text = rng.choice(UNNECESSARY_TEXTS)
+            content.update(text=text, **_markup("OtherText", "PARAGRAPH", text))
+            category.update(label="OtherText", type="PARAGRAPH")
+
+    # R005 셀이 없는 표 (표가 있으면 하나)
+    tables = [e for e in elements if e["category"]["type"] == "TABLE"]
+    if tables and count:
+        rng.choice(tables)["content"].pop("table", None)
+
+    return count
+
+
+def document_id(index: int) -> str:
+    """합성 문서 ID (실제 문서 ID 형식)"""
+    return f"TSYN{index:010d}_TP"
+
+
+def dummy_pdf(num_pages: int) -> bytes:
+    """페이지 객체 수만 맞춘 최소 PDF (모의 OCR 서버의 페이지 수 계산용)"""
+    pages = "".join(f"{3 + i} 0 obj << /Type /Page /Parent 2 0 R >> endobj\n" for i in range(num_pages))
+    return (f"%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+            f"2 0 obj << /Type /Pages /Count {num_pages} >> endobj\n{pages}%%EOF\n").encode('ascii')
+
+
+def visualinfo_bytes(document: Dict[str, Any]) -> bytes:
+    """OCR 결과와 같은 형식의 visualinfo JSON (indent=2)"""
+    return json_codec.dumps(document)
+
+
+def write_visualcontent_zip(document: Dict[str, Any], output_dir: Path) -> Path:
+    """visualcontent-{문서ID}.zip (original/, visualinfo/, meta/) 저장"""
+    metadata = document["metadata"]
+    doc_id = Path(metadata["fileName"]).stem
+    meta = {
+        "fileId": metadata["fileId"],
+        "fileName": metadata["fileName"],
+        "created": metadata["created"],
+        "processing": {"engine": metadata["engine"], "ocrMode": metadata["ocrMode"]}
+    }
+
+    zip_path = output_dir / f"visualcontent-{doc_id}.zip"
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        zipf.writestr(f"original/{doc_id}.pdf", dummy_pdf(metadata["numOfPages"]))
+        zipf.writestr(f"visualinfo/{doc_id}_visualinfo.json", visualinfo_bytes(document))
+        zipf.writestr(f"meta/{metadata['fileId']}_meta.json", json_codec.dumps(meta))
+    return zip_path
+
+
+def write_corpus(output_dir: Path, docs: int, elements: int, seed: int = 0,
+                 error_rate: float = DEFAULT_ERROR_RATE, layout: str = "zip",
+                 reviewed_dir: Optional[Path] = None) -> List[Path]:
+    """
+    합성 문서 여러 개 저장
+
+    Args:
+        layout: "zip"이면 visualcontent ZIP, "json"이면 압축 해제 폴더 구조({ID}/visualinfo/{ID}_visualinfo.json)
+        reviewed_dir: 지정하면 오류를 심지 않은 검수완료본을 같은 layout으로 저장
+
+    Returns:
+        저장한 ZIP 또는 visualinfo JSON 경로 목록
+    """
+    paths = []
+    for target_dir, rate in ((output_dir, error_rate), (reviewed_dir, 0.0)):
+        if target_dir is None:
+            continue
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        written = []
+        for index in range(docs):
+            doc_id = document_id(index)
+            document = generate_document(doc_id, elements, seed, rate)
+            if layout == "zip":
+                written.append(write_visualcontent_zip(document, target_dir))
+            else:
+                json_path = target_dir / doc_id / "visualinfo" / f"{doc_id}_visualinfo.json"
+                json_path.parent.mkdir(parents=True, exist_ok=True)
+                json_path.write_bytes(visualinfo_bytes(document))
+                written.append(json_path)
+
+        if target_dir == output_dir:
+            paths = written
+    return paths
+
+
+def main():
+    """합성 문서 생성"""
+    parser = argparse.ArgumentParser(description="합성 visualinfo 문서 생성")
+    parser.add_argument("output_dir", type=Path, help="저장 폴더")
+    parser.add_argument("--docs", type=int, default=10, help="문서 수")
+    parser.add_argument("--elements", type=int, default=1000, help="문서당 요소 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 seed")
+    parser.add_argument("--error-rate", type=float, default=DEFAULT_ERROR_RATE, help="규칙 위반 요소 비율 (0~1)")
+    parser.add_argument("--layout", choices=["zip", "json"], default="zip", help="저장 형식")
+    parser.add_argument("--reviewed", type=Path, help="오류 없는 검수완료본 저장 폴더")
+    args = parser.parse_args()
+
+    paths = write_corpus(args.output_dir, args.docs, args.elements, args.seed, args.error_rate,
+                         args.layout, args.reviewed)
+    total_bytes = sum(path.stat().st_size for path in paths)
+    print(f"✅ 합성 문서 {len(paths)}개 생성: {args.output_dir} ({total_bytes / 1024 / 1024:.1f}MB)")
+    if args.reviewed:
+        print(f"📁 검수완료본: {args.reviewed}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+업로드 파이프라인 부하 측정
+모의 OCR 서버(또는 --url로 지정한 서버)에 대해 동시 처리 수별로 UploadPipeline을 실행하고
+처리량(문서/분)과 문서별 소요 시간 분포를 비교
+
+사용 예:
+    python -m benchmarks.upload_benchmark upload_test --concurrency 1 4 8 16 --repeat 2
+    python -m benchmarks.upload_benchmark upload_test --ocr-delay-per-page 0.5 --max-concurrent-ocr 8 --report bench.json
+    python -m benchmarks.upload_benchmark upload_test --client thread async --concurrency 16 64
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.src.services.pdf_uploader import PDFUploader
+from backend.src.services.upload_pipeline import AsyncUploadPipeline, UploadPipeline, UploadResult
+
+from .mock_ocr_server import MockOCRConfig, start_background_server
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    """정렬된 값의 백분위 (선형 보간)"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    position = (len(values) - 1) * ratio
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def prepare_pdfs(source_dir: Path, work_dir: Path, repeat: int, limit: Optional[int]) -> List[Path]:
+    """측정용 PDF 복사 (repeat > 1이면 파일명을 바꿔 같은 문서를 여러 번 처리)"""
+    source_pdfs = sorted(p for p in source_dir.iterdir() if p.suffix.lower() == '.pdf')
+    if limit:
+        source_pdfs = source_pdfs[:limit]
+
+    pdf_files = []
+    for round_index in range(repeat):
+        for pdf_path in source_pdfs:
+            # 모의 서버가 같은 문서의 visualinfo를 찾을 수 있도록 stem은 유지하고 폴더로 구분
+            target_dir = work_dir / f"round{round_index}"
+            target_dir.mkdir(parents=True, exist_ok=True)
+            target = target_dir / pdf_path.name
+            shutil.copy2(pdf_path, target)
+            pdf_files.append(target)
+    return pdf_files
+
+
+def summarize(client: str, concurrency: int, results: List[UploadResult], wall_time: float) -> Dict[str, Any]:
+    """동시 처리 수 한 단계의 측정 결과 요약"""
+    elapsed = [r.elapsed for r in results if r.success]
+    succeeded = len(elapsed)
+    return {
+        "client": client,
+        "concurrency": concurrency,
+        "documents": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "pages": sum(r.num_pages for r in results if r.success),
+        "wall_time": round(wall_time, 3),
+        "docs_per_min": round(succeeded / wall_time * 60, 2) if wall_time > 0 else 0.0,
+        "latency_p50": round(percentile(elapsed, 0.5), 3),
+        "latency_p95": round(percentile(elapsed, 0.95), 3),
+        "latency_mean": round(statistics.mean(elapsed), 3) if elapsed else 0.0
+    }
+
+
+def run_level(base_url: str, pdf_files: List[Path], concurrency: int, output_dir: Path,
+              client: str = "thread") -> Dict[str, Any]:
+    """주어진 동시 처리 수로 전체 PDF를 한 번 처리 (client: thread=UploadPipeline, async=AsyncUploadPipeline)"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start_time = time.time()
+    if client == "async":
+        results = asyncio.run(run_async(base_url, pdf_files, concurrency, output_dir))
+    else:
+        uploader = PDFUploader(base_url=base_url, pool_size=max(concurrency, 10))
+        # 문서별 로그는 측정 결과 출력과 섞이지 않도록 생략
+        pipeline = UploadPipeline(uploader, concurrency=concurrency, log=lambda message: None,
+                                  progress=lambda pdf_path, message: None)
+        results = pipeline.run(pdf_files, output_dir)
+    return summarize(client, concurrency, results, time.time() - start_time)
+
+
+async def run_async(base_url: str, pdf_files: List[Path], concurrency: int, output_dir: Path) -> List[UploadResult]:
+    """AsyncPDFUploader로 전체 PDF 처리 (aiohttp 필요)"""
+    from backend.src.services.async_pdf_uploader import AsyncPDFUploader
+
+    async with AsyncPDFUploader(base_url=base_url, max_connections=max(concurrency * 2, 10),
+                                max_connections_per_host=max(concurrency * 2, 10)) as uploader:
+        pipeline = AsyncUploadPipeline(uploader, concurrency=concurrency, log=lambda message: None,
+                                       progress=lambda pdf_path, message: None)
+        return await pipeline.run(pdf_files, output_dir)
+
+
+def print_table(rows: List[Dict[str, Any]]):
+    """측정 결과 표 출력"""
+    print(f"\n{'방식':>6} {'동시 처리':>8} {'성공/전체':>10} {'소요(초)':>9} {'문서/분':>8} {'p50(초)':>8} {'p95(초)':>8}")
+    print("-" * 67)
+    for row in rows:
+        print(f"{row['client']:>6} {row['concurrency']:>8} {row['succeeded']:>5}/{row['documents']:<4} "
+              f"{row['wall_time']:>9.1f} {row['docs_per_min']:>8.1f} "
+              f"{row['latency_p50']:>8.2f} {row['latency_p95']:>8.2f}")
+
+
+def main():
+    """업로드 파이프라인 부하 측정 실행"""
+    parser = argparse.ArgumentParser(description="업로드 파이프라인 동시 처리 수별 처리량 측정")
+    parser.add_argument("pdf_dir", type=Path, help="측정에 사용할 PDF 폴더 (visualcontent ZIP이 있으면 모의 응답에 사용)")
+    parser.add_argument("--concurrency", type=int, nargs='+', default=[1, 4, 8, 16], help="측정할 동시 처리 수 목록")
+    parser.add_argument("--client", nargs='+', choices=["thread", "async"], default=["thread"],
+                        help="측정할 클라이언트 (thread: 스레드 풀 + requests, async: asyncio + aiohttp)")
+    parser.add_argument("--repeat", type=int, default=1, help="PDF 목록 반복 횟수 (문서 수 늘리기)")
+    parser.add_argument("--limit", type=int, help="사용할 PDF 최대 개수")
+    parser.add_argument("--url", help="측정 대상 서버 base URL (생략 시 모의 서버를 내부에서 실행)")
+    parser.add_argument("--latency", type=float, default=0.02, help="모의 서버 요청당 응답 지연 (초)")
+    parser.add_argument("--ocr-delay-base", type=float, default=1.0, help="모의 서버 OCR 기본 처리 시간 (초)")
+    parser.add_argument("--ocr-delay-per-page", type=float, default=0.2, help="모의 서버 페이지당 OCR 처리 시간 (초)")
+    parser.add_argument("--ocr-delay-sigma", type=float, default=0.3, help="모의 서버 OCR 처리 시간 편차")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="모의 서버 503 오류 확률 (0~1)")
+    parser.add_argument("--retry-after", type=float, help="모의 서버가 처리 중 응답에 보낼 Retry-After (초)")
+    parser.add_argument("--max-concurrent-ocr", type=int, default=0, help="모의 서버 동시 OCR 처리 수 (0이면 무제한)")
+    parser.add_argument("--report", type=Path, help="측정 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if not args.pdf_dir.is_dir():
+        print(f"❌ 폴더를 찾을 수 없습니다: {args.pdf_dir}")
+        return 1
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        config = MockOCRConfig(
+            latency=args.latency,
+            ocr_delay_base=args.ocr_delay_base,
+            ocr_delay_per_page=args.ocr_delay_per_page,
+            ocr_delay_sigma=args.ocr_delay_sigma,
+            failure_rate=args.failure_rate,
+            retry_after=args.retry_after,
+            max_concurrent_ocr=args.max_concurrent_ocr
+        )
+        server = start_background_server(config=config, canned_dir=args.pdf_dir)
+        base_url = server.base_url
+        print(f"🧪 모의 OCR 서버: {base_url} (준비된 문서 {len(server.state.canned)}개)")
+
+    rows = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="upload_bench_") as temp_dir:
+            work_dir = Path(temp_dir)
+            pdf_files = prepare_pdfs(args.pdf_dir, work_dir / "pdf", args.repeat, args.limit)
+            if not pdf_files:
+                print(f"❌ PDF 파일이 없습니다: {args.pdf_dir}")
+                return 1
+            print(f"📄 측정 문서: {len(pdf_files)}개")
+
+            for client in args.client:
+                for concurrency in args.concurrency:
+                    print(f"⏱️ {client} 동시 처리 {concurrency} 측정 중...")
+                    stats_before = dict(server.state.stats) if server is not None else {}
+                    row = run_level(base_url, pdf_files, concurrency, work_dir / f"out_{client}_c{concurrency}", client)
+                    if server is not None:
+                        row["server_stats"] = {k: v - stats_before[k] for k, v in server.state.stats.items()}
+                    rows.append(row)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print_table(rows)
+
+    if args.report:
+        report = {
+            "base_url": base_url,
+            "mock_server": server is not None,
+            "settings": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+            "results": rows
+        }
+        args.report.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\n💾 측정 결과 저장: {args.report}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,6 +4,7 @@ CLI 도구 - 품질 검수 명령행 인터페이스
 """
 
 import argparse
+import io
 import sys
 import time
 import json
@@ -15,11 +16,54 @@ import shutil
 import zipfile
 
 from backend.src.core import QualityController
+from backend.src.core.quality_controller import DEFAULT_STREAM_MIN_BYTES
 from backend.src.utils.quality_comparator import QualityComparator
+from backend.src.utils import json_codec
 from backend.src import ZipProcessor
 from backend.src.utils.zip_recompressor import ZipRecompressor
+from backend.src.utils.result_cache import DEFAULT_CACHE_DIR, ResultCache
 from backend.src.core.rule_fixer import RuleBasedFixer
 from backend.src import PDFUploader
+from backend.src.services.upload_pipeline import UploadPipeline
+from backend.src.services.upload_journal import UPLOAD_JOURNAL_NAME, UploadJournal
+
+
+# --profile 기본 출력 항목 수
+PROFILE_TOP_N = 10
+
+
+def print_profile(profile, top_n: int, cache_used: bool):
+    """규칙/수정 단계별 소요 시간 상위 N개 표 출력"""
+    sections = [("rules", "🔍 규칙별 소요 시간"), ("fixer", "🔧 수정 단계별 소요 시간")]
+    for key, title in sections:
+        summary = profile[key]
+        if not summary['documents']:
+            continue
+        
+        print(f"\n{title} (문서 {summary['documents']}개, 요소 {summary['elements']}개, "
+              f"합계 {summary['total_seconds']:.3f}초)")
+        print(f"  {'항목':<14} {'시간(초)':>9} {'비율':>7} {'호출':>9} {'이슈':>7} {'요소당(µs)':>11}")
+        print("  " + "-" * 62)
+        for item in summary['items'][:top_n]:
+            print(f"  {item['name']:<14} {item['seconds']:>9.4f} {item['share']:>7.1%} "
+                  f"{item['calls']:>9} {item['issues']:>7} {item['us_per_element']:>11.2f}")
+    
+    if cache_used:
+        print("💡 캐시로 처리한 문서는 측정에서 제외됩니다 (전체 측정: --no-cache)")
+
+
+def report_profile(controller: QualityController, args):
+    """자동 수정 모드의 --profile 출력 (--report가 있으면 측정 결과를 보고서로 저장)"""
+    if args.profile is None:
+        return
+    
+    profile = controller.profile_report()
+    print_profile(profile, args.profile, controller.cache is not None)
+    
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({"profile": profile}, f, ensure_ascii=False, indent=2)
+        print(f"📄 측정 결과 저장: {args.report}")
 
 
 def main():
@@ -69,10 +113,17 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
   --full-workflow     : ZIP 추출 → 수정 → 재압축 전체 과정
   --recompress        : 수정 후 ZIP 파일로 재압축
   --compare (-c)      : 두 폴더의 검수 결과 비교
+  --jobs (-j) N       : N개 프로세스로 병렬 검증
+  --concurrency N     : --upload 시 N개 문서 동시 업로드/OCR 처리
+  --no-resume         : --upload 시 이전 작업 기록을 무시하고 처음부터 처리
+  --no-cache          : 검증/수정 결과 캐시를 사용하지 않음 (기본은 캐시 사용)
+  --prune-cache       : 시작 전에 캐시 폴더를 정리해 용량 제한 이하로 줄임
 
 📊 출력 옵션:
   --report (-r)       : 결과를 JSON 파일로 저장
+  --issues 경로       : 이슈를 처리하는 대로 JSONL/Parquet 파일에 저장 (대량 검수용)
   --verbose           : 상세한 처리 과정 출력
+  --profile [N]       : 규칙/수정 단계별 소요 시간 상위 N개 출력 (보고서에도 기록)
 
 🚀 권장 사용법:
   1. 품질 확인: python cli/cli_tool.py "폴더경로/" --validate
@@ -155,13 +206,26 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
     output_group.add_argument(
         "--report", "-r", 
         metavar="보고서파일.json",
-        help="검수 결과를 JSON 보고서로 저장할 경로"
+        help="검수 결과를 JSON 보고서로 저장할 경로 (--compare에서 .jsonl이면 파일별 한 줄씩)"
+    )
+    output_group.add_argument(
+        "--issues",
+        metavar="이슈파일.jsonl",
+        help="검출된 이슈를 처리하는 대로 한 행씩 저장할 경로 (.jsonl 또는 .parquet, parquet는 pyarrow 필요)"
     )
     output_group.add_argument(
         "--verbose", 
         action="store_true", 
         help="상세한 처리 과정과 디버그 정보 출력"
     )
+    output_group.add_argument(
+        "--profile",
+        type=int,
+        nargs='?',
+        const=PROFILE_TOP_N,
+        metavar="N",
+        help=f"규칙/수정 단계별 소요 시간을 측정해 상위 N개 출력 (기본값: {PROFILE_TOP_N}, --report 보고서에도 기록)"
+    )
     
     # 고급 옵션 (하위 호환성)
     advanced_group = parser.add_argument_group('고급 옵션', '특수한 용도로 사용되는 옵션들')
@@ -175,6 +239,48 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         action="store_true", 
         help="수정 후 ZIP 파일로 재압축"
     )
+    advanced_group.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="디렉토리 검증 시 사용할 프로세스 수 (기본값: 1, 순차 처리)"
+    )
+    advanced_group.add_argument(
+        "--include-zip",
+        action="store_true",
+        help="디렉토리 검증 시 ZIP 파일 내부의 visualinfo JSON도 압축 해제 없이 검증 (--fix 대상에서는 제외)"
+    )
+    advanced_group.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="--upload 시 동시에 업로드/OCR 처리할 문서 수 (기본값: 1, 순차 처리)"
+    )
+    advanced_group.add_argument(
+        "--no-resume",
+        action="store_true",
+        help=f"--upload 시 작업 저널({UPLOAD_JOURNAL_NAME})을 무시하고 모든 PDF를 처음부터 처리"
+    )
+    advanced_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"내용이 같은 문서의 검증/수정 결과 캐시를 사용하지 않음 (캐시 위치: {DEFAULT_CACHE_DIR})"
+    )
+    advanced_group.add_argument(
+        "--prune-cache",
+        action="store_true",
+        help="시작 전에 결과 캐시를 정리 (평소에는 저장 중 용량 제한을 넘을 때만 정리)"
+    )
+    advanced_group.add_argument(
+        "--stream-mb",
+        type=int,
+        default=DEFAULT_STREAM_MIN_BYTES // (1024 * 1024),
+        metavar="MB",
+        help=f"이 크기(MB) 이상인 visualinfo는 요소 단위로 스트리밍 검증해 메모리 사용량 제한 "
+             f"(기본값: {DEFAULT_STREAM_MIN_BYTES // (1024 * 1024)})"
+    )
     
     args = parser.parse_args()
     
@@ -184,12 +290,25 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         print(f"❌ 경로를 찾을 수 없습니다: {target_path}")
         sys.exit(1)
     
+    # 결과 캐시 (내용이 바뀌지 않은 문서는 재검증/재수정하지 않음)
+    result_cache = None
+    if not args.no_cache:
+        result_cache = ResultCache()
+        if args.prune_cache:
+            removed = result_cache.prune()
+            print(f"🧹 결과 캐시 정리: {removed}개 항목 삭제")
+    
     # 컨트롤러 초기화
-    controller = QualityController()
+    controller = QualityController({
+        'use_cache': result_cache is not None,
+        'profile': args.profile is not None,
+        'stream_min_bytes': args.stream_mb * 1024 * 1024,
+        'include_zip': args.include_zip
+    })
     
     # 비교 모드
     if args.compare:
-        comparator = QualityComparator()
+        comparator = QualityComparator(cache=result_cache)
         completed_dir = Path(args.compare)
         
         if not completed_dir.exists():
@@ -200,14 +319,20 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         print(f"📂 검수 대상: {target_path}")
         print(f"📂 검수 완료: {completed_dir}")
         
-        results = comparator.compare_directories(target_path, completed_dir)
-        report = comparator.generate_comparison_report(results)
+        if args.report or args.issues:
+            # 비교하면서 보고서/이슈 파일에 바로 기록 (보고서 경로가 없으면 이슈 파일만)
+            report = comparator.write_comparison_report(target_path, completed_dir,
+                                                        Path(args.report) if args.report else None,
+                                                        Path(args.issues) if args.issues else None)
+        else:
+            results = comparator.compare_directories(target_path, completed_dir)
+            report = comparator.generate_comparison_report(results)
         comparator.print_summary(report)
         
         if args.report:
-            with open(args.report, 'w', encoding='utf-8') as f:
-                json.dump(report, f, ensure_ascii=False, indent=2)
             print(f"📄 비교 보고서 저장: {args.report}")
+        if args.issues:
+            print(f"📄 이슈 목록 저장: {args.issues}")
         
         return
     
@@ -215,95 +340,83 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
     if args.count_pages:
         print("📊 페이지 수 분석 시작")
         
-        # 임시 추출 디렉토리 생성
-        temp_extract_dir = target_path / "temp_page_count"
-        temp_extract_dir.mkdir(exist_ok=True)
+        # 페이지 수 계산 - ZIP 내부 PDF를 압축 해제 없이 메모리에서 읽어 정확히 계산
+        total_pages = 0
+        file_pages = {}
+        zip_files = list(target_path.glob("*.zip"))
         
-        try:
-            # ZIP 파일 추출
-            processor = ZipProcessor(extract_base_dir=temp_extract_dir)
-            json_files = processor.process_directory(target_path)
-
-            if not json_files:
-                print("❌ JSON 파일을 찾을 수 없습니다.")
-                shutil.rmtree(temp_extract_dir, ignore_errors=True)
-                sys.exit(1)
-
-            # 페이지 수 계산 - PDF 파일 기반으로 정확히 계산
-            total_pages = 0
-            file_pages = {}
-            zip_files = list(target_path.glob("*.zip"))
-            
-            print(f"\n📂 분석 대상: {len(zip_files)}개 ZIP 파일")
+        if not zip_files:
+            print("❌ ZIP 파일을 찾을 수 없습니다.")
+            sys.exit(1)
+        
+        print(f"\n📂 분석 대상: {len(zip_files)}개 ZIP 파일")
+        
+        for zip_file in zip_files:
+            zip_name = zip_file.stem
+            if zip_name.startswith('visualcontent-'):
+                doc_name = zip_name.replace('visualcontent-', '')
+            else:
+                doc_name = zip_name
             
-            # 각 ZIP 파일의 추출된 폴더에서 PDF 파일 찾기
-            for zip_file in zip_files:
-                zip_name = zip_file.stem
-                if zip_name.startswith('visualcontent-'):
-                    doc_name = zip_name.replace('visualcontent-', '')
-                else:
-                    doc_name = zip_name
-                
-                # 추출된 폴더에서 original 폴더의 PDF 파일 찾기
-                extracted_folder = temp_extract_dir / zip_name
-                original_folder = extracted_folder / "original"
-                
-                if original_folder.exists():
-                    pdf_files = list(original_folder.glob("*.pdf"))
-                    if pdf_files:
-                        pdf_file = pdf_files[0]  # 첫 번째 PDF 파일 사용
-                        try:
-                            # PDF 파일의 페이지 수 읽기
-                            with open(pdf_file, 'rb') as file:
-                                pdf_reader = PyPDF2.PdfReader(file)
-                                pages_count = len(pdf_reader.pages)
-                                
-                            file_pages[doc_name] = pages_count
-                            total_pages += pages_count
-                            
-                        except Exception as e:
-                            print(f"⚠️ {pdf_file.name} PDF 읽기 오류: {e}")
-                            # PDF 읽기 실패시 JSON 기반으로 추정
-                            file_pages[doc_name] = 1
-                            total_pages += 1
-                    else:
+            try:
+                with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+                    # original 폴더의 PDF 멤버 찾기
+                    pdf_members = [
+                        name for name in zip_ref.namelist()
+                        if name.startswith('original/') and name.lower().endswith('.pdf')
+                    ]
+                    
+                    if not pdf_members:
                         print(f"⚠️ {doc_name}: original 폴더에 PDF 파일이 없습니다")
                         file_pages[doc_name] = 1
                         total_pages += 1
-                else:
-                    print(f"⚠️ {doc_name}: original 폴더를 찾을 수 없습니다")
-                    file_pages[doc_name] = 1
-                    total_pages += 1
+                        continue
+                    
+                    pdf_member = pdf_members[0]  # 첫 번째 PDF 파일 사용
+                    try:
+                        # PDF 파일의 페이지 수 읽기
+                        pdf_reader = PyPDF2.PdfReader(io.BytesIO(zip_ref.read(pdf_member)))
+                        pages_count = len(pdf_reader.pages)
+                        
+                        file_pages[doc_name] = pages_count
+                        total_pages += pages_count
+                        
+                    except Exception as e:
+                        print(f"⚠️ {Path(pdf_member).name} PDF 읽기 오류: {e}")
+                        # PDF 읽기 실패시 1페이지로 추정
+                        file_pages[doc_name] = 1
+                        total_pages += 1
+                        
+            except zipfile.BadZipFile as e:
+                print(f"⚠️ {doc_name}: ZIP 파일을 열 수 없습니다 - {e}")
+                file_pages[doc_name] = 1
+                total_pages += 1
 
-            # 결과 출력
-            print(f"\n📊 페이지 수 분석 결과:")
-            print(f"=" * 50)
-            
-            for file_name, pages in sorted(file_pages.items()):
-                print(f"📄 {file_name}: {pages}페이지")
-            
-            print(f"=" * 50)
-            print(f"📚 총 {len(file_pages)}개 문서")
-            print(f"📖 총 페이지 수: {total_pages}페이지")
-            print(f"📊 평균 페이지 수: {total_pages/len(file_pages):.1f}페이지" if file_pages else "📊 평균: 0페이지")
-            
-            # 보고서 저장
-            if args.report:
-                page_report = {
-                    "analysis_date": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "total_documents": len(file_pages),
-                    "total_pages": total_pages,
-                    "average_pages": round(total_pages/len(file_pages), 1) if file_pages else 0,
-                    "documents": file_pages
-                }
-                
-                with open(args.report, 'w', encoding='utf-8') as f:
-                    json.dump(page_report, f, ensure_ascii=False, indent=2)
-                print(f"📄 페이지 수 보고서 저장: {args.report}")
+        # 결과 출력
+        print(f"\n📊 페이지 수 분석 결과:")
+        print(f"=" * 50)
         
-        finally:
-            # 임시 디렉토리 정리
-            shutil.rmtree(temp_extract_dir, ignore_errors=True)
+        for file_name, pages in sorted(file_pages.items()):
+            print(f"📄 {file_name}: {pages}페이지")
+        
+        print(f"=" * 50)
+        print(f"📚 총 {len(file_pages)}개 문서")
+        print(f"📖 총 페이지 수: {total_pages}페이지")
+        print(f"📊 평균 페이지 수: {total_pages/len(file_pages):.1f}페이지" if file_pages else "📊 평균: 0페이지")
+        
+        # 보고서 저장
+        if args.report:
+            page_report = {
+                "analysis_date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "total_documents": len(file_pages),
+                "total_pages": total_pages,
+                "average_pages": round(total_pages/len(file_pages), 1) if file_pages else 0,
+                "documents": file_pages
+            }
+            
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(page_report, f, ensure_ascii=False, indent=2)
+            print(f"📄 페이지 수 보고서 저장: {args.report}")
         
         return
     
@@ -312,7 +425,7 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         print("📤 PDF 업로드 및 OCR 처리 시작")
         
         # PDF 파일 검색
-        pdf_files = list(target_path.glob("*.pdf")) + list(target_path.glob("*.PDF"))
+        pdf_files = sorted(list(target_path.glob("*.pdf")) + list(target_path.glob("*.PDF")))
         
         if not pdf_files:
             print("❌ PDF 파일을 찾을 수 없습니다.")
@@ -320,82 +433,39 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         
         print(f"📂 발견된 PDF 파일: {len(pdf_files)}개")
         
-        # PDF 업로드 처리기 초기화
-        uploader = PDFUploader()
+        # PDF 업로드 처리기 초기화 (동시 처리 문서 수만큼 연결 풀 확보)
+        concurrency = max(args.concurrency, 1)
+        uploader = PDFUploader(pool_size=max(concurrency, 10))
+        
+        # 작업 저널 (중단된 배치를 이어서 처리 - 완료된 문서는 건너뛰고 OCR 대기 중이던 문서는 재업로드하지 않음)
+        journal = UploadJournal(target_path / UPLOAD_JOURNAL_NAME, resume=not args.no_resume)
         
-        success_count = 0
         start_time = time.time()
         
         # tqdm으로 진행률 표시
         with tqdm(total=len(pdf_files), desc="📤 PDF 처리 중", 
                   unit="파일", bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]") as pbar:
             
-            for pdf_file in pdf_files:
-                file_start_time = time.time()
-                pbar.set_postfix_str(f"현재: {pdf_file.name}")
-                
-                try:
-                    # 1. PDF 업로드
-                    pbar.set_description("📤 업로드 중")
-                    file_info = uploader.upload_pdf(pdf_file)
-                    if not file_info:
-                        pbar.write(f"❌ 업로드 실패: {pdf_file.name}")
-                        pbar.update(1)
-                        continue
-                    
-                    upload_time = time.time() - file_start_time
-                    pbar.write(f"✅ 업로드 완료: {file_info['fileName']} ({file_info['numOfPages']}페이지, {upload_time:.1f}초)")
-                    
-                    # 2. OCR 처리 요청
-                    pbar.set_description("🔍 OCR 요청 중")
-                    ocr_start_time = time.time()
-                    extract_result = uploader.extract_pages(file_info['fileId'], f"1-{file_info['numOfPages']}")
-                    if not extract_result:
-                        pbar.write(f"❌ OCR 처리 실패: {pdf_file.name}")
-                        pbar.update(1)
-                        continue
-                    
-                    ocr_request_time = time.time() - ocr_start_time
-                    pbar.write(f"🔍 OCR 요청 완료: {pdf_file.name} ({ocr_request_time:.1f}초)")
-                    
-                    # 3. VisualInfo 다운로드 (대기 시간 포함)
-                    pbar.set_description("⏳ OCR 결과 대기")
-                    visual_start_time = time.time()
-                    visual_info = uploader.get_visual_info(file_info['fileId'], progress_callback=lambda msg: pbar.set_postfix_str(msg))
-                    if not visual_info:
-                        pbar.write(f"❌ VisualInfo 다운로드 실패: {pdf_file.name}")
-                        pbar.update(1)
-                        continue
-                    
-                    visual_time = time.time() - visual_start_time
-                    pbar.write(f"📄 VisualInfo 완료: {pdf_file.name} ({visual_time:.1f}초)")
-                    
-                    # 4. ZIP 파일로 저장
-                    pbar.set_description("📦 ZIP 생성 중")
-                    zip_start_time = time.time()
-                    zip_filename = f"visualcontent-{pdf_file.stem}.zip"
-                    zip_path = target_path / zip_filename
-                    
-                    zip_created = uploader.create_visualcontent_zip(
-                        pdf_file, visual_info, zip_path, file_info['fileId']
-                    )
-                    
-                    zip_time = time.time() - zip_start_time
-                    file_total_time = time.time() - file_start_time
-                    
-                    if zip_created:
-                        pbar.write(f"📦 ZIP 생성 완료: {zip_filename} (생성: {zip_time:.1f}초, 총: {file_total_time:.1f}초)")
-                        success_count += 1
-                    else:
-                        pbar.write(f"❌ ZIP 파일 생성 실패: {pdf_file.name}")
-                    
-                except Exception as e:
-                    pbar.write(f"❌ {pdf_file.name} 처리 중 오류: {e}")
-                finally:
-                    pbar.update(1)
+            if concurrency > 1:
+                pbar.write(f"🚀 최대 {concurrency}개 문서 동시 처리")
+            
+            # 업로드 → OCR 요청 → 결과 대기 → ZIP 생성 (문서별로 동시에 진행, 끝난 문서부터 집계)
+            pipeline = UploadPipeline(
+                uploader,
+                concurrency=concurrency,
+                log=pbar.write,
+                progress=lambda pdf_file, msg: pbar.set_postfix_str(f"{pdf_file.name}: {msg}"),
+                journal=journal
+            )
+            results = pipeline.run(pdf_files, target_path, on_complete=lambda result: pbar.update(1))
+        
+        success_count = sum(1 for result in results if result.success)
+        skipped_count = sum(1 for result in results if result.skipped)
         
         total_time = time.time() - start_time
         print(f"\n✅ 업로드 완료: {success_count}/{len(pdf_files)}개 파일")
+        if skipped_count:
+            print(f"⏭️  이전 실행에서 완료되어 건너뜀: {skipped_count}개 파일")
         print(f"⏱️  총 처리 시간: {total_time:.1f}초 (평균: {total_time/len(pdf_files):.1f}초/파일)")
         return
     
@@ -427,8 +497,7 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
             if "visualinfo" in json_file.name:
                 try:
                     # JSON 파일 로드
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = json_codec.load(json_file)
                     
                     elements = data.get('elements', [])
                     changes = 0
@@ -464,8 +533,7 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
                     
                     if changes > 0:
                         # JSON 파일 저장
-                        with open(json_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
+                        json_codec.dump(data, json_file)
                         
                         total_changes += changes
                         print(f"  ✅ {json_file.parent.parent.name}: {changes}개 변경")
@@ -481,7 +549,7 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         if total_changes > 0:
             print(f"\n📦 재압축 중...")
             recompressor = ZipRecompressor(review_dir)
-            recompressed_files = recompressor.recompress_all(extracted_dir)
+            recompressed_files = recompressor.recompress_all(extracted_dir, source_dir=target_path)
 
             print(f"✅ 처리 완료!")
             print(f"📁 수정된 파일 저장 위치: {review_dir}")
@@ -496,16 +564,14 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         
         # 1. 경로 설정
         output_dir = target_path.parent / f"{target_path.name}_ListText"
-        temp_processing_dir = target_path.parent / "temp_processing_ListText"
         
-        # 이전 결과 폴더/임시 폴더 삭제
+        # 이전 결과 폴더 삭제
         if output_dir.exists():
             shutil.rmtree(output_dir)
-        if temp_processing_dir.exists():
-            shutil.rmtree(temp_processing_dir)
             
         output_dir.mkdir(exist_ok=True)
-        temp_processing_dir.mkdir(exist_ok=True)
+        processor = ZipProcessor()
+        recompressor = ZipRecompressor(output_dir)
         
         print(f"� 원본 경로: {target_path}")
         print(f"📁 결과물 저장 경로: {output_dir}")
@@ -514,12 +580,12 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         zip_files = list(target_path.rglob("*.zip"))
         if not zip_files:
             print("❌ 처리할 ZIP 파일을 찾을 수 없습니다.")
-            shutil.rmtree(temp_processing_dir)
             sys.exit(1)
             
         print(f"� 총 {len(zip_files)}개의 ZIP 파일을 처리합니다.")
         
         total_changes = 0
+        failed_files = []
         
         # 3. 파일 단위 처리
         with tqdm(total=len(zip_files), desc="🚀 전체 진행률", unit="개") as pbar:
@@ -527,27 +593,22 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
                 pbar.set_postfix_str(zip_path.name)
                 
                 try:
-                    # 3-1. 임시 추출
-                    extract_dir = temp_processing_dir / zip_path.stem
-                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        zip_ref.extractall(extract_dir)
-                        
-                    # 3-2. visualinfo.json 파일 찾기
-                    visualinfo_files = list(extract_dir.rglob("*_visualinfo.json"))
-                    if not visualinfo_files:
+                    relative_path = zip_path.relative_to(target_path)
+                    dest_path = output_dir / relative_path
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    
+                    # 3-1. visualinfo.json 멤버 찾기 (압축 해제 없이)
+                    visualinfo_entries = processor.list_visualinfo_entries(zip_path)
+                    if not visualinfo_entries:
                         pbar.write(f"  ⚠️ {zip_path.name}: visualinfo.json 파일 없음")
                         # 원본 ZIP 그대로 복사
-                        relative_path = zip_path.relative_to(target_path)
-                        dest_path = output_dir / relative_path
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
                         shutil.copy2(zip_path, dest_path)
                         continue
 
-                    json_file = visualinfo_files[0]
+                    visualinfo_entry = visualinfo_entries[0]
                     
-                    # 3-3. ListText 변환 로직
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    # 3-2. ListText 변환 로직
+                    data = processor.read_visualinfo(visualinfo_entry)
                     
                     elements = data.get('elements', [])
                     changes = 0
@@ -570,36 +631,30 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
                                 category['type'] = 'HEADING'
                                 changes += 1
                     
+                    # 3-3. 결과물 저장 (visualinfo 멤버만 교체하고 나머지는 압축 데이터 그대로 복사)
                     if changes > 0:
-                        with open(json_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
+                        json_content = json_codec.dumps(data)
+                        recompressor.rewrite_zip(zip_path, {visualinfo_entry.member: json_content}, dest_path)
                         total_changes += changes
                         pbar.write(f"  ✅ {zip_path.name}: {changes}개 항목 변경")
                     else:
+                        shutil.copy2(zip_path, dest_path)
                         pbar.write(f"  📝 {zip_path.name}: 변경 사항 없음")
 
-                    # 3-4. 결과물 재압축 및 저장
-                    relative_path = zip_path.relative_to(target_path)
-                    dest_path = output_dir / relative_path
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    with zipfile.ZipFile(dest_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-                        for file_to_zip in extract_dir.rglob('*'):
-                            if file_to_zip.is_file():
-                                arcname = file_to_zip.relative_to(extract_dir)
-                                new_zip.write(file_to_zip, arcname)
-
                 except Exception as e:
+                    failed_files.append(zip_path)
                     pbar.write(f"  ❌ {zip_path.name} 처리 중 오류: {e}")
                 finally:
-                    # 임시 추출 폴더 정리
-                    shutil.rmtree(extract_dir, ignore_errors=True)
                     pbar.update(1)
 
         # 4. 최종 정리
-        shutil.rmtree(temp_processing_dir, ignore_errors=True)
         print(f"\n🎉 처리 완료! 총 {total_changes}개 항목이 변경되었습니다.")
         print(f"� 결과는 {output_dir} 폴더에 저장되었습니다.")
+        if failed_files:
+            print(f"❌ 처리 실패: {len(failed_files)}개 ZIP (결과 폴더에 없음)")
+            for zip_path in failed_files:
+                print(f"  📄 {zip_path}")
+            sys.exit(1)
         return
     
     if args.paratext_only:
@@ -607,16 +662,14 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         
         # 1. 경로 설정
         output_dir = target_path.parent / f"{target_path.name}_ListText"
-        temp_processing_dir = target_path.parent / "temp_processing_ListText"
         
-        # 이전 결과 폴더/임시 폴더 삭제
+        # 이전 결과 폴더 삭제
         if output_dir.exists():
             shutil.rmtree(output_dir)
-        if temp_processing_dir.exists():
-            shutil.rmtree(temp_processing_dir)
             
         output_dir.mkdir(exist_ok=True)
-        temp_processing_dir.mkdir(exist_ok=True)
+        processor = ZipProcessor()
+        recompressor = ZipRecompressor(output_dir)
         
         print(f"� 원본 경로: {target_path}")
         print(f"📁 결과물 저장 경로: {output_dir}")
@@ -625,12 +678,12 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         zip_files = list(target_path.rglob("*.zip"))
         if not zip_files:
             print("❌ 처리할 ZIP 파일을 찾을 수 없습니다.")
-            shutil.rmtree(temp_processing_dir)
             sys.exit(1)
             
         print(f"� 총 {len(zip_files)}개의 ZIP 파일을 처리합니다.")
         
         total_changes = 0
+        failed_files = []
         
         # 3. 파일 단위 처리
         with tqdm(total=len(zip_files), desc="🚀 전체 진행률", unit="개") as pbar:
@@ -638,27 +691,22 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
                 pbar.set_postfix_str(zip_path.name)
                 
                 try:
-                    # 3-1. 임시 추출
-                    extract_dir = temp_processing_dir / zip_path.stem
-                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        zip_ref.extractall(extract_dir)
-                        
-                    # 3-2. visualinfo.json 파일 찾기
-                    visualinfo_files = list(extract_dir.rglob("*_visualinfo.json"))
-                    if not visualinfo_files:
+                    relative_path = zip_path.relative_to(target_path)
+                    dest_path = output_dir / relative_path
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    
+                    # 3-1. visualinfo.json 멤버 찾기 (압축 해제 없이)
+                    visualinfo_entries = processor.list_visualinfo_entries(zip_path)
+                    if not visualinfo_entries:
                         pbar.write(f"  ⚠️ {zip_path.name}: visualinfo.json 파일 없음")
                         # 원본 ZIP 그대로 복사
-                        relative_path = zip_path.relative_to(target_path)
-                        dest_path = output_dir / relative_path
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
                         shutil.copy2(zip_path, dest_path)
                         continue
 
-                    json_file = visualinfo_files[0]
+                    visualinfo_entry = visualinfo_entries[0]
                     
-                    # 3-3. ListText 변환 로직
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    # 3-2. ListText 변환 로직
+                    data = processor.read_visualinfo(visualinfo_entry)
                     
                     elements = data.get('elements', [])
                     changes = 0
@@ -681,36 +729,30 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
                                 category['type'] = 'HEADING'
                                 changes += 1
                     
+                    # 3-3. 결과물 저장 (visualinfo 멤버만 교체하고 나머지는 압축 데이터 그대로 복사)
                     if changes > 0:
-                        with open(json_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
+                        json_content = json_codec.dumps(data)
+                        recompressor.rewrite_zip(zip_path, {visualinfo_entry.member: json_content}, dest_path)
                         total_changes += changes
                         pbar.write(f"  ✅ {zip_path.name}: {changes}개 항목 변경")
                     else:
+                        shutil.copy2(zip_path, dest_path)
                         pbar.write(f"  📝 {zip_path.name}: 변경 사항 없음")
 
-                    # 3-4. 결과물 재압축 및 저장
-                    relative_path = zip_path.relative_to(target_path)
-                    dest_path = output_dir / relative_path
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    with zipfile.ZipFile(dest_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-                        for file_to_zip in extract_dir.rglob('*'):
-                            if file_to_zip.is_file():
-                                arcname = file_to_zip.relative_to(extract_dir)
-                                new_zip.write(file_to_zip, arcname)
-
                 except Exception as e:
+                    failed_files.append(zip_path)
                     pbar.write(f"  ❌ {zip_path.name} 처리 중 오류: {e}")
                 finally:
-                    # 임시 추출 폴더 정리
-                    shutil.rmtree(extract_dir, ignore_errors=True)
                     pbar.update(1)
 
         # 4. 최종 정리
-        shutil.rmtree(temp_processing_dir, ignore_errors=True)
         print(f"\n🎉 처리 완료! 총 {total_changes}개 항목이 변경되었습니다.")
         print(f"� 결과는 {output_dir} 폴더에 저장되었습니다.")
+        if failed_files:
+            print(f"❌ 처리 실패: {len(failed_files)}개 ZIP (결과 폴더에 없음)")
+            for zip_path in failed_files:
+                print(f"  📄 {zip_path}")
+            sys.exit(1)
         return
     
     # 지정 폴더에 검수 폴더 생성하여 처리
@@ -736,16 +778,13 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         # 2. 자동 수정 (extracted_dir 내부 파일만 대상으로)
         print(f"\n🔧 자동 수정 시작: {len(json_files)}개 파일")
         total_fixes = 0
+        fixer = RuleBasedFixer(cache=result_cache, stats=controller.fixer_stats)
 
         for json_file in json_files:
             if "visualinfo" in json_file.name:
-                extract_dir = json_file.parent.parent
-                fixer = RuleBasedFixer(extract_dir)
-                fixes = fixer.run_all_rule_fixes()
-
-                fix_count = sum(len(fix_list) for fix_list in fixes.values())
+                # 수정 사항이 있으면 같은 파일에 저장
+                fix_count = fixer.fix_file(json_file).fix_count
                 if fix_count > 0:
-                    fixer.save_fixes()
                     total_fixes += fix_count
                     print(f"  ✅ {json_file.parent.parent.name}: {fix_count}개 수정")
                 else:
@@ -757,7 +796,7 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         if total_fixes > 0:
             print(f"\n📦 검수 폴더에 재압축 중...")
             recompressor = ZipRecompressor(review_dir)
-            recompressed_files = recompressor.recompress_all(extracted_dir)
+            recompressed_files = recompressor.recompress_all(extracted_dir, source_dir=target_path)
 
             print(f"✅ 처리 완료!")
             print(f"📁 수정된 파일 저장 위치: {review_dir}")
@@ -777,6 +816,7 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         else:
             print("📝 수정된 항목이 없어 재압축을 건너뜁니다.")
 
+        report_profile(controller, args)
         return
     
     # 전체 워크플로우 모드 (추출 → 자동수정 → 재압축)
@@ -794,16 +834,13 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         # 2. 자동 수정
         print(f"\n🔧 자동 수정 시작: {len(json_files)}개 파일")
         total_fixes = 0
+        fixer = RuleBasedFixer(cache=result_cache, stats=controller.fixer_stats)
         
         for json_file in json_files:
             if "visualinfo" in json_file.name:
-                extract_dir = json_file.parent.parent
-                fixer = RuleBasedFixer(extract_dir)
-                fixes = fixer.run_all_rule_fixes()
-                
-                fix_count = sum(len(fix_list) for fix_list in fixes.values())
+                # 수정 사항이 있으면 같은 파일에 저장
+                fix_count = fixer.fix_file(json_file).fix_count
                 if fix_count > 0:
-                    fixer.save_fixes()
                     total_fixes += fix_count
                     print(f"  ✅ {json_file.parent.parent.name}: {fix_count}개 수정")
                 else:
@@ -822,6 +859,7 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         else:
             print("📝 수정된 항목이 없어 재압축을 건너뜁니다.")
         
+        report_profile(controller, args)
         return
     
     # 자동 수정만 실행
@@ -835,22 +873,20 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
         
         print(f"🔧 자동 수정 시작: {len(json_files)}개 파일")
         total_fixes = 0
+        fixer = RuleBasedFixer(cache=result_cache, stats=controller.fixer_stats)
         
         for json_file in json_files:
             if "visualinfo" in json_file.name:
-                extract_dir = json_file.parent.parent
-                fixer = RuleBasedFixer(extract_dir)
-                fixes = fixer.run_all_rule_fixes()
-                
-                fix_count = sum(len(fix_list) for fix_list in fixes.values())
+                # 수정 사항이 있으면 같은 파일에 저장
+                fix_count = fixer.fix_file(json_file).fix_count
                 if fix_count > 0:
-                    fixer.save_fixes()
                     total_fixes += fix_count
                     print(f"  ✅ {json_file.parent.parent.name}: {fix_count}개 수정")
                 else:
                     print(f"  📝 {json_file.parent.parent.name}: 수정할 항목 없음")
         
         print(f"\n📊 총 수정 항목: {total_fixes}개")
+        report_profile(controller, args)
         return
     
     # 재압축만 실행
@@ -877,13 +913,25 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
             
         else:
             print(f"📁 디렉토리 검수: {target_path}")
-            all_issues = controller.validate_directory(target_path)
+            if args.issues:
+                # 이슈는 파일에 바로 기록하고 요약만 유지
+                all_issues = controller.export_issues(target_path, Path(args.issues), workers=args.jobs)
+                print(f"📄 이슈 목록 저장: {args.issues}")
+            else:
+                all_issues = controller.validate_directory_store(target_path, workers=args.jobs)
             
-            if args.fix and all_issues:
+            if args.fix and len(all_issues):
                 print("🔧 일괄 자동 수정 실행 중...")
-                for file_path in all_issues.keys():
+                skipped_files = []
+                for file_path in all_issues.files():
+                    # ZIP 내부 문서("x.zip/.../y.json")는 실제 파일이 아니므로 수정하지 않음
+                    if not Path(file_path).is_file():
+                        skipped_files.append(file_path)
+                        continue
                     controller.auto_fix_file(Path(file_path))
                 print("✅ 일괄 수정 완료")
+                if skipped_files:
+                    print(f"⚠️ ZIP 내부 문서 {len(skipped_files)}개는 수정하지 않았습니다 (--auto-fix로 압축 해제 후 수정하세요)")
             
             # 보고서 생성
             processing_time = time.time() - start_time
@@ -898,6 +946,9 @@ JSON 파일 내의 라벨링 오류를 감지하고, 한글 인코딩 문제까
                 controller.export_report(report, Path(args.report))
                 print(f"📄 보고서 저장: {args.report}")
         
+        if args.profile is not None:
+            print_profile(controller.profile_report(), args.profile, controller.cache is not None)
+        
     except KeyboardInterrupt:
         print("\n⚠️ 사용자에 의해 중단되었습니다.")
         sys.exit(1)
@@ -59,3 +59,19 @@ export interface LabelPredictionRequest {
 export interface TrendAnalysisRequest {
   history: Array<Record<string, any>>;
 }
+
+// 백그라운드 작업 (/api/jobs)
+export interface Job {
+  id: string;
+  type: 'auto_fix' | 'compare';
+  state: 'queued' | 'running' | 'done' | 'failed';
+  created: number;
+  updated: number;
+  progress: {
+    done: number;
+    total: number;
+  };
+  message: string;
+  error: string | null;
+  summary: Record<string, any> | null;
+}
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+비동기 PDF 업로더 테스트 (모의 OCR 서버 사용)
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from backend.src.services.async_pdf_uploader import AsyncPDFUploader
+from backend.src.services.pdf_uploader import PDFUploader
+from backend.src.services.upload_pipeline import AsyncUploadPipeline
+from benchmarks.mock_ocr_server import MockOCRConfig, start_background_server
+
+PDF_CONTENT = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n2 0 obj << /Type /Page >> endobj\n%%EOF\n"
+
+IMAGES = {f"figure/DOC1_{index}.png": bytes([index]) * (1000 + index) for index in range(5)}
+
+def make_canned_zip(zip_path):
+    elements = [
+        {"id": str(index), "category": {"label": "Figure", "type": "FIGURE"},
+         "content": {"text": "", "imagePath": image_path}, "pageIndex": 0}
+        for index, image_path in enumerate(IMAGES)
+    ]
+    with zipfile.ZipFile(zip_path, 'w') as zipf:
+        zipf.writestr("visualinfo/DOC1_visualinfo.json", json.dumps({"elements": elements}))
+        for image_path, image_data in IMAGES.items():
+            zipf.writestr(image_path, image_data)
+
+def member_kind(member):
+    return "meta" if member.startswith("meta/") else member
+
+class TestAsyncPDFUploader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.temp_dir.name)
+        canned_dir = self.base_dir / "canned"
+        canned_dir.mkdir()
+        make_canned_zip(canned_dir / "visualcontent-DOC1.zip")
+
+        self.pdf_dir = self.base_dir / "pdf"
+        self.pdf_dir.mkdir()
+        self.pdf_files = []
+        for name in ("DOC1", "DOC2", "DOC3"):
+            pdf_path = self.pdf_dir / f"{name}.pdf"
+            pdf_path.write_bytes(PDF_CONTENT)
+            self.pdf_files.append(pdf_path)
+
+        config = MockOCRConfig(latency=0.0, ocr_delay_base=0.05, ocr_delay_per_page=0.0, ocr_delay_sigma=0.0)
+        self.server = start_background_server(config=config, canned_dir=canned_dir)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def test_pipeline_matches_sync_uploader(self):
+        output_dir = self.base_dir / "async"
+        output_dir.mkdir()
+        completed = []
+
+        async def run():
+            async with AsyncPDFUploader(base_url=self.server.base_url, image_workers=2) as uploader:
+                pipeline = AsyncUploadPipeline(uploader, concurrency=2, log=lambda message: None,
+                                               progress=lambda pdf_path, message: None)
+                return await pipeline.run(self.pdf_files, output_dir, on_complete=completed.append)
+
+        results = asyncio.run(run())
+
+        self.assertEqual([result.pdf_path for result in results], self.pdf_files)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(sorted(result.pdf_path for result in completed), self.pdf_files)
+        self.assertEqual([result.num_pages for result in results], [2, 2, 2])
+
+        # 같은 문서를 동기 업로더로 만든 ZIP과 멤버 구성/내용이 같음
+        sync_zip = self.base_dir / "sync.zip"
+        uploader = PDFUploader(base_url=self.server.base_url)
+        file_info = uploader.upload_pdf(self.pdf_files[0])
+        uploader.extract_pages(file_info['fileId'], "1-2")
+        visual_info = uploader.get_visual_info(file_info['fileId'], progress_callback=lambda message: None)
+        self.assertTrue(uploader.create_visualcontent_zip(self.pdf_files[0], visual_info, sync_zip,
+                                                          file_info['fileId']))
+
+        with zipfile.ZipFile(results[0].zip_path) as async_ref, zipfile.ZipFile(sync_zip) as sync_ref:
+            # meta 파일명은 업로드마다 다른 fileId
+            self.assertEqual(sorted(map(member_kind, async_ref.namelist())), sorted(map(member_kind, sync_ref.namelist())))
+            self.assertEqual(async_ref.read("visualinfo/DOC1_visualinfo.json"),
+                             sync_ref.read("visualinfo/DOC1_visualinfo.json").replace(
+                                 file_info['fileId'].encode(), results[0].file_id.encode()))
+            self.assertEqual(async_ref.read("original/DOC1.pdf"), PDF_CONTENT)
+            for image_path, image_data in IMAGES.items():
+                self.assertEqual(async_ref.read(image_path), image_data)
+                self.assertEqual(async_ref.getinfo(image_path).compress_type, zipfile.ZIP_STORED)
+
+    def test_upload_failure_returns_none(self):
+        async def run():
+            async with AsyncPDFUploader(base_url=self.server.base_url) as uploader:
+                uploaded = await uploader.upload_pdf(self.pdf_files[0])
+                missing = await uploader.upload_pdf(self.pdf_dir / "missing.pdf")
+                return uploaded, missing
+
+        uploaded, missing = asyncio.run(run())
+        self.assertEqual(uploaded['numOfPages'], 2)
+        self.assertIsNone(missing)
+
+if __name__ == '__main__':
+    unittest.main()
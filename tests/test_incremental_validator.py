@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+증분 검증기 테스트
+"""
+
+import copy
+import random
+import unittest
+
+from backend.src.core import IncrementalValidator, QualityController, RuleValidator
+from benchmarks.synthetic_corpus import generate_document
+
+class TestIncrementalValidator(unittest.TestCase):
+    def setUp(self):
+        self.validator = RuleValidator()
+
+    def assert_same_as_full(self, incremental, data):
+        self.assertEqual(incremental.issues, self.validator.validate_all_rules(data, "a.json"))
+
+    def test_edit_with_changed_ids(self):
+        data = generate_document("A", 200, seed=1, error_rate=0.1)
+        incremental = IncrementalValidator("a.json", self.validator)
+        incremental.validate(data)
+        self.assert_same_as_full(incremental, data)
+
+        element = data["elements"][50]
+        element["category"]["label"] = "연결"
+        element["content"]["text"] = data["elements"][10]["content"].get("text", "")
+        incremental.update(data, [element["id"]])
+
+        self.assertEqual(incremental.last_changed, 1)
+        self.assert_same_as_full(incremental, data)
+
+    def test_diff_detects_changes(self):
+        data = generate_document("A", 200, seed=2, error_rate=0.1)
+        incremental = QualityController().incremental_validator(data, "a.json")
+
+        data["elements"][3]["pageIndex"] += 1
+        data["elements"][7]["bbox"]["top"] = 0
+        incremental.update(data)
+
+        self.assertEqual(incremental.last_changed, 2)
+        self.assert_same_as_full(incremental, data)
+
+        incremental.update(data)
+        self.assertEqual(incremental.last_changed, 0)
+
+    def test_random_edits_match_full_validation(self):
+        rng = random.Random(7)
+        data = generate_document("A", 120, seed=3, error_rate=0.2)
+        incremental = IncrementalValidator("a.json", self.validator)
+        incremental.validate(data)
+
+        for step in range(60):
+            elements = data["elements"]
+            op = rng.random()
+            if op < 0.6:
+                element = rng.choice(elements)
+                element["category"]["label"] = rng.choice(["ParaText", "ParaTitle", "Date", "연결"])
+                element["content"]["text"] = rng.choice(["원문", "2021. 2. 3", "", "반복되는 문장입니다"])
+                element["pageIndex"] = rng.randint(0, 3)
+            elif op < 0.8:
+                del elements[rng.randrange(len(elements))]
+            else:
+                element = copy.deepcopy(rng.choice(elements))
+                element["id"] = f"new{step}"
+                elements.insert(rng.randrange(len(elements)), element)
+
+            incremental.update(data)
+            self.assert_same_as_full(incremental, data)
+
+    def test_empty_document(self):
+        incremental = IncrementalValidator("a.json", self.validator)
+        incremental.validate(generate_document("A", 10))
+        incremental.update({"elements": []})
+
+        self.assertEqual([issue.rule_id for issue in incremental.issues], ["STRUCTURE_001"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+열 단위 이슈 저장소 테스트
+"""
+
+import json
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.src.core import QualityController
+from backend.src.models import IssueStore, QualityIssue
+
+class TestIssueStore(unittest.TestCase):
+    def make_issues(self):
+        return [
+            QualityIssue("R001", "error", "빈 텍스트", "a.json", element_id="0", page_index=0, category="content"),
+            QualityIssue("R001", "error", "빈 텍스트", "a.json", element_id="12", page_index=3, category="content",
+                         auto_fixable=True, metadata={"old_label": "ParaText", "new_label": "ParaTitle"}),
+            QualityIssue("R007", "warning", "중복", "b.json", element_id="007", page_index=None,
+                         metadata={"duplicate_of": ["1", "2"]}),
+            QualityIssue("SYSTEM_ERROR", "error", "로드 실패", "c.json", element_id=None, page_index=-1)
+        ]
+
+    def test_round_trip(self):
+        issues = self.make_issues()
+        store = IssueStore.from_issues(issues)
+
+        self.assertEqual(len(store), 4)
+        self.assertEqual(list(store), issues)
+        self.assertEqual(list(store.iter_dicts()), [issue.to_dict() for issue in issues])
+        self.assertEqual(store[-1], issues[-1])
+        self.assertEqual(list(pickle.loads(pickle.dumps(store))), issues)
+
+    def test_ranges_and_counts(self):
+        store = IssueStore()
+        first = store.extend(self.make_issues()[:2])
+        second = store.extend(self.make_issues()[2:])
+
+        self.assertEqual((len(first), len(second)), (2, 2))
+        self.assertEqual(first.count_by_rule(), {"R001": 2})
+        self.assertEqual(list(second.messages()), ["중복", "로드 실패"])
+        self.assertEqual(store.count_by_rule(), {"R001": 2, "R007": 1, "SYSTEM_ERROR": 1})
+        self.assertEqual(store.files(), ["a.json", "b.json", "c.json"])
+
+    def test_directory_store_matches_directory(self):
+        data = {
+            "elements": [
+                {"id": "0", "category": {"label": "ParaText"}, "content": {"text": ""}, "pageIndex": 0},
+                {"id": "1", "category": {"label": "ParaText"}, "content": {"text": "본문"}, "pageIndex": 0}
+            ]
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir)
+            for name in ("c", "a", "b"):
+                (base_dir / f"{name}_visualinfo.json").write_text(json.dumps(data), encoding='utf-8')
+
+            controller = QualityController()
+            results = controller.validate_directory(base_dir)
+            store = controller.validate_directory_store(base_dir, workers=2)
+
+        expected = [issue for issues in results.values() for issue in issues]
+        self.assertEqual(list(store), expected)
+        self.assertEqual(controller.generate_report(store, 0.0).issue_types,
+                         controller.generate_report(results, 0.0).issue_types)
+
+if __name__ == '__main__':
+    unittest.main()
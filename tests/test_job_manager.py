@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+백그라운드 작업 관리자 테스트
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+from pathlib import Path
+
+from backend.src.services.job_manager import (
+    JOB_AUTO_FIX,
+    STATE_DONE,
+    STATE_RUNNING,
+    JobManager,
+    JobStore,
+    run_job,
+)
+
+class TestJobStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = JobStore(Path(self.temp_dir.name))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_run_auto_fix_job(self):
+        job = self.store.create(JOB_AUTO_FIX)
+        files_dir = self.store.input_dir(job['id']) / "files"
+        files_dir.mkdir()
+        data = {"elements": [
+            {"id": "0", "category": {"label": "ListText"}, "content": {"text": "원문"}, "pageIndex": 0}
+        ]}
+        (files_dir / "DOC1_visualinfo.json").write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        (files_dir / "broken.zip").write_bytes(b"not a zip")
+
+        # 작업은 서버 작업 폴더에 아무것도 남기지 않아야 함 (fixed_files/ 등)
+        with tempfile.TemporaryDirectory() as cwd:
+            previous_cwd = os.getcwd()
+            os.chdir(cwd)
+            try:
+                run_job(str(self.store.jobs_dir), job['id'])
+            finally:
+                os.chdir(previous_cwd)
+            self.assertEqual(os.listdir(cwd), [])
+
+        job = self.store.get(job['id'])
+        self.assertEqual(job['state'], STATE_DONE)
+        self.assertEqual(job['summary']['errors'], 1)
+        self.assertEqual(job['progress'], {'done': 2, 'total': 2})
+        with zipfile.ZipFile(self.store.result_path(job)) as result_zip:
+            self.assertEqual(sorted(result_zip.namelist()), ["DOC1_visualinfo.json", "report.json"])
+            report = json.loads(result_zip.read("report.json"))
+            fixed = json.loads(result_zip.read("DOC1_visualinfo.json"))
+        self.assertEqual(fixed["elements"][0]["category"]["label"], "ParaText")
+        self.assertEqual(report['documents'][1]['document'], "broken.zip")
+
+    def test_batch_zip_members_with_same_name(self):
+        job = self.store.create(JOB_AUTO_FIX)
+        files_dir = self.store.input_dir(job['id']) / "files"
+        files_dir.mkdir()
+        documents = {}
+        for name in ("a", "b", "upload"):
+            data = {"elements": [
+                {"id": name, "category": {"label": "ParaText"}, "content": {"text": name}, "pageIndex": 0}
+            ]}
+            documents[name] = json.dumps(data)
+        (files_dir / "x.json").write_text(documents["upload"], encoding='utf-8')
+        with zipfile.ZipFile(files_dir / "batch.zip", 'w') as zipf:
+            zipf.writestr("a/x.json", documents["a"])
+            zipf.writestr("b/x.json", documents["b"])
+        with zipfile.ZipFile(files_dir / "empty.zip", 'w') as zipf:
+            zipf.writestr("readme.txt", "no documents")
+
+        run_job(str(self.store.jobs_dir), job['id'])
+
+        job = self.store.get(job['id'])
+        with zipfile.ZipFile(self.store.result_path(job)) as result_zip:
+            ids = {name: json.loads(result_zip.read(name))["elements"][0]["id"]
+                   for name in result_zip.namelist() if name.endswith(".json") and name != "report.json"}
+            report = json.loads(result_zip.read("report.json"))
+        # 같은 이름의 멤버와 업로드 파일이 서로 덮어쓰지 않음
+        self.assertEqual(ids, {"x.json": "upload", "x-2.json": "a", "x-3.json": "b"})
+        # 문서가 없는 ZIP은 지워지지 않고 보고서에 오류로 남음
+        self.assertEqual(job['summary']['errors'], 1)
+        self.assertIn({'document': "empty.zip", 'error': "visualinfo JSON이나 visualcontent ZIP이 없는 ZIP"},
+                      report['documents'])
+
+    def test_prune_keeps_active_and_recent_jobs(self):
+        old = self.store.update(self.store.create(JOB_AUTO_FIX)['id'], state=STATE_DONE)
+        recent = self.store.update(self.store.create(JOB_AUTO_FIX)['id'], state=STATE_DONE)
+        running = self.store.update(self.store.create(JOB_AUTO_FIX)['id'], state=STATE_RUNNING)
+
+        job_file = self.store.job_dir(old['id']) / "job.json"
+        old['updated'] = time.time() - 3600
+        job_file.write_text(json.dumps(old), encoding='utf-8')
+
+        self.assertEqual(self.store.prune(retention_seconds=60), 1)
+        self.assertEqual(sorted(job['id'] for job in self.store.list()), sorted([recent['id'], running['id']]))
+
+        self.assertEqual(self.store.prune(retention_seconds=60, max_count=1), 1)
+        self.assertEqual([job['id'] for job in self.store.list()], [running['id']])
+
+class TestJobManager(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = JobStore(Path(self.temp_dir.name))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_completion_handled_on_event_loop(self):
+        manager = JobManager(self.store, workers=1)
+
+        async def run():
+            manager.start()
+            loop_thread = threading.get_ident()
+            finished_threads = []
+            finish = manager._finish
+            manager._finish = lambda job_id, future: (finished_threads.append(threading.get_ident()),
+                                                      finish(job_id, future))
+
+            for _ in range(3):
+                job = self.store.create(JOB_AUTO_FIX)
+                (self.store.input_dir(job['id']) / "files").mkdir()
+                manager.submit(job)
+
+            # 완료 콜백이 도는 동안 이벤트 루프에서 계속 조회해도 안전
+            deadline = time.monotonic() + 30
+            while (manager.active or manager._futures) and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            manager.shutdown()
+            return loop_thread, finished_threads
+
+        loop_thread, finished_threads = asyncio.run(run())
+
+        self.assertEqual(manager.active, 0)
+        self.assertEqual(finished_threads, [loop_thread] * 3)
+        self.assertTrue(all(job['state'] == STATE_DONE for job in self.store.list()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+JSON 코덱 테스트 (orjson 설치 여부와 관계없이 표준 json과 같은 결과)
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.src.utils import json_codec
+from benchmarks.synthetic_corpus import generate_document
+
+def expected_bytes(data):
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+class TestJsonCodec(unittest.TestCase):
+    def test_visualinfo_round_trip(self):
+        data = generate_document("A", 50, seed=1, error_rate=0.1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "a_visualinfo.json"
+            json_codec.dump(data, path)
+
+            self.assertEqual(path.read_bytes(), expected_bytes(data))
+            self.assertEqual(json_codec.load(path), data)
+
+    def test_float_notation_matches_stdlib(self):
+        for value in (0.0, -0.0, 1e-05, 0.0001, 9.99e-05, 1e15, 1e16, 1.5e300, 5e-324, float('nan'), float('inf')):
+            data = {"bbox": {"left": value, "top": [value, 1.5]}, "text": "1e-05 \"따옴표\""}
+            self.assertEqual(json_codec.dumps(data), expected_bytes(data), value)
+
+    def test_loads_fallbacks(self):
+        self.assertEqual(json_codec.loads('\ufeff{"a": 1}'.encode('utf-8')), {"a": 1})
+        self.assertEqual(json_codec.loads(b'{"a": NaN, "b": 123456789012345678901234567890}')["b"],
+                         123456789012345678901234567890)
+        with self.assertRaises(json.JSONDecodeError):
+            json_codec.loads(b'{"a": ')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+운영 지표 수집기 테스트
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.src.core import QualityController
+from backend.src.core.rule_validator import RuleValidator, RuleStats
+from backend.src.utils.metrics import MetricsRegistry
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_render_prometheus_text(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("qc_requests_total", "요청 수", ("route",))
+        latency = registry.histogram("qc_latency_seconds", "처리 시간", buckets=(0.1, 1.0))
+        registry.gauge("qc_pending", "대기 작업 수", function=lambda: 3)
+
+        requests.inc(route="/upload")
+        requests.inc(2, route="/upload")
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5)
+
+        lines = registry.render().splitlines()
+
+        self.assertIn("# TYPE qc_requests_total counter", lines)
+        self.assertIn('qc_requests_total{route="/upload"} 3', lines)
+        self.assertIn('qc_latency_seconds_bucket{le="0.1"} 1', lines)
+        self.assertIn('qc_latency_seconds_bucket{le="1.0"} 2', lines)
+        self.assertIn('qc_latency_seconds_bucket{le="+Inf"} 3', lines)
+        self.assertIn("qc_latency_seconds_count 3", lines)
+        self.assertIn("qc_pending 3", lines)
+
+    def test_label_mismatch_rejected(self):
+        counter = MetricsRegistry().counter("qc_issues_total", "이슈 수", ("rule",))
+
+        with self.assertRaises(ValueError):
+            counter.inc(route="/upload")
+
+class TestRuleStats(unittest.TestCase):
+    def test_timing_does_not_change_results(self):
+        data = {
+            "elements": [
+                {"id": "0", "category": {"label": "ParaText"}, "content": {"text": ""}, "pageIndex": 0},
+                {"id": "1", "category": {"label": "ParaText"}, "content": {"text": "본문"}, "pageIndex": 0}
+            ]
+        }
+        validator = RuleValidator()
+        expected = [issue.to_dict() for issue in validator.validate_all_rules(data, "a.json")]
+
+        validator.stats = RuleStats()
+        actual = [issue.to_dict() for issue in validator.validate_all_rules(data, "a.json")]
+        snapshot = validator.stats.snapshot()
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(snapshot["R001"]["calls"], 2)
+        self.assertEqual(snapshot["R001"]["issues"], 1)
+        # 누적/마무리 두 단계로 재는 R002도 요소당 한 번만 호출로 셈
+        self.assertEqual(snapshot["R002"]["calls"], 2)
+        self.assertEqual(snapshot["R006"]["calls"], 1)
+
+class TestProfileReport(unittest.TestCase):
+    def test_parallel_profile_merged_into_report(self):
+        data = {
+            "elements": [
+                {"id": "0", "category": {"label": "ParaText"}, "content": {"text": ""}, "pageIndex": 0},
+                {"id": "1", "category": {"label": "ParaText"}, "content": {"text": "본문"}, "pageIndex": 0}
+            ]
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir)
+            for name in ("a", "b", "c"):
+                (base_dir / f"{name}_visualinfo.json").write_text(json.dumps(data), encoding='utf-8')
+
+            controller = QualityController({'profile': True})
+            results = controller.validate_directory(base_dir, workers=2)
+            report = controller.generate_report(results, 0.1)
+
+        rules = report.profile["rules"]
+        r001 = next(item for item in rules["items"] if item["name"] == "R001")
+        self.assertEqual((rules["documents"], rules["elements"]), (3, 6))
+        self.assertEqual((r001["calls"], r001["issues"]), (6, 3))
+        self.assertEqual(report.profile["fixer"]["documents"], 0)
+
+    def test_profile_disabled_by_default(self):
+        controller = QualityController()
+
+        self.assertIsNone(controller.validator.stats)
+        self.assertIsNone(controller.generate_report({}, 0.0).profile)
+
+if __name__ == '__main__':
+    unittest.main()
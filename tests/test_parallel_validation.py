@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+디렉토리 병렬 검증 테스트 (순차 검증과 같은 결과)
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.src.core import QualityController
+from benchmarks.synthetic_corpus import generate_document
+
+def issue_dicts(results):
+    return {path: [issue.to_dict() for issue in issues] for path, issues in results.items()}
+
+def counts(stats):
+    return {name: (values['calls'], values['issues']) for name, values in stats.snapshot().items()}
+
+class TestParallelValidation(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.temp_dir.name)
+        for index in range(12):
+            doc_dir = self.base_dir / f"DOC{index:02d}" / "visualinfo"
+            doc_dir.mkdir(parents=True)
+            data = generate_document(f"DOC{index:02d}", 20 + index * 5, seed=index, error_rate=0.2)
+            (doc_dir / f"DOC{index:02d}_visualinfo.json").write_text(json.dumps(data, ensure_ascii=False),
+                                                                     encoding='utf-8')
+        (self.base_dir / "broken_visualinfo.json").write_text('{"elements": [', encoding='utf-8')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parallel_matches_sequential(self):
+        sequential = QualityController().validate_directory(self.base_dir)
+
+        completed = []
+        controller = QualityController()
+        parallel = controller.validate_directory(self.base_dir, workers=2,
+                                                 progress_callback=lambda path, issues: completed.append(path))
+        yielded = [path for path, _ in controller.iter_directory(self.base_dir, workers=2)]
+
+        self.assertEqual(list(parallel), list(sequential))
+        self.assertEqual(issue_dicts(parallel), issue_dicts(sequential))
+        self.assertEqual(sorted(completed), sorted(self.base_dir.rglob("*.json")))
+        self.assertEqual(yielded, sorted(self.base_dir.rglob("*.json")))
+
+    def test_parallel_profile_matches_sequential(self):
+        sequential = QualityController({'profile': True})
+        sequential.validate_directory(self.base_dir)
+        parallel = QualityController({'profile': True})
+        parallel.validate_directory(self.base_dir, workers=2)
+
+        pairs = ((parallel.validator.stats, sequential.validator.stats), (parallel.fixer_stats, sequential.fixer_stats))
+        for actual, expected in pairs:
+            self.assertEqual((actual.documents, actual.elements), (expected.documents, expected.elements))
+            self.assertEqual(counts(actual), counts(expected))
+
+if __name__ == '__main__':
+    unittest.main()
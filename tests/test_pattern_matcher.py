@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+패턴 매처 테스트
+"""
+
+import re
+import unittest
+import warnings
+from backend.src.core.pattern_matcher import PatternMatcher, PATTERN_GROUPS
+from backend.src.utils.advanced_analyzer import AdvancedQualityAnalyzer
+
+def legacy_predict_label(text):
+    # 공용 매처 도입 전 predict_optimal_label의 판단 순서 (비교 기준)
+    text = text.strip()
+    if re.match(r'^제\s*\d+\s*[장절조항]', text):
+        return 'ParaTitle'
+    elif re.match(r'^\d+\.\s*', text) or text.startswith('○'):
+        return 'ListText'
+    elif re.search(r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일', text):
+        return 'Date'
+    return 'ParaText'
+
+class TestPatternMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = PatternMatcher()
+
+    def test_matches_individual_search(self):
+        # 매처 결과가 패턴별 re.search 결과와 같아야 함
+        texts = [
+            "제1장 총칙", "제 3 편 선거", "저작권법", "2021년 2월 3일", "2021. 2. 3",
+            "2021. 2. 3 작성", "2021-02-03", "(1) 선거를 말한다", "가. 목적", "제3항",
+            "I. 개요", "1. 개요", "The 현안 분석", "첨부자료 1", "로그인", "헤더 영역 정보",
+            "일반 텍스트", "여러 줄\n저작권법", ""
+        ]
+
+        for text in texts:
+            expected = {
+                name for name, patterns in PATTERN_GROUPS.items()
+                if any(re.search(pattern, text) for pattern in patterns)
+            }
+            self.assertEqual(set(self.matcher.match(text)), expected, text)
+
+    def test_multiple_hits(self):
+        # 하나의 텍스트가 여러 그룹에 동시에 적중
+        hits = self.matcher.match("1. 개요")
+        self.assertIn("title", hits)
+        self.assertIn("list_item", hits)
+
+    def test_patterns_unsafe_to_combine(self):
+        # 최상위 '|', 번호 그룹/역참조, 전역 플래그가 있는 '^' 패턴도 re.search와 같은 결과
+        pattern_groups = {
+            "alternation": [r'^a|b'],
+            "backref": [r'^(\d)\1', r'^x+'],
+            "named": [r'^(?P<word>y)(?P=word)'],
+            "flags": [r'^(?i)zz'],
+            "class_bar": [r'^[|]q'],
+        }
+        with warnings.catch_warnings():
+            # 3.11 미만에서는 패턴 중간의 전역 플래그가 경고, 이후로는 오류
+            warnings.simplefilter("ignore", DeprecationWarning)
+            try:
+                re.compile(pattern_groups["flags"][0])
+            except re.error:
+                del pattern_groups["flags"]
+            matcher = PatternMatcher(pattern_groups)
+
+            for text in ["a", "xb", "11", "12", "xx", "yy", "ZZ", "|q", "q|", ""]:
+                expected = {
+                    name for name, patterns in pattern_groups.items()
+                    if any(re.search(pattern, text) for pattern in patterns)
+                } if text else set()
+                self.assertEqual(set(matcher.match(text)), expected, text)
+
+class TestPredictOptimalLabel(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = AdvancedQualityAnalyzer()
+
+    def predict(self, text):
+        return self.analyzer.predict_optimal_label(text, {})[0]
+
+    def test_unchanged_for_overlapping_patterns(self):
+        # 여러 그룹에 함께 적중해도 이전과 같은 라벨
+        texts = [
+            "제1장 총칙", "제2조 목적", "제 3 절 1. 개요", "제1조의 2021년 2월 3일",
+            "1. 개요", "1. 2021년 2월 3일 작성", "○ 항목", "2021년 2월 3일", "일반 텍스트", "",
+            "다음 사항을 준수하여야 한다.", "국가재정법", "저작권법"    # 수정기 전용 '항'/'~법' 규칙은 예측에 쓰지 않음
+        ]
+
+        for text in texts:
+            self.assertEqual(self.predict(text), legacy_predict_label(text), text)
+
+    def test_intended_changes_for_overlapping_patterns(self):
+        # (텍스트, 이전 예측, 현재 예측) - 현재 예측은 수정기 _determine_correct_label과 같은 그룹 기준
+        cases = [
+            ("2021. 2. 3", 'ListText', 'Date'),                 # 날짜 그룹이 목록보다 우선
+            ("2021. 2. 3 작성", 'ListText', 'Date'),
+            ("제3항", 'ParaTitle', 'ListText'),                 # '제~항'은 list_item 그룹
+            ("제 5 편 부칙", 'ParaText', 'ParaTitle'),
+            ("가. 목적", 'ParaText', 'ListText'),
+            ("(1) 선거를 말한다", 'ParaText', 'ListText'),
+            ("붙임 2021년 2월 3일", 'Date', 'ParaText'),        # 날짜 그룹은 텍스트 시작에서만 적중
+        ]
+
+        for text, old, new in cases:
+            self.assertEqual(legacy_predict_label(text), old, text)
+            self.assertEqual(self.predict(text), new, text)
+
+if __name__ == '__main__':
+    unittest.main()
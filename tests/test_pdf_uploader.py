@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+OCR 결과 폴링 일정 / Retry-After 처리 테스트
+"""
+
+import time
+import unittest
+from email.utils import formatdate
+
+from backend.src.services.pdf_uploader import (
+    OCR_MIN_TIMEOUT,
+    POLL_BACKOFF_FACTOR,
+    POLL_INITIAL_INTERVAL,
+    POLL_JITTER,
+    POLL_MAX_INTERVAL,
+    POLL_MIN_INTERVAL,
+    PollSchedule,
+    ocr_timeout,
+    parse_retry_after,
+)
+
+class TestOcrTimeout(unittest.TestCase):
+    def test_scales_with_pages(self):
+        self.assertEqual(ocr_timeout(None), OCR_MIN_TIMEOUT)
+        self.assertEqual(ocr_timeout(0), OCR_MIN_TIMEOUT)
+        self.assertEqual(ocr_timeout(10), OCR_MIN_TIMEOUT)
+        self.assertEqual(ocr_timeout(100), 560.0)
+        self.assertGreater(ocr_timeout(1000), ocr_timeout(100))
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_seconds_and_dates(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after(""))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("5"), 5.0)
+        self.assertEqual(parse_retry_after("0.5"), 0.5)
+        self.assertEqual(parse_retry_after("-3"), 0.0)
+
+        self.assertAlmostEqual(parse_retry_after(formatdate(time.time() + 30, usegmt=True)), 30, delta=2)
+        self.assertEqual(parse_retry_after(formatdate(time.time() - 30, usegmt=True)), 0.0)
+
+class TestPollSchedule(unittest.TestCase):
+    def test_backoff_with_jitter(self):
+        schedule = PollSchedule()
+        interval = POLL_INITIAL_INTERVAL
+        for _ in range(12):
+            delay = schedule.next_delay()
+            self.assertGreaterEqual(delay, interval * (1 - POLL_JITTER))
+            self.assertLessEqual(delay, interval * (1 + POLL_JITTER))
+            interval = min(interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL)
+        self.assertEqual(schedule.interval, POLL_MAX_INTERVAL)
+        self.assertEqual(schedule.poll_count, 12)
+
+    def test_retry_after_is_clamped(self):
+        schedule = PollSchedule()
+        self.assertEqual(schedule.next_delay(7.0), 7.0)
+        self.assertEqual(schedule.next_delay(0.0), POLL_MIN_INTERVAL)
+        self.assertEqual(schedule.next_delay(parse_retry_after(formatdate(time.time() - 30, usegmt=True))),
+                         POLL_MIN_INTERVAL)
+        # Retry-After를 따른 폴링은 백오프 간격을 늘리지 않음
+        self.assertEqual(schedule.interval, POLL_INITIAL_INTERVAL)
+
+    def test_deadline(self):
+        schedule = PollSchedule(num_pages=100)
+        self.assertEqual(schedule.timeout, ocr_timeout(100))
+
+        schedule.deadline = time.monotonic() + 2.0
+        self.assertLessEqual(schedule.next_delay(60.0), 2.0)
+        schedule.deadline = time.monotonic() - 1.0
+        self.assertIsNone(schedule.next_delay())
+        self.assertIn("2회", schedule.message(1.0, "50%"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+스트리밍 보고서 작성기 테스트
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.src.core import QualityController
+from backend.src.models import IssueStore, QualityIssue
+from backend.src.utils.report_writer import DocumentReportWriter, open_issue_writer
+
+class TestIssueWriter(unittest.TestCase):
+    def test_ndjson_rows_and_summary(self):
+        issues = [
+            QualityIssue("R001", "error", "빈 텍스트", "a.json", element_id="0", page_index=0),
+            QualityIssue("R007", "warning", "중복", "a.json", element_id="3", page_index=1, metadata={"text": "x"})
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "issues.jsonl"
+            with open_issue_writer(path) as writer:
+                writer.write("a.json", issues)
+                writer.write("b.json", [])
+                writer.write("c.json", IssueStore.from_issues(issues[:1]))
+
+            rows = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+        self.assertEqual([row["document"] for row in rows], ["a.json", "a.json", "c.json"])
+        self.assertEqual(rows[1]["metadata"], {"text": "x"})
+        self.assertEqual(writer.summary.to_dict()["issue_breakdown"], {"R001": 2, "R007": 1})
+        self.assertEqual((writer.summary.documents, writer.summary.files()), (3, ["a.json", "c.json"]))
+
+    def test_json_report_streamed(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "report.json"
+            lines_path = Path(temp_dir) / "report.jsonl"
+            for path in (json_path, lines_path):
+                writer = DocumentReportWriter(path)
+                writer.write({"file": "a", "accuracy_score": 90.0})
+                writer.write({"file": "b", "accuracy_score": 50.0})
+                writer.close({"summary": {"total_files": 2}})
+
+            report = json.loads(json_path.read_text(encoding='utf-8'))
+            lines = lines_path.read_text(encoding='utf-8').splitlines()
+
+        self.assertEqual([r["file"] for r in report["detailed_results"]], ["a", "b"])
+        self.assertEqual(report["summary"], {"total_files": 2})
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[-1]), {"summary": {"total_files": 2}})
+
+    def test_export_issues_report(self):
+        data = {"elements": [{"id": "0", "category": {"label": "ParaText"}, "content": {"text": ""}, "pageIndex": 0}]}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir) / "docs"
+            base_dir.mkdir()
+            for name in ("a", "b"):
+                (base_dir / f"{name}_visualinfo.json").write_text(json.dumps(data), encoding='utf-8')
+
+            controller = QualityController()
+            summary = controller.export_issues(base_dir, Path(temp_dir) / "issues.jsonl")
+            expected = controller.generate_report(controller.validate_directory(base_dir), 0.0)
+            actual = controller.generate_report(summary, 0.0)
+
+        self.assertEqual((actual.total_files, actual.total_issues), (expected.total_files, expected.total_issues))
+        self.assertEqual(actual.issue_types, expected.issue_types)
+
+if __name__ == '__main__':
+    unittest.main()
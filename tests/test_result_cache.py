@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+검수 결과 캐시 테스트
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from backend.src.core import QualityController, RuleBasedFixer
+from backend.src.utils.result_cache import ResultCache
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.temp_dir.name)
+        self.cache_dir = self.base_dir / "cache"
+
+        data = {
+            "elements": [
+                {"id": "0", "category": {"label": "ListText", "type": "LIST"}, "content": {"text": "원문"}, "pageIndex": 0},
+                {"id": "1", "category": {"label": "ParaText"}, "content": {"text": ""}, "pageIndex": 0}
+            ]
+        }
+        self.doc_dir = self.base_dir / "doc"
+        (self.doc_dir / "visualinfo").mkdir(parents=True)
+        self.json_path = self.doc_dir / "visualinfo" / "TEST0001_visualinfo.json"
+        self.json_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_validate_file_uses_cache(self):
+        controller = QualityController({'use_cache': True, 'cache_dir': self.cache_dir})
+        first = controller.validate_file(self.json_path)
+
+        # 같은 내용의 다른 경로도 캐시 적중, 이슈 경로는 새 경로로 채워짐
+        copy_path = self.base_dir / "copy.json"
+        copy_path.write_bytes(self.json_path.read_bytes())
+        second = controller.validate_file(copy_path)
+
+        self.assertEqual(controller.cache.hits, 1)
+        self.assertEqual([i.rule_id for i in first], [i.rule_id for i in second])
+        r001 = [i for i in second if i.rule_id == "R001"]
+        self.assertEqual(r001[0].file_path, str(copy_path))
+
+    def test_fixer_reuses_cached_fix(self):
+        cache = ResultCache(self.cache_dir)
+        fixer = RuleBasedFixer(self.doc_dir, cache=cache)
+        fixes = fixer.run_all_rule_fixes()
+
+        cached_fixer = RuleBasedFixer(self.doc_dir, cache=cache)
+        cached_fixes = cached_fixer.run_all_rule_fixes()
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual({k: [f.to_dict() for f in v] for k, v in fixes.items()},
+                         {k: [f.to_dict() for f in v] for k, v in cached_fixes.items()})
+        self.assertEqual(cached_fixer.visualinfo_data, fixer.visualinfo_data)
+
+    def test_prune_evicts_least_recently_used(self):
+        cache = ResultCache(self.cache_dir)
+        keys = [cache.make_key("test", "1", str(i).encode()) for i in range(12)]
+        for i, key in enumerate(keys):
+            cache.put(key, {"value": key})
+            os.utime(cache._entry_path(key), (1000 + i, 1000 + i))
+        cache.get(keys[0])
+        cache.max_entries = 10
+
+        removed = cache.prune()
+
+        self.assertEqual(removed, 3)
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+
+    def test_put_prunes_only_over_limit(self):
+        cache = ResultCache(self.cache_dir, max_entries=10)
+        keys = [cache.make_key("test", "1", str(i).encode()) for i in range(11)]
+        with mock.patch.object(cache, "prune", wraps=cache.prune) as prune:
+            for key in keys[:10]:
+                cache.put(key, {"value": key})
+            # 첫 저장에서 한 번 세고 나면 제한 안에서는 캐시 폴더를 다시 훑지 않음
+            self.assertEqual(prune.call_count, 1)
+
+            cache.put(keys[0], {"value": "updated"})
+            self.assertEqual(prune.call_count, 1)
+
+            cache.put(keys[10], {"value": keys[10]})
+            self.assertEqual(prune.call_count, 2)
+
+        self.assertEqual(len(list(self.cache_dir.glob("*/*.json"))), 9)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+메모리 기반 자동 수정 API 테스트
+"""
+
+import copy
+import json
+import tempfile
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+
+from backend.src.core import QualityController, RuleBasedFixer
+
+DOCUMENT = {
+    "elements": [
+        {"id": "0", "category": {"label": "ListText", "type": "LIST"}, "content": {"text": "원문"}, "pageIndex": 0},
+        {"id": "1", "category": {"label": "ParaText", "type": "PARAGRAPH"}, "content": {"text": "본문 내용입니다"}, "pageIndex": 0}
+    ]
+}
+
+class TestRuleBasedFixer(unittest.TestCase):
+    def test_fix_document_and_content(self):
+        fixer = RuleBasedFixer()
+        data = copy.deepcopy(DOCUMENT)
+
+        result = fixer.fix_document(data)
+        self.assertTrue(result.changed)
+        self.assertEqual(result.data["elements"][0]["category"], {"label": "ParaText", "type": "PARAGRAPH"})
+
+        # 같은 인스턴스로 다른 문서 수정 - 이전 문서 상태가 남지 않음
+        unchanged = fixer.fix_content(json.dumps(result.data, ensure_ascii=False).encode('utf-8'))
+        self.assertFalse(unchanged.changed)
+        self.assertEqual(unchanged.data, result.data)
+
+    def test_law_structure_labels(self):
+        # 수정기는 예측기와 달리 '~법'과 '항' 포함 문장도 법령 구조로 처리 (기존 동작 유지)
+        fixer = RuleBasedFixer()
+        cases = [
+            ("국가재정법", 'ParaTitle'), ("제2조 목적", 'ParaTitle'),
+            ("다음 사항을 준수하여야 한다.", 'ListText'), ("제3항", 'ListText'), ("일반 텍스트", 'ParaText'),
+        ]
+
+        for text, expected in cases:
+            element = {"category": {"label": "ParaText", "type": "PARAGRAPH"}}
+            self.assertEqual(fixer._determine_correct_label(text, "ParaText", element), expected, text)
+
+    def test_fixer_reused_across_documents(self):
+        documents = []
+        for index in range(40):
+            data = copy.deepcopy(DOCUMENT)
+            data["elements"] = data["elements"][:1 + index % 2]
+            documents.append(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        expected = [RuleBasedFixer().fix_content(content) for content in documents]
+
+        fixer = RuleBasedFixer()
+        results = [fixer.fix_content(content) for content in documents]
+
+        self.assertEqual([result.data for result in results], [result.data for result in expected])
+        self.assertEqual([result.fix_count for result in results], [result.fix_count for result in expected])
+        self.assertEqual(set(results[0].timings), {"unnecessary", "labels", "tables", "tags"})
+
+    def test_fix_file_matches_directory_fixer(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            visualinfo_dir = Path(temp_dir) / "doc" / "visualinfo"
+            visualinfo_dir.mkdir(parents=True)
+            json_path = visualinfo_dir / "TEST0001_visualinfo.json"
+            json_path.write_text(json.dumps(DOCUMENT, ensure_ascii=False), encoding='utf-8')
+
+            legacy = RuleBasedFixer(visualinfo_dir.parent)
+            legacy_fixes = legacy.run_all_rule_fixes()
+
+            result = RuleBasedFixer().fix_file(json_path)
+
+            self.assertEqual(result.fix_count, sum(len(fixes) for fixes in legacy_fixes.values()))
+            self.assertEqual(json.loads(json_path.read_text(encoding='utf-8')), legacy.visualinfo_data)
+
+    def test_controller_auto_fix_content(self):
+        controller = QualityController()
+        stages = []
+
+        @contextmanager
+        def stage(name):
+            stages.append(name)
+            yield
+
+        content = json.dumps(DOCUMENT, ensure_ascii=False).encode('utf-8')
+        before_issues, result, after_issues = controller.auto_fix_content(content, "a.json", stage=stage)
+        self.assertTrue(result.changed)
+        self.assertEqual(stages, ["validate", "fix", "revalidate"])
+        self.assertEqual(after_issues, controller.validate_data(result.data, "a.json"))
+
+        # 수정 사항이 없으면 다시 검증하지 않고 수정 전 이슈를 그대로 돌려줌
+        fixed = json.dumps(result.data, ensure_ascii=False).encode('utf-8')
+        before_issues, result, after_issues = controller.auto_fix_content(fixed, "a.json")
+        self.assertFalse(result.changed)
+        self.assertIs(after_issues, before_issues)
+
+    def test_controller_auto_fix_each_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [Path(temp_dir) / name / "a_visualinfo.json" for name in ("x", "y")]
+            for path in paths:
+                path.parent.mkdir()
+                path.write_text(json.dumps(DOCUMENT, ensure_ascii=False), encoding='utf-8')
+
+            controller = QualityController()
+            for path in paths:
+                controller.auto_fix_file(path)
+
+            for path in paths:
+                label = json.loads(path.read_text(encoding='utf-8'))["elements"][0]["category"]["label"]
+                self.assertEqual(label, "ParaText")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -58,5 +58,52 @@ class TestRuleValidator(unittest.TestCase):
         region_to_para = [i for i in issues if i.rule_id == "R002"]
         self.assertEqual(len(region_to_para), 1, "숫자나 □가 없는 RegionTitle만 ParaTitle로 변경되어야 함")
 
+    def test_fused_matches_per_rule(self):
+        # 단일 순회 모드와 규칙별 순회 모드의 결과가 동일해야 함
+        test_data = {
+            "elements": [
+                {"id": "a", "category": {"label": "ListText"}, "content": {"text": "원문"},
+                 "pageIndex": 0, "bbox": {"top": 300}},
+                {"id": "b", "category": {"label": "ParaText"}, "content": {"text": "2021. 2. 3 작성"},
+                 "pageIndex": 0, "bbox": {"top": 100}},
+                {"id": "c", "category": {"label": "연결"}, "content": {"text": ""},
+                 "pageIndex": 0, "bbox": {"top": 200}},
+                {"id": "d", "category": {"label": "ParaText"}, "content": {"text": "제1장 총칙 규정"},
+                 "pageIndex": 1, "bbox": {"top": 50}},
+                {"id": "e", "category": {"label": "ListText"}, "content": {"text": "제2장 총칙 규정"},
+                 "pageIndex": 1, "bbox": {"top": 80}},
+                {"id": "f", "category": {"label": "ListText"}, "content": {"text": "제2장 총칙 규정"},
+                 "pageIndex": 1, "bbox": {"top": 90}},
+                {"id": "g", "category": {"label": "Table", "type": "TABLE"}, "content": {"text": "표"},
+                 "pageIndex": 1, "bbox": {"top": 10}}
+            ]
+        }
+
+        fused = self.validator.validate_all_rules(test_data, "test.json")
+        per_rule = self.validator.validate_all_rules(test_data, "test.json", fused=False)
+
+        self.assertEqual([i.to_dict() for i in fused], [i.to_dict() for i in per_rule])
+        self.assertTrue(fused)
+
+    def test_r006_reports_minimal_moves(self):
+        # 한 요소만 잘못된 위치에 있으면 그 요소 하나만 보고되어야 함
+        elements = [
+            {"id": f"e{i}", "category": {"label": "ParaText"}, "content": {"text": f"문단 {i}"},
+             "pageIndex": 0, "bbox": {"top": 100 + i * 20, "left": 50}}
+            for i in range(6)
+        ]
+        elements.insert(1, elements.pop(4))
+
+        # 같은 줄(top 차이가 허용치 이내)은 left 순서로 판단
+        elements.append({"id": "left", "category": {"label": "ParaText"}, "content": {"text": "왼쪽"},
+                         "pageIndex": 0, "bbox": {"top": 300, "left": 50}})
+        elements.append({"id": "right", "category": {"label": "ParaText"}, "content": {"text": "오른쪽"},
+                         "pageIndex": 0, "bbox": {"top": 301, "left": 300}})
+
+        issues = self.validator.validate_all_rules({"elements": elements}, "test.json")
+        order_issues = [i for i in issues if i.rule_id == "R006"]
+
+        self.assertEqual([i.element_id for i in order_issues], ["e4"])
+
 if __name__ == '__main__':
     unittest.main()
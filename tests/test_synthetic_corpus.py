@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+합성 visualinfo 문서 생성기 테스트
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.src.core import QualityController
+from backend.src.utils.zip_processor import ZipProcessor
+from benchmarks.synthetic_corpus import document_id, generate_document, write_corpus
+
+class TestSyntheticCorpus(unittest.TestCase):
+    def test_document_matches_visualinfo_schema(self):
+        document = generate_document(document_id(0), 300)
+
+        self.assertEqual(sorted(document), ["elements", "metadata", "pageSizes", "runtime", "version"])
+        self.assertEqual(len(document["elements"]), 300)
+        self.assertEqual(len(document["pageSizes"]), document["metadata"]["numOfPages"])
+        self.assertEqual([e["id"] for e in document["elements"]], [str(i) for i in range(300)])
+
+        types = {e["category"]["type"] for e in document["elements"]}
+        self.assertTrue({"HEADING", "PARAGRAPH", "TABLE", "FIGURE"} <= types)
+        table = next(e for e in document["elements"] if e["content"].get("table"))
+        self.assertTrue(table["content"]["html"].startswith("<table>"))
+
+    def test_same_seed_same_document(self):
+        self.assertEqual(generate_document("A", 100, seed=3), generate_document("A", 100, seed=3))
+        self.assertNotEqual(generate_document("A", 100, seed=3), generate_document("A", 100, seed=4))
+
+    def test_injected_errors_are_detected(self):
+        controller = QualityController()
+        clean = controller.validate_data(generate_document("A", 500, error_rate=0.0), "a.json")
+        broken = controller.validate_data(generate_document("A", 500, error_rate=0.1), "a.json")
+
+        self.assertGreater(len(broken), len(clean))
+        self.assertIn("R001", {issue.rule_id for issue in broken})
+
+    def test_zip_corpus_readable(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir)
+            zip_paths = write_corpus(base_dir / "zip", 3, 50, reviewed_dir=base_dir / "reviewed")
+
+            entries = ZipProcessor().find_visualinfo_entries(base_dir / "zip")
+            reviewed = list((base_dir / "reviewed").glob("*.zip"))
+
+        self.assertEqual(len(zip_paths), 3)
+        self.assertEqual(sorted(entry.name for entry in entries),
+                         [f"{document_id(i)}_visualinfo.json" for i in range(3)])
+        self.assertEqual(len(reviewed), 3)
+
+if __name__ == '__main__':
+    unittest.main()
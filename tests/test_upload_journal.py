@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+업로드 작업 저널 및 이어서 처리 테스트 (모의 OCR 서버 사용)
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.src.services.pdf_uploader import PDFUploader
+from backend.src.services.upload_journal import (
+    STATE_DONE,
+    STATE_OCR_REQUESTED,
+    STATE_UPLOADED,
+    UploadJournal,
+    file_sha256,
+)
+from backend.src.services.upload_pipeline import UploadPipeline
+from benchmarks.mock_ocr_server import MockOCRConfig, start_background_server
+
+PDF_CONTENT = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n"
+
+class TestUploadJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.temp_dir.name)
+        self.journal_path = self.base_dir / "journal.jsonl"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_append_and_reload(self):
+        journal = UploadJournal(self.journal_path)
+        journal.record("abc", Path("a.pdf"), Path("out/a.zip"), STATE_UPLOADED, fileId="f1", numOfPages=3)
+        journal.record("abc", Path("a.pdf"), Path("out/a.zip"), STATE_OCR_REQUESTED)
+
+        reloaded = UploadJournal(self.journal_path).get("abc", Path("out/a.zip"))
+        self.assertEqual((reloaded['state'], reloaded['fileId'], reloaded['numOfPages']),
+                         (STATE_OCR_REQUESTED, "f1", 3))
+        self.assertEqual(len(self.journal_path.read_text(encoding='utf-8').splitlines()), 2)
+        self.assertIsNone(UploadJournal(self.journal_path, resume=False).get("abc", Path("out/a.zip")))
+
+    def test_same_content_different_outputs(self):
+        journal = UploadJournal(self.journal_path)
+        journal.record("abc", Path("a.pdf"), Path("out/a.zip"), STATE_DONE)
+        journal.record("abc", Path("b.pdf"), Path("out/b.zip"), STATE_UPLOADED, fileId="f2")
+
+        reloaded = UploadJournal(self.journal_path)
+        self.assertEqual(reloaded.get("abc", Path("out/a.zip"))['state'], STATE_DONE)
+        self.assertEqual(reloaded.get("abc", Path("out/b.zip"))['fileId'], "f2")
+
+    def test_compaction_keeps_last_state(self):
+        journal = UploadJournal(self.journal_path)
+        for index in range(150):
+            journal.record("abc", Path("a.pdf"), Path("out/a.zip"), STATE_UPLOADED, fileId=f"f{index}")
+
+        reloaded = UploadJournal(self.journal_path)
+        self.assertEqual(reloaded.get("abc", Path("out/a.zip"))['fileId'], "f149")
+        self.assertEqual(len(self.journal_path.read_text(encoding='utf-8').splitlines()), 1)
+
+    def test_torn_last_line_recovery(self):
+        journal = UploadJournal(self.journal_path)
+        journal.record("abc", Path("a.pdf"), Path("out/a.zip"), STATE_DONE)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"sha256": "def", "output": "out/b.z')
+
+        journal = UploadJournal(self.journal_path)
+        self.assertIsNone(journal.get("def", Path("out/b.zip")))
+        journal.record("def", Path("b.pdf"), Path("out/b.zip"), STATE_UPLOADED, fileId="f2")
+
+        lines = self.journal_path.read_text(encoding='utf-8').splitlines()
+        self.assertEqual([json.loads(line)['sha256'] for line in lines], ["abc", "def"])
+        reloaded = UploadJournal(self.journal_path)
+        self.assertEqual(reloaded.get("abc", Path("out/a.zip"))['state'], STATE_DONE)
+        self.assertEqual(reloaded.get("def", Path("out/b.zip"))['fileId'], "f2")
+
+class TestUploadPipelineResume(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.temp_dir.name)
+        self.output_dir = self.base_dir / "out"
+        self.output_dir.mkdir()
+        self.pdf_files = []
+        for name in ("DOC1", "DOC1_copy"):
+            pdf_path = self.base_dir / f"{name}.pdf"
+            pdf_path.write_bytes(PDF_CONTENT)
+            self.pdf_files.append(pdf_path)
+
+        config = MockOCRConfig(latency=0.0, ocr_delay_base=0.05, ocr_delay_per_page=0.0, ocr_delay_sigma=0.0)
+        self.server = start_background_server(config=config)
+        self.uploader = PDFUploader(base_url=self.server.base_url)
+        self.journal_path = self.base_dir / "journal.jsonl"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def run_pipeline(self):
+        pipeline = UploadPipeline(self.uploader, concurrency=2, log=lambda message: None,
+                                  progress=lambda pdf_path, message: None,
+                                  journal=UploadJournal(self.journal_path))
+        return pipeline.run(self.pdf_files, self.output_dir)
+
+    def test_resume_after_ocr_request(self):
+        # 첫 문서는 OCR 요청까지 끝난 상태에서 중단된 것으로 기록
+        file_info = self.uploader.upload_pdf(self.pdf_files[0])
+        self.uploader.extract_pages(file_info['fileId'], "1-1")
+        zip_path = self.output_dir / "visualcontent-DOC1.zip"
+        UploadJournal(self.journal_path).record(file_sha256(self.pdf_files[0]), self.pdf_files[0], zip_path,
+                                                STATE_OCR_REQUESTED, fileId=file_info['fileId'], numOfPages=1)
+
+        results = self.run_pipeline()
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(results[0].file_id, file_info['fileId'])
+        # 내용이 같아도 이름이 다른 두 번째 PDF는 따로 업로드해서 각자 ZIP 생성
+        self.assertNotEqual(results[1].file_id, file_info['fileId'])
+        self.assertEqual(self.server.state.stats["uploads"], 2)
+        self.assertTrue(all(result.zip_path.exists() for result in results))
+
+        rerun = self.run_pipeline()
+        self.assertEqual([result.skipped for result in rerun], [True, True])
+        self.assertEqual(self.server.state.stats["uploads"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
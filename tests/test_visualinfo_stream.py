@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+visualinfo 요소 스트리밍 읽기/검증 테스트
+"""
+
+import io
+import json
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from backend.src.core import QualityController, RuleValidator
+from backend.src.utils.visualinfo_stream import iter_elements
+from benchmarks.synthetic_corpus import generate_document
+
+def issue_dicts(issues):
+    return [issue.to_dict() for issue in issues]
+
+class TestVisualinfoStream(unittest.TestCase):
+    def test_elements_across_chunk_boundaries(self):
+        data = {"meta": {"elements": [1]}, **generate_document("A", 40, seed=1), "tail": [1.5, None]}
+        raw = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+        for chunk_size in (1, 7, 4096):
+            elements = list(iter_elements(io.BytesIO(raw), slim=False, chunk_size=chunk_size))
+            self.assertEqual(elements, data["elements"])
+
+        slim = next(iter_elements(io.BytesIO(raw)))
+        self.assertEqual(set(slim["content"]), {"text"})
+
+    def test_invalid_json(self):
+        for raw in (b'{"elements": [{"id": "0"},]}', b'{"elements": [{"id": "0"}', b'{} x'):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_elements(io.BytesIO(raw), chunk_size=4))
+
+    def test_stream_validation_matches_full(self):
+        validator = RuleValidator()
+        data = generate_document("A", 300, seed=2, error_rate=0.2)
+        raw = json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+        self.assertEqual(issue_dicts(validator.validate_elements(iter_elements(io.BytesIO(raw)), "a.json")),
+                         issue_dicts(validator.validate_all_rules(data, "a.json")))
+        self.assertEqual([issue.rule_id for issue in validator.validate_elements(iter([]), "a.json")],
+                         ["STRUCTURE_001"])
+
+    def test_controller_streams_large_files(self):
+        data = generate_document("A", 100, seed=3, error_rate=0.2)
+        raw = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "a_visualinfo.json"
+            json_path.write_bytes(raw)
+            zip_path = Path(temp_dir) / "a.zip"
+            with zipfile.ZipFile(zip_path, 'w') as zip_ref:
+                zip_ref.writestr("a/visualinfo/a_visualinfo.json", raw)
+
+            expected = QualityController()
+            streaming = QualityController({'stream_min_bytes': 0})
+
+            self.assertEqual(issue_dicts(streaming.validate_file(json_path)),
+                             issue_dicts(expected.validate_file(json_path)))
+            self.assertEqual(issue_dicts(streaming.validate_file(zip_path)),
+                             issue_dicts(expected.validate_file(zip_path)))
+
+if __name__ == '__main__':
+    unittest.main()
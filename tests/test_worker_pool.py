@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+API 작업자 프로세스 풀 테스트 (대기 제한, 429 응답, 규칙 시간 표본 측정)
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from backend.src.core import QualityController
+from backend.src.core.worker_pool import PoolSaturatedError, WorkerPool, validate_content_task
+from benchmarks.synthetic_corpus import generate_document
+
+# main.py는 backend 디렉토리 기준으로 모듈을 가져옴
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+import main
+
+CONTENT = json.dumps(generate_document("A", 30, seed=1, error_rate=0.2), ensure_ascii=False).encode('utf-8')
+
+class TestWorkerPool(unittest.TestCase):
+    def test_validate_matches_controller(self):
+        expected = [issue.to_dict() for issue in QualityController().validate_content(CONTENT, "a.json")]
+
+        async def run():
+            pool = WorkerPool(1, 1)
+            try:
+                return await pool.run(validate_content_task, CONTENT, "a.json")
+            finally:
+                pool.shutdown()
+
+        self.assertEqual(list(asyncio.run(run()).iter_dicts()), expected)
+
+    def test_waiters_are_bounded(self):
+        async def run():
+            pool = WorkerPool(1, 1, max_waiting=1)
+            try:
+                running = asyncio.create_task(pool.run(time.sleep, 0.5))
+                await asyncio.sleep(0)
+                self.assertTrue(pool.saturated)
+
+                with self.assertRaises(PoolSaturatedError):
+                    await pool.run(time.sleep, 0)
+
+                waiting = asyncio.create_task(pool.run(time.sleep, 0, wait=True))
+                await asyncio.sleep(0)
+                self.assertEqual(pool.waiting, 1)
+
+                # 기다리는 작업도 max_waiting을 넘으면 거절
+                with self.assertRaises(PoolSaturatedError):
+                    await pool.run(time.sleep, 0, wait=True)
+
+                await asyncio.gather(running, waiting)
+                return pool.pending, pool.waiting
+            finally:
+                pool.shutdown()
+
+        self.assertEqual(asyncio.run(run()), (0, 0))
+
+    def test_rule_timing_sample(self):
+        def sampled_rules(sample):
+            collected = []
+
+            async def run():
+                pool = WorkerPool(1, 1, config={'rule_timing_sample': sample},
+                                  on_metrics=lambda name, elapsed, metrics: collected.append((name, metrics)))
+                try:
+                    await pool.run(validate_content_task, CONTENT, "a.json")
+                finally:
+                    pool.shutdown()
+
+            asyncio.run(run())
+            name, metrics = collected[0]
+            self.assertEqual(name, "validate_content_task")
+            self.assertEqual([stage for stage, _ in metrics['stages']], ["validate"])
+            self.assertTrue(metrics['issues'])
+            return metrics['rules']
+
+        self.assertEqual(sampled_rules(0.0), {})
+        rules = sampled_rules(1.0)
+        self.assertTrue(rules)
+        self.assertTrue(all(values['calls'] > 0 for values in rules.values()))
+
+class TestSaturatedResponses(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(main.app)
+        self.pending = main.worker_pool.pending
+
+    def tearDown(self):
+        main.worker_pool.pending = self.pending
+
+    def test_upload_returns_429(self):
+        async def saturated(*args, **kwargs):
+            raise main.PoolSaturatedError("가득 참")
+
+        original = main.worker_pool.run
+        main.worker_pool.run = saturated
+        try:
+            for route in ("/upload", "/api/auto_fix"):
+                response = self.client.post(route, files={"file": ("a.json", CONTENT)})
+                self.assertEqual(response.status_code, 429, route)
+                self.assertEqual(response.headers["Retry-After"], str(main.SATURATED_RETRY_AFTER))
+        finally:
+            main.worker_pool.run = original
+
+    def test_batch_rejected_before_streaming(self):
+        main.worker_pool.pending = main.worker_pool.max_pending
+        response = self.client.post("/api/validate_batch", files=[("files", ("a.json", CONTENT))])
+        self.assertEqual(response.status_code, 429)
+
+class TestJobRoutes(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(main.app)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # 작업 관리자는 lifespan에서 생성되므로 (TestClient를 with 없이 쓰면 실행되지 않음) 직접 설정
+        self.job_manager = main.job_manager
+        main.job_manager = main.JobManager(main.JobStore(Path(self.temp_dir.name)))
+
+    def tearDown(self):
+        main.job_manager = self.job_manager
+        self.temp_dir.cleanup()
+
+    def test_import_does_not_create_job_manager(self):
+        self.assertIsNone(self.job_manager)
+
+    def test_duplicate_filenames_rejected(self):
+        files = [("files", ("a.json", CONTENT)), ("files", ("dir/a.json", CONTENT))]
+        response = self.client.post("/api/jobs", data={"job_type": "auto_fix"}, files=files)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(main.job_manager.store.list(), [])
+
+    def test_inputs_saved_and_submitted_off_event_loop(self):
+        submitted = []
+
+        def submit(job):
+            try:
+                asyncio.get_running_loop()
+                on_loop = True
+            except RuntimeError:
+                on_loop = False
+            submitted.append((job['id'], on_loop))
+
+        original = main.job_manager.submit
+        main.job_manager.submit = submit
+        try:
+            files = [("files", ("a.json", CONTENT)), ("files", ("b.json", CONTENT))]
+            response = self.client.post("/api/jobs", data={"job_type": "auto_fix"}, files=files)
+        finally:
+            main.job_manager.submit = original
+
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()['id']
+        # 입력 저장과 제출은 이벤트 루프가 아닌 스레드에서 실행됨
+        self.assertEqual(submitted, [(job_id, False)])
+        files_dir = main.job_manager.store.input_dir(job_id) / "files"
+        self.assertEqual(sorted(path.name for path in files_dir.iterdir()), ["a.json", "b.json"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+ZIP 처리기 테스트
+"""
+
+import io
+import json
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from backend.src.core import QualityController
+from backend.src.utils import zip_processor
+from backend.src.utils.zip_processor import ZipProcessor
+
+class TestZipVisualinfoReader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.temp_dir.name)
+        self.zip_path = self.base_dir / "visualcontent-TEST0001.zip"
+
+        data = {
+            "elements": [
+                {"id": "0", "category": {"label": "ListText"}, "content": {"text": "원문"}, "pageIndex": 0},
+                {"id": "1", "category": {"label": "ParaText"}, "content": {"text": ""}, "pageIndex": 0}
+            ]
+        }
+        with zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("original/TEST0001.pdf", b"%PDF-1.4 dummy")
+            zipf.writestr("visualinfo/TEST0001_visualinfo.json", json.dumps(data, ensure_ascii=False))
+            zipf.writestr("meta/abc_meta.json", json.dumps({"fileId": "abc"}))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_find_and_read_entries(self):
+        processor = ZipProcessor()
+        entries = processor.find_visualinfo_entries(self.base_dir)
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].name, "TEST0001_visualinfo.json")
+        self.assertEqual(processor.read_visualinfo(entries[0])["elements"][0]["id"], "0")
+
+    def test_validate_zip_without_extracting(self):
+        controller = QualityController()
+        issues = controller.validate_file(self.zip_path)
+
+        empty_text = [issue for issue in issues if issue.rule_id == "R001"]
+        self.assertEqual(len(empty_text), 1)
+        self.assertTrue(empty_text[0].file_path.endswith(".zip/visualinfo/TEST0001_visualinfo.json"))
+        self.assertEqual(sorted(p.name for p in self.base_dir.iterdir()), [self.zip_path.name])
+
+    def test_directory_zip_discovery_is_opt_in(self):
+        (self.base_dir / "LOOSE_visualinfo.json").write_text('{"elements": []}', encoding='utf-8')
+
+        default = QualityController().validate_directory(self.base_dir)
+        with_zip = QualityController({'include_zip': True}).validate_directory(self.base_dir)
+
+        self.assertEqual([Path(path).name for path in default], ["LOOSE_visualinfo.json"])
+        self.assertEqual(sorted(Path(path).name for path in with_zip), ["LOOSE_visualinfo.json", self.zip_path.name])
+        self.assertTrue(with_zip[str(self.zip_path)][0].file_path.endswith(".zip/visualinfo/TEST0001_visualinfo.json"))
+
+    def test_malformed_member_does_not_stop_zip(self):
+        # JSON으로는 읽히지만 구조가 잘못된 멤버는 그 멤버만 SYSTEM_ERROR, 나머지 멤버는 계속 검증
+        zip_path = self.base_dir / "visualcontent-MIXED.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zipf:
+            zipf.writestr("visualinfo/A_visualinfo.json", "[]")
+            zipf.writestr("visualinfo/B_visualinfo.json", '{"elements": [{"id": "0", "category": {"label": "ParaText"}, '
+                                                          '"content": {"text": ""}, "pageIndex": 0}]}')
+        self.zip_path.unlink()
+
+        for workers in (1, 2):
+            results = QualityController({'include_zip': True}).validate_directory(self.base_dir, workers=workers)
+            issues = results[str(zip_path)]
+
+            errors = [issue for issue in issues if issue.rule_id == "SYSTEM_ERROR"]
+            self.assertEqual(len(errors), 1, workers)
+            self.assertTrue(errors[0].file_path.endswith(".zip/visualinfo/A_visualinfo.json"))
+            self.assertTrue(any(issue.rule_id == "R001" and issue.file_path.endswith("B_visualinfo.json")
+                                for issue in issues), workers)
+
+    def test_iter_uploaded_batch_zip(self):
+        batch = io.BytesIO()
+        with zipfile.ZipFile(batch, 'w') as zipf:
+            zipf.write(self.zip_path, "delivery/visualcontent-TEST0001.zip")
+            zipf.writestr("loose_visualinfo.json", b'{"elements": []}')
+        batch.seek(0)
+
+        documents = list(ZipProcessor().iter_uploaded_visualinfo(batch, "batch.zip"))
+
+        self.assertEqual([path for path, _ in documents], [
+            "batch.zip/delivery/visualcontent-TEST0001.zip/visualinfo/TEST0001_visualinfo.json",
+            "batch.zip/loose_visualinfo.json"
+        ])
+        self.assertEqual(json.loads(documents[0][1])["elements"][0]["id"], "0")
+
+        # 큰 안쪽 ZIP은 임시 파일에 풀어서 읽음 - 결과는 같음
+        batch.seek(0)
+        with mock.patch.object(zip_processor, "NESTED_ZIP_SPOOL_BYTES", 0):
+            self.assertEqual(list(ZipProcessor().iter_uploaded_visualinfo(batch, "batch.zip")), documents)
+
+if __name__ == '__main__':
+    unittest.main()
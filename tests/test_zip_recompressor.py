@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+ZIP 재압축기 테스트
+"""
+
+import io
+import json
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from backend.src.utils.zip_recompressor import ZipRecompressor
+
+class TestZipRecompressor(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.temp_dir.name)
+        self.zip_path = self.base_dir / "visualcontent-TEST0001.zip"
+        self.pdf_bytes = b"%PDF-1.4 " + bytes(range(256)) * 64
+
+        with zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("original/TEST0001.pdf", self.pdf_bytes)
+            zipf.writestr("visualinfo/TEST0001_visualinfo.json", json.dumps({"elements": []}))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_rewrite_copies_unchanged_members(self):
+        recompressor = ZipRecompressor(self.base_dir / "out")
+        new_json = json.dumps({"elements": [{"id": "0"}]}).encode('utf-8')
+        dest = recompressor.rewrite_zip(self.zip_path, {"visualinfo/TEST0001_visualinfo.json": new_json})
+
+        with zipfile.ZipFile(self.zip_path) as src, zipfile.ZipFile(dest) as out:
+            self.assertIsNone(out.testzip())
+            self.assertEqual(out.read("original/TEST0001.pdf"), self.pdf_bytes)
+            self.assertEqual(out.read("visualinfo/TEST0001_visualinfo.json"), new_json)
+            self.assertEqual(out.getinfo("original/TEST0001.pdf").compress_size,
+                             src.getinfo("original/TEST0001.pdf").compress_size)
+        self.assertEqual([p.name for p in dest.parent.iterdir()], [dest.name])
+
+    def test_rewrite_streamed_zip(self):
+        # 탐색할 수 없는 스트림에 쓴 ZIP (데이터 디스크립터 사용) + zip64 extra + 보관 주석
+        class Unseekable(io.RawIOBase):
+            def __init__(self, fp):
+                self.fp = fp
+
+            def writable(self):
+                return True
+
+            def write(self, data):
+                return self.fp.write(data)
+
+        source = self.base_dir / "streamed.zip"
+        with open(source, 'wb') as raw, zipfile.ZipFile(Unseekable(raw), 'w', zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("원본/문서.pdf", self.pdf_bytes)
+            with zipf.open("big.bin", 'w', force_zip64=True) as member:
+                member.write(b"x" * 100000)
+            zipf.writestr(zipfile.ZipInfo("stored.txt"), b"stored")
+            zipf.comment = b"comment"
+
+        dest = ZipRecompressor(self.base_dir / "out").rewrite_zip(source, {"visualinfo/new_visualinfo.json": b"{}"})
+
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(dest) as out:
+            self.assertIsNone(out.testzip())
+            self.assertEqual(out.comment, b"comment")
+            for info in src.infolist():
+                self.assertEqual(out.read(info.filename), src.read(info))
+                self.assertEqual(out.getinfo(info.filename).compress_size, info.compress_size)
+            self.assertEqual(out.read("visualinfo/new_visualinfo.json"), b"{}")
+
+    def test_rewrite_failure_raises(self):
+        source = self.base_dir / "broken.zip"
+        source.write_bytes(b"not a zip")
+        out_dir = self.base_dir / "out"
+
+        with self.assertRaises(zipfile.BadZipFile):
+            ZipRecompressor(out_dir).rewrite_zip(source, {})
+        self.assertEqual(list(out_dir.iterdir()), [])
+
+    def test_recompress_directory_with_source(self):
+        extracted_dir = self.base_dir / "extracted" / self.zip_path.stem
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            zipf.extractall(extracted_dir)
+        json_file = extracted_dir / "visualinfo" / "TEST0001_visualinfo.json"
+        json_file.write_text(json.dumps({"elements": [{"id": "1"}]}), encoding='utf-8')
+
+        recompressor = ZipRecompressor(self.base_dir / "out")
+        dest = recompressor.recompress_directory(extracted_dir, self.zip_path)
+
+        with zipfile.ZipFile(dest) as out:
+            self.assertEqual(out.read("original/TEST0001.pdf"), self.pdf_bytes)
+            self.assertEqual(json.loads(out.read("visualinfo/TEST0001_visualinfo.json")), {"elements": [{"id": "1"}]})
+
+    def test_recompress_directory_with_deleted_member(self):
+        # 추출 디렉토리가 기준 - 디스크에서 지운 원본 멤버는 결과 ZIP에도 없어야 함
+        extracted_dir = self.base_dir / "extracted" / self.zip_path.stem
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            zipf.extractall(extracted_dir)
+        (extracted_dir / "original" / "TEST0001.pdf").unlink()
+
+        dest = ZipRecompressor(self.base_dir / "out").recompress_directory(extracted_dir, self.zip_path)
+
+        with zipfile.ZipFile(dest) as out:
+            self.assertEqual(out.namelist(), ["visualinfo/TEST0001_visualinfo.json"])
+
+    def test_recompress_directory_falls_back_when_rewrite_fails(self):
+        extracted_dir = self.base_dir / "extracted" / self.zip_path.stem
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            zipf.extractall(extracted_dir)
+
+        recompressor = ZipRecompressor(self.base_dir / "out")
+        with mock.patch.object(recompressor, "rewrite_zip", side_effect=OSError("disk error")):
+            dest = recompressor.recompress_directory(extracted_dir, self.zip_path)
+
+        self.assertIsNotNone(dest)
+        with zipfile.ZipFile(dest) as out:
+            self.assertEqual(out.read("original/TEST0001.pdf"), self.pdf_bytes)
+
+if __name__ == '__main__':
+    unittest.main()